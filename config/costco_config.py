@@ -15,6 +15,9 @@ BASE_URL = "https://www.costco.com"
 LOCATIONS_URL = "https://www.costco.com/w/-/locations"
 WAREHOUSE_URL_PATTERN = "https://www.costco.com/w/-/{state}/{city}/{warehouse_id}"
 
+# Radius (miles) one zip code search on the locations page is assumed to cover
+ZIP_SEARCH_RADIUS_MILES = 100
+
 # Geographic bounds (continental US + Hawaii + Alaska)
 US_BOUNDS = {
     'lat_min': 24.5,    # Southern tip of Florida
@@ -35,6 +35,32 @@ DEFAULT_SEARCH_RADIUS_MILES = 50
 # Maximum results per API call (Yext limit)
 MAX_RESULTS_PER_CALL = 50
 
+# Adaptive (quadtree) search, used when search_mode is "adaptive"
+# Seed cells of this size tile US_BOUNDS; a cell whose query returns
+# MAX_RESULTS_PER_CALL stores may be truncated and is split into four
+ADAPTIVE_INITIAL_CELL_MILES = 200
+# Saturated cells are not split below this size
+ADAPTIVE_MIN_CELL_MILES = 2
+# A cell whose query failed (after get_with_retry's own retries) is queued
+# again this many times before it is reported as not searched
+ADAPTIVE_CELL_RETRIES = 1
+
+# Coarse outline of the lower 48 states as (latitude, longitude) vertices,
+# clockwise from the Pacific northwest. It is padded offshore and along the
+# borders so every coastal and border store falls inside; seed cells that do
+# not touch it (open ocean, Canada, Mexico) are never queried.
+US_LAND_POLYGON = [
+    (49.4, -125.0), (49.4, -95.1), (48.4, -89.5), (46.9, -84.6), (46.0, -82.5), (43.0, -82.3),
+    (41.6, -82.5), (42.7, -79.3), (43.6, -79.2), (44.4, -76.3), (45.2, -74.8), (45.2, -71.5),
+    (47.6, -69.2), (47.3, -67.7), (45.6, -67.3), (44.8, -66.8), (43.3, -69.5), (41.2, -69.7),
+    (40.8, -72.0), (40.2, -73.7), (38.6, -74.6), (35.1, -75.2), (33.5, -78.0), (31.3, -80.3),
+    (28.3, -79.9), (26.5, -79.8), (25.0, -79.9), (24.3, -80.4), (24.3, -82.0), (26.3, -82.5),
+    (28.0, -83.2), (29.5, -84.0), (29.4, -85.6), (29.9, -88.0), (28.8, -89.0), (28.8, -90.5),
+    (29.4, -93.5), (28.9, -94.7), (25.6, -97.0), (26.0, -99.2), (29.0, -101.0), (28.8, -103.0),
+    (29.3, -104.5), (31.3, -106.6), (31.0, -111.1), (32.2, -114.9), (32.3, -117.5), (34.3, -120.9),
+    (37.8, -123.3), (40.3, -124.8), (48.5, -124.9),
+]
+
 # Store type mapping from c_locatorFilters to friendly names
 STORE_TYPES = {
     'Cricket Wireless Authorized Retailer': 'authorized_retailer',
@@ -5,6 +5,9 @@ Two operations are used:
 1. storeDirectoryByState — lists all stores in a state (Phase 1: discovery)
 2. storeSearch — returns detailed store data by store ID (Phase 2: enrichment)
 
+Both can be batched: build_*_batch() alias many copies of an operation into
+one query so a single POST covers many states or stores.
+
 No authentication tokens or API keys are required.
 """
 
@@ -31,9 +34,8 @@ US_STATES = [
     "WY", "GU", "PR", "VI",
 ]
 
-# Phase 1: State directory query — returns store list with basic info + county
-QUERY_STATE_DIRECTORY = """query storeDirectoryByState($state: String!) {
-  storeDirectoryByState(state: $state) {
+# Phase 1: State directory selection — store list with basic info + county
+STATE_DIRECTORY_SELECTION = """{
     stateName
     storesInfo {
       storeName
@@ -43,24 +45,15 @@ QUERY_STATE_DIRECTORY = """query storeDirectoryByState($state: String!) {
       servicesLink
       address { street city state postalCode county }
     }
-  }
-}"""
+  }"""
 
-# Phase 2: Store search query — returns full detail (services, hours, coordinates)
-QUERY_STORE_SEARCH = """query storeSearch(
-  $lat: String,
-  $lng: String,
-  $storeSearchInput: String,
-  $pagesize: String,
-  $storeFeaturesFilter: StoreFeaturesFilter
-) {
-  storeSearch(
-    lat: $lat
-    lng: $lng
-    storeSearchInput: $storeSearchInput
-    pagesize: $pagesize
-    storeFeaturesFilter: $storeFeaturesFilter
-  ) {
+# Phase 1: State directory query — returns store list with basic info + county
+QUERY_STATE_DIRECTORY = f"""query storeDirectoryByState($state: String!) {{
+  storeDirectoryByState(state: $state) {STATE_DIRECTORY_SELECTION}
+}}"""
+
+# Phase 2: Store search selection — full detail (services, hours, coordinates)
+STORE_SEARCH_SELECTION = """{
     stores {
       storeId
       name
@@ -137,8 +130,72 @@ QUERY_STORE_SEARCH = """query storeSearch(
         sunday { open close }
       }
     }
-  }
-}"""
+  }"""
+
+# Phase 2: Store search query — returns full detail (services, hours, coordinates)
+QUERY_STORE_SEARCH = f"""query storeSearch(
+  $lat: String,
+  $lng: String,
+  $storeSearchInput: String,
+  $pagesize: String,
+  $storeFeaturesFilter: StoreFeaturesFilter
+) {{
+  storeSearch(
+    lat: $lat
+    lng: $lng
+    storeSearchInput: $storeSearchInput
+    pagesize: $pagesize
+    storeFeaturesFilter: $storeFeaturesFilter
+  ) {STORE_SEARCH_SELECTION}
+}}"""
+
+
+def build_state_directory_batch(count: int) -> str:
+    """Build one query fetching `count` state directories through aliases.
+
+    Alias `s{i}` reads variable `$state{i}`.
+
+    Args:
+        count: Number of states in the batch
+
+    Returns:
+        GraphQL query string for operation storeDirectoryByStateBatch
+    """
+    params = ", ".join(f"$state{i}: String!" for i in range(count))
+    fields = "\n".join(
+        f"  s{i}: storeDirectoryByState(state: $state{i}) {STATE_DIRECTORY_SELECTION}"
+        for i in range(count)
+    )
+    return f"query storeDirectoryByStateBatch({params}) {{\n{fields}\n}}"
+
+
+def build_store_search_batch(count: int) -> str:
+    """Build one query fetching `count` stores by ID through aliases.
+
+    Alias `s{i}` reads variable `$storeSearchInput{i}`; lat, lng, pagesize
+    and storeFeaturesFilter are shared by all aliases.
+
+    Args:
+        count: Number of stores in the batch
+
+    Returns:
+        GraphQL query string for operation storeSearchBatch
+    """
+    params = ", ".join(
+        ["$lat: String", "$lng: String", "$pagesize: String",
+         "$storeFeaturesFilter: StoreFeaturesFilter"]
+        + [f"$storeSearchInput{i}: String" for i in range(count)]
+    )
+    fields = "\n".join(
+        f"  s{i}: storeSearch(lat: $lat, lng: $lng, storeSearchInput: $storeSearchInput{i}, "
+        f"pagesize: $pagesize, storeFeaturesFilter: $storeFeaturesFilter) {STORE_SEARCH_SELECTION}"
+        for i in range(count)
+    )
+    return f"query storeSearchBatch({params}) {{\n{fields}\n}}"
+
+# Operations per aliased GraphQL request (1 = one operation per POST);
+# halved automatically whenever the gateway rejects a batch
+GRAPHQL_BATCH_SIZE = 1
 
 # Default features filter — all False means no filtering
 DEFAULT_FEATURES_FILTER = {
@@ -41,6 +41,15 @@ STORE_NUMBER_RANGES = [
     (5001, 5500),   # Outlier range: 5001-5499
 ]
 
+# Scan planning (Phase 1). Hit history per store number is kept across runs;
+# between full sweeps only known-live numbers and every DEAD_SAMPLE_STRIDE-th
+# other number are probed (rotating offset, so each number is probed at least
+# once every DEAD_SAMPLE_STRIDE runs)
+FULL_SWEEP_DAYS = 30      # Probe every number at least this often (0 = every run)
+DEAD_SAMPLE_STRIDE = 20
+DENSIFY_RADIUS = 10       # Probe this many numbers either side of a new hit
+LIVE_MISS_LIMIT = 3       # Consecutive misses before a number is treated as dead
+
 # ===========================================================================
 # ZIP Codes for Geographic Gap-Fill (Phase 2)
 # ===========================================================================
@@ -59,8 +68,12 @@ GAP_FILL_ZIP_CODES = [
     "92101", "94101", "97201", "98101", "99201",
 ]
 
+# Test mode sample: far enough apart that no search's radius covers another
+TEST_GAP_FILL_ZIP_CODES = ["10001", "60601", "75201", "80201", "94101"]
+
 # Store locator search radius (miles) - max 10 results per query
 LOCATOR_SEARCH_RADIUS = 200
+LOCATOR_MAX_RESULTS = 10
 
 # ===========================================================================
 # Feature and Service Mappings
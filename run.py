@@ -45,8 +45,12 @@ from src.shared.sentry_integration import (
     add_breadcrumb,
     flush as sentry_flush,
 )
+from src.shared.async_http import AIOHTTP_AVAILABLE
 from src.shared.constants import WORKERS
 from src.shared.export_service import ExportService, ExportFormat, parse_format_list
+from src.shared.proxy_client import ProxyCostLedger
+from src.shared.run_tracker import RunTracker, get_active_run, get_run_history
+from src.shared.store_pipeline import STREAMABLE_FORMATS, StorePipeline
 from src.shared.cloud_storage import get_cloud_storage, CloudStorageManager
 from src.scrapers import get_available_retailers, get_enabled_retailers, get_scraper_module
 from src.change_detector import ChangeDetector
@@ -170,7 +174,7 @@ def validate_config_on_startup(config_path: str = "config/retailers.yaml") -> Li
             errors.append("'proxy' section must be a dictionary")
         else:
             mode = proxy.get('mode', 'direct')
-            valid_modes = {'direct', 'residential', 'web_scraper_api'}
+            valid_modes = {'direct', 'residential', 'web_scraper_api', 'tiered'}
             if mode not in valid_modes:
                 errors.append(f"Invalid proxy mode '{mode}'. Must be one of: {', '.join(valid_modes)}")
 
@@ -287,7 +291,7 @@ def setup_parser() -> argparse.ArgumentParser:
         '--format', '-f',
         type=str,
         default='json,csv',
-        help='Export formats (comma-separated): json,csv,excel,geojson (default: json,csv)'
+        help='Export formats (comma-separated): json,jsonl,csv,excel,geojson (default: json,csv)'
     )
 
     # Cloud storage options
@@ -390,12 +394,71 @@ def show_status(retailers: Optional[List[str]] = None) -> None:
             else:
                 print("  Outputs: Directory not found")
 
+            # Proxy spend from the most recent run that recorded it
+            for run in get_run_history(retailer):
+                if run.get('proxy_costs'):
+                    _print_proxy_costs(run['run_id'], run['proxy_costs'])
+                    break
+
         except Exception as e:
             print(f"  Error getting status: {e}")
 
     print("\n" + "=" * 60)
 
 
+def _print_proxy_costs(run_id: str, costs: Dict[str, Any]) -> None:
+    """Print a run's proxy usage summary (from ProxyCostLedger.summary())."""
+    print(
+        f"  Proxy usage ({run_id}): {costs['requests']} requests "
+        f"({costs['rendered']} rendered, {costs['retries']} retries, {costs['errors']} errors), "
+        f"{costs['credits']:g} credits, {costs['bytes'] / (1024 * 1024):.1f} MB, "
+        f"avg {costs['avg_latency_ms']:.0f} ms"
+    )
+    if costs.get('stores'):
+        print(
+            f"    Per store: {costs['credits_per_store']:g} credits, "
+            f"{costs['bytes_per_store'] / 1024:.1f} KB, {costs['requests_per_store']:g} requests"
+        )
+    for mode, usage in costs.get('modes', {}).items():
+        print(
+            f"    {mode}: {usage['requests']} requests, {usage['credits']:g} credits, "
+            f"{usage['bytes'] / (1024 * 1024):.1f} MB"
+        )
+
+
+def _record_proxy_costs(retailer: str, stores: int) -> None:
+    """Log this run's proxy usage and persist it into RunTracker metadata.
+
+    Runs started from the dashboard already have an active RunTracker record;
+    CLI runs get a completed record of their own so `--status` can show them.
+
+    Args:
+        retailer: Retailer name
+        stores: Number of stores extracted, for per-store costs
+    """
+    costs = ProxyCostLedger().summary(retailer, stores=stores)
+    if not costs['requests']:
+        return
+
+    logging.info(
+        f"[{retailer}] Proxy usage: {costs['requests']} requests ({costs['rendered']} rendered, "
+        f"{costs['retries']} retries), {costs['credits']:g} credits, "
+        f"{costs['bytes'] / (1024 * 1024):.1f} MB"
+    )
+    try:
+        active_run = get_active_run(retailer)
+        if active_run:
+            RunTracker(retailer, run_id=active_run['run_id']).update_proxy_costs(costs)
+        else:
+            tracker = RunTracker(retailer)
+            tracker.update_config({'source': 'cli'})
+            tracker.update_stats(stores_scraped=stores, requests_made=costs['requests'])
+            tracker.update_proxy_costs(costs)
+            tracker.complete()
+    except (IOError, OSError) as e:
+        logging.warning(f"[{retailer}] Failed to record proxy usage: {e}")
+
+
 # Thread pool executor for running synchronous scrapers without blocking the event loop
 _scraper_executor = concurrent.futures.ThreadPoolExecutor(max_workers=WORKERS.EXECUTOR_MAX_WORKERS, thread_name_prefix='scraper')
 
@@ -426,6 +489,53 @@ def _run_scraper_sync(
     return scraper_module.run(session, retailer_config, retailer=retailer, **kwargs)
 
 
+def _use_async_engine(
+    retailer: str,
+    retailer_config: Dict[str, Any],
+    scraper_module: ModuleType
+) -> bool:
+    """Check whether a retailer should run on the asyncio fetch engine.
+
+    Requires `async_engine: true` in the retailer config, a scraper module
+    that provides run_async(), and aiohttp to be installed.
+
+    Args:
+        retailer: Name of the retailer
+        retailer_config: Configuration dict for the retailer
+        scraper_module: Module containing the scraper implementation
+
+    Returns:
+        True if run_async() should be awaited instead of run() in a thread
+    """
+    if not retailer_config.get('async_engine', False):
+        return False
+    if not hasattr(scraper_module, 'run_async'):
+        logging.warning(f"[{retailer}] async_engine enabled but scraper has no run_async(); using threaded run()")
+        return False
+    if not AIOHTTP_AVAILABLE:
+        logging.warning(f"[{retailer}] async_engine enabled but aiohttp is not installed; using threaded run()")
+        return False
+    return True
+
+
+def _finish_pipeline(pipeline: StorePipeline, stores: List[Dict[str, Any]]) -> Dict[ExportFormat, str]:
+    """Flush a retailer's StorePipeline and move its exports into place.
+
+    Scrapers that don't stream through store_sink hand back their full list
+    instead; it is fed through the pipeline here in a single pass.
+
+    Args:
+        pipeline: Running StorePipeline for the retailer
+        stores: Stores returned by the scraper
+
+    Returns:
+        Mapping of streamed format to output path
+    """
+    if pipeline.queued == 0 and stores:
+        pipeline.add_many(stores)
+    return pipeline.close()
+
+
 async def run_retailer_async(
     retailer: str,
     cli_proxy_override: Optional[str] = None,
@@ -458,6 +568,9 @@ async def run_retailer_async(
         export_formats = [ExportFormat.JSON, ExportFormat.CSV]
 
     session = None
+    pipeline = None
+    # Proxy usage is accounted per run
+    ProxyCostLedger().reset(retailer)
     try:
         # Pass CLI proxy settings through to retailer config (#52)
         retailer_config = load_retailer_config(
@@ -470,20 +583,33 @@ async def run_retailer_async(
 
         scraper_module = get_scraper_module(retailer)
 
-        # Run synchronous scraper in thread pool to avoid blocking the event loop
-        # This enables true concurrent execution when running multiple retailers
-        loop = asyncio.get_running_loop()
-        scraper_result = await loop.run_in_executor(
-            _scraper_executor,
-            functools.partial(
-                _run_scraper_sync,
-                retailer,
-                retailer_config,
-                session,
-                scraper_module,
-                **kwargs
+        # JSON/CSV are written incrementally while the scraper runs; scrapers
+        # built on ScrapeRunner push each store through store_sink as it is extracted
+        output_dir = f"data/{retailer}/output"
+        pipeline = StorePipeline(retailer, output_dir, retailer_config, formats=export_formats).start()
+        kwargs['store_sink'] = pipeline.add
+
+        if _use_async_engine(retailer, retailer_config, scraper_module):
+            # Native asyncio scraper: shares this event loop instead of a worker thread
+            logging.info(f"[{retailer}] Calling scraper run_async() function")
+            scraper_result = await scraper_module.run_async(
+                session, retailer_config, retailer=retailer, **kwargs
+            )
+        else:
+            # Run synchronous scraper in thread pool to avoid blocking the event loop
+            # This enables true concurrent execution when running multiple retailers
+            loop = asyncio.get_running_loop()
+            scraper_result = await loop.run_in_executor(
+                _scraper_executor,
+                functools.partial(
+                    _run_scraper_sync,
+                    retailer,
+                    retailer_config,
+                    session,
+                    scraper_module,
+                    **kwargs
+                )
             )
-        )
 
         # Extract data from scraper result
         stores = scraper_result.get('stores', [])
@@ -491,20 +617,30 @@ async def run_retailer_async(
         checkpoints_used = scraper_result.get('checkpoints_used', False)
 
         logging.info(f"[{retailer}] Scraper completed: {count} stores")
+        _record_proxy_costs(retailer, count)
         if checkpoints_used:
             logging.info(f"[{retailer}] Resumed from checkpoint")
 
-        # Run change detection if incremental mode is enabled
         incremental = kwargs.get('incremental', False)
+        detector = None
         if incremental and stores:
-            logging.info(f"[{retailer}] Running change detection (incremental mode)")
             try:
-                detector = ChangeDetector(retailer)
-
-                # Fix #122: Rotate stores_latest → stores_previous BEFORE detection
-                # This ensures we compare against Run N-1 (not N-2)
+                detector = ChangeDetector(retailer, compact=bool(retailer_config.get('compact_json', False)))
+                # Fix #122: Rotate stores_latest → stores_previous BEFORE the new
+                # outputs are moved into place, so we compare against Run N-1
                 detector.rotate_previous()
+            except Exception as change_err:
+                logging.warning(f"[{retailer}] Change detection failed: {change_err}")
+                detector = None
+
+        # close() owns the partial files from here on, even if this task is cancelled
+        finishing, pipeline = pipeline, None
+        streamed = await asyncio.to_thread(_finish_pipeline, finishing, stores)
 
+        # Run change detection if incremental mode is enabled
+        if detector is not None:
+            logging.info(f"[{retailer}] Running change detection (incremental mode)")
+            try:
                 change_report = detector.detect_changes(stores)
 
                 if change_report.has_changes:
@@ -515,18 +651,21 @@ async def run_retailer_async(
                 else:
                     logging.info(f"[{retailer}] No changes detected")
 
-                # Save fingerprints for next run comparison
-                detector.save_fingerprints(stores)
+                # Save new latest unless the streamed JSON export already wrote it
+                # (rotation already done, so use save_latest not save_version)
+                if ExportFormat.JSON not in streamed:
+                    detector.save_latest(stores)
 
-                # Save new latest (rotation already done, so use save_latest not save_version)
-                detector.save_latest(stores)
+                # Save the fingerprint index for next run comparison (after
+                # stores_latest.json is final, so the index can recognize it)
+                detector.save_fingerprints(stores)
             except Exception as change_err:
                 logging.warning(f"[{retailer}] Change detection failed: {change_err}")
 
-        # Export to all requested formats
-        output_dir = f"data/{retailer}/output"
+        # Export remaining (non-streamable) formats from the in-memory list
         format_extensions = {
             ExportFormat.JSON: 'json',
+            ExportFormat.JSONL: 'jsonl',
             ExportFormat.CSV: 'csv',
             ExportFormat.EXCEL: 'xlsx',
             ExportFormat.GEOJSON: 'geojson'
@@ -536,6 +675,11 @@ async def run_retailer_async(
         successful_extensions = []
         for fmt in export_formats:
             ext = format_extensions.get(fmt, fmt.value)
+            if fmt in STREAMABLE_FORMATS:
+                if fmt in streamed:
+                    successful_formats.append(fmt)
+                    successful_extensions.append(ext)
+                continue
             output_path = f"{output_dir}/stores_latest.{ext}"
             try:
                 ExportService.export_stores(stores, fmt, output_path, retailer_config)
@@ -592,6 +736,10 @@ async def run_retailer_async(
             'error': str(e)
         }
     finally:
+        # Discard partial streamed exports on any early exit (errors, cancellation,
+        # KeyboardInterrupt); previous outputs stay in place
+        if pipeline is not None:
+            pipeline.abort()
         # Close session to prevent resource leak (#4 review feedback)
         if session is not None:
             try:
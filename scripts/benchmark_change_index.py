@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""Benchmark ChangeDetector index build time against store count.
+
+Builds synthetic store lists (a mix of ID-keyed and address-keyed stores,
+like a combined --all run) and times ChangeDetector._build_store_index()
+next to the previous per-store SHA-256 + json.dumps(sort_keys=True)
+fingerprinting, which is reimplemented here for comparison.
+
+Usage:
+    python scripts/benchmark_change_index.py [--sizes 1000 10000 50000] [--repeat 3]
+"""
+
+import argparse
+import hashlib
+import json
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.change_detector import ChangeDetector
+
+
+def make_stores(count: int) -> List[Dict[str, Any]]:
+    """Synthetic stores; every fourth one has no store_id/url (address-keyed)."""
+    stores = []
+    for i in range(count):
+        store = {
+            'name': f'Store {i}',
+            'street_address': f'{i} Main St',
+            'city': 'Austin',
+            'state': 'TX',
+            'zip': f'{78000 + i % 1000}',
+            'phone': f'512-555-{i % 10000:04d}',
+            'country': 'US',
+            'latitude': 30.0 + i / 1e5,
+            'longitude': -97.0 - i / 1e5,
+            'store_type': 'retail',
+            'status': 'open',
+            'hours': 'Mon-Sun 9-9',
+        }
+        if i % 4:
+            store['store_id'] = str(i)
+            store['url'] = f'https://example.com/stores/{i}'
+        stores.append(store)
+    return stores
+
+
+def legacy_fingerprints(detector: ChangeDetector, stores: List[Dict[str, Any]]) -> None:
+    """Previous hashing cost: field list rebuilt per store, identity hashed twice."""
+    for store in stores:
+        fields = detector.IDENTITY_FIELDS + detector.ADDRESS_IDENTITY_FIELDS + detector.COMPARISON_FIELDS
+        seen = set()
+        unique_fields = []
+        for field in fields:
+            if field not in seen:
+                seen.add(field)
+                unique_fields.append(field)
+        for field_list in (detector.ADDRESS_IDENTITY_FIELDS, detector.ADDRESS_IDENTITY_FIELDS, unique_fields):
+            data = {k: store.get(k, '') for k in field_list if k in store or k == 'zip'}
+            hashlib.sha256(json.dumps(data, sort_keys=True).encode()).hexdigest()
+
+
+def best_time(func: Callable[[], Any], repeat: int) -> float:
+    """Best wall time of `repeat` runs, in seconds."""
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--sizes', type=int, nargs='+', default=[1000, 10000, 50000])
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as data_dir:
+        detector = ChangeDetector('benchmark', data_dir=data_dir)
+
+        print(f"{'stores':>8}  {'legacy hashing':>15}  {'index build':>12}  {'per store':>10}")
+        for size in args.sizes:
+            stores = make_stores(size)
+            legacy = best_time(lambda: legacy_fingerprints(detector, stores), args.repeat)
+            current = best_time(lambda: detector._build_store_index(stores), args.repeat)
+            print(f"{size:>8}  {legacy * 1000:>12.1f} ms  {current * 1000:>9.1f} ms  {current / size * 1e6:>7.1f} us")
+
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -8,11 +8,13 @@ fingerprints of store data.
 import hashlib
 import json
 import logging
+import os
 import shutil
+from contextlib import contextmanager
 from dataclasses import dataclass, asdict
 from datetime import datetime
 from pathlib import Path
-from typing import List, Dict, Optional, Any, Iterator
+from typing import List, Dict, Optional, Any, Iterator, Tuple
 
 from src.shared.constants import STREAMING
 
@@ -26,6 +28,20 @@ except ImportError:
 
 __all__ = ["IJSON_AVAILABLE", "ChangeReport", "ChangeDetector"]
 
+# Compact canonical JSON; keys are pre-sorted by the detector's field tuples,
+# so the encoder does not sort them again for every store
+_FIELD_ENCODER = json.JSONEncoder(separators=(',', ':'))
+_STORE_ENCODER = json.JSONEncoder(separators=(',', ':'), sort_keys=True, default=str)
+
+
+def _digest(text: str) -> str:
+    """Hash canonical JSON to 64 hex characters (BLAKE2b, 32-byte digest).
+
+    BLAKE2b is faster than SHA-256 in CPython's hashlib and keeps the same
+    digest length, so keys and fingerprints keep their format.
+    """
+    return hashlib.blake2b(text.encode(), digest_size=32).hexdigest()
+
 
 @dataclass
 class ChangeReport:
@@ -77,12 +93,32 @@ class ChangeDetector:
         'store_type', 'status'
     ]
 
-    def __init__(self, retailer: str, data_dir: str = "data"):
+    # Format version of fingerprints.json; bump when keys or fingerprints change
+    # so an index written by older code is not trusted
+    INDEX_VERSION = 2
+
+    def __init__(self, retailer: str, data_dir: str = "data", compact: bool = False):
+        """Initialize the detector.
+
+        Args:
+            retailer: Retailer name (subdirectory of data_dir)
+            data_dir: Base data directory
+            compact: Write stores_latest.json without indentation
+        """
         self.retailer = retailer
+        self.compact = compact
         self.data_dir = Path(data_dir) / retailer
         self.output_dir = self.data_dir / "output"
         self.history_dir = self.data_dir / "history"
         self.fingerprints_path = self.data_dir / "fingerprints.json"
+        self.records_path = self.data_dir / "fingerprint_records.jsonl"
+
+        # Hashed field tuples are fixed per detector: build (and sort) them once
+        # instead of rebuilding and deduplicating the field list for every store
+        self._identity_fields = tuple(sorted(set(self.ADDRESS_IDENTITY_FIELDS)))
+        self._fingerprint_fields = tuple(sorted(set(
+            self.IDENTITY_FIELDS + self.ADDRESS_IDENTITY_FIELDS + self.COMPARISON_FIELDS
+        )))
 
         # Ensure directories exist
         self.output_dir.mkdir(parents=True, exist_ok=True)
@@ -98,6 +134,14 @@ class ChangeDetector:
         Returns:
             A unique string key for the store
         """
+        key = self._get_id_key(store)
+        if key is not None:
+            return key
+        # If no identity hash provided, generate it now for stability
+        return self._get_address_key(store, identity_suffix or self.compute_identity_hash(store)[:8])
+
+    def _get_id_key(self, store: Dict[str, Any]) -> Optional[str]:
+        """Key from store_id or URL, or None for stores that need an address-based key."""
         # For Best Buy, prioritize URL over store_id (multi-service locations share IDs)
         if self.retailer == 'bestbuy':
             if store.get('url'):
@@ -110,10 +154,16 @@ class ChangeDetector:
                 return f"id:{store['store_id']}"
             if store.get('url'):
                 return f"url:{store['url']}"
+        return None
 
-        # Fall back to address-based key with identity hash for cross-run stability (#57)
-        # Always include identity hash suffix for address-based keys to ensure the same
-        # store has the same key across runs, even when comparison fields change
+    def _get_address_key(self, store: Dict[str, Any], identity_suffix: str) -> str:
+        """Address-based key with identity hash suffix for cross-run stability (#57).
+
+        Always includes the identity hash suffix so the same store has the same
+        key across runs, even when comparison fields change. The identity hash
+        (NOT the full fingerprint) keeps keys stable when phone, status, etc.
+        change while still disambiguating stores at the same address.
+        """
         addr_parts = [
             store.get('name', ''),
             store.get('street_address', ''),
@@ -122,14 +172,7 @@ class ChangeDetector:
             store.get('zip', ''),  # Include zip for better uniqueness
         ]
         base_key = f"addr:{'-'.join(p.lower().strip() for p in addr_parts if p)}"
-
-        # Always use identity hash (NOT full fingerprint) for address-based keys
-        # This prevents keys from changing when comparison fields (phone, status, etc.) change
-        # while still allowing disambiguation of stores at the same address
-        if identity_suffix:
-            return f"{base_key}::{identity_suffix}"
-        # If no identity hash provided, generate it now for stability
-        return f"{base_key}::{self.compute_identity_hash(store)[:8]}"
+        return f"{base_key}::{identity_suffix}"
 
     def _build_store_index(
         self,
@@ -146,18 +189,23 @@ class ChangeDetector:
         Returns:
             Tuple of (stores_by_key dict, fingerprints_by_key dict, collision_count)
         """
+        fingerprints = self.compute_fingerprints(stores)
+
         # First pass: detect all collisions
-        base_key_groups = {}  # Map base_key -> list of (index, store)
+        base_key_groups = {}  # Map base_key -> list of (index, store, identity_hash)
 
         for idx, store in enumerate(stores):
-            # Compute identity hash for stable key generation (address-based stores only)
-            identity_hash = self.compute_identity_hash(store)
-            # Keys use identity hash to remain stable when comparison fields change
-            base_key = self._get_store_key(store, identity_hash[:8])
+            base_key = self._get_id_key(store)
+            identity_hash = None
+            if base_key is None:
+                # Address-based stores only: identity hash computed once and reused below;
+                # keys use it to remain stable when comparison fields change
+                identity_hash = self.compute_identity_hash(store)
+                base_key = self._get_address_key(store, identity_hash[:8])
 
             if base_key not in base_key_groups:
                 base_key_groups[base_key] = []
-            base_key_groups[base_key].append((idx, store))
+            base_key_groups[base_key].append((idx, store, identity_hash))
 
         # Second pass: assign keys with deterministic suffixes for collisions
         stores_by_key = {}
@@ -175,7 +223,7 @@ class ChangeDetector:
             # Track duplicate keys within this group for true duplicates
             seen_keys = {}
 
-            for _, store in group_stores:
+            for idx, store, identity_hash in group_stores:
                 if is_address_based:
                     if has_collision:
                         # Collision: use full_hash for disambiguation
@@ -184,7 +232,6 @@ class ChangeDetector:
                     else:
                         # Single address-based store: use identity_hash for stable keys
                         # This ensures keys remain stable when comparison fields change
-                        identity_hash = self.compute_identity_hash(store)
                         key = f"{base_key}::col:{identity_hash}"
 
                     # Handle true duplicates (identical stores) by adding counter suffix
@@ -208,10 +255,8 @@ class ChangeDetector:
                     # Single ID/URL-based store - use base_key directly (already unique)
                     key = base_key
 
-                fingerprint = self.compute_fingerprint(store)
-
                 stores_by_key[key] = store
-                fingerprints_by_key[key] = fingerprint
+                fingerprints_by_key[key] = fingerprints[idx]
 
             if has_collision:
                 logging.debug(f"Key collision resolved with deterministic suffixes for base_key: '{base_key}'")
@@ -235,11 +280,25 @@ class ChangeDetector:
             store: Store dictionary
 
         Returns:
-            Full SHA256 hash string (64 hex characters)
+            Full hash string (64 hex characters)
         """
-        # json.dumps with sort_keys=True handles key ordering
-        json_str = json.dumps(store, sort_keys=True, default=str)
-        return hashlib.sha256(json_str.encode()).hexdigest()
+        # sort_keys=True handles key ordering
+        return _digest(_STORE_ENCODER.encode(store))
+
+    @staticmethod
+    def _project(store: Dict[str, Any], fields: tuple) -> Dict[str, Any]:
+        """Select the hashed fields of a store, in the (sorted) order of `fields`.
+
+        Absent fields are left out, except zip, which is normalized from
+        postal_code (some scrapers use 'zip', others 'postal_code').
+        """
+        data = {}
+        for k in fields:
+            if k == 'zip':
+                data[k] = store.get('zip') or store.get('postal_code', '')
+            elif k in store:
+                data[k] = store[k]
+        return data
 
     def compute_identity_hash(self, store: Dict[str, Any]) -> str:
         """Compute a hash of ONLY identity fields for stable key generation.
@@ -252,20 +311,9 @@ class ChangeDetector:
             store: Store dictionary
 
         Returns:
-            SHA256 hash of identity fields only
+            Hash of identity fields only (64 hex characters)
         """
-        # Only use address identity fields for stable keys
-        # Normalize postal code field (some scrapers use 'zip', others 'postal_code')
-        data = {}
-        for k in self.ADDRESS_IDENTITY_FIELDS:
-            if k == 'zip':
-                data[k] = store.get('zip') or store.get('postal_code', '')
-            elif k in store:
-                data[k] = store.get(k, '')
-
-        # Sort keys for consistent hashing
-        json_str = json.dumps(data, sort_keys=True)
-        return hashlib.sha256(json_str.encode()).hexdigest()
+        return _digest(_FIELD_ENCODER.encode(self._project(store, self._identity_fields)))
 
     def compute_fingerprint(self, store: Dict[str, Any]) -> str:
         """Compute a fingerprint hash of a store's key attributes.
@@ -277,30 +325,26 @@ class ChangeDetector:
             store: Store dictionary
 
         Returns:
-            SHA256 hash of all relevant fields (identity + comparison)
+            Hash of all relevant fields (identity + comparison, 64 hex characters)
         """
-        # Include basic identity fields, address identity fields, and comparison fields
-        # This ensures fingerprint captures ALL important store attributes
-        fields_to_hash = self.IDENTITY_FIELDS + self.ADDRESS_IDENTITY_FIELDS + self.COMPARISON_FIELDS
-        # Remove duplicates while preserving order
-        seen = set()
-        unique_fields = []
-        for field in fields_to_hash:
-            if field not in seen:
-                seen.add(field)
-                unique_fields.append(field)
-
-        # Normalize postal code field (some scrapers use 'zip', others 'postal_code')
-        data = {}
-        for k in unique_fields:
-            if k == 'zip':
-                data[k] = store.get('zip') or store.get('postal_code', '')
-            elif k in store:
-                data[k] = store.get(k, '')
+        return _digest(_FIELD_ENCODER.encode(self._project(store, self._fingerprint_fields)))
+
+    def compute_fingerprints(self, stores: List[Dict[str, Any]]) -> List[str]:
+        """Compute fingerprints for a batch of stores.
+
+        Same result as compute_fingerprint() per store, with the field tuple,
+        encoder and hash function bound once for the whole batch.
 
-        # Sort keys for consistent hashing
-        json_str = json.dumps(data, sort_keys=True)
-        return hashlib.sha256(json_str.encode()).hexdigest()
+        Args:
+            stores: List of store dictionaries
+
+        Returns:
+            Fingerprints in the order of `stores`
+        """
+        fields = self._fingerprint_fields
+        project = self._project
+        encode = _FIELD_ENCODER.encode
+        return [_digest(encode(project(store, fields))) for store in stores]
 
     def rotate_previous(self) -> bool:
         """Rotate stores_latest.json to stores_previous.json BEFORE change detection (#122).
@@ -308,17 +352,36 @@ class ChangeDetector:
         This ensures change detection compares against Run N-1 (not N-2).
         Must be called before detect_changes() for correct comparison.
 
+        Rotation hard-links stores_latest.json under a temporary name and
+        renames that over stores_previous.json, so it costs the same for any
+        file size and stores_previous.json is never partially written. Both
+        names then share one file until the next stores_latest.json is renamed
+        into place, which is why every writer of stores_latest.json must
+        replace it rather than rewrite it in place.
+
         Returns:
             True if rotation occurred, False if no latest file exists
         """
         latest_path = self.output_dir / "stores_latest.json"
         previous_path = self.output_dir / "stores_previous.json"
 
-        if latest_path.exists():
-            shutil.copy2(latest_path, previous_path)
-            logging.debug(f"[{self.retailer}] Rotated stores_latest.json → stores_previous.json")
-            return True
-        return False
+        if not latest_path.exists():
+            return False
+
+        temp_path = previous_path.with_name(f".{previous_path.name}.rotating")
+        temp_path.unlink(missing_ok=True)
+        try:
+            try:
+                os.link(latest_path, temp_path)
+            except OSError:
+                # Filesystem without hard links: fall back to a full copy
+                shutil.copy2(latest_path, temp_path)
+            os.replace(temp_path, previous_path)
+        except BaseException:
+            temp_path.unlink(missing_ok=True)
+            raise
+        logging.debug(f"[{self.retailer}] Rotated stores_latest.json → stores_previous.json")
+        return True
 
     def _load_stores_streaming(self, filepath: Path) -> Iterator[Dict[str, Any]]:
         """Load stores incrementally using ijson for memory efficiency (#65).
@@ -379,15 +442,28 @@ class ChangeDetector:
         """
         Detect changes between current stores and previous run.
 
+        When the fingerprint index saved by the previous run still matches
+        stores_previous.json, only the index is loaded and the full records
+        of modified and closed stores are read by offset; otherwise the
+        previous data file is loaded and indexed.
+
         Args:
             current_stores: List of store dictionaries from current run
 
         Returns:
             ChangeReport with lists of new, closed, and modified stores
         """
-        previous_stores = self.load_previous_data()
         timestamp = datetime.now().isoformat()
 
+        index = self._load_fingerprint_index()
+        if index is not None:
+            try:
+                return self._detect_changes_indexed(current_stores, index, timestamp)
+            except (OSError, ValueError, KeyError, TypeError) as e:
+                logging.warning(f"[{self.retailer}] Fingerprint index unusable ({e}), loading previous data")
+
+        previous_stores = self.load_previous_data()
+
         if previous_stores is None:
             # First run - all stores are "new"
             logging.info(f"No previous data found for {self.retailer} - treating as first run")
@@ -408,45 +484,153 @@ class ChangeDetector:
         previous_by_key, previous_fingerprints, prev_collisions = self._build_store_index(previous_stores)
         current_by_key, current_fingerprints, curr_collisions = self._build_store_index(current_stores)
 
-        # Detect changes
+        new_stores, modified_keys, closed_keys, unchanged_count = self._diff_fingerprints(
+            current_by_key, current_fingerprints, previous_fingerprints
+        )
+
+        # Get previous run timestamp
+        previous_run = None
+        if previous_stores and previous_stores[0].get('scraped_at'):
+            previous_run = previous_stores[0]['scraped_at']
+
+        return ChangeReport(
+            retailer=self.retailer,
+            timestamp=timestamp,
+            previous_run=previous_run,
+            current_run=timestamp,
+            total_previous=len(previous_stores),
+            total_current=len(current_stores),
+            new_stores=new_stores,
+            closed_stores=[previous_by_key[key] for key in closed_keys],
+            modified_stores=[
+                {
+                    'current': current_by_key[key],
+                    'previous': previous_by_key[key],
+                    'changes': self._get_field_changes(previous_by_key[key], current_by_key[key])
+                }
+                for key in modified_keys
+            ],
+            unchanged_count=unchanged_count
+        )
+
+    def _diff_fingerprints(
+        self,
+        current_by_key: Dict[str, Dict[str, Any]],
+        current_fingerprints: Dict[str, str],
+        previous_fingerprints: Dict[str, str]
+    ) -> Tuple[List[Dict[str, Any]], List[str], List[str], int]:
+        """Compare current stores against previous key->fingerprint map.
+
+        Returns:
+            Tuple of (new stores, modified keys, closed keys, unchanged count)
+        """
         new_stores = []
-        closed_stores = []
-        modified_stores = []
+        modified_keys = []
         unchanged_count = 0
 
         # Find new and modified stores
         for key, store in current_by_key.items():
-            if key not in previous_by_key:
+            previous_fingerprint = previous_fingerprints.get(key)
+            if previous_fingerprint is None:
                 new_stores.append(store)
-            elif current_fingerprints[key] != previous_fingerprints.get(key):
-                modified_stores.append({
-                    'current': store,
-                    'previous': previous_by_key[key],
-                    'changes': self._get_field_changes(previous_by_key[key], store)
-                })
+            elif current_fingerprints[key] != previous_fingerprint:
+                modified_keys.append(key)
             else:
                 unchanged_count += 1
 
         # Find closed stores
-        for key, store in previous_by_key.items():
-            if key not in current_by_key:
-                closed_stores.append(store)
+        closed_keys = [key for key in previous_fingerprints if key not in current_by_key]
 
-        # Get previous run timestamp
-        previous_run = None
-        if previous_stores and previous_stores[0].get('scraped_at'):
-            previous_run = previous_stores[0]['scraped_at']
+        return new_stores, modified_keys, closed_keys, unchanged_count
+
+    def _load_fingerprint_index(self) -> Optional[Dict[str, Any]]:
+        """Load the previous run's fingerprint index if it describes stores_previous.json.
+
+        The index records the size and mtime of stores_latest.json when it was
+        saved; rotate_previous() copies the file with its metadata, so a match
+        means stores_previous.json is the data the index was built from. An
+        index from older code, or one left behind by a non-incremental run
+        that rewrote the data file, is ignored.
+        """
+        previous_path = self.output_dir / "stores_previous.json"
+        if not (previous_path.exists() and self.fingerprints_path.exists() and self.records_path.exists()):
+            return None
+
+        try:
+            with open(self.fingerprints_path, 'r', encoding='utf-8') as f:
+                index = json.load(f)
+            stat = previous_path.stat()
+        except (OSError, ValueError) as e:
+            logging.debug(f"[{self.retailer}] Could not read fingerprint index: {e}")
+            return None
+
+        source = index.get('source') or {}
+        if (index.get('version') != self.INDEX_VERSION
+                or 'offsets' not in index
+                or source.get('size') != stat.st_size
+                or source.get('mtime_ns') != stat.st_mtime_ns):
+            logging.debug(f"[{self.retailer}] Fingerprint index does not match stores_previous.json")
+            return None
+        return index
+
+    def _read_indexed_records(self, offsets: Dict[str, List[int]], keys: List[str]) -> Dict[str, Dict[str, Any]]:
+        """Read the full previous records for `keys` from the records file by offset.
+
+        Raises:
+            ValueError: If a record at an indexed offset belongs to another key
+        """
+        records = {}
+        with open(self.records_path, 'rb') as f:
+            # Read in file order so the seeks only move forward
+            for key in sorted(keys, key=lambda k: offsets[k][0]):
+                offset, length = offsets[key]
+                f.seek(offset)
+                record = json.loads(f.read(length))
+                if record.get('key') != key:
+                    raise ValueError(f"record at offset {offset} is not '{key}'")
+                records[key] = record['store']
+        return records
+
+    def _detect_changes_indexed(
+        self,
+        current_stores: List[Dict[str, Any]],
+        index: Dict[str, Any],
+        timestamp: str
+    ) -> ChangeReport:
+        """Detect changes against a persisted fingerprint index.
+
+        Only the current stores are indexed; previous records are read from
+        disk for modified and closed stores only.
+        """
+        previous_fingerprints = index['fingerprints']
+        current_by_key, current_fingerprints, _ = self._build_store_index(current_stores)
+
+        new_stores, modified_keys, closed_keys, unchanged_count = self._diff_fingerprints(
+            current_by_key, current_fingerprints, previous_fingerprints
+        )
+        previous = self._read_indexed_records(index['offsets'], modified_keys + closed_keys)
+        logging.info(
+            f"[{self.retailer}] Change detection used fingerprint index "
+            f"({len(previous)} of {len(previous_fingerprints)} previous records read)"
+        )
 
         return ChangeReport(
             retailer=self.retailer,
             timestamp=timestamp,
-            previous_run=previous_run,
+            previous_run=index.get('previous_run'),
             current_run=timestamp,
-            total_previous=len(previous_stores),
+            total_previous=index.get('total', len(previous_fingerprints)),
             total_current=len(current_stores),
             new_stores=new_stores,
-            closed_stores=closed_stores,
-            modified_stores=modified_stores,
+            closed_stores=[previous[key] for key in closed_keys],
+            modified_stores=[
+                {
+                    'current': current_by_key[key],
+                    'previous': previous[key],
+                    'changes': self._get_field_changes(previous[key], current_by_key[key])
+                }
+                for key in modified_keys
+            ],
             unchanged_count=unchanged_count
         )
 
@@ -471,14 +655,14 @@ class ChangeDetector:
         """Save stores to stores_latest.json without rotation (#122).
 
         Use this after calling rotate_previous() + detect_changes() to avoid
-        double rotation.
+        double rotation. The file is written to a temporary path and renamed
+        into place, so an interrupted write leaves the old file intact.
 
         Args:
             stores: List of store dictionaries to save
         """
         latest_path = self.output_dir / "stores_latest.json"
-        with open(latest_path, 'w', encoding='utf-8') as f:
-            json.dump(stores, f, indent=2, ensure_ascii=False)
+        self._write_stores(latest_path, stores)
         logging.info(f"[{self.retailer}] Saved {len(stores)} stores to {latest_path}")
 
     def save_version(self, stores: List[Dict[str, Any]]) -> None:
@@ -492,18 +676,23 @@ class ChangeDetector:
         use save_latest() instead to avoid double rotation (#122).
         """
         latest_path = self.output_dir / "stores_latest.json"
-        previous_path = self.output_dir / "stores_previous.json"
 
         # Rotate: latest -> previous
-        if latest_path.exists():
-            shutil.copy2(latest_path, previous_path)
+        if self.rotate_previous():
             logging.info(f"Rotated previous version for {self.retailer}")
 
         # Write new latest
-        with open(latest_path, 'w', encoding='utf-8') as f:
-            json.dump(stores, f, indent=2, ensure_ascii=False)
+        self._write_stores(latest_path, stores)
         logging.info(f"Saved {len(stores)} stores to {latest_path}")
 
+    def _write_stores(self, path: Path, stores: List[Dict[str, Any]]) -> None:
+        """Atomically write a store list as indented (or compact) JSON."""
+        with self._atomic_write(path, 'w', encoding='utf-8') as f:
+            if self.compact:
+                json.dump(stores, f, ensure_ascii=False, separators=(',', ':'))
+            else:
+                json.dump(stores, f, indent=2, ensure_ascii=False)
+
     def save_change_report(self, report: ChangeReport) -> str:
         """Save change report to history directory"""
         timestamp = datetime.now().strftime("%Y-%m-%d_%H-%M-%S-%f")
@@ -517,19 +706,59 @@ class ChangeDetector:
         return str(filepath)
 
     def save_fingerprints(self, stores: List[Dict[str, Any]]) -> None:
-        """Save fingerprints for current stores.
+        """Save the fingerprint index for current stores.
 
         Uses _build_store_index for consistent collision handling (#2 review feedback).
         This ensures fingerprints use the same keys as change detection.
+
+        Alongside fingerprints.json (key -> fingerprint, plus key -> byte
+        offset/length), every store is written as one line of
+        fingerprint_records.jsonl, so the next run can read just the records
+        of stores that changed. Call this after stores_latest.json has been
+        written: the index records that file's size and mtime to recognize
+        it after rotation.
         """
         # Use _build_store_index for consistent collision handling
-        _, fingerprints, _ = self._build_store_index(stores)
+        stores_by_key, fingerprints, _ = self._build_store_index(stores)
 
-        with open(self.fingerprints_path, 'w', encoding='utf-8') as f:
+        offsets = {}
+        position = 0
+        with self._atomic_write(self.records_path, 'wb') as f:
+            for key, store in stores_by_key.items():
+                line = (json.dumps({'key': key, 'store': store}, ensure_ascii=False, default=str) + '\n').encode('utf-8')
+                f.write(line)
+                offsets[key] = [position, len(line)]
+                position += len(line)
+
+        latest_path = self.output_dir / "stores_latest.json"
+        source = None
+        if latest_path.exists():
+            stat = latest_path.stat()
+            source = {'size': stat.st_size, 'mtime_ns': stat.st_mtime_ns}
+
+        with self._atomic_write(self.fingerprints_path, 'w', encoding='utf-8') as f:
             json.dump({
+                'version': self.INDEX_VERSION,
                 'timestamp': datetime.now().isoformat(),
                 'count': len(fingerprints),
-                'fingerprints': fingerprints
-            }, f, indent=2)
+                'total': len(stores),
+                'previous_run': stores[0].get('scraped_at') if stores else None,
+                'source': source,
+                'fingerprints': fingerprints,
+                'offsets': offsets,
+            }, f, separators=(',', ':'))
 
         logging.info(f"Saved {len(fingerprints)} fingerprints for {self.retailer}")
+
+    @staticmethod
+    @contextmanager
+    def _atomic_write(path: Path, mode: str, **kwargs: Any) -> Iterator[Any]:
+        """Open a temp file next to `path` and move it into place on success."""
+        temp_path = path.with_name(f".{path.name}.partial")
+        try:
+            with open(temp_path, mode, **kwargs) as f:
+                yield f
+            os.replace(temp_path, path)
+        except BaseException:
+            temp_path.unlink(missing_ok=True)
+            raise
@@ -7,10 +7,12 @@ import defusedxml.ElementTree as ET
 from datetime import datetime
 from dataclasses import dataclass, asdict
 from typing import List, Optional, Dict, Any, Tuple
-from bs4 import BeautifulSoup
 import requests
 from config import att_config
 from src.shared import utils
+from src.shared.cache_interface import RevalidationCache
+from src.shared.html_extract import extract_json_ld, find_json_ld
+from src.shared.incremental import sitemap_lastmods
 from src.shared.request_counter import RequestCounter, check_pause_logic
 from src.shared.scrape_runner import ScrapeRunner, ScraperContext
 
@@ -104,7 +106,8 @@ def get_store_urls_from_sitemap(
     session: requests.Session,
     retailer: str = 'att',
     yaml_config: dict = None,
-    request_counter: RequestCounter = None
+    request_counter: RequestCounter = None,
+    lastmods: Optional[Dict[str, str]] = None
 ) -> List[str]:
     """Fetch all store URLs from the AT&T sitemap.
 
@@ -113,13 +116,18 @@ def get_store_urls_from_sitemap(
         retailer: Retailer name for logging
         yaml_config: Retailer configuration from retailers.yaml
         request_counter: Optional RequestCounter instance for tracking requests
+        lastmods: Optional dict filled with each URL's sitemap <lastmod> (incremental runs)
 
     Returns:
         List of store URLs (filtered to only those ending in numeric IDs)
     """
     logging.info(f"[{retailer}] Fetching sitemap from {att_config.SITEMAP_URL}")
 
-    response = utils.get_with_retry(session, att_config.SITEMAP_URL)
+    response = utils.get_with_retry(
+        session,
+        att_config.SITEMAP_URL,
+        revalidation_cache=RevalidationCache.for_retailer(retailer)
+    )
     if not response:
         logging.error(f"[{retailer}] Failed to fetch sitemap")
         return []
@@ -142,6 +150,9 @@ def get_store_urls_from_sitemap(
 
         logging.info(f"[{retailer}] Found {len(all_urls)} total URLs in sitemap")
 
+        if lastmods is not None:
+            lastmods.update(sitemap_lastmods(root))
+
         # Filter to only store URLs (ending in numeric ID)
         store_urls = []
         for url in all_urls:
@@ -192,35 +203,36 @@ def extract_store_details(
         current_count = request_counter.increment()
         check_pause_logic(request_counter, retailer=retailer, config=yaml_config, current_count=current_count)
 
-    try:
-        soup = BeautifulSoup(response.text, 'html.parser')
+    return parse_store_page(response.text, url, retailer)
+
+
+def parse_store_page(html: str, url: str, retailer: str = 'att') -> Optional[ATTStore]:
+    """Parse store data from the HTML of a single AT&T store page.
 
+    Args:
+        html: Raw HTML content of the store page
+        url: Store page URL
+        retailer: Retailer name for logging
+
+    Returns:
+        ATTStore object if successful, None otherwise
+    """
+    try:
         # Extract store type (COR/Dealer) and dealer name from HTML
-        sub_channel, dealer_name = _extract_store_type_and_dealer(response.text)
+        sub_channel, dealer_name = _extract_store_type_and_dealer(html)
 
-        # Find all JSON-LD script tags (there may be multiple)
-        scripts = soup.find_all('script', type='application/ld+json')
-        if not scripts:
+        # Scan the JSON-LD blocks (there may be multiple) without building a DOM
+        objects = extract_json_ld(html)
+        if not objects:
             logging.warning(f"[{retailer}] No JSON-LD found for {url}")
             return None
 
-        # Try each script until we find a MobilePhoneStore
-        data = None
-        for script in scripts:
-            try:
-                script_data = json.loads(script.string)
-                if script_data.get('@type') == 'MobilePhoneStore':
-                    data = script_data
-                    break
-            except json.JSONDecodeError as e:
-                logging.debug(f"[{retailer}] Failed to parse JSON-LD script for {url}: {e}")
-                continue
+        data = find_json_ld(html, 'MobilePhoneStore', objects=objects)
 
         # If no MobilePhoneStore found, log and return None
         if not data:
-            if scripts:
-                first_type = json.loads(scripts[0].string).get('@type', 'Unknown') if scripts[0].string else 'Unknown'
-                logging.debug(f"[{retailer}] Skipping {url}: No MobilePhoneStore found (first @type: '{first_type}')")
+            first_type = objects[0].get('@type', 'Unknown')
+            logging.debug(f"[{retailer}] Skipping {url}: No MobilePhoneStore found (first @type: '{first_type}')")
             return None
 
         # Extract store ID from URL
@@ -368,7 +380,9 @@ def run(session, config: dict, **kwargs) -> dict:
         resume=kwargs.get('resume', False),
         limit=kwargs.get('limit'),
         refresh_urls=kwargs.get('refresh_urls', False),
-        use_rich_cache=False  # AT&T uses simple URL cache
+        use_rich_cache=False,  # AT&T uses simple URL cache
+        store_sink=kwargs.get('store_sink'),
+        incremental=kwargs.get('incremental', False),
     )
 
     # Create and run scraper with unified orchestration
@@ -377,5 +391,48 @@ def run(session, config: dict, **kwargs) -> dict:
     return runner.run_with_checkpoints(
         url_discovery_func=get_store_urls_from_sitemap,
         extraction_func=extract_store_details,
-        item_key_func=lambda url: url  # Use URL as unique key
+        item_key_func=lambda url: url,  # Use URL as unique key
+        parse_func=parse_store_page  # Used when the retailer sets parse_processes
+    )
+
+
+async def run_async(session, config: dict, **kwargs) -> dict:
+    """Asyncio entry point, used when the retailer enables `async_engine`.
+
+    Discovery is identical to run(); store pages are fetched concurrently
+    through the shared asyncio engine and parsed with parse_store_page().
+
+    Args:
+        session: Configured session (used for sitemap discovery)
+        config: Retailer configuration dict from retailers.yaml
+        **kwargs: Same options as run()
+
+    Returns:
+        dict with keys:
+            - stores: List[dict] - Scraped store data
+            - count: int - Number of stores processed
+            - checkpoints_used: bool - Whether resume was used
+    """
+    retailer_name = kwargs.get('retailer', 'att')
+
+    reset_request_counter()
+
+    context = ScraperContext(
+        retailer=retailer_name,
+        session=session,
+        config=config,
+        resume=kwargs.get('resume', False),
+        limit=kwargs.get('limit'),
+        refresh_urls=kwargs.get('refresh_urls', False),
+        use_rich_cache=False,
+        store_sink=kwargs.get('store_sink'),
+        incremental=kwargs.get('incremental', False),
+    )
+
+    runner = ScrapeRunner(context)
+
+    return await runner.run_with_checkpoints_async(
+        url_discovery_func=get_store_urls_from_sitemap,
+        parse_func=parse_store_page,
+        item_key_func=lambda url: url
     )
@@ -19,7 +19,11 @@ from bs4 import BeautifulSoup
 from config import bell_config
 from src.shared import utils
 from src.shared.cache import URLCache
+from src.shared.cache_interface import RevalidationCache
+from src.shared.html_extract import extract_json_ld, find_json_ld, make_soup
+from src.shared.incremental import IncrementalState, sitemap_lastmods
 from src.shared.request_counter import RequestCounter, check_pause_logic
+from src.shared.scrape_runner import ScrapeRunner, ScraperContext
 
 
 # Global request counter
@@ -158,7 +162,8 @@ def get_request_count() -> int:
 def get_store_urls_from_sitemap(
     session,
     retailer: str = 'bell',
-    yaml_config: dict = None
+    yaml_config: dict = None,
+    lastmods: Optional[Dict[str, str]] = None
 ) -> List[str]:
     """Fetch all store URLs from the Bell sitemap.
 
@@ -166,13 +171,18 @@ def get_store_urls_from_sitemap(
         session: Requests session object
         retailer: Retailer name for logging
         yaml_config: Retailer configuration from retailers.yaml
+        lastmods: Optional dict filled with each URL's sitemap <lastmod> (incremental runs)
 
     Returns:
         List of store URLs (filtered to only those with BE### store IDs)
     """
     logging.info(f"[{retailer}] Fetching sitemap from {bell_config.SITEMAP_URL}")
 
-    response = utils.get_with_retry(session, bell_config.SITEMAP_URL)
+    response = utils.get_with_retry(
+        session,
+        bell_config.SITEMAP_URL,
+        revalidation_cache=RevalidationCache.for_retailer(retailer)
+    )
     if not response:
         logging.error(f"[{retailer}] Failed to fetch sitemap")
         return []
@@ -194,6 +204,9 @@ def get_store_urls_from_sitemap(
 
         logging.info(f"[{retailer}] Found {len(all_urls)} total URLs in sitemap")
 
+        if lastmods is not None:
+            lastmods.update(sitemap_lastmods(root))
+
         # Filter to only store URLs (containing /BE followed by digits)
         store_pattern = re.compile(bell_config.STORE_URL_PATTERN)
         store_urls = [url for url in all_urls if store_pattern.search(url)]
@@ -237,32 +250,35 @@ def extract_store_details(
     _request_counter.increment()
     check_pause_logic(_request_counter, retailer=retailer, config=yaml_config)
 
-    try:
-        soup = BeautifulSoup(response.text, 'html.parser')
+    return parse_store_page(response.text, url, retailer)
+
+
+def parse_store_page(html: str, url: str, retailer: str = 'bell') -> Optional[BellStore]:
+    """Parse store data from the HTML of a single Bell store page.
+
+    Args:
+        html: Raw HTML content of the store page
+        url: Store page URL
+        retailer: Retailer name for logging
 
-        # Find JSON-LD script with LocalBusiness schema
-        scripts = soup.find_all('script', type='application/ld+json')
-        if not scripts:
+    Returns:
+        BellStore object if successful, None otherwise
+    """
+    try:
+        # Find JSON-LD script with LocalBusiness schema (no DOM needed yet)
+        objects = extract_json_ld(html)
+        if not objects:
             logging.warning(f"[{retailer}] No JSON-LD found for {url}")
             return None
 
-        # Find LocalBusiness schema
-        data = None
-        for script in scripts:
-            try:
-                if not script.string:
-                    continue
-                script_data = json.loads(script.string)
-                if script_data.get('@type') == 'LocalBusiness':
-                    data = script_data
-                    break
-            except (json.JSONDecodeError, TypeError):
-                continue
-
+        data = find_json_ld(html, 'LocalBusiness', objects=objects)
         if not data:
             logging.debug(f"[{retailer}] No LocalBusiness schema found for {url}")
             return None
 
+        # Services and curbside pickup are only in the markup
+        soup = make_soup(html)
+
         # Extract store ID from URL (e.g., BE516)
         store_id_match = re.search(r'(BE\d+)$', data.get('url', url))
         store_id = store_id_match.group(1) if store_id_match else ''
@@ -327,6 +343,7 @@ def run(session, config: dict, **kwargs) -> dict:
             - resume: bool - Resume from checkpoint
             - limit: int - Max stores to process
             - refresh_urls: bool - Force URL re-discovery (ignore cache)
+            - incremental: bool - Only fetch URLs whose sitemap <lastmod> changed
 
     Returns:
         dict with keys:
@@ -341,6 +358,7 @@ def run(session, config: dict, **kwargs) -> dict:
         limit = kwargs.get('limit')
         resume = kwargs.get('resume', False)
         refresh_urls = kwargs.get('refresh_urls', False)
+        incremental = IncrementalState(retailer_name) if kwargs.get('incremental', False) else None
 
         reset_request_counter()
 
@@ -364,15 +382,18 @@ def run(session, config: dict, **kwargs) -> dict:
                 logging.info(f"[{retailer_name}] Resuming from checkpoint: {len(stores)} stores already collected")
                 checkpoints_used = True
 
-        # Try to load cached URLs
+        # Try to load cached URLs (incremental runs rediscover to get fresh <lastmod>)
         url_cache = URLCache(retailer_name)
         store_urls = None
-        if not refresh_urls:
+        if not refresh_urls and not incremental:
             store_urls = url_cache.get()
 
         if store_urls is None:
             # Cache miss - fetch from sitemap
-            store_urls = get_store_urls_from_sitemap(session, retailer_name, yaml_config=config)
+            store_urls = get_store_urls_from_sitemap(
+                session, retailer_name, yaml_config=config,
+                lastmods=incremental.lastmods if incremental else None
+            )
             logging.info(f"[{retailer_name}] Found {len(store_urls)} store URLs from sitemap")
 
             if store_urls:
@@ -384,6 +405,11 @@ def run(session, config: dict, **kwargs) -> dict:
             logging.warning(f"[{retailer_name}] No store URLs found")
             return {'stores': [], 'count': 0, 'checkpoints_used': False}
 
+        # Incremental: only fetch new/changed URLs, carry unchanged stores forward
+        carried = []
+        if incremental:
+            store_urls, carried = incremental.plan(store_urls, completed=completed_urls)
+
         remaining_urls = [url for url in store_urls if url not in completed_urls]
 
         if resume and completed_urls:
@@ -397,6 +423,10 @@ def run(session, config: dict, **kwargs) -> dict:
             else:
                 remaining_urls = []
 
+        for url, store_data in carried:
+            stores.append(store_data)
+            completed_urls.add(url)
+
         total_to_process = len(remaining_urls)
         if total_to_process > 0:
             logging.info(f"[{retailer_name}] Extracting details for {total_to_process} stores")
@@ -445,6 +475,9 @@ def run(session, config: dict, **kwargs) -> dict:
 
         logging.info(f"[{retailer_name}] Completed: {len(stores)} stores scraped")
 
+        if incremental:
+            incremental.save(stores)
+
         return {
             'stores': stores,
             'count': len(stores),
@@ -454,3 +487,49 @@ def run(session, config: dict, **kwargs) -> dict:
     except Exception as e:
         logging.error(f"[{retailer_name}] Fatal error: {e}", exc_info=True)
         raise
+
+
+async def run_async(session, config: dict, **kwargs) -> dict:
+    """Asyncio entry point, used when the retailer enables `async_engine`.
+
+    Discovery is identical to run(); store pages are fetched through the
+    shared asyncio engine and parsed with parse_store_page().
+
+    Args:
+        session: Configured session (used for sitemap discovery)
+        config: Retailer configuration dict from retailers.yaml
+        **kwargs: Same options as run()
+
+    Returns:
+        dict with keys:
+            - stores: List[dict] - Scraped store data
+            - count: int - Number of stores processed
+            - checkpoints_used: bool - Whether resume was used
+    """
+    retailer_name = kwargs.get('retailer', 'bell')
+
+    reset_request_counter()
+
+    context = ScraperContext(
+        retailer=retailer_name,
+        session=session,
+        config=config,
+        resume=kwargs.get('resume', False),
+        limit=kwargs.get('limit'),
+        refresh_urls=kwargs.get('refresh_urls', False),
+        use_rich_cache=False,
+        store_sink=kwargs.get('store_sink'),
+        incremental=kwargs.get('incremental', False),
+    )
+
+    runner = ScrapeRunner(context)
+    # Bell requires conservative rate limiting, so only go wide when configured to
+    runner.async_concurrency = config.get('async_concurrency', runner.parallel_workers)
+
+    return await runner.run_with_checkpoints_async(
+        url_discovery_func=lambda session, retailer, yaml_config=None, lastmods=None, **_: get_store_urls_from_sitemap(
+            session, retailer, yaml_config=yaml_config, lastmods=lastmods
+        ),
+        parse_func=parse_store_page,
+        item_key_func=lambda url: url
+    )
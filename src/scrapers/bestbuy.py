@@ -7,6 +7,7 @@ import logging
 import re
 import threading
 import time
+import defusedxml.ElementTree as ET
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
 from dataclasses import dataclass, asdict
@@ -18,9 +19,12 @@ import requests
 from config import bestbuy_config
 from src.shared import utils
 from src.shared.cache import URLCache, DEFAULT_CACHE_EXPIRY_DAYS
+from src.shared.cache_interface import RevalidationCache
 from src.shared.constants import WORKERS
+from src.shared.incremental import IncrementalState, sitemap_lastmods
 from src.shared.request_counter import RequestCounter, check_pause_logic
-from src.shared.session_factory import create_session_factory
+from src.shared.scrape_runner import ScrapeRunner, ScraperContext
+from src.shared.session_factory import create_session_pool, release_session
 
 
 # Global request counter
@@ -338,7 +342,9 @@ def _looks_like_service_name(text: str) -> bool:
 def get_all_store_ids(
     session: requests.Session,
     min_delay: float = None,
-    max_delay: float = None
+    max_delay: float = None,
+    retailer: str = 'bestbuy',
+    lastmods: Optional[Dict[str, str]] = None
 ) -> List[Dict[str, Any]]:
     """Extract all store URLs from Best Buy's sitemap.
 
@@ -346,6 +352,8 @@ def get_all_store_ids(
         session: Requests session object
         min_delay: Minimum delay between requests
         max_delay: Maximum delay between requests
+        retailer: Retailer name (keys the sitemap's revalidation cache)
+        lastmods: Optional dict filled with each URL's sitemap <lastmod> (incremental runs)
 
     Returns:
         List of store dictionaries with store_id and url
@@ -356,7 +364,8 @@ def get_all_store_ids(
         session,
         bestbuy_config.SITEMAP_URL,
         min_delay=min_delay,
-        max_delay=max_delay
+        max_delay=max_delay,
+        revalidation_cache=RevalidationCache.for_retailer(retailer)
     )
     if not response:
         logging.error(f"Failed to fetch sitemap: {bestbuy_config.SITEMAP_URL}")
@@ -373,6 +382,12 @@ def get_all_store_ids(
         url_pattern = r'<loc>(https://stores\.bestbuy\.com/[^<]+)</loc>'
         urls = re.findall(url_pattern, content)
 
+        if lastmods is not None:
+            try:
+                lastmods.update(sitemap_lastmods(ET.fromstring(response.content)))
+            except ET.ParseError as e:
+                logging.warning(f"[{retailer}] Could not read <lastmod> dates from sitemap: {e}")
+
         # Extract store IDs from URLs and create store dictionaries
         stores = []
         seen_urls = set()
@@ -470,8 +485,22 @@ def extract_store_details(
     _request_counter.increment()
     check_pause_logic(_request_counter, retailer='bestbuy', config=None)
 
+    return parse_store_page(response.text, url)
+
+
+def parse_store_page(html: str, url: str, retailer: str = 'bestbuy') -> Optional[BestBuyStore]:
+    """Build a BestBuyStore from a store page's JSON-LD.
+
+    Args:
+        html: Store page HTML
+        url: Store page URL
+        retailer: Retailer name (unused; matches ScrapeRunner's parse_func signature)
+
+    Returns:
+        BestBuyStore object if successful, None otherwise
+    """
     try:
-        soup = BeautifulSoup(response.text, 'html.parser')
+        soup = BeautifulSoup(html, 'html.parser')
 
         # Find JSON-LD structured data (similar to T-Mobile scraper)
         scripts = soup.find_all('script', type='application/ld+json')
@@ -679,12 +708,12 @@ def _extract_single_store_worker(
 ) -> Tuple[str, Optional[Dict[str, Any]], Optional[str]]:
     """Worker function for parallel store extraction.
 
-    Creates its own session for thread safety and extracts store details
-    from a single URL.
+    Uses this thread's session from session_factory (a SessionPool keeps it
+    warm across stores) and extracts store details from a single URL.
 
     Args:
         url: Store URL to extract
-        session_factory: Callable that creates session instances
+        session_factory: SessionPool or callable that creates session instances
         yaml_config: Retailer configuration
         retailer_name: Name of retailer for logging
         min_delay: Minimum delay between requests
@@ -709,9 +738,7 @@ def _extract_single_store_worker(
         logging.warning(f"[{retailer_name}] Error extracting {url}: {error_msg}")
         return (url, None, error_msg)
     finally:
-        # Clean up session resources
-        if hasattr(session, 'close'):
-            session.close()
+        release_session(session_factory, session)
 
 
 def _save_failed_extractions(
@@ -747,6 +774,44 @@ def _save_failed_extractions(
         logging.warning(f"[{retailer}] Failed to save failed extractions: {e}")
 
 
+def _run_batch(session, config: dict, retailer_name: str, **kwargs) -> dict:
+    """Scrape store pages as Web Scraper API batch jobs (`scraper_api_batch: true`).
+
+    Store pages are submitted in bulk through ScrapeRunner's push-pull
+    backend instead of parallel_workers blocking threads.
+
+    Args:
+        session: Session used for sitemap discovery
+        config: Retailer configuration dict (proxy mode web_scraper_api)
+        retailer_name: Retailer name
+        **kwargs: Options from run()
+
+    Returns:
+        Same dict as run()
+    """
+    context = ScraperContext(
+        retailer=retailer_name,
+        session=session,
+        config=config,
+        resume=kwargs.get('resume', False),
+        limit=kwargs.get('limit'),
+        refresh_urls=kwargs.get('refresh_urls', False),
+        store_sink=kwargs.get('store_sink'),
+        incremental=kwargs.get('incremental', False),
+    )
+    runner = ScrapeRunner(context)
+
+    return runner.run_with_checkpoints_batch(
+        url_discovery_func=lambda session, retailer, lastmods=None, **_: [
+            store['url']
+            for store in get_all_store_ids(session, retailer=retailer, lastmods=lastmods)
+            if store.get('url')
+        ],
+        parse_func=parse_store_page,
+        item_key_func=lambda url: url,
+    )
+
+
 def run(session, retailer_config: dict, retailer: str, **kwargs) -> dict:
     """Standard scraper entry point with parallel extraction and URL caching.
 
@@ -757,7 +822,7 @@ def run(session, retailer_config: dict, retailer: str, **kwargs) -> dict:
         **kwargs: Additional options
             - resume: bool - Resume from checkpoint
             - limit: int - Max stores to process
-            - incremental: bool - Only process changes
+            - incremental: bool - Only fetch URLs whose sitemap <lastmod> changed
             - refresh_urls: bool - Force URL re-discovery (ignore cache)
 
     Returns:
@@ -777,12 +842,17 @@ def run(session, retailer_config: dict, retailer: str, **kwargs) -> dict:
     """
     retailer_name = retailer
     config = retailer_config
+
+    if config.get('scraper_api_batch') and config.get('proxy', {}).get('mode') == 'web_scraper_api':
+        return _run_batch(session, config, retailer_name, **kwargs)
+
     logging.info(f"[{retailer_name}] Starting scrape run")
 
     try:
         limit = kwargs.get('limit')
         resume = kwargs.get('resume', False)
         refresh_urls = kwargs.get('refresh_urls', False)
+        incremental = IncrementalState(retailer_name) if kwargs.get('incremental', False) else None
 
         reset_request_counter()
 
@@ -820,11 +890,12 @@ def run(session, retailer_config: dict, retailer: str, **kwargs) -> dict:
                            f"{len(failed_urls)} failed URLs to retry")
                 checkpoints_used = True
 
-        # Try to load cached URLs (skip sitemap fetch if cache is valid)
+        # Try to load cached URLs (skip sitemap fetch if cache is valid; incremental
+        # runs rediscover to get fresh <lastmod> dates)
         url_cache_days = config.get('url_cache_days', DEFAULT_CACHE_EXPIRY_DAYS)
         url_cache = URLCache(retailer_name, expiry_days=url_cache_days)
         all_store_urls = None
-        if not refresh_urls:
+        if not refresh_urls and not incremental:
             all_store_urls = url_cache.get()
 
         if all_store_urls is None:
@@ -833,7 +904,9 @@ def run(session, retailer_config: dict, retailer: str, **kwargs) -> dict:
             store_list = get_all_store_ids(
                 session,
                 min_delay=min_delay,
-                max_delay=max_delay
+                max_delay=max_delay,
+                retailer=retailer_name,
+                lastmods=incremental.lastmods if incremental else None
             )
 
             if not store_list:
@@ -853,6 +926,11 @@ def run(session, retailer_config: dict, retailer: str, **kwargs) -> dict:
             logging.warning(f"[{retailer_name}] No store URLs available")
             return {'stores': [], 'count': 0, 'checkpoints_used': False}
 
+        # Incremental: only fetch new/changed URLs, carry unchanged stores forward
+        carried = []
+        if incremental:
+            all_store_urls, carried = incremental.plan(all_store_urls, completed=completed_urls)
+
         # Filter to remaining URLs (exclude already completed)
         remaining_urls = [url for url in all_store_urls if url not in completed_urls]
 
@@ -873,9 +951,15 @@ def run(session, retailer_config: dict, retailer: str, **kwargs) -> dict:
             else:
                 remaining_urls = []
 
+        for url, store_data in carried:
+            stores.append(store_data)
+            completed_urls.add(url)
+
         total_to_process = len(remaining_urls)
         if total_to_process == 0:
             logging.info(f"[{retailer_name}] No stores to process (all completed or limit reached)")
+            if incremental:
+                incremental.save(stores)
             return {
                 'stores': stores,
                 'count': len(stores),
@@ -891,15 +975,13 @@ def run(session, retailer_config: dict, retailer: str, **kwargs) -> dict:
         if parallel_workers > 1 and total_to_process > 0:
             logging.info(f"[{retailer_name}] Using parallel extraction with {parallel_workers} workers")
 
-            # Create session factory for thread-safe session creation
-            session_factory = create_session_factory(config)
-
             # Thread-safe counters for progress
             processed_count = [0]
             successful_count = [0]
             processed_lock = threading.Lock()
 
-            with ThreadPoolExecutor(max_workers=parallel_workers) as executor:
+            with create_session_pool(config) as session_factory, \
+                    ThreadPoolExecutor(max_workers=parallel_workers) as executor:
                 # Process in batches to limit memory usage
                 batch_size = config.get('extraction_batch_size', 500)
 
@@ -1048,6 +1130,9 @@ def run(session, retailer_config: dict, retailer: str, **kwargs) -> dict:
             f"{elapsed:.1f}s total ({avg_time:.2f}s/store)"
         )
 
+        if incremental:
+            incremental.save(stores)
+
         return {
             'stores': stores,
             'count': len(stores),
@@ -20,11 +20,12 @@ import re
 from dataclasses import dataclass, asdict
 from datetime import datetime, timezone
 from typing import List, Dict, Any, Optional, Set, Tuple
-from bs4 import BeautifulSoup
 
 from config import costco_config as config
 from src.shared import utils
-from src.shared.constants import TEST_MODE
+from src.shared.constants import GAP_FILL, TEST_MODE
+from src.shared.gap_fill import ZipGapFill
+from src.shared.html_extract import iter_script_blocks, make_soup
 from src.shared.proxy_client import ProxyClient, ProxyConfig, ProxyMode
 
 
@@ -177,12 +178,10 @@ def _extract_warehouses_from_page(html: str) -> List[Dict[str, Any]]:
         List of warehouse dictionaries
     """
     warehouses = []
-    soup = BeautifulSoup(html, 'html.parser')
 
-    # Try to find embedded JSON data first (React apps often embed state)
-    scripts = soup.find_all('script')
-    for script in scripts:
-        script_text = script.string or ''
+    # Try to find embedded JSON data first (React apps often embed state);
+    # the script scan needs no DOM, which is only built for the HTML fallback
+    for script_text in iter_script_blocks(html):
         # Look for warehouse data in script tags
         if 'warehouse' in script_text.lower() and 'locationId' in script_text:
             try:
@@ -208,6 +207,7 @@ def _extract_warehouses_from_page(html: str) -> List[Dict[str, Any]]:
 
     # If no JSON found, fall back to HTML parsing
     if not warehouses:
+        soup = make_soup(html)
         # Look for warehouse list items
         warehouse_containers = soup.find_all(
             ['div', 'li', 'article'],
@@ -268,7 +268,8 @@ def _fetch_by_zip_codes(
 ) -> List[Dict[str, Any]]:
     """Fetch warehouses by searching zip codes across the US.
 
-    Uses a grid of zip codes to discover all warehouses.
+    Searches a spread of zip codes concurrently through ZipGapFill, least
+    covered first, until every zip lies within an earlier search's radius.
 
     Args:
         proxy_client: ProxyClient instance
@@ -295,10 +296,8 @@ def _fetch_by_zip_codes(
         '96801',  # Hawaii
     ]
 
-    all_warehouses = {}
-
-    def search_zip(zip_code: str) -> List[Dict[str, Any]]:
-        """Search for warehouses near a zip code."""
+    def search_zip(zip_code: str) -> Optional[List[Dict[str, Any]]]:
+        """Search for warehouses near a zip code (None if the search failed)."""
         try:
             search_url = f"{config.LOCATIONS_URL}?input={zip_code}"
 
@@ -313,23 +312,20 @@ def _fetch_by_zip_codes(
                 return _extract_warehouses_from_page(response.text)
         except Exception as e:
             logger.debug(f"Error searching zip {zip_code}: {e}")
-        return []
-
-    # Search each zip code
-    for zip_code in sample_zips:
-        if limit and len(all_warehouses) >= limit:
-            break
-
-        warehouses = search_zip(zip_code)
-        for w in warehouses:
-            store_id = w.get('store_id')
-            if store_id and store_id not in all_warehouses:
-                all_warehouses[store_id] = w
-
-        min_delay, max_delay = utils.select_delays(retailer_config, kwargs.get('proxy_mode'))
-        utils.random_delay(min_delay, max_delay)
+        return None
 
-    return list(all_warehouses.values())
+    # ProxyClient.get draws rate-limit tokens itself, so no proxy_mode here
+    engine = ZipGapFill(
+        search=search_zip,
+        key_func=lambda w: w.get('store_id'),
+        coords_func=lambda w: (w.get('latitude'), w.get('longitude')),
+        radius_miles=retailer_config.get('zip_search_radius', config.ZIP_SEARCH_RADIUS_MILES),
+        zip_codes=sample_zips,
+        workers=retailer_config.get('gap_fill_workers', GAP_FILL.WORKERS),
+        patience=retailer_config.get('gap_fill_patience', GAP_FILL.PATIENCE),
+        limit=limit,
+    )
+    return list(engine.run().values())
 
 
 def run(session, retailer_config: Dict[str, Any], retailer: str, **kwargs) -> dict:
@@ -389,7 +385,7 @@ def run(session, retailer_config: Dict[str, Any], retailer: str, **kwargs) -> di
     else:
         proxy_config.mode = ProxyMode.DIRECT
 
-    proxy_client = ProxyClient(proxy_config)
+    proxy_client = ProxyClient(proxy_config, retailer=retailer_name)
 
     try:
         # Step 1: Fetch main locations page to discover warehouses
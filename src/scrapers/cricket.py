@@ -10,21 +10,31 @@ Approach:
 3. Deduplicate stores by store_id (thread-safe)
 4. Return normalized store data
 
+With search_mode "adaptive" the fixed grid is replaced by a quadtree search:
+coarse seed cells inside a US outline are queried with a radius covering the
+whole cell, and only cells whose response hits the per-call result cap are
+split into four and queried again. Cells that held at least that many stores
+in the previous run are split before querying.
+
 API: https://prod-cdn.us.yextapis.com/v2/accounts/me/search/query
 Expected results: ~13,588 stores (Cricket standalone + in-store retail partners)
 """
 
+import json
 import logging
+import math
 import threading
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from collections import defaultdict
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, as_completed, wait
 from dataclasses import dataclass, asdict
 from datetime import datetime
-from typing import List, Dict, Any, Optional, Set, Tuple
+from pathlib import Path
+from typing import List, Dict, Any, Iterable, Optional, Sequence, Set, Tuple
 
 from config import cricket_config as config
 from src.shared import utils
 from src.shared.constants import TEST_MODE
-from src.shared.session_factory import create_session_factory
+from src.shared.session_factory import create_session_pool, release_session
 
 
 @dataclass
@@ -102,6 +112,194 @@ def _generate_us_grid(spacing_miles: float = 50) -> List[Tuple[float, float]]:
     return grid_points
 
 
+# Miles per degree: latitude is constant, longitude is taken at mid-US
+# latitudes (~37°N), matching _generate_us_grid()
+_MILES_PER_DEGREE_LAT = 69.0
+_MILES_PER_DEGREE_LNG = 54.6
+
+
+@dataclass(frozen=True)
+class _SearchCell:
+    """Latitude/longitude rectangle covered by a single Yext query."""
+    lat_min: float
+    lat_max: float
+    lng_min: float
+    lng_max: float
+
+    @property
+    def center(self) -> Tuple[float, float]:
+        return (
+            round((self.lat_min + self.lat_max) / 2, 4),
+            round((self.lng_min + self.lng_max) / 2, 4),
+        )
+
+    @property
+    def height_miles(self) -> float:
+        return (self.lat_max - self.lat_min) * _MILES_PER_DEGREE_LAT
+
+    def radius_miles(self) -> int:
+        """Whole-mile search radius from the center that reaches every corner."""
+        # A degree of longitude is widest on the edge nearest the equator
+        widest_lat = min(abs(self.lat_min), abs(self.lat_max))
+        width = (self.lng_max - self.lng_min) * _MILES_PER_DEGREE_LAT * math.cos(math.radians(widest_lat))
+        return max(1, math.ceil(math.hypot(self.height_miles, width) / 2))
+
+    def contains(self, lat: float, lng: float) -> bool:
+        """Half-open containment, so a point belongs to exactly one sibling."""
+        return self.lat_min <= lat < self.lat_max and self.lng_min <= lng < self.lng_max
+
+    def can_split(self, min_cell_miles: float) -> bool:
+        return self.height_miles / 2 >= min_cell_miles
+
+    def split(self) -> List['_SearchCell']:
+        """Four equal quadrants."""
+        lat_mid = (self.lat_min + self.lat_max) / 2
+        lng_mid = (self.lng_min + self.lng_max) / 2
+        return [
+            _SearchCell(self.lat_min, lat_mid, self.lng_min, lng_mid),
+            _SearchCell(self.lat_min, lat_mid, lng_mid, self.lng_max),
+            _SearchCell(lat_mid, self.lat_max, self.lng_min, lng_mid),
+            _SearchCell(lat_mid, self.lat_max, lng_mid, self.lng_max),
+        ]
+
+
+def _point_in_polygon(lat: float, lng: float, polygon: Sequence[Tuple[float, float]]) -> bool:
+    """Ray-casting test for a (lat, lng) point against (lat, lng) vertices."""
+    inside = False
+    for (a_lat, a_lng), (b_lat, b_lng) in zip(polygon, polygon[-1:] + polygon[:-1]):
+        if (a_lat > lat) != (b_lat > lat):
+            crossing = a_lng + (lat - a_lat) * (b_lng - a_lng) / (b_lat - a_lat)
+            if lng < crossing:
+                inside = not inside
+    return inside
+
+
+def _segments_intersect(
+    p1: Tuple[float, float],
+    p2: Tuple[float, float],
+    q1: Tuple[float, float],
+    q2: Tuple[float, float]
+) -> bool:
+    """Whether segments p1-p2 and q1-q2 properly cross."""
+    def orientation(a, b, c):
+        return (b[0] - a[0]) * (c[1] - a[1]) - (b[1] - a[1]) * (c[0] - a[0])
+
+    d1 = orientation(q1, q2, p1)
+    d2 = orientation(q1, q2, p2)
+    d3 = orientation(p1, p2, q1)
+    d4 = orientation(p1, p2, q2)
+    return (d1 > 0) != (d2 > 0) and (d3 > 0) != (d4 > 0)
+
+
+def _cell_intersects_polygon(cell: _SearchCell, polygon: Sequence[Tuple[float, float]]) -> bool:
+    """Whether any part of the cell lies inside the polygon."""
+    corners = [
+        (cell.lat_min, cell.lng_min), (cell.lat_min, cell.lng_max),
+        (cell.lat_max, cell.lng_max), (cell.lat_max, cell.lng_min),
+    ]
+    if any(_point_in_polygon(lat, lng, polygon) for lat, lng in corners):
+        return True
+    if any(cell.contains(lat, lng) for lat, lng in polygon):
+        return True
+    polygon_edges = list(zip(polygon, polygon[1:] + polygon[:1]))
+    return any(
+        _segments_intersect(c1, c2, v1, v2)
+        for c1, c2 in zip(corners, corners[1:] + corners[:1])
+        for v1, v2 in polygon_edges
+    )
+
+
+def _load_prior_points(retailer: str) -> List[Tuple[float, float]]:
+    """Store coordinates from the previous run's stores_latest.json (empty if unavailable)."""
+    path = Path(f"data/{retailer}/output/stores_latest.json")
+    if not path.exists():
+        return []
+
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            stores = json.load(f)
+    except (OSError, ValueError) as e:
+        logging.warning(f"[{retailer}] Could not load previous stores for search seeding: {e}")
+        return []
+
+    points = []
+    for store in stores:
+        try:
+            points.append((float(store['latitude']), float(store['longitude'])))
+        except (KeyError, TypeError, ValueError):
+            continue
+    return points
+
+
+def _presplit_cell(
+    cell: _SearchCell,
+    points: List[Tuple[float, float]],
+    min_cell_miles: float,
+    polygon: Sequence[Tuple[float, float]]
+) -> List[_SearchCell]:
+    """Split a cell until no part held a full page of stores last run.
+
+    A cell containing MAX_RESULTS_PER_CALL known stores would saturate its
+    query, so its children are queried directly instead.
+    """
+    if len(points) < config.MAX_RESULTS_PER_CALL or not cell.can_split(min_cell_miles):
+        return [cell]
+
+    cells = []
+    for child in cell.split():
+        if _cell_intersects_polygon(child, polygon):
+            child_points = [point for point in points if child.contains(*point)]
+            cells.extend(_presplit_cell(child, child_points, min_cell_miles, polygon))
+    return cells
+
+
+def _generate_seed_cells(
+    cell_miles: float,
+    min_cell_miles: float,
+    prior_points: Iterable[Tuple[float, float]] = (),
+    polygon: Optional[Sequence[Tuple[float, float]]] = None
+) -> List[_SearchCell]:
+    """Tile US_BOUNDS with cells, drop those outside the polygon, pre-split dense ones.
+
+    Args:
+        cell_miles: Seed cell edge length in miles
+        min_cell_miles: Cells are never pre-split below this size
+        prior_points: (latitude, longitude) of stores seen in the previous run
+        polygon: (latitude, longitude) outline; cells not touching it are
+            skipped (default: US_LAND_POLYGON)
+
+    Returns:
+        Cells to query first
+    """
+    if polygon is None:
+        polygon = config.US_LAND_POLYGON
+    bounds = config.US_BOUNDS
+    lat_step = cell_miles / _MILES_PER_DEGREE_LAT
+    lng_step = cell_miles / _MILES_PER_DEGREE_LNG
+    rows = math.ceil((bounds['lat_max'] - bounds['lat_min']) / lat_step)
+    cols = math.ceil((bounds['lng_max'] - bounds['lng_min']) / lng_step)
+
+    # Bucket prior stores by seed cell so each cell only scans its own points
+    buckets: Dict[Tuple[int, int], List[Tuple[float, float]]] = defaultdict(list)
+    for lat, lng in prior_points:
+        row = math.floor((lat - bounds['lat_min']) / lat_step)
+        col = math.floor((lng - bounds['lng_min']) / lng_step)
+        if 0 <= row < rows and 0 <= col < cols:
+            buckets[(row, col)].append((lat, lng))
+
+    cells = []
+    for row in range(rows):
+        for col in range(cols):
+            lat_min = bounds['lat_min'] + row * lat_step
+            lng_min = bounds['lng_min'] + col * lng_step
+            cell = _SearchCell(lat_min, lat_min + lat_step, lng_min, lng_min + lng_step)
+            if _cell_intersects_polygon(cell, polygon):
+                cells.extend(_presplit_cell(cell, buckets.get((row, col), []), min_cell_miles, polygon))
+
+    logging.debug(f"Generated {len(cells)} seed cells at {cell_miles}-mile size")
+    return cells
+
+
 def _format_hours(hours_data: Dict[str, Any], day_key: str) -> str:
     """Format hours for a specific day from Yext hours data.
 
@@ -220,8 +418,9 @@ def _fetch_stores_at_point(
     session,
     lat: float,
     lng: float,
-    retailer: str = 'cricket'
-) -> List[Dict[str, Any]]:
+    retailer: str = 'cricket',
+    radius_miles: int = config.DEFAULT_SEARCH_RADIUS_MILES
+) -> Optional[List[Dict[str, Any]]]:
     """Fetch stores near a geographic point using Yext API.
 
     Args:
@@ -229,11 +428,13 @@ def _fetch_stores_at_point(
         lat: Latitude of search center
         lng: Longitude of search center
         retailer: Retailer name for logging
+        radius_miles: Search radius in miles
 
     Returns:
-        List of raw store data from API response
+        List of raw store data from API response, or None if the request
+        or the response parsing failed (an empty list means no stores)
     """
-    url = config.build_api_url(lat, lng)
+    url = config.build_api_url(lat, lng, radius_miles)
 
     response = utils.get_with_retry(
         session,
@@ -245,7 +446,7 @@ def _fetch_stores_at_point(
 
     if not response:
         logging.debug(f"[{retailer}] No response for point ({lat}, {lng})")
-        return []
+        return None
 
     try:
         data = response.json()
@@ -262,7 +463,7 @@ def _fetch_stores_at_point(
 
     except Exception as e:
         logging.warning(f"[{retailer}] Failed to parse response for ({lat}, {lng}): {e}")
-        return []
+        return None
 
 
 def _fetch_stores_worker(
@@ -272,12 +473,12 @@ def _fetch_stores_worker(
 ) -> Tuple[Tuple[float, float], List[CricketStore]]:
     """Worker function for parallel grid scanning.
 
-    Each worker creates its own session for thread safety and fetches
+    Each worker uses its own thread's session for thread safety and fetches
     stores at a single grid point.
 
     Args:
         point: (latitude, longitude) tuple
-        session_factory: Callable that creates session instances
+        session_factory: Session factory or SessionPool providing the worker's session
         retailer: Retailer name for logging
 
     Returns:
@@ -287,7 +488,7 @@ def _fetch_stores_worker(
     session = session_factory()
 
     try:
-        raw_stores = _fetch_stores_at_point(session, lat, lng, retailer)
+        raw_stores = _fetch_stores_at_point(session, lat, lng, retailer) or []
         parsed_stores = []
 
         for raw_store in raw_stores:
@@ -302,15 +503,241 @@ def _fetch_stores_worker(
         return (point, [])
 
     finally:
-        if hasattr(session, 'close'):
-            session.close()
+        release_session(session_factory, session)
+
+
+def _fetch_cell_worker(
+    cell: _SearchCell,
+    session_factory,
+    retailer: str
+) -> Tuple[_SearchCell, Optional[int], List[CricketStore]]:
+    """Worker function for the adaptive search.
+
+    Queries the cell's center with a radius covering the whole cell.
+
+    Args:
+        cell: Cell to search
+        session_factory: Session factory or SessionPool providing the worker's session
+        retailer: Retailer name for logging
+
+    Returns:
+        Tuple of (cell, raw_result_count, list_of_parsed_stores); the count
+        is None when the query failed, so an unsearched cell is never taken
+        for an empty one
+    """
+    lat, lng = cell.center
+    session = session_factory()
+
+    try:
+        raw_stores = _fetch_stores_at_point(session, lat, lng, retailer, radius_miles=cell.radius_miles())
+        if raw_stores is None:
+            return (cell, None, [])
+        parsed_stores = [store for store in map(_parse_store, raw_stores) if store]
+        return (cell, len(raw_stores), parsed_stores)
+
+    except Exception as e:
+        logging.warning(f"[{retailer}] Error in cell centered at ({lat}, {lng}): {e}")
+        return (cell, None, [])
+
+    finally:
+        release_session(session_factory, session)
+
+
+def _scan_grid(
+    session_pool,
+    retailer_config: dict,
+    retailer_name: str,
+    parallel_workers: int,
+    limit: Optional[int],
+    test_mode: bool
+) -> List[CricketStore]:
+    """Query every point of a fixed lattice over US_BOUNDS.
+
+    Returns:
+        Stores deduplicated by store_id
+    """
+    grid_spacing = retailer_config.get('grid_spacing_miles', config.DEFAULT_GRID_SPACING_MILES)
+
+    # Reduce grid for test mode (quick validation)
+    if test_mode:
+        grid_spacing = TEST_MODE.GRID_SPACING_MILES  # Fewer points for quick testing
+        logging.info(f"[{retailer_name}] Test mode: using {grid_spacing}-mile grid spacing")
+
+    # Generate grid points
+    grid_points = _generate_us_grid(grid_spacing)
+    total_points = len(grid_points)
+    logging.info(f"[{retailer_name}] Generated {total_points} grid points at {grid_spacing}-mile spacing")
+
+    # Thread-safe storage for deduplication
+    seen_ids: Set[str] = set()
+    all_stores: List[CricketStore] = []
+    lock = threading.Lock()
+
+    # Track progress
+    points_completed = [0]
+    progress_lock = threading.Lock()
+
+    # Parallel grid scanning
+    logging.info(f"[{retailer_name}] Scanning grid with {parallel_workers} parallel workers")
+
+    with ThreadPoolExecutor(max_workers=parallel_workers) as executor:
+        # Submit all grid points
+        futures = {
+            executor.submit(_fetch_stores_worker, point, session_pool, retailer_name): point
+            for point in grid_points
+        }
+
+        for future in as_completed(futures):
+            point, stores = future.result()
+
+            # Thread-safe deduplication and storage
+            with lock:
+                for store in stores:
+                    if store.store_id not in seen_ids:
+                        seen_ids.add(store.store_id)
+                        all_stores.append(store)
+
+                        # Check limit
+                        if limit and len(all_stores) >= limit:
+                            logging.info(f"[{retailer_name}] Reached limit of {limit} stores")
+                            # Cancel remaining futures
+                            for f in futures:
+                                f.cancel()
+                            break
+
+            # Progress logging
+            with progress_lock:
+                points_completed[0] += 1
+                if points_completed[0] % 100 == 0 or points_completed[0] == total_points:
+                    logging.info(
+                        f"[{retailer_name}] Progress: {points_completed[0]}/{total_points} points "
+                        f"({points_completed[0]/total_points*100:.1f}%), "
+                        f"{len(all_stores)} unique stores found"
+                    )
+
+            # Early exit if limit reached
+            if limit and len(all_stores) >= limit:
+                break
+
+    return all_stores
+
+
+def _scan_adaptive(
+    session_pool,
+    retailer_config: dict,
+    retailer_name: str,
+    parallel_workers: int,
+    limit: Optional[int],
+    test_mode: bool
+) -> List[CricketStore]:
+    """Quadtree search: split only the cells whose query hit the result cap.
+
+    Every query uses a radius that covers its whole cell, so a response
+    below MAX_RESULTS_PER_CALL means the cell is complete. Saturated cells
+    are split into the quadrants that touch US_LAND_POLYGON. A failed query
+    is queued again up to ADAPTIVE_CELL_RETRIES times, then reported.
+
+    Returns:
+        Stores deduplicated by store_id
+    """
+    cell_miles = retailer_config.get('initial_cell_miles', config.ADAPTIVE_INITIAL_CELL_MILES)
+    min_cell_miles = retailer_config.get('min_cell_miles', config.ADAPTIVE_MIN_CELL_MILES)
+    prior_points: List[Tuple[float, float]] = []
+
+    if test_mode:
+        # Seed cells only: no splitting, no seeding from the previous run
+        cell_miles = min_cell_miles = TEST_MODE.GRID_SPACING_MILES
+        logging.info(f"[{retailer_name}] Test mode: querying {cell_miles}-mile cells without splitting")
+    else:
+        prior_points = _load_prior_points(retailer_name)
+
+    seed_cells = _generate_seed_cells(cell_miles, min_cell_miles, prior_points)
+    logging.info(
+        f"[{retailer_name}] Adaptive search: {len(seed_cells)} seed cells at {cell_miles}-mile size "
+        f"(seeded from {len(prior_points)} previous stores)"
+    )
+
+    seen_ids: Set[str] = set()
+    all_stores: List[CricketStore] = []
+    queries = 0
+    splits = 0
+    saturated = 0
+    failures: Dict[_SearchCell, int] = {}
+    failed_cells: List[_SearchCell] = []
+
+    with ThreadPoolExecutor(max_workers=parallel_workers) as executor:
+        pending = {
+            executor.submit(_fetch_cell_worker, cell, session_pool, retailer_name)
+            for cell in seed_cells
+        }
+
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                cell, result_count, stores = future.result()
+                queries += 1
+
+                if result_count is None:
+                    failures[cell] = failures.get(cell, 0) + 1
+                    if failures[cell] <= config.ADAPTIVE_CELL_RETRIES:
+                        pending.add(executor.submit(_fetch_cell_worker, cell, session_pool, retailer_name))
+                    else:
+                        failed_cells.append(cell)
+                    continue
+
+                # Results are consumed on this thread only, so no lock is needed
+                for store in stores:
+                    if store.store_id not in seen_ids:
+                        seen_ids.add(store.store_id)
+                        all_stores.append(store)
+
+                if result_count >= config.MAX_RESULTS_PER_CALL:
+                    if cell.can_split(min_cell_miles):
+                        splits += 1
+                        for child in cell.split():
+                            if _cell_intersects_polygon(child, config.US_LAND_POLYGON):
+                                pending.add(executor.submit(_fetch_cell_worker, child, session_pool, retailer_name))
+                    else:
+                        saturated += 1
+
+                if queries % 100 == 0:
+                    logging.info(
+                        f"[{retailer_name}] Progress: {queries} queries, {len(pending)} pending, "
+                        f"{len(all_stores)} unique stores found"
+                    )
+
+            if limit and len(all_stores) >= limit:
+                logging.info(f"[{retailer_name}] Reached limit of {limit} stores")
+                for f in pending:
+                    f.cancel()
+                break
+
+    logging.info(
+        f"[{retailer_name}] Adaptive search finished: {queries} queries, {splits} cells split, "
+        f"{len(all_stores)} unique stores found"
+    )
+    if saturated:
+        logging.warning(
+            f"[{retailer_name}] {saturated} cells still returned {config.MAX_RESULTS_PER_CALL} results "
+            f"at the {min_cell_miles}-mile minimum size; some stores there may be missing"
+        )
+    if failed_cells:
+        centers = ', '.join(f"{cell.center} r={cell.radius_miles()}mi" for cell in failed_cells)
+        logging.warning(
+            f"[{retailer_name}] {len(failed_cells)} cells could not be searched after "
+            f"{config.ADAPTIVE_CELL_RETRIES + 1} attempts; stores there may be missing: {centers}"
+        )
+
+    return all_stores
 
 
 def run(session, retailer_config: dict, retailer: str, **kwargs) -> dict:
     """Standard scraper entry point.
 
     Cricket scraper uses geographic grid-based discovery with parallel
-    execution. Stores are deduplicated by store_id across all grid points.
+    execution, or the adaptive quadtree search when retailer_config sets
+    search_mode: "adaptive". Stores are deduplicated by store_id across all
+    queries.
 
     Args:
         session: Configured session (requests.Session or ProxyClient)
@@ -347,72 +774,18 @@ def run(session, retailer_config: dict, retailer: str, **kwargs) -> dict:
 
     try:
         # Get configuration values
-        grid_spacing = retailer_config.get('grid_spacing_miles', config.DEFAULT_GRID_SPACING_MILES)
+        search_mode = retailer_config.get('search_mode', 'grid')
         parallel_workers = retailer_config.get('parallel_workers', 10)
 
-        # Reduce grid for test mode (quick validation)
-        if test_mode:
-            grid_spacing = TEST_MODE.GRID_SPACING_MILES  # Fewer points for quick testing
-            logging.info(f"[{retailer_name}] Test mode: using {grid_spacing}-mile grid spacing")
-
-        # Generate grid points
-        grid_points = _generate_us_grid(grid_spacing)
-        total_points = len(grid_points)
-        logging.info(f"[{retailer_name}] Generated {total_points} grid points at {grid_spacing}-mile spacing")
-
-        # Thread-safe storage for deduplication
-        seen_ids: Set[str] = set()
-        all_stores: List[CricketStore] = []
-        lock = threading.Lock()
-
-        # Track progress
-        points_completed = [0]
-        progress_lock = threading.Lock()
-
-        # Create session factory for parallel workers
-        session_factory = create_session_factory(retailer_config)
-
-        # Parallel grid scanning
-        logging.info(f"[{retailer_name}] Scanning grid with {parallel_workers} parallel workers")
-
-        with ThreadPoolExecutor(max_workers=parallel_workers) as executor:
-            # Submit all grid points
-            futures = {
-                executor.submit(_fetch_stores_worker, point, session_factory, retailer_name): point
-                for point in grid_points
-            }
-
-            for future in as_completed(futures):
-                point, stores = future.result()
-
-                # Thread-safe deduplication and storage
-                with lock:
-                    for store in stores:
-                        if store.store_id not in seen_ids:
-                            seen_ids.add(store.store_id)
-                            all_stores.append(store)
-
-                            # Check limit
-                            if limit and len(all_stores) >= limit:
-                                logging.info(f"[{retailer_name}] Reached limit of {limit} stores")
-                                # Cancel remaining futures
-                                for f in futures:
-                                    f.cancel()
-                                break
-
-                # Progress logging
-                with progress_lock:
-                    points_completed[0] += 1
-                    if points_completed[0] % 100 == 0 or points_completed[0] == total_points:
-                        logging.info(
-                            f"[{retailer_name}] Progress: {points_completed[0]}/{total_points} points "
-                            f"({points_completed[0]/total_points*100:.1f}%), "
-                            f"{len(all_stores)} unique stores found"
-                        )
-
-                # Early exit if limit reached
-                if limit and len(all_stores) >= limit:
-                    break
+        with create_session_pool(retailer_config) as session_pool:
+            if search_mode == 'adaptive':
+                all_stores = _scan_adaptive(
+                    session_pool, retailer_config, retailer_name, parallel_workers, limit, test_mode
+                )
+            else:
+                all_stores = _scan_grid(
+                    session_pool, retailer_config, retailer_name, parallel_workers, limit, test_mode
+                )
 
         # Apply limit if specified
         if limit and len(all_stores) > limit:
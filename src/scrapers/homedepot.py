@@ -10,10 +10,11 @@ and parallel extraction.
 
 import json
 import logging
+import threading
 import time
 from dataclasses import dataclass, asdict
 from datetime import datetime
-from typing import Dict, Any, List, Optional
+from typing import Callable, Dict, Any, List, Optional, Tuple
 
 import requests
 
@@ -169,7 +170,27 @@ def _format_hours_json(hours_dict: Optional[Dict]) -> str:
 # GraphQL POST with retry
 # ---------------------------------------------------------------------------
 
-def _post_graphql(
+# Status codes that mean the payload itself was too large. Other 4xx
+# (schema changes, auth, bad queries) would fail at any batch size.
+_REJECTED_STATUSES = (413, 414, 431)
+
+# GraphQL error codes (errors[].extensions.code) for size or complexity limits
+_REJECTED_ERROR_CODES = frozenset({
+    "QUERY_TOO_COMPLEX",
+    "QUERY_TOO_DEEP",
+    "MAX_COMPLEXITY_EXCEEDED",
+    "MAX_ALIASES_EXCEEDED",
+    "PAYLOAD_TOO_LARGE",
+})
+
+
+def _is_size_error(error: Dict[str, Any]) -> bool:
+    """Whether a GraphQL error reports a size or complexity limit."""
+    code = (error.get("extensions") or {}).get("code")
+    return isinstance(code, str) and code.upper() in _REJECTED_ERROR_CODES
+
+
+def _send_graphql(
     session: requests.Session,
     operation_name: str,
     query: str,
@@ -180,7 +201,8 @@ def _post_graphql(
     min_delay: Optional[float] = None,
     max_delay: Optional[float] = None,
     retailer: str = "homedepot",
-) -> Optional[Dict]:
+    allow_partial: bool = False,
+) -> Tuple[Optional[Dict], bool]:
     """POST a GraphQL query with retry logic.
 
     Mirrors the retry semantics of get_with_retry in src/shared/http.py:
@@ -188,6 +210,11 @@ def _post_graphql(
     - Fail-fast on other 4xx
     - Checks for GraphQL-level errors in the response
 
+    A request is reported as rejected only on an explicit size signal: a
+    413/414/431, or, with allow_partial, errors and no data where an error
+    carries a size or complexity code. Batch callers split and retry
+    those; any other failure fails the whole batch.
+
     Args:
         session: Requests session object
         operation_name: GraphQL operation name (used in URL param)
@@ -199,9 +226,11 @@ def _post_graphql(
         min_delay: Minimum delay between requests
         max_delay: Maximum delay between requests
         retailer: Retailer name for log prefixes
+        allow_partial: Return responses carrying both data and errors
+            (aliased batches where only some aliases failed)
 
     Returns:
-        Parsed JSON response dict, or None on failure
+        Tuple of (parsed JSON response dict or None on failure, rejected)
     """
     max_retries = max_retries if max_retries is not None else HTTP.MAX_RETRIES
     timeout = timeout if timeout is not None else HTTP.TIMEOUT
@@ -234,8 +263,11 @@ def _post_graphql(
                         f"[{retailer}] GraphQL errors for {operation_name}: {error_msgs}",
                         level=logging.WARNING,
                     )
-                    return None
-                return data
+                    if not allow_partial:
+                        return None, False
+                    if not any((data.get("data") or {}).values()):
+                        return None, any(_is_size_error(e) for e in data["errors"])
+                return data, False
 
             if response.status_code in (429, 403):
                 wait_time = (2 ** attempt) * HTTP.RATE_LIMIT_BASE_WAIT
@@ -263,7 +295,7 @@ def _post_graphql(
                     f"{operation_name}. Failing immediately.",
                     level=logging.ERROR,
                 )
-                return None
+                return None, response.status_code in _REJECTED_STATUSES
 
         except requests.exceptions.RequestException as exc:
             wait_time = HTTP.SERVER_ERROR_WAIT
@@ -279,7 +311,179 @@ def _post_graphql(
         f"[{retailer}] Failed {operation_name} after {max_retries} attempts",
         level=logging.ERROR,
     )
-    return None
+    return None, False
+
+
+def _post_graphql(
+    session: requests.Session,
+    operation_name: str,
+    query: str,
+    variables: Dict[str, Any],
+    headers: Optional[Dict[str, str]] = None,
+    max_retries: Optional[int] = None,
+    timeout: Optional[int] = None,
+    min_delay: Optional[float] = None,
+    max_delay: Optional[float] = None,
+    retailer: str = "homedepot",
+) -> Optional[Dict]:
+    """POST a single GraphQL operation with retry logic.
+
+    Args:
+        session: Requests session object
+        operation_name: GraphQL operation name (used in URL param)
+        query: GraphQL query string
+        variables: GraphQL variables dict
+        headers: Optional headers override (uses config defaults if None)
+        max_retries: Maximum retry attempts
+        timeout: Request timeout in seconds
+        min_delay: Minimum delay between requests
+        max_delay: Maximum delay between requests
+        retailer: Retailer name for log prefixes
+
+    Returns:
+        Parsed JSON response dict, or None on failure
+    """
+    data, _ = _send_graphql(
+        session, operation_name, query, variables,
+        headers=headers, max_retries=max_retries, timeout=timeout,
+        min_delay=min_delay, max_delay=max_delay, retailer=retailer,
+    )
+    return data
+
+
+# ---------------------------------------------------------------------------
+# Aliased GraphQL batches
+# ---------------------------------------------------------------------------
+
+class GraphQLBatchSize:
+    """Operations per aliased GraphQL request, shared by all workers of a run.
+
+    Starts at the configured size and is halved every time the gateway
+    rejects a batch, so later batches never resend a payload size that was
+    already refused.
+    """
+
+    def __init__(self, size: int, retailer: str = "homedepot"):
+        """Initialize with the configured batch size (floored at 1)."""
+        self._size = max(1, int(size))
+        self._lock = threading.Lock()
+        self.retailer = retailer
+
+    @property
+    def value(self) -> int:
+        """Current batch size."""
+        return self._size
+
+    def reject(self, size: int) -> None:
+        """Record that a batch of `size` operations was rejected."""
+        with self._lock:
+            reduced = max(1, size // 2)
+            if reduced < self._size:
+                self._size = reduced
+                logging.warning(
+                    f"[{self.retailer}] GraphQL batch of {size} rejected, "
+                    f"batch size reduced to {reduced}"
+                )
+
+
+def _resolve_batch_size(yaml_config: Optional[dict], kwargs: Dict[str, Any], retailer: str) -> GraphQLBatchSize:
+    """Return the run's shared GraphQLBatchSize, or one built from config."""
+    batch = kwargs.get("graphql_batch")
+    if batch is None:
+        batch = GraphQLBatchSize(
+            (yaml_config or {}).get("graphql_batch_size", hd_config.GRAPHQL_BATCH_SIZE), retailer
+        )
+    return batch
+
+
+def _count_request(
+    request_counter: Optional[RequestCounter],
+    retailer: str,
+    yaml_config: Optional[dict],
+) -> None:
+    """Count one POST and apply the configured pause logic."""
+    if request_counter:
+        current_count = request_counter.increment()
+        check_pause_logic(
+            request_counter, retailer=retailer,
+            config=yaml_config, current_count=current_count
+        )
+
+
+def _post_graphql_batch(
+    session: requests.Session,
+    operation_name: str,
+    build_query: Callable[[int], str],
+    alias_variable: str,
+    values: List[Any],
+    batch: GraphQLBatchSize,
+    shared_variables: Optional[Dict[str, Any]] = None,
+    retailer: str = "homedepot",
+    yaml_config: Optional[dict] = None,
+    request_counter: Optional[RequestCounter] = None,
+    min_delay: Optional[float] = None,
+    max_delay: Optional[float] = None,
+) -> List[Optional[Dict]]:
+    """Run one aliased operation per value, many per POST.
+
+    Values are sent in chunks of batch.value, with alias `s{i}` reading
+    variable `{alias_variable}{i}`. A rejected chunk is split in half and
+    both halves are retried; the shared batch size shrinks with it.
+
+    Args:
+        session: Requests session object
+        operation_name: Name of the batched operation (build_query's output)
+        build_query: Builds the aliased query for a given chunk size
+        alias_variable: Per-alias variable name prefix
+        values: One variable value per operation
+        batch: Shared batch size
+        shared_variables: Variables common to all aliases
+        retailer: Retailer name for logging
+        yaml_config: Retailer configuration (pause logic)
+        request_counter: RequestCounter instance for tracking requests
+        min_delay: Minimum delay between requests
+        max_delay: Maximum delay between requests
+
+    Returns:
+        Each alias's result field (None on failure), aligned with values
+    """
+    results: List[Optional[Dict]] = [None] * len(values)
+    pending = [list(range(len(values)))]
+
+    while pending:
+        indexes = pending.pop()
+        if len(indexes) > batch.value:
+            size = batch.value
+            pending.extend(indexes[i:i + size] for i in reversed(range(0, len(indexes), size)))
+            continue
+
+        variables = dict(shared_variables or {})
+        for alias, index in enumerate(indexes):
+            variables[f"{alias_variable}{alias}"] = values[index]
+
+        data, rejected = _send_graphql(
+            session,
+            operation_name=operation_name,
+            query=build_query(len(indexes)),
+            variables=variables,
+            min_delay=min_delay,
+            max_delay=max_delay,
+            retailer=retailer,
+            allow_partial=True,
+        )
+        _count_request(request_counter, retailer, yaml_config)
+
+        if rejected and len(indexes) > 1:
+            batch.reject(len(indexes))
+            half = len(indexes) // 2
+            pending.extend([indexes[half:], indexes[:half]])
+            continue
+
+        fields = (data or {}).get("data") or {}
+        for alias, index in enumerate(indexes):
+            results[index] = fields.get(f"s{alias}")
+
+    return results
 
 
 # ---------------------------------------------------------------------------
@@ -296,15 +500,17 @@ def discover_stores(
     """Discover all Home Depot stores by querying each state directory.
 
     Phase 1: Loops through 54 US states/territories, calling the
-    storeDirectoryByState GraphQL operation for each. Returns a flat
-    list of store info dicts containing basic data + county.
+    storeDirectoryByState GraphQL operation for each (many per POST when
+    `graphql_batch_size` > 1). Returns a flat list of store info dicts
+    containing basic data + county.
 
     Args:
         session: Requests session object
         retailer: Retailer name for logging
         yaml_config: Retailer configuration from retailers.yaml
         request_counter: RequestCounter instance for tracking requests
-        **kwargs: Additional keyword arguments (unused)
+        **kwargs: Additional keyword arguments (graphql_batch: the run's
+            shared GraphQLBatchSize)
 
     Returns:
         List of dicts with keys: store_id, name, phone, street_address,
@@ -316,35 +522,46 @@ def discover_stores(
     proxy_mode = (yaml_config or {}).get("proxy", {}).get("mode", "direct")
     min_delay, max_delay = select_delays(yaml_config or {}, proxy_mode)
 
-    for state_code in hd_config.US_STATES:
-        data = _post_graphql(
+    batch = _resolve_batch_size(yaml_config, kwargs, retailer)
+    if batch.value > 1:
+        directories = _post_graphql_batch(
             session,
-            operation_name="storeDirectoryByState",
-            query=hd_config.QUERY_STATE_DIRECTORY,
-            variables={"state": state_code},
+            operation_name="storeDirectoryByStateBatch",
+            build_query=hd_config.build_state_directory_batch,
+            alias_variable="state",
+            values=hd_config.US_STATES,
+            batch=batch,
+            retailer=retailer,
+            yaml_config=yaml_config,
+            request_counter=request_counter,
             min_delay=min_delay,
             max_delay=max_delay,
-            retailer=retailer,
         )
-
-        if request_counter:
-            current_count = request_counter.increment()
-            check_pause_logic(
-                request_counter, retailer=retailer,
-                config=yaml_config, current_count=current_count
+    else:
+        directories = []
+        for state_code in hd_config.US_STATES:
+            data = _post_graphql(
+                session,
+                operation_name="storeDirectoryByState",
+                query=hd_config.QUERY_STATE_DIRECTORY,
+                variables={"state": state_code},
+                min_delay=min_delay,
+                max_delay=max_delay,
+                retailer=retailer,
+            )
+            _count_request(request_counter, retailer, yaml_config)
+            directories.append(
+                (data.get("data") or {}).get("storeDirectoryByState") or {} if data else None
             )
 
-        if not data:
+    for state_code, state_data in zip(hd_config.US_STATES, directories):
+        if state_data is None:
             log_safe(
                 f"[{retailer}] Failed to fetch state: {state_code}",
                 level=logging.WARNING,
             )
             continue
 
-        state_data = (data.get("data") or {}).get("storeDirectoryByState")
-        if not state_data:
-            continue
-
         stores_info = state_data.get("storesInfo") or []
         for store in stores_info:
             # Extract store_id from URL last path segment
@@ -428,12 +645,7 @@ def extract_store_details(
         retailer=retailer,
     )
 
-    if request_counter:
-        current_count = request_counter.increment()
-        check_pause_logic(
-            request_counter, retailer=retailer,
-            config=yaml_config, current_count=current_count
-        )
+    _count_request(request_counter, retailer, yaml_config)
 
     if not data:
         log_safe(
@@ -442,8 +654,90 @@ def extract_store_details(
         )
         return None
 
-    store_search = (data.get("data") or {}).get("storeSearch") or {}
-    stores = store_search.get("stores") or []
+    return _parse_store_search((data.get("data") or {}).get("storeSearch"), item, retailer, yaml_config)
+
+
+def extract_store_details_batch(
+    session: requests.Session,
+    items: List[Dict[str, Any]],
+    retailer: str = "homedepot",
+    yaml_config: Optional[dict] = None,
+    request_counter: Optional[RequestCounter] = None,
+    **kwargs,
+) -> List[Optional[HomeDepotStore]]:
+    """Extract detailed store data for many stores with aliased storeSearch queries.
+
+    Batched variant of extract_store_details() for ScrapeRunner's batch
+    path: one POST carries up to the current batch size of storeSearch
+    operations, and rejected payloads are split and retried.
+
+    Args:
+        session: Requests session object
+        items: Store info dicts from Phase 1 (must contain store_id, county)
+        retailer: Retailer name for logging
+        yaml_config: Retailer configuration from retailers.yaml
+        request_counter: RequestCounter instance for tracking requests
+        **kwargs: Additional keyword arguments (graphql_batch: the run's
+            shared GraphQLBatchSize)
+
+    Returns:
+        HomeDepotStore objects (None on failure), aligned with items
+    """
+    proxy_mode = (yaml_config or {}).get("proxy", {}).get("mode", "direct")
+    min_delay, max_delay = select_delays(yaml_config or {}, proxy_mode)
+
+    results = _post_graphql_batch(
+        session,
+        operation_name="storeSearchBatch",
+        build_query=hd_config.build_store_search_batch,
+        alias_variable="storeSearchInput",
+        values=[item.get("store_id", "").zfill(4) for item in items],
+        batch=_resolve_batch_size(yaml_config, kwargs, retailer),
+        shared_variables={
+            "lat": "",
+            "lng": "",
+            "pagesize": "1",
+            "storeFeaturesFilter": hd_config.DEFAULT_FEATURES_FILTER,
+        },
+        retailer=retailer,
+        yaml_config=yaml_config,
+        request_counter=request_counter,
+        min_delay=min_delay,
+        max_delay=max_delay,
+    )
+
+    stores: List[Optional[HomeDepotStore]] = []
+    for item, store_search in zip(items, results):
+        if store_search is None:
+            log_safe(
+                f"[{retailer}] Failed to fetch details for store {item.get('store_id', '')}",
+                level=logging.WARNING,
+            )
+            stores.append(None)
+        else:
+            stores.append(_parse_store_search(store_search, item, retailer, yaml_config))
+    return stores
+
+
+def _parse_store_search(
+    store_search: Optional[Dict[str, Any]],
+    item: Dict[str, Any],
+    retailer: str,
+    yaml_config: Optional[dict],
+) -> Optional[HomeDepotStore]:
+    """Build a HomeDepotStore from a storeSearch result and its Phase 1 item.
+
+    Args:
+        store_search: The storeSearch field of a response (may be None)
+        item: Store info dict from Phase 1 (store_id, county)
+        retailer: Retailer name for logging
+        yaml_config: Retailer configuration (base_url)
+
+    Returns:
+        HomeDepotStore object, or None if no store was returned
+    """
+    store_id = item.get("store_id", "")
+    stores = (store_search or {}).get("stores") or []
 
     if not stores:
         logging.warning(f"[{retailer}] No stores returned for ID {store_id}")
@@ -559,12 +853,21 @@ def run(session, retailer_config: dict, **kwargs) -> dict:
         limit=kwargs.get("limit"),
         refresh_urls=kwargs.get("refresh_urls", False),
         use_rich_cache=True,  # Phase 1 returns dicts with county
+        store_sink=kwargs.get('store_sink'),
     )
 
     runner = ScrapeRunner(context)
 
+    # Shared by both phases so a size the gateway rejected is not retried
+    batch = GraphQLBatchSize(
+        retailer_config.get("graphql_batch_size", hd_config.GRAPHQL_BATCH_SIZE), retailer_name
+    )
+
     return runner.run_with_checkpoints(
         url_discovery_func=discover_stores,
         extraction_func=extract_store_details,
         item_key_func=lambda x: x.get("store_id"),
+        batch_extraction_func=extract_store_details_batch,
+        batch_size=batch.value,
+        graphql_batch=batch,
     )
@@ -25,6 +25,8 @@ from bs4 import BeautifulSoup
 from config import samsclub_config as config
 from src.shared import utils
 from src.shared.cache import URLCache
+from src.shared.cache_interface import RevalidationCache
+from src.shared.incremental import IncrementalState, sitemap_lastmods
 from src.shared.proxy_client import ProxyClient, ProxyConfig, ProxyMode
 from src.shared.request_counter import RequestCounter, check_pause_logic
 from src.shared.session_factory import create_session_factory
@@ -93,7 +95,11 @@ class SamsClubStore:
         return result
 
 
-def get_club_urls_from_sitemap(session: requests.Session, retailer: str = 'samsclub') -> List[str]:
+def get_club_urls_from_sitemap(
+    session: requests.Session,
+    retailer: str = 'samsclub',
+    lastmods: Optional[Dict[str, str]] = None
+) -> List[str]:
     """Fetch all club URLs from Sam's Club sitemap.
 
     The sitemap is publicly accessible but requires curl-like headers to avoid bot detection.
@@ -101,6 +107,7 @@ def get_club_urls_from_sitemap(session: requests.Session, retailer: str = 'samsc
     Args:
         session: Requests session (plain session works fine)
         retailer: Retailer name for logging
+        lastmods: Optional dict filled with each URL's sitemap <lastmod> (incremental runs)
 
     Returns:
         List of unique club URLs
@@ -113,15 +120,25 @@ def get_club_urls_from_sitemap(session: requests.Session, retailer: str = 'samsc
         'User-Agent': 'curl/8.4.0',
         'Accept': '*/*',
     }
+    # Conditional GET: an unchanged sitemap comes back as 304 and is read from the cache
+    revalidation_cache = RevalidationCache.for_retailer(retailer)
+    validators = revalidation_cache.get(sitemap_url)
+    headers.update(RevalidationCache.conditional_headers(validators))
     response = session.get(sitemap_url, headers=headers, timeout=30)
 
-    if response.status_code != 200:
+    if response.status_code == 304 and validators:
+        logging.info(f"[{retailer}] Sitemap not modified, using cached copy")
+        content = RevalidationCache.body(validators)
+    elif response.status_code != 200:
         logging.error(f"[{retailer}] Failed to fetch sitemap: {response.status_code}")
         return []
+    else:
+        content = response.content
+        revalidation_cache.store(sitemap_url, content, response.headers)
 
     try:
         # Parse XML sitemap
-        root = ET.fromstring(response.content)
+        root = ET.fromstring(content)
 
         # Extract club URLs - handle both namespaced and non-namespaced elements
         club_urls = set()
@@ -139,6 +156,9 @@ def get_club_urls_from_sitemap(session: requests.Session, retailer: str = 'samsc
             if url and '/club/' in url:
                 club_urls.add(url)
 
+        if lastmods is not None:
+            lastmods.update(sitemap_lastmods(root))
+
         logging.info(f"[{retailer}] Found {len(club_urls)} unique club URLs in sitemap")
         return list(club_urls)
 
@@ -392,6 +412,7 @@ def run(session, yaml_config: dict, **kwargs) -> dict:
             - resume: bool - Resume from checkpoint
             - limit: int - Max clubs to process
             - refresh_urls: bool - Force URL re-discovery (ignore cache)
+            - incremental: bool - Only fetch URLs whose sitemap <lastmod> changed
 
     Returns:
         dict with keys:
@@ -408,6 +429,7 @@ def run(session, yaml_config: dict, **kwargs) -> dict:
         limit = kwargs.get('limit')
         resume = kwargs.get('resume', False)
         refresh_urls = kwargs.get('refresh_urls', False)
+        incremental = IncrementalState(retailer_name) if kwargs.get('incremental', False) else None
 
         # Create fresh RequestCounter instance for this run
         request_counter = RequestCounter()
@@ -422,7 +444,7 @@ def run(session, yaml_config: dict, **kwargs) -> dict:
         proxy_config = ProxyConfig.from_env()
         proxy_config.mode = ProxyMode.WEB_SCRAPER_API
         proxy_config.render_js = True
-        club_client = ProxyClient(proxy_config)
+        club_client = ProxyClient(proxy_config, retailer=retailer_name)
         logging.info(f"[{retailer_name}] Web Scraper API client ready (render_js=true)")
 
         checkpoint_path = f"data/{retailer_name}/checkpoints/scrape_progress.json"
@@ -440,15 +462,17 @@ def run(session, yaml_config: dict, **kwargs) -> dict:
                 logging.info(f"[{retailer_name}] Resuming from checkpoint: {len(clubs)} clubs already collected")
                 checkpoints_used = True
 
-        # Try to load cached URLs
+        # Try to load cached URLs (incremental runs rediscover to get fresh <lastmod>)
         url_cache = URLCache(retailer_name)
         club_urls = None
-        if not refresh_urls:
+        if not refresh_urls and not incremental:
             club_urls = url_cache.get()
 
         if club_urls is None:
             # Fetch from sitemap
-            club_urls = get_club_urls_from_sitemap(session, retailer_name)
+            club_urls = get_club_urls_from_sitemap(
+                session, retailer_name, lastmods=incremental.lastmods if incremental else None
+            )
             logging.info(f"[{retailer_name}] Found {len(club_urls)} club URLs from sitemap")
 
             # Save to cache
@@ -461,6 +485,11 @@ def run(session, yaml_config: dict, **kwargs) -> dict:
             logging.warning(f"[{retailer_name}] No club URLs found")
             return {'stores': [], 'count': 0, 'checkpoints_used': False}
 
+        # Incremental: only fetch new/changed URLs, carry unchanged clubs forward
+        carried = []
+        if incremental:
+            club_urls, carried = incremental.plan(club_urls, completed=completed_urls)
+
         remaining_urls = [url for url in club_urls if url not in completed_urls]
 
         if resume and completed_urls:
@@ -474,6 +503,10 @@ def run(session, yaml_config: dict, **kwargs) -> dict:
             else:
                 remaining_urls = []
 
+        for url, club_data in carried:
+            clubs.append(club_data)
+            completed_urls.add(url)
+
         total_to_process = len(remaining_urls)
         if total_to_process > 0:
             logging.info(f"[{retailer_name}] Extracting details for {total_to_process} clubs")
@@ -551,6 +584,9 @@ def run(session, yaml_config: dict, **kwargs) -> dict:
 
         logging.info(f"[{retailer_name}] Completed: {len(clubs)} clubs scraped")
 
+        if incremental:
+            incremental.save(clubs)
+
         return {
             'stores': clubs,
             'count': len(clubs),
@@ -11,6 +11,8 @@ data not available from StaplesConnect.
 
 Supports:
   - Parallel store number scanning with ThreadPoolExecutor
+  - Scan planning across runs: known-live numbers plus a sample of the
+    rest between periodic full sweeps (StoreNumberPlanner)
   - Checkpoint/resume for long-running scans
   - Proxy integration via Oxylabs Web Scraper API
   - Test mode with configurable store limits
@@ -22,7 +24,7 @@ import json
 import logging
 import threading
 import time
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, as_completed, wait
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from pathlib import Path
@@ -32,6 +34,9 @@ import requests as req_lib
 
 from config import staples_config as config
 from src.shared import utils
+from src.shared.checkpoint import CheckpointJournal, save_checkpoint
+from src.shared.constants import CHECKPOINT, GAP_FILL
+from src.shared.gap_fill import ZipGapFill
 from src.shared.proxy_client import ProxyClient, ProxyConfig, ProxyMode
 
 logger = logging.getLogger(__name__)
@@ -400,7 +405,7 @@ def _merge_store_data(
 def _fetch_store_detail(
     store_number: str,
     proxy_client: ProxyClient,
-) -> Optional[Dict[str, Any]]:
+) -> Tuple[Optional[Dict[str, Any]], bool]:
     """Fetch store detail from StaplesConnect API.
 
     Args:
@@ -408,25 +413,27 @@ def _fetch_store_detail(
         proxy_client: Configured ProxyClient instance.
 
     Returns:
-        Parsed JSON dict if store exists, None if 404 or error.
+        Tuple of (parsed JSON dict or None, answered). answered is True for
+        a JSON response or a 404 and False for errors, so a failed request
+        is never mistaken for a number with no store.
     """
     url = config.build_store_detail_url(store_number)
     response = proxy_client.get(url, headers=config.get_headers())
 
     if response is None:
-        return None
+        return None, False
 
     if response.status_code == 404:
-        return None
+        return None, True
 
     if response.ok:
         try:
-            return response.json()
+            return response.json(), True
         except (json.JSONDecodeError, ValueError):
             logger.warning("Invalid JSON for store %s", store_number)
-            return None
+            return None, False
 
-    return None
+    return None, False
 
 
 def _fetch_store_services(
@@ -457,7 +464,7 @@ def _fetch_store_services(
 def _scan_worker(
     store_number: str,
     proxy_client: ProxyClient,
-) -> Tuple[str, Optional[StaplesStore]]:
+) -> Tuple[str, Optional[StaplesStore], bool]:
     """Worker function for parallel store number scanning.
 
     Args:
@@ -465,14 +472,15 @@ def _scan_worker(
         proxy_client: ProxyClient instance (thread-safe for Web Scraper API).
 
     Returns:
-        Tuple of (store_number, StaplesStore or None).
+        Tuple of (store_number, StaplesStore or None, answered): a store, a
+        definitive miss (None, True) or an error (None, False).
     """
-    data = _fetch_store_detail(store_number, proxy_client)
+    data, answered = _fetch_store_detail(store_number, proxy_client)
     if data is None:
-        return store_number, None
+        return store_number, None, answered
 
     store = _parse_staplesconnect_store(data)
-    return store_number, store
+    return store_number, store, answered
 
 
 def _generate_store_numbers() -> List[str]:
@@ -488,12 +496,176 @@ def _generate_store_numbers() -> List[str]:
     return numbers
 
 
+class StoreNumberPlanner:
+    """Per-store-number hit history that plans Phase 1 scans across runs.
+
+    Most numbers in STORE_NUMBER_RANGES are not stores. A full sweep probes
+    every number (known-live ones first) and runs when there is no history,
+    the last sweep is older than full_sweep_days, or it is forced. Between
+    sweeps only known-live numbers and a strided sample of the rest are
+    probed, and a hit on a number not known to be live also probes its
+    neighbours, so Phase 1 costs roughly the number of real stores.
+
+    History is stored in data/staples/scan_history.json and only written by
+    save() after a run finishes.
+
+    Attributes:
+        full_sweep: Whether the last plan() covers every store number
+    """
+
+    def __init__(
+        self,
+        state_path: Optional[str] = None,
+        full_sweep_days: int = config.FULL_SWEEP_DAYS,
+        sample_stride: int = config.DEAD_SAMPLE_STRIDE,
+        densify_radius: int = config.DENSIFY_RADIUS,
+        miss_limit: int = config.LIVE_MISS_LIMIT,
+        force_full_sweep: bool = False,
+    ) -> None:
+        """Initialize the planner and load the previous history.
+
+        Args:
+            state_path: Override for data/staples/scan_history.json.
+            full_sweep_days: Maximum age of the last full sweep (0 = always sweep).
+            sample_stride: Probe every Nth number that is not known to be live.
+            densify_radius: Numbers probed on each side of a new hit.
+            miss_limit: Consecutive misses before a live number counts as dead.
+            force_full_sweep: Sweep every number regardless of history.
+        """
+        self.state_path = Path(state_path or "data/staples/scan_history.json")
+        self.full_sweep_days = full_sweep_days
+        self.sample_stride = max(1, sample_stride)
+        self.densify_radius = densify_radius
+        self.miss_limit = miss_limit
+        self.force_full_sweep = force_full_sweep
+        self.full_sweep = False
+        self._history = self._load()
+        self._ids: Dict[str, Dict[str, Any]] = dict(self._history.get("ids", {}))
+        self._live: Set[str] = set()
+        self._numbers: List[str] = []
+        self._index: Dict[str, int] = {}
+        self._planned: Optional[Set[str]] = None
+
+    def _load(self) -> Dict[str, Any]:
+        """Load the previous history (empty if missing or unreadable)."""
+        if not self.state_path.exists():
+            return {}
+        try:
+            with open(self.state_path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            return data if isinstance(data, dict) else {}
+        except (json.JSONDecodeError, IOError, OSError) as e:
+            logger.warning("Ignoring unreadable scan history %s: %s", self.state_path, e)
+            return {}
+
+    def known_live(self) -> List[str]:
+        """Store numbers that were hits and have not missed miss_limit times since."""
+        return sorted(
+            number for number, record in self._ids.items()
+            if record.get("misses", 0) < self.miss_limit
+        )
+
+    def _full_sweep_due(self) -> bool:
+        if self.force_full_sweep or not self._ids or self.full_sweep_days <= 0:
+            return True
+        last = self._history.get("last_full_sweep")
+        if not last:
+            return True
+        try:
+            age = datetime.now(timezone.utc) - datetime.fromisoformat(last)
+        except (TypeError, ValueError):
+            return True
+        return age.days >= self.full_sweep_days
+
+    def plan(self, numbers: List[str]) -> List[str]:
+        """Order the numbers to probe this run.
+
+        Args:
+            numbers: Every configured store number, in range order.
+
+        Returns:
+            Known-live numbers first (including any outside the ranges), then
+            either all remaining numbers or a strided sample of them.
+        """
+        live = self.known_live()
+        self._live = set(live)
+        self._numbers = list(numbers)
+        self._index = {number: i for i, number in enumerate(self._numbers)}
+        self.full_sweep = self._full_sweep_due()
+
+        if self.full_sweep:
+            rest = [n for n in self._numbers if n not in self._live]
+        else:
+            # Rotate the sample offset so every number is probed once per stride runs
+            offset = self._history.get("runs", 0) % self.sample_stride
+            rest = [
+                n for i, n in enumerate(self._numbers)
+                if i % self.sample_stride == offset and n not in self._live
+            ]
+
+        planned = live + rest
+        self._planned = set(planned)
+        logger.info(
+            "Phase 1 plan: %s, %d known-live numbers, %d other numbers",
+            "full sweep" if self.full_sweep else f"1 in {self.sample_stride} sample",
+            len(live), len(rest),
+        )
+        return planned
+
+    def neighbors(self, store_number: str) -> List[str]:
+        """Unplanned numbers around a new hit, added to the plan.
+
+        Returns nothing during a full sweep or for numbers already known to
+        be live.
+        """
+        if self.full_sweep or self._planned is None or store_number in self._live:
+            return []
+        index = self._index.get(store_number)
+        if index is None:
+            return []
+
+        found = []
+        low = max(0, index - self.densify_radius)
+        high = min(len(self._numbers), index + self.densify_radius + 1)
+        for number in self._numbers[low:high]:
+            if number not in self._planned:
+                self._planned.add(number)
+                found.append(number)
+        return found
+
+    def record(self, store_number: str, hit: bool) -> None:
+        """Record the result of probing (or otherwise finding) a store number."""
+        if hit:
+            self._ids[store_number] = {
+                "last_hit": datetime.now(timezone.utc).date().isoformat(),
+                "misses": 0,
+            }
+        elif store_number in self._ids:
+            self._ids[store_number]["misses"] = self._ids[store_number].get("misses", 0) + 1
+
+    def save(self) -> None:
+        """Write the history after a completed run (no-op if plan() was not called)."""
+        if self._planned is None:
+            return
+        now = datetime.now(timezone.utc).isoformat()
+        try:
+            save_checkpoint({
+                "updated_at": now,
+                "runs": self._history.get("runs", 0) + 1,
+                "last_full_sweep": now if self.full_sweep else self._history.get("last_full_sweep"),
+                "ids": self._ids,
+            }, str(self.state_path))
+        except (IOError, OSError) as e:
+            logger.warning("Could not save scan history %s: %s", self.state_path, e)
+
+
 def _scan_store_numbers(
     proxy_client: ProxyClient,
     retailer_config: Dict[str, Any],
     resume: bool = False,
     limit: int = 0,
     test: bool = False,
+    planner: Optional[StoreNumberPlanner] = None,
 ) -> Tuple[Dict[str, StaplesStore], bool]:
     """Phase 1: Scan store numbers via StaplesConnect API.
 
@@ -503,6 +675,8 @@ def _scan_store_numbers(
         resume: Whether to resume from checkpoint.
         limit: Maximum stores to collect (0 = unlimited).
         test: If True, scan only first 20 store numbers.
+        planner: Chooses and orders the numbers to probe and records hits;
+            without one every configured number is scanned.
 
     Returns:
         Tuple of (stores dict keyed by store_number, checkpoints_used bool).
@@ -515,28 +689,61 @@ def _scan_store_numbers(
     all_numbers = _generate_store_numbers()
     if test:
         all_numbers = all_numbers[:20]
+    elif planner is not None:
+        all_numbers = planner.plan(all_numbers)
 
-    # Checkpoint support
+    # Checkpoint support: snapshot plus an append-only journal of scanned numbers
     checkpoint_dir = Path("data/staples/checkpoints")
     checkpoint_path = checkpoint_dir / "scan_checkpoint.json"
+    checkpoint_interval = retailer_config.get("checkpoint_interval", 100)
+    journal = CheckpointJournal(str(checkpoint_path), fsync_every=checkpoint_interval)
     scanned_numbers: Set[str] = set()
 
-    if resume and checkpoint_path.exists():
-        checkpoint = utils.load_checkpoint(str(checkpoint_path))
+    def snapshot_data() -> Dict[str, Any]:
+        """Copy the scan state for a snapshot (caller holds store_lock)."""
+        return {
+            "scanned": list(scanned_numbers),
+            "stores": [
+                {"storeNumber": s.store_id, "name": s.name}
+                for s in stores.values()
+            ],
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+        }
+
+    def save_snapshot(data: Dict[str, Any]) -> None:
+        utils.save_checkpoint(data, str(checkpoint_path))
+        journal.truncate()
+
+    if resume:
+        checkpoint = utils.load_checkpoint(str(checkpoint_path)) if checkpoint_path.exists() else None
+        store_records = checkpoint.get("stores", []) if checkpoint else []
         if checkpoint:
             scanned_numbers = set(checkpoint.get("scanned", []))
-            for store_data in checkpoint.get("stores", []):
-                store = _parse_staplesconnect_store(store_data)
-                if store:
-                    stores[store.store_id] = store
+        for record in journal.read():
+            scanned_numbers.add(record["key"])
+            if record.get("store"):
+                store_records.append(record["store"])
+        for store_data in store_records:
+            store = _parse_staplesconnect_store(store_data)
+            if store:
+                stores[store.store_id] = store
+        if scanned_numbers:
             checkpoints_used = True
             logger.info(
                 "Resumed from checkpoint: %d scanned, %d stores found",
                 len(scanned_numbers), len(stores),
             )
+    else:
+        journal.truncate()
 
     # Filter out already-scanned numbers
     remaining = [n for n in all_numbers if n not in scanned_numbers]
+    if planner is not None:
+        # Resumed results count as probes; densify around resumed new hits too
+        for number in scanned_numbers:
+            planner.record(number, number in stores)
+        for number in stores:
+            remaining.extend(n for n in planner.neighbors(number) if n not in scanned_numbers)
     logger.info(
         "Phase 1: Scanning %d store numbers (%d already scanned)",
         len(remaining), len(scanned_numbers),
@@ -544,8 +751,11 @@ def _scan_store_numbers(
 
     # Parallel scanning
     max_workers = retailer_config.get("parallel_workers", 5)
-    checkpoint_interval = retailer_config.get("checkpoint_interval", 100)
     processed_count = 0
+    failed_numbers: List[str] = []
+
+    total = len(remaining)
+    reached_limit = False
 
     with ThreadPoolExecutor(max_workers=max_workers) as executor:
         futures = {
@@ -553,47 +763,78 @@ def _scan_store_numbers(
             for num in remaining
         }
 
-        for future in as_completed(futures):
-            store_number = futures[future]
-            try:
-                _, store = future.result()
-                with store_lock:
-                    scanned_numbers.add(store_number)
-                    if store:
-                        stores[store.store_id] = store
-                    processed_count += 1
-
-                    # Progress logging
-                    if processed_count % 100 == 0:
-                        logger.info(
-                            "Phase 1 progress: %d/%d scanned, %d stores found",
-                            processed_count, len(remaining), len(stores),
-                        )
-
-                    # Checkpoint (inside lock to prevent race condition)
-                    if processed_count % checkpoint_interval == 0:
-                        checkpoint_dir.mkdir(parents=True, exist_ok=True)
-                        checkpoint_data = {
-                            "scanned": list(scanned_numbers),
-                            "stores": [
-                                {"storeNumber": s.store_id, "name": s.name}
-                                for s in stores.values()
-                            ],
-                            "timestamp": datetime.now(timezone.utc).isoformat(),
-                        }
-                        utils.save_checkpoint(checkpoint_data, str(checkpoint_path))
-
-                    # Limit check
-                    store_count = len(stores)
-
-                if limit and store_count >= limit:
-                    logger.info("Reached store limit of %d", limit)
-                    executor.shutdown(wait=False, cancel_futures=True)
-                    break
-
-            except Exception as e:
-                logger.warning("Error scanning store %s: %s", store_number, e)
-
+        while futures and not reached_limit:
+            done, _ = wait(futures, return_when=FIRST_COMPLETED)
+            for future in done:
+                store_number = futures.pop(future)
+                try:
+                    _, store, answered = future.result()
+                    extra: List[str] = []
+                    journal_record: Optional[Dict[str, Any]] = None
+                    snapshot: Optional[Dict[str, Any]] = None
+                    with store_lock:
+                        processed_count += 1
+                        if store:
+                            stores[store.store_id] = store
+                        if answered:
+                            scanned_numbers.add(store_number)
+                            journal_record = {
+                                "key": store_number,
+                                "store": {"storeNumber": store.store_id, "name": store.name} if store else None,
+                            }
+                        else:
+                            # Left out of the journal so a resumed run probes it again
+                            failed_numbers.append(store_number)
+
+                        # A hit in a sampled range probes the numbers around it;
+                        # an error says nothing about the number, so it is not recorded
+                        if planner is not None and answered:
+                            planner.record(store_number, store is not None)
+                            if store:
+                                extra = planner.neighbors(store_number)
+                                total += len(extra)
+
+                        # Progress logging
+                        if processed_count % 100 == 0:
+                            logger.info(
+                                "Phase 1 progress: %d/%d scanned, %d stores found",
+                                processed_count, total, len(stores),
+                            )
+
+                        # Journal appends are O(1); fold into a snapshot only occasionally
+                        if journal_record and journal.records + 1 >= CHECKPOINT.COMPACT_EVERY:
+                            snapshot = snapshot_data()
+
+                        # Limit check
+                        store_count = len(stores)
+
+                    # Disk writes and fsyncs happen outside the lock
+                    if journal_record:
+                        journal.append(journal_record)
+                    if snapshot:
+                        save_snapshot(snapshot)
+
+                    if limit and store_count >= limit:
+                        logger.info("Reached store limit of %d", limit)
+                        executor.shutdown(wait=False, cancel_futures=True)
+                        reached_limit = True
+                        break
+
+                    for num in extra:
+                        futures[executor.submit(_scan_worker, num, proxy_client)] = num
+
+                except Exception as e:
+                    logger.warning("Error scanning store %s: %s", store_number, e)
+
+    if journal.records:
+        save_snapshot(snapshot_data())
+    journal.close()
+
+    if failed_numbers:
+        logger.warning(
+            "Phase 1: %d store numbers could not be checked and were not counted as misses: %s",
+            len(failed_numbers), ", ".join(sorted(failed_numbers)[:20]),
+        )
     logger.info("Phase 1 complete: %d stores found from %d numbers", len(stores), len(scanned_numbers))
     return stores, checkpoints_used
 
@@ -602,40 +843,57 @@ def _zip_code_gap_fill(
     proxy_client: ProxyClient,
     known_store_ids: Set[str],
     test: bool = False,
+    retailer_config: Optional[Dict[str, Any]] = None,
 ) -> Dict[str, StaplesStore]:
     """Phase 2: Geographic gap-fill using store locator ZIP code sweep.
 
+    Searches run concurrently through ZipGapFill, least-covered ZIP first,
+    and stop once every candidate lies within the proven search radius of
+    an earlier search. Phase 1 stores do not seed the coverage map: nearly
+    every gap-fill ZIP has a Staples nearby, so that would skip the very
+    searches meant to find the stores Phase 1 missed.
+
     Args:
         proxy_client: Configured ProxyClient.
         known_store_ids: Set of store IDs already found in Phase 1.
         test: If True, only sweep 5 ZIP codes.
+        retailer_config: Retailer configuration (gap_fill_workers, gap_fill_patience).
 
     Returns:
         Dict of newly discovered stores keyed by store number.
     """
-    new_stores: Dict[str, StaplesStore] = {}
-    zip_codes = config.GAP_FILL_ZIP_CODES[:5] if test else config.GAP_FILL_ZIP_CODES
-
-    logger.info("Phase 2: Sweeping %d ZIP codes for gap-fill", len(zip_codes))
-
-    for i, zip_code in enumerate(zip_codes, 1):
-        stores = _search_stores_by_zip(proxy_client, zip_code)
-        for store in stores:
-            if store.store_id not in known_store_ids and store.store_id not in new_stores:
-                new_stores[store.store_id] = store
-                logger.debug("Gap-fill found new store: %s", store.store_id)
-
-        if i % 10 == 0:
-            logger.info("Phase 2 progress: %d/%d ZIPs, %d new stores", i, len(zip_codes), len(new_stores))
+    retailer_config = retailer_config or {}
+    zip_codes = config.TEST_GAP_FILL_ZIP_CODES if test else config.GAP_FILL_ZIP_CODES
+
+    logger.info("Phase 2: Gap-fill over up to %d ZIP codes", len(zip_codes))
+
+    # The locator POST bypasses ProxyClient.get, so draw rate-limit tokens here
+    mode = proxy_client.config.mode
+    engine = ZipGapFill(
+        search=lambda zip_code: _search_stores_by_zip(proxy_client, zip_code),
+        key_func=lambda store: store.store_id,
+        coords_func=lambda store: (store.latitude, store.longitude),
+        radius_miles=config.LOCATOR_SEARCH_RADIUS,
+        max_results=config.LOCATOR_MAX_RESULTS,
+        zip_codes=zip_codes,
+        workers=retailer_config.get('gap_fill_workers', GAP_FILL.WORKERS),
+        patience=0 if test else retailer_config.get('gap_fill_patience', GAP_FILL.PATIENCE),
+        retailer=proxy_client.retailer,
+        proxy_mode=mode.value if isinstance(mode, ProxyMode) else None,
+    )
+    new_stores = engine.run(known_ids=known_store_ids)
 
-    logger.info("Phase 2 complete: %d new stores found", len(new_stores))
+    logger.info(
+        "Phase 2 complete: %d new stores found from %d ZIP searches",
+        len(new_stores), len(engine.searched),
+    )
     return new_stores
 
 
 def _search_stores_by_zip(
     proxy_client: ProxyClient,
     zip_code: str,
-) -> List[StaplesStore]:
+) -> Optional[List[StaplesStore]]:
     """Search for stores near a ZIP code via the store locator API.
 
     Uses Oxylabs Web Scraper API with POST method to call the
@@ -646,7 +904,8 @@ def _search_stores_by_zip(
         zip_code: 5-digit US ZIP code.
 
     Returns:
-        List of StaplesStore objects found near the ZIP code.
+        List of StaplesStore objects found near the ZIP code, or None if
+        the search failed (error status or unparseable response).
     """
     post_body = json.dumps({
         "address": zip_code,
@@ -685,7 +944,7 @@ def _search_stores_by_zip(
                 raw_stores = store_data.get("results", {}).get("stores", [])
                 return [s for s in (_parse_locator_store(r) for r in raw_stores) if s]
             except (json.JSONDecodeError, ValueError):
-                return []
+                return None
     else:
         # Direct mode: POST directly (may fail without session cookies)
         import requests as req_lib  # noqa: E402 - conditional import
@@ -703,7 +962,7 @@ def _search_stores_by_zip(
         except (req_lib.RequestException, json.JSONDecodeError, ValueError):
             pass
 
-    return []
+    return None
 
 
 def _enrich_services(
@@ -769,7 +1028,7 @@ def run(
             - test (bool): Run in test mode with reduced scope.
             - limit (int): Maximum number of stores to collect.
             - resume (bool): Resume from checkpoint.
-            - refresh_urls (bool): Ignored (no URL caching).
+            - refresh_urls (bool): Force a full store number sweep.
 
     Returns:
         Dict with keys:
@@ -785,7 +1044,18 @@ def run(
 
     # Create proxy client from retailer config
     proxy_config_dict = retailer_config.get("proxy", {})
-    proxy_client = ProxyClient(ProxyConfig.from_dict(proxy_config_dict))
+    proxy_client = ProxyClient(ProxyConfig.from_dict(proxy_config_dict), retailer=retailer)
+
+    # Phase 1 probes known-live numbers plus a sample of the rest between
+    # periodic full sweeps (test mode always scans the first 20 numbers)
+    planner = None
+    if not test:
+        planner = StoreNumberPlanner(
+            full_sweep_days=retailer_config.get("full_sweep_days", config.FULL_SWEEP_DAYS),
+            sample_stride=retailer_config.get("sample_stride", config.DEAD_SAMPLE_STRIDE),
+            densify_radius=retailer_config.get("densify_radius", config.DENSIFY_RADIUS),
+            force_full_sweep=kwargs.get("refresh_urls", False),
+        )
 
     # Phase 1: Store number scan
     stores, checkpoints_used = _scan_store_numbers(
@@ -794,6 +1064,7 @@ def run(
         resume=resume,
         limit=limit,
         test=test,
+        planner=planner,
     )
 
     # Phase 2: ZIP code gap-fill (skip if we hit the limit already)
@@ -802,6 +1073,7 @@ def run(
             proxy_client=proxy_client,
             known_store_ids=set(stores.keys()),
             test=test,
+            retailer_config=retailer_config,
         )
         # Merge gap-fill stores (add new, merge existing)
         for sid, store in gap_fill_stores.items():
@@ -809,6 +1081,13 @@ def run(
                 stores[sid] = _merge_store_data(stores[sid], store)
             else:
                 stores[sid] = store
+            # Stores the scan missed are probed first next run
+            if planner is not None:
+                planner.record(sid, True)
+
+    # A run cut short by --limit says nothing about the numbers it skipped
+    if planner is not None and not limit:
+        planner.save()
 
     # Phase 3: Service enrichment
     max_workers = retailer_config.get("parallel_workers", 3)
@@ -17,9 +17,11 @@ import requests
 from config import target_config
 from src.shared import utils
 from src.shared.cache import RichURLCache
+from src.shared.cache_interface import RevalidationCache
 from src.shared.constants import WORKERS
 from src.shared.request_counter import RequestCounter, check_pause_logic
-from src.shared.session_factory import create_session_factory
+from src.shared.scrape_runner import ScrapeRunner, ScraperContext
+from src.shared.session_factory import create_session_pool, release_session
 from src.shared.scraper_utils import (
     initialize_run_context,
     load_urls_with_cache,
@@ -95,11 +97,11 @@ def _extract_single_store(
 ) -> Tuple[int, Optional[Dict[str, Any]]]:
     """Worker function for parallel store extraction.
 
-    Creates its own session for thread safety and extracts store details.
+    Uses the calling thread's session for thread safety and extracts store details.
 
     Args:
         store_info: Store info dict with store_id, slug, url
-        session_factory: Callable that creates session instances
+        session_factory: Session factory or SessionPool providing the worker's session
         retailer_name: Name of retailer for logging
         yaml_config: Retailer configuration from retailers.yaml
         min_delay: Minimum delay between requests
@@ -135,9 +137,7 @@ def _extract_single_store(
         logging.warning(f"[{retailer_name}] Unexpected error extracting store {store_id}: {e}")
         return (store_id, None)
     finally:
-        # Clean up session resources
-        if hasattr(session, 'close'):
-            session.close()
+        release_session(session_factory, session)
 
 
 def get_all_store_ids(
@@ -167,7 +167,8 @@ def get_all_store_ids(
         session,
         target_config.SITEMAP_URL,
         min_delay=min_delay,
-        max_delay=max_delay
+        max_delay=max_delay,
+        revalidation_cache=RevalidationCache.for_retailer(retailer)
     )
     if not response:
         logging.error(f"[{retailer}] Failed to fetch sitemap: {target_config.SITEMAP_URL}")
@@ -242,14 +243,7 @@ def get_store_details(
     Returns:
         TargetStore object if successful, None otherwise
     """
-    params = {
-        "store_id": store_id,
-        "key": target_config.API_KEY,
-        "channel": target_config.API_CHANNEL
-    }
-
-    # Build URL with params for get_with_retry
-    url_with_params = f"{target_config.REDSKY_API_URL}?{urllib.parse.urlencode(params)}"
+    url_with_params = _store_api_url(store_id)
     response = utils.get_with_retry(
         session,
         url_with_params,
@@ -267,51 +261,7 @@ def get_store_details(
 
     try:
         if response.status_code == 200:
-            data = response.json()
-            store = data.get("data", {}).get("store", {})
-
-            if not store:
-                logging.warning(f"[{retailer}] No store data found for store_id={store_id}")
-                return None
-
-            # Extract address
-            mailing_address = store.get("mailing_address", {})
-
-            # Extract geographic specifications
-            geo_specs = store.get("geographic_specifications", {})
-
-            # Extract physical specifications
-            physical_specs = store.get("physical_specifications", {})
-
-            # Extract capabilities
-            capabilities = [c.get("capability_name", "") for c in store.get("capabilities", [])]
-
-            # Build store URL from slug if available, otherwise construct from store_id
-            store_url = f"https://www.target.com/sl/store/{store_id}"
-            # Try to get slug from original store data if available
-            if 'slug' in store:
-                store_url = f"https://www.target.com/sl/{store['slug']}/{store_id}"
-
-            target_store = TargetStore(
-                store_id=str(store.get("store_id", store_id)),
-                name=store.get("location_name", ""),
-                status=store.get("status", ""),
-                street_address=mailing_address.get("address_line1", ""),
-                city=mailing_address.get("city", ""),
-                state=mailing_address.get("region", ""),  # State abbreviation
-                postal_code=mailing_address.get("postal_code", ""),
-                country=mailing_address.get("country", "United States of America"),
-                latitude=geo_specs.get("latitude"),
-                longitude=geo_specs.get("longitude"),
-                phone=store.get("main_voice_phone_number", ""),
-                capabilities=capabilities if capabilities else None,
-                format=physical_specs.get("format"),
-                building_area=physical_specs.get("total_building_area"),
-                url=store_url,
-                scraped_at=datetime.now().isoformat()
-            )
-
-            return target_store
+            return parse_store_data(response.json(), store_id, retailer)
         else:
             logging.warning(f"[{retailer}] API returned status {response.status_code} for store_id={store_id}")
             return None
@@ -319,11 +269,96 @@ def get_store_details(
     except json.JSONDecodeError as e:
         logging.warning(f"[{retailer}] Failed to parse JSON response for store_id={store_id}: {e}")
         return None
+
+
+def _store_api_url(store_id: int) -> str:
+    """Build the Redsky store-location API URL for a store ID."""
+    params = {
+        "store_id": store_id,
+        "key": target_config.API_KEY,
+        "channel": target_config.API_CHANNEL
+    }
+    return f"{target_config.REDSKY_API_URL}?{urllib.parse.urlencode(params)}"
+
+
+def parse_store_data(
+    data: Dict[str, Any],
+    store_id: int,
+    retailer: str = 'target'
+) -> Optional[TargetStore]:
+    """Build a TargetStore from a decoded Redsky API response.
+
+    Args:
+        data: Decoded JSON body from the Redsky store-location API
+        store_id: Numeric store ID the response belongs to
+        retailer: Retailer name for logging
+
+    Returns:
+        TargetStore object if successful, None otherwise
+    """
+    try:
+        store = data.get("data", {}).get("store", {})
+
+        if not store:
+            logging.warning(f"[{retailer}] No store data found for store_id={store_id}")
+            return None
+
+        # Extract address
+        mailing_address = store.get("mailing_address", {})
+
+        # Extract geographic specifications
+        geo_specs = store.get("geographic_specifications", {})
+
+        # Extract physical specifications
+        physical_specs = store.get("physical_specifications", {})
+
+        # Extract capabilities
+        capabilities = [c.get("capability_name", "") for c in store.get("capabilities", [])]
+
+        # Build store URL from slug if available, otherwise construct from store_id
+        store_url = f"https://www.target.com/sl/store/{store_id}"
+        # Try to get slug from original store data if available
+        if 'slug' in store:
+            store_url = f"https://www.target.com/sl/{store['slug']}/{store_id}"
+
+        return TargetStore(
+            store_id=str(store.get("store_id", store_id)),
+            name=store.get("location_name", ""),
+            status=store.get("status", ""),
+            street_address=mailing_address.get("address_line1", ""),
+            city=mailing_address.get("city", ""),
+            state=mailing_address.get("region", ""),  # State abbreviation
+            postal_code=mailing_address.get("postal_code", ""),
+            country=mailing_address.get("country", "United States of America"),
+            latitude=geo_specs.get("latitude"),
+            longitude=geo_specs.get("longitude"),
+            phone=store.get("main_voice_phone_number", ""),
+            capabilities=capabilities if capabilities else None,
+            format=physical_specs.get("format"),
+            building_area=physical_specs.get("total_building_area"),
+            url=store_url,
+            scraped_at=datetime.now().isoformat()
+        )
+
     except (KeyError, TypeError, AttributeError) as e:
         logging.warning(f"[{retailer}] Data extraction error for store_id={store_id}: {e}", exc_info=True)
         return None
 
 
+def _parse_store_api_text(
+    text: str,
+    store_info: Dict[str, Any],
+    retailer: str = 'target'
+) -> Optional[TargetStore]:
+    """Parse a raw Redsky API body fetched by the async engine."""
+    store_id = store_info.get('store_id')
+    try:
+        return parse_store_data(json.loads(text), store_id, retailer)
+    except json.JSONDecodeError as e:
+        logging.warning(f"[{retailer}] Failed to parse JSON response for store_id={store_id}: {e}")
+        return None
+
+
 def get_request_count() -> int:
     """Get current request count"""
     return _request_counter.count
@@ -401,49 +436,47 @@ def run(session, config: dict, **kwargs) -> dict:
         if context.parallel_workers > 1 and total_to_process > 0:
             logging.info(f"[{retailer_name}] Using parallel extraction with {context.parallel_workers} workers")
 
-            # Create session factory for parallel workers (each worker needs its own session)
-            session_factory = create_session_factory(config)
-
             # Thread-safe counters for progress
             processed_count = [0]  # Use list for mutable closure
             successful_count = [0]
             processed_lock = threading.Lock()
 
-            with ThreadPoolExecutor(max_workers=context.parallel_workers) as executor:
-                # Submit all extraction tasks
-                futures = {
-                    executor.submit(
-                        _extract_single_store,
-                        store_info,
-                        session_factory,
-                        retailer_name,
-                        config,
-                        context.min_delay,
-                        context.max_delay,
-                        context.request_counter
-                    ): store_info
-                    for store_info in remaining_stores
-                }
-
-                for future in as_completed(futures):
-                    store_id, store_data = future.result()
-
-                    with processed_lock:
-                        processed_count[0] += 1
-                        current_count = processed_count[0]
-
-                        if store_data:
-                            context.stores.append(store_data)
-                            context.completed_ids.add(store_id)
-                            successful_count[0] += 1
-                        else:
-                            failed_store_ids.append(store_id)
-
-                        # Progress logging every 50 stores
-                        log_progress(retailer_name, current_count, total_to_process, successful_count[0])
-
-                        # Checkpoint at intervals
-                        save_checkpoint_if_needed(context, current_count)
+            with create_session_pool(config) as session_pool:
+                with ThreadPoolExecutor(max_workers=context.parallel_workers) as executor:
+                    # Submit all extraction tasks
+                    futures = {
+                        executor.submit(
+                            _extract_single_store,
+                            store_info,
+                            session_pool,
+                            retailer_name,
+                            config,
+                            context.min_delay,
+                            context.max_delay,
+                            context.request_counter
+                        ): store_info
+                        for store_info in remaining_stores
+                    }
+
+                    for future in as_completed(futures):
+                        store_id, store_data = future.result()
+
+                        with processed_lock:
+                            processed_count[0] += 1
+                            current_count = processed_count[0]
+
+                            if store_data:
+                                context.stores.append(store_data)
+                                context.completed_ids.add(store_id)
+                                successful_count[0] += 1
+                            else:
+                                failed_store_ids.append(store_id)
+
+                            # Progress logging every 50 stores
+                            log_progress(retailer_name, current_count, total_to_process, successful_count[0])
+
+                            # Checkpoint at intervals
+                            save_checkpoint_if_needed(context, current_count)
         else:
             # Sequential extraction (original behavior for direct mode)
             for i, store_info in enumerate(remaining_stores, 1):
@@ -479,3 +512,55 @@ def run(session, config: dict, **kwargs) -> dict:
     except Exception as e:
         logging.error(f"[{retailer_name}] Fatal error: {e}", exc_info=True)
         raise
+
+
+async def run_async(session, config: dict, **kwargs) -> dict:
+    """Asyncio entry point, used when the retailer enables `async_engine`.
+
+    Discovery is identical to run(); Redsky API lookups are issued
+    concurrently through the shared asyncio engine.
+
+    Args:
+        session: Configured session (used for sitemap discovery)
+        config: Retailer configuration dict from retailers.yaml
+        **kwargs: Same options as run()
+
+    Returns:
+        dict with keys:
+            - stores: List[dict] - Scraped store data
+            - count: int - Number of stores processed
+            - checkpoints_used: bool - Whether resume was used
+    """
+    retailer_name = kwargs.get('retailer', 'target')
+
+    reset_request_counter()
+
+    context = ScraperContext(
+        retailer=retailer_name,
+        session=session,
+        config=config,
+        resume=kwargs.get('resume', False),
+        limit=kwargs.get('limit'),
+        refresh_urls=kwargs.get('refresh_urls', False),
+        use_rich_cache=True,  # Target caches store_id/slug dicts
+        store_sink=kwargs.get('store_sink'),
+    )
+
+    runner = ScrapeRunner(context)
+
+    def discover(session, retailer, yaml_config=None, request_counter=None):
+        return get_all_store_ids(
+            session,
+            retailer,
+            min_delay=runner.min_delay,
+            max_delay=runner.max_delay,
+            yaml_config=yaml_config,
+            request_counter=request_counter
+        )
+
+    return await runner.run_with_checkpoints_async(
+        url_discovery_func=discover,
+        parse_func=_parse_store_api_text,
+        item_key_func=lambda store_info: store_info.get('store_id'),
+        item_url_func=lambda store_info: _store_api_url(store_info['store_id'])
+    )
@@ -16,9 +16,13 @@ import requests
 from config import tmobile_config
 from src.shared import utils
 from src.shared.cache import URLCache
+from src.shared.cache_interface import RevalidationCache
+from src.shared.html_extract import extract_json_ld, extract_title, find_json_ld, make_soup
+from src.shared.incremental import IncrementalState, sitemap_lastmods
 from src.shared.constants import WORKERS
 from src.shared.request_counter import RequestCounter, check_pause_logic
-from src.shared.session_factory import create_session_factory
+from src.shared.scrape_runner import ScrapeRunner, ScraperContext
+from src.shared.session_factory import create_session_pool, release_session
 from src.shared.scraper_utils import (
     initialize_run_context,
     load_urls_with_cache,
@@ -80,11 +84,11 @@ def _extract_single_store(
 ) -> Tuple[str, Optional[Dict[str, Any]]]:
     """Worker function for parallel store extraction.
 
-    Creates its own session for thread safety and extracts store details.
+    Uses the calling thread's session for thread safety and extracts store details.
 
     Args:
         url: Store URL to extract
-        session_factory: Callable that creates session instances
+        session_factory: Session factory or SessionPool providing the worker's session
         retailer_name: Name of retailer for logging
         yaml_config: Retailer configuration from retailers.yaml
 
@@ -105,9 +109,7 @@ def _extract_single_store(
         logging.warning(f"[{retailer_name}] Unexpected error extracting {url}: {e}")
         return (url, None)
     finally:
-        # Clean up session resources
-        if hasattr(session, 'close'):
-            session.close()
+        release_session(session_factory, session)
 
 
 def _extract_store_type_from_title(page_title: str) -> Optional[str]:
@@ -164,9 +166,18 @@ def _extract_store_type_from_dom(soup: BeautifulSoup) -> Optional[str]:
     return None
 
 
-def get_store_urls_from_sitemap(session: requests.Session, retailer: str = 'tmobile') -> List[str]:
+def get_store_urls_from_sitemap(
+    session: requests.Session,
+    retailer: str = 'tmobile',
+    lastmods: Optional[Dict[str, str]] = None
+) -> List[str]:
     """Fetch all store URLs from the T-Mobile paginated sitemaps.
 
+    Args:
+        session: Requests session object
+        retailer: Retailer name for logging
+        lastmods: Optional dict filled with each URL's sitemap <lastmod> (incremental runs)
+
     Returns:
         List of retail store URLs (excludes service pages like business-internet, home-internet)
     """
@@ -180,7 +191,9 @@ def get_store_urls_from_sitemap(session: requests.Session, retailer: str = 'tmob
 
         logging.info(f"[{retailer}] Fetching sitemap page {page} from {sitemap_url}")
 
-        response = utils.get_with_retry(session, sitemap_url)
+        response = utils.get_with_retry(
+            session, sitemap_url, revalidation_cache=RevalidationCache.for_retailer(retailer)
+        )
         if not response:
             logging.error(f"[{retailer}] Failed to fetch sitemap page {page}")
             continue
@@ -202,6 +215,9 @@ def get_store_urls_from_sitemap(session: requests.Session, retailer: str = 'tmob
                     if 'business-internet' not in url and 'home-internet' not in url:
                         all_store_urls.append(url)
 
+            if lastmods is not None:
+                lastmods.update(sitemap_lastmods(root))
+
             logging.info(f"[{retailer}] Found {len(all_store_urls)} retail store URLs from page {page}")
 
         except (ET.ParseError, UnicodeDecodeError) as e:
@@ -232,62 +248,43 @@ def extract_store_details(session: requests.Session, url: str, retailer: str = '
     _request_counter.increment()
     check_pause_logic(_request_counter, retailer=retailer, config=None)
 
-    try:
-        soup = BeautifulSoup(response.text, 'html.parser')
+    return parse_store_page(response.text, url, retailer)
+
+
+def parse_store_page(html: str, url: str, retailer: str = 'tmobile') -> Optional[TMobileStore]:
+    """Parse store data from the HTML of a single T-Mobile store page.
+
+    Args:
+        html: Raw HTML content of the store page
+        url: Store page URL
+        retailer: Retailer name for logging
 
+    Returns:
+        TMobileStore object if successful, None otherwise
+    """
+    try:
         # Extract store type from page title (with DOM fallback)
         store_type = None
-        title_tag = soup.find('title')
-        if title_tag and title_tag.string:
-            store_type = _extract_store_type_from_title(title_tag.string)
+        page_title = extract_title(html)
+        if page_title:
+            store_type = _extract_store_type_from_title(page_title)
 
-        # Fallback to DOM extraction if title parsing fails
+        # Fallback to DOM extraction if title parsing fails (only then is a DOM built)
         if not store_type:
-            store_type = _extract_store_type_from_dom(soup)
+            store_type = _extract_store_type_from_dom(make_soup(html))
 
-        # Find all JSON-LD script tags (there may be multiple)
-        scripts = soup.find_all('script', type='application/ld+json')
-        if not scripts:
+        # Scan the JSON-LD blocks (single objects or arrays) without building a DOM
+        objects = extract_json_ld(html)
+        if not objects:
             logging.warning(f"[{retailer}] No JSON-LD found for {url}")
             return None
 
-        # Try each script until we find a Store
-        data = None
-        for script in scripts:
-            try:
-                script_content = script.string
-                if not script_content:
-                    continue
-
-                script_data = json.loads(script_content)
-
-                # Handle both single objects and arrays
-                if isinstance(script_data, list):
-                    for item in script_data:
-                        if item.get('@type') == 'Store':
-                            data = item
-                            break
-                elif script_data.get('@type') == 'Store':
-                    data = script_data
-
-                if data:
-                    break
-
-            except json.JSONDecodeError as e:
-                logging.debug(f"[{retailer}] Failed to parse JSON-LD script for {url}: {e}")
-                continue
+        data = find_json_ld(html, 'Store', objects=objects)
 
         # If no Store found, log and return None
         if not data:
-            if scripts:
-                try:
-                    first_script = json.loads(scripts[0].string) if scripts[0].string else {}
-                    first_type = first_script.get('@type', 'Unknown') if isinstance(first_script, dict) else 'Unknown'
-                    if isinstance(first_script, list) and first_script:
-                        first_type = first_script[0].get('@type', 'Unknown') if isinstance(first_script[0], dict) else 'Unknown'
-                    logging.debug(f"[{retailer}] Skipping {url}: No Store found (first @type: '{first_type}')")
-                except (json.JSONDecodeError, KeyError, TypeError, AttributeError, IndexError):
-                    logging.debug(f"[{retailer}] Skipping {url}: No Store found")
+            first_type = objects[0].get('@type', 'Unknown')
+            logging.debug(f"[{retailer}] Skipping {url}: No Store found (first @type: '{first_type}')")
             return None
 
         # Extract address components
@@ -373,24 +370,32 @@ def run(session, config: dict, **kwargs) -> dict:
     limit = kwargs.get('limit')
     resume = kwargs.get('resume', False)
     refresh_urls = kwargs.get('refresh_urls', False)
+    incremental = IncrementalState(retailer_name) if kwargs.get('incremental', False) else None
 
     try:
         # Initialize common run context (handles delays, workers, checkpoints, resume)
         context = initialize_run_context(retailer_name, config, resume)
         reset_request_counter()  # Reset global counter for backwards compatibility
 
-        # Load store URLs with cache support
+        # Load store URLs with cache support (incremental runs rediscover to get fresh <lastmod>)
         url_cache = URLCache(retailer_name)
         store_urls = load_urls_with_cache(
             url_cache,
-            lambda: get_store_urls_from_sitemap(session, retailer_name),
-            refresh_urls
+            lambda: get_store_urls_from_sitemap(
+                session, retailer_name, lastmods=incremental.lastmods if incremental else None
+            ),
+            refresh_urls or incremental is not None
         )
 
         if not store_urls:
             logging.warning(f"[{retailer_name}] No store URLs found")
             return {'stores': [], 'count': 0, 'checkpoints_used': False}
 
+        # Incremental: only fetch new/changed URLs, carry unchanged stores forward
+        carried = []
+        if incremental:
+            store_urls, carried = incremental.plan(store_urls, completed=context.completed_ids)
+
         # Filter remaining URLs based on checkpoint and limit
         remaining_urls = filter_remaining_items(
             store_urls,
@@ -400,6 +405,10 @@ def run(session, config: dict, **kwargs) -> dict:
             retailer_name
         )
 
+        for url, store_data in carried:
+            context.stores.append(store_data)
+            context.completed_ids.add(url)
+
         total_to_process = len(remaining_urls)
 
         # Track failed URLs for logging
@@ -409,40 +418,38 @@ def run(session, config: dict, **kwargs) -> dict:
         if context.parallel_workers > 1 and total_to_process > 0:
             logging.info(f"[{retailer_name}] Using parallel extraction with {context.parallel_workers} workers")
 
-            # Create session factory for parallel workers (each worker needs its own session)
-            session_factory = create_session_factory(config)
-
             # Thread-safe counters for progress
             processed_count = [0]  # Use list for mutable closure
             successful_count = [0]
             processed_lock = threading.Lock()
 
-            with ThreadPoolExecutor(max_workers=context.parallel_workers) as executor:
-                # Submit all extraction tasks
-                futures = {
-                    executor.submit(_extract_single_store, url, session_factory, retailer_name, config): url
-                    for url in remaining_urls
-                }
-
-                for future in as_completed(futures):
-                    url, store_data = future.result()
-
-                    with processed_lock:
-                        processed_count[0] += 1
-                        current_count = processed_count[0]
-
-                        if store_data:
-                            context.stores.append(store_data)
-                            context.completed_ids.add(url)
-                            successful_count[0] += 1
-                        else:
-                            failed_urls.append(url)
-
-                        # Progress logging every 50 stores
-                        log_progress(retailer_name, current_count, total_to_process, successful_count[0])
-
-                        # Checkpoint at intervals
-                        save_checkpoint_if_needed(context, current_count)
+            with create_session_pool(config) as session_pool:
+                with ThreadPoolExecutor(max_workers=context.parallel_workers) as executor:
+                    # Submit all extraction tasks
+                    futures = {
+                        executor.submit(_extract_single_store, url, session_pool, retailer_name, config): url
+                        for url in remaining_urls
+                    }
+
+                    for future in as_completed(futures):
+                        url, store_data = future.result()
+
+                        with processed_lock:
+                            processed_count[0] += 1
+                            current_count = processed_count[0]
+
+                            if store_data:
+                                context.stores.append(store_data)
+                                context.completed_ids.add(url)
+                                successful_count[0] += 1
+                            else:
+                                failed_urls.append(url)
+
+                            # Progress logging every 50 stores
+                            log_progress(retailer_name, current_count, total_to_process, successful_count[0])
+
+                            # Checkpoint at intervals
+                            save_checkpoint_if_needed(context, current_count)
         else:
             # Sequential extraction (original behavior for direct mode)
             for i, url in enumerate(remaining_urls, 1):
@@ -464,8 +471,55 @@ def run(session, config: dict, **kwargs) -> dict:
                 save_checkpoint_if_needed(context, i)
 
         # Finalize run with validation and cleanup
-        return finalize_scraper_run(context, failed_items=failed_urls, item_key="failed_urls")
+        result = finalize_scraper_run(context, failed_items=failed_urls, item_key="failed_urls")
+        if incremental:
+            incremental.save(context.stores)
+        return result
 
     except Exception as e:
         logging.error(f"[{retailer_name}] Fatal error: {e}", exc_info=True)
         raise
+
+
+async def run_async(session, config: dict, **kwargs) -> dict:
+    """Asyncio entry point, used when the retailer enables `async_engine`.
+
+    Discovery is identical to run(); store pages are fetched concurrently
+    through the shared asyncio engine and parsed with parse_store_page().
+
+    Args:
+        session: Configured session (used for sitemap discovery)
+        config: Retailer configuration dict from retailers.yaml
+        **kwargs: Same options as run()
+
+    Returns:
+        dict with keys:
+            - stores: List[dict] - Scraped store data
+            - count: int - Number of stores processed
+            - checkpoints_used: bool - Whether resume was used
+    """
+    retailer_name = kwargs.get('retailer', 'tmobile')
+
+    reset_request_counter()
+
+    context = ScraperContext(
+        retailer=retailer_name,
+        session=session,
+        config=config,
+        resume=kwargs.get('resume', False),
+        limit=kwargs.get('limit'),
+        refresh_urls=kwargs.get('refresh_urls', False),
+        use_rich_cache=False,
+        store_sink=kwargs.get('store_sink'),
+        incremental=kwargs.get('incremental', False),
+    )
+
+    runner = ScrapeRunner(context)
+
+    return await runner.run_with_checkpoints_async(
+        url_discovery_func=lambda session, retailer, lastmods=None, **_: get_store_urls_from_sitemap(
+            session, retailer, lastmods=lastmods
+        ),
+        parse_func=parse_store_page,
+        item_key_func=lambda url: url
+    )
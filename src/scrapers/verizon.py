@@ -3,22 +3,21 @@
 
 import json
 import logging
-import re
 import threading
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
 from typing import List, Dict, Optional, Any, Set, Tuple
-from bs4 import BeautifulSoup
 import requests
 
 from config import verizon_config as config
 from src.shared import utils
 from src.shared.cache import URLCache
 from src.shared.constants import WORKERS
+from src.shared.html_extract import extract_js_object, find_json_ld, make_soup
 from src.shared.request_counter import RequestCounter, check_pause_logic
-from src.shared.session_factory import create_session_factory
+from src.shared.session_factory import create_session_pool, release_session
 
 
 # Global request counter
@@ -155,43 +154,34 @@ def _scrape_states_from_html(session: requests.Session, yaml_config: dict = None
     _request_counter.increment()
     check_pause_logic(_request_counter, retailer=retailer, config=yaml_config)
 
-    soup = BeautifulSoup(response.text, 'html.parser')
+    html = response.text
     states = []
     seen_slugs = set()
 
-    # Try to extract states from JavaScript/JSON data first (similar to cities extraction)
-    scripts = soup.find_all('script')
-    for script in scripts:
-        script_content = script.string or ""
-        if 'var statesJSON' in script_content or 'statesJSON' in script_content:
-            try:
-                json_match = re.search(r'statesJSON\s*=\s*({.+?});', script_content, re.DOTALL)
-                if json_match:
-                    json_str = json_match.group(1)
-                    states_data = json.loads(json_str)
-                    if 'states' in states_data:
-                        for state_data in states_data['states']:
-                            state_slug = state_data.get('slug', '').lower()
-                            state_name = state_data.get('name', '')
-                            if state_slug and state_slug in VALID_STATE_SLUGS and state_slug not in seen_slugs:
-                                # Use provided name or fall back to mapping
-                                proper_name = state_name if state_name else STATE_SLUG_TO_NAME.get(state_slug, state_slug.title())
-                                # Use special URL pattern if available, otherwise standard pattern
-                                url_path = STATE_URL_PATTERNS.get(state_slug, f'/stores/state/{state_slug}/')
-                                states.append({
-                                    'name': proper_name,
-                                    'url': f"{config.BASE_URL}{url_path}"
-                                })
-                                seen_slugs.add(state_slug)
-                        if states:
-                            logging.info(f"[{retailer}] Extracted {len(states)} states from statesJSON")
-                            break
-            except (json.JSONDecodeError, AttributeError, KeyError) as e:
-                logging.debug(f"[{retailer}] Failed to parse statesJSON: {e}")
+    # Try to extract states from the embedded statesJSON blob first (no DOM needed)
+    states_data = extract_js_object(html, 'statesJSON')
+    if isinstance(states_data, dict) and isinstance(states_data.get('states'), list):
+        for state_data in states_data['states']:
+            if not isinstance(state_data, dict):
                 continue
+            state_slug = state_data.get('slug', '').lower()
+            state_name = state_data.get('name', '')
+            if state_slug and state_slug in VALID_STATE_SLUGS and state_slug not in seen_slugs:
+                # Use provided name or fall back to mapping
+                proper_name = state_name if state_name else STATE_SLUG_TO_NAME.get(state_slug, state_slug.title())
+                # Use special URL pattern if available, otherwise standard pattern
+                url_path = STATE_URL_PATTERNS.get(state_slug, f'/stores/state/{state_slug}/')
+                states.append({
+                    'name': proper_name,
+                    'url': f"{config.BASE_URL}{url_path}"
+                })
+                seen_slugs.add(state_slug)
+        if states:
+            logging.info(f"[{retailer}] Extracted {len(states)} states from statesJSON")
 
     # Fallback: Parse HTML links if JSON extraction didn't work
     if not states:
+        soup = make_soup(html)
         for link in soup.find_all('a', href=True):
             href = link.get('href', '')
             # Match patterns: /stores/state/{slug}/ or /stores/{slug}/ (for North Carolina)
@@ -319,54 +309,41 @@ def get_cities_for_state(session: requests.Session, state_url: str, state_name:
     # Extract state slug from URL (e.g., "new-jersey" from "/stores/state/new-jersey/")
     state_slug = state_url.rstrip('/').split('/')[-1].lower()
 
-    soup = BeautifulSoup(response.text, 'html.parser')
+    html = response.text
     cities = []
     seen_cities = set()
 
     # Try to extract cities from stateJSON JavaScript variable first
     # The page embeds city data in: var stateJSON = {"state":{...},"cities":[...]}
-    scripts = soup.find_all('script')
-    for script in scripts:
-        script_content = script.string or ""
-        if 'var stateJSON' in script_content or 'stateJSON' in script_content:
-            # Extract JSON from JavaScript variable
-            try:
-                # Find the JSON part (between = and ; or just the JSON object)
-                # Match: var stateJSON = {...}; or stateJSON = {...};
-                json_match = re.search(r'stateJSON\s*=\s*({.+?});', script_content, re.DOTALL)
-                if json_match:
-                    json_str = json_match.group(1)
-                    state_data = json.loads(json_str)
-
-                    # Validate that returned data matches expected state (prevents race condition)
-                    json_state_name = state_data.get('state', {}).get('name', '')
-                    if json_state_name and json_state_name.lower() != state_name.lower():
-                        logging.warning(
-                            f"[{retailer}] State mismatch for {state_name}: "
-                            f"page returned '{json_state_name}' data. Skipping."
-                        )
-                        continue
-
-                    if 'cities' in state_data:
-                        for city_data in state_data['cities']:
-                            city_name = city_data.get('name', '')
-                            city_url_path = city_data.get('url', '')
-                            if city_name and city_url_path and city_name not in seen_cities:
-                                city_url = f"{config.BASE_URL}{city_url_path}" if city_url_path.startswith('/') else city_url_path
-                                cities.append({
-                                    'city': city_name,
-                                    'state': state_name,
-                                    'url': city_url
-                                })
-                                seen_cities.add(city_name)
-                        logging.info(f"[{retailer}] Extracted {len(cities)} cities from stateJSON")
-                        break
-            except (json.JSONDecodeError, AttributeError, KeyError) as e:
-                logging.debug(f"[{retailer}] Failed to parse stateJSON: {e}")
-                continue
+    state_data = extract_js_object(html, 'stateJSON')
+    if isinstance(state_data, dict):
+        # Validate that returned data matches expected state (prevents race condition)
+        json_state = state_data.get('state')
+        json_state_name = json_state.get('name', '') if isinstance(json_state, dict) else ''
+        if json_state_name and json_state_name.lower() != state_name.lower():
+            logging.warning(
+                f"[{retailer}] State mismatch for {state_name}: "
+                f"page returned '{json_state_name}' data. Skipping."
+            )
+        elif isinstance(state_data.get('cities'), list):
+            for city_data in state_data['cities']:
+                if not isinstance(city_data, dict):
+                    continue
+                city_name = city_data.get('name', '')
+                city_url_path = city_data.get('url', '')
+                if city_name and city_url_path and city_name not in seen_cities:
+                    city_url = f"{config.BASE_URL}{city_url_path}" if city_url_path.startswith('/') else city_url_path
+                    cities.append({
+                        'city': city_name,
+                        'state': state_name,
+                        'url': city_url
+                    })
+                    seen_cities.add(city_name)
+            logging.info(f"[{retailer}] Extracted {len(cities)} cities from stateJSON")
 
     # Fallback: if no cities found from stateJSON, try parsing HTML links
     if not cities:
+        soup = make_soup(html)
         all_links = soup.find_all('a', href=True)
         state_slug = state_url.rstrip('/').split('/')[-1].lower()
 
@@ -425,43 +402,32 @@ def get_stores_for_city(session: requests.Session, city_url: str, city_name: str
     _request_counter.increment()
     check_pause_logic(_request_counter, retailer=retailer, config=yaml_config)
 
-    soup = BeautifulSoup(response.text, 'html.parser')
+    html = response.text
     stores = []
     seen_urls = set()
 
     # Try to extract stores from cityJSON JavaScript variable first
     # The page embeds store data in: var cityJSON = {"city":{...},"stores":[...]}
-    scripts = soup.find_all('script')
-    for script in scripts:
-        script_content = script.string or ""
-        if 'var cityJSON' in script_content or 'cityJSON' in script_content:
-            # Extract JSON from JavaScript variable
-            try:
-                # Match: var cityJSON = {...}; or cityJSON = {...};
-                json_match = re.search(r'cityJSON\s*=\s*({.+?});', script_content, re.DOTALL)
-                if json_match:
-                    json_str = json_match.group(1)
-                    city_data = json.loads(json_str)
-                    if 'stores' in city_data:
-                        for store_data in city_data['stores']:
-                            store_url_path = store_data.get('storeUrl', '')
-                            if store_url_path:
-                                store_url = f"{config.BASE_URL}{store_url_path}" if store_url_path.startswith('/') else store_url_path
-                                if store_url not in seen_urls:
-                                    stores.append({
-                                        'city': city_name,
-                                        'state': state_name,
-                                        'url': store_url
-                                    })
-                                    seen_urls.add(store_url)
-                        logging.info(f"[{retailer}] Extracted {len(stores)} stores from cityJSON")
-                        break
-            except (json.JSONDecodeError, AttributeError, KeyError) as e:
-                logging.debug(f"[{retailer}] Failed to parse cityJSON: {e}")
+    city_data = extract_js_object(html, 'cityJSON')
+    if isinstance(city_data, dict) and isinstance(city_data.get('stores'), list):
+        for store_data in city_data['stores']:
+            if not isinstance(store_data, dict):
                 continue
+            store_url_path = store_data.get('storeUrl', '')
+            if store_url_path:
+                store_url = f"{config.BASE_URL}{store_url_path}" if store_url_path.startswith('/') else store_url_path
+                if store_url not in seen_urls:
+                    stores.append({
+                        'city': city_name,
+                        'state': state_name,
+                        'url': store_url
+                    })
+                    seen_urls.add(store_url)
+        logging.info(f"[{retailer}] Extracted {len(stores)} stores from cityJSON")
 
     # Fallback: if no stores found from cityJSON, try parsing HTML links
     if not stores:
+        soup = make_soup(html)
         for link in soup.find_all('a', href=True):
             href = link.get('href', '')
             # Store detail URLs can be in format: /stores/{state}/{city}/{store-name}/ or /stores/details/...
@@ -682,49 +648,43 @@ def extract_store_details(session: requests.Session, store_url: str, yaml_config
     _request_counter.increment()
     check_pause_logic(_request_counter, retailer=retailer, config=yaml_config)
 
-    soup = BeautifulSoup(response.text, 'html.parser')
-
-    # Find JSON-LD script tag
-    for script in soup.find_all('script', type='application/ld+json'):
+    # Find the JSON-LD Store object without building a DOM
+    data = find_json_ld(response.text, 'Store')
+    if data:
         try:
-            data = json.loads(script.string)
-            if data.get('@type') == 'Store':
-                # Extract address components
-                address = data.get('address', {})
-                geo = data.get('geo', {})
-
-                result = {
-                    'name': data.get('name', ''),
-                    'street_address': address.get('streetAddress', ''),
-                    'city': address.get('addressLocality', ''),
-                    'state': address.get('addressRegion', ''),
-                    'zip': address.get('postalCode', ''),
-                    'country': address.get('addressCountry', 'US'),
-                    'latitude': geo.get('latitude', ''),
-                    'longitude': geo.get('longitude', ''),
-                    'phone': data.get('telephone', ''),
-                    'url': store_url,
-                    'scraped_at': datetime.now().isoformat()
-                }
+            # Extract address components
+            address = data.get('address', {})
+            geo = data.get('geo', {})
+
+            result = {
+                'name': data.get('name', ''),
+                'street_address': address.get('streetAddress', ''),
+                'city': address.get('addressLocality', ''),
+                'state': address.get('addressRegion', ''),
+                'zip': address.get('postalCode', ''),
+                'country': address.get('addressCountry', 'US'),
+                'latitude': geo.get('latitude', ''),
+                'longitude': geo.get('longitude', ''),
+                'phone': data.get('telephone', ''),
+                'url': store_url,
+                'scraped_at': datetime.now().isoformat()
+            }
 
-                # Parse URL components (sub-channel, dealer name, location, store number, UID)
-                url_components = parse_url_components(store_url)
-                result.update(url_components)
+            # Parse URL components (sub-channel, dealer name, location, store number, UID)
+            url_components = parse_url_components(store_url)
+            result.update(url_components)
 
-                # Validate the extracted data
-                if _validate_store_data(result, store_url):
-                    logging.debug(f"[{retailer}] Extracted store: {result.get('name', 'Unknown')}")
-                    return result
-                else:
-                    logging.warning(f"[{retailer}] Skipping store due to validation failure: {store_url}")
-                    return None
+            # Validate the extracted data
+            if _validate_store_data(result, store_url):
+                logging.debug(f"[{retailer}] Extracted store: {result.get('name', 'Unknown')}")
+                return result
+            else:
+                logging.warning(f"[{retailer}] Skipping store due to validation failure: {store_url}")
+                return None
 
-        except json.JSONDecodeError as e:
-            logging.warning(f"[{retailer}] JSON decode error for {store_url}: {e}")
-            continue
         except Exception as e:
             logging.warning(f"[{retailer}] Error parsing JSON-LD for {store_url}: {e}")
-            continue
+            return None
 
     logging.warning(f"[{retailer}] No JSON-LD Store data found for {store_url}")
     return None
@@ -753,12 +713,12 @@ def _fetch_cities_for_state_worker(
 ) -> Tuple[str, List[Dict[str, str]]]:
     """Worker function for parallel city discovery.
 
-    Fetches all cities for a single state. Each worker creates its own
-    session instance for thread safety.
+    Fetches all cities for a single state. Each worker uses its own
+    thread's session instance for thread safety.
 
     Args:
         state: Dict with 'name' and 'url' keys
-        session_factory: Callable that creates session instances
+        session_factory: Session factory or SessionPool providing the worker's session
         yaml_config: Retailer configuration
         retailer_name: Name of retailer for logging
 
@@ -779,9 +739,7 @@ def _fetch_cities_for_state_worker(
         logging.warning(f"[{retailer_name}] Error fetching cities for {state['name']}: {e}")
         return (state['name'], [])
     finally:
-        # Clean up session resources
-        if hasattr(session, 'close'):
-            session.close()
+        release_session(session_factory, session)
 
 
 def _fetch_stores_for_city_worker(
@@ -792,12 +750,12 @@ def _fetch_stores_for_city_worker(
 ) -> Tuple[str, str, List[str]]:
     """Worker function for parallel store URL discovery.
 
-    Fetches all store URLs for a single city. Each worker creates its own
-    session instance for thread safety.
+    Fetches all store URLs for a single city. Each worker uses its own
+    thread's session instance for thread safety.
 
     Args:
         city: Dict with 'city', 'state', and 'url' keys
-        session_factory: Callable that creates session instances
+        session_factory: Session factory or SessionPool providing the worker's session
         yaml_config: Retailer configuration
         retailer_name: Name of retailer for logging
 
@@ -820,9 +778,7 @@ def _fetch_stores_for_city_worker(
         logging.warning(f"[{retailer_name}] Error fetching stores for {city['city']}, {city['state']}: {e}")
         return (city['city'], city['state'], [])
     finally:
-        # Clean up session resources
-        if hasattr(session, 'close'):
-            session.close()
+        release_session(session_factory, session)
 
 
 # =============================================================================
@@ -833,7 +789,7 @@ def _fetch_stores_for_city_worker(
 
 def _extract_single_store(
     url: str,
-    session,
+    session_factory,
     yaml_config: dict,
     retailer_name: str
 ) -> Tuple[str, Optional[Dict[str, Any]]]:
@@ -841,19 +797,22 @@ def _extract_single_store(
 
     Args:
         url: Store URL to extract
-        session: Session to use for requests
+        session_factory: Session factory or SessionPool providing the worker's session
         yaml_config: Retailer configuration
         retailer_name: Name of retailer for logging
 
     Returns:
         Tuple of (url, store_data) where store_data is None on failure
     """
+    session = session_factory()
     try:
         store_data = extract_store_details(session, url, yaml_config, retailer_name)
         return (url, store_data)
     except Exception as e:
         logging.warning(f"[{retailer_name}] Error extracting {url}: {e}")
         return (url, None)
+    finally:
+        release_session(session_factory, session)
 
 
 def _initialize_scraper_context(config: dict, **kwargs) -> dict:
@@ -1098,9 +1057,6 @@ def _discover_or_load_urls(session, context: dict) -> Optional[List[str]]:
         else:
             logging.info(f"[{retailer_name}] Found {len(all_states)} states")
 
-        # Create session factory for parallel workers (each worker needs its own session)
-        session_factory = create_session_factory(config)
-
         # Phase 2: Parallel city discovery
         if discovery_checkpoint and discovery_checkpoint.get('phase', 0) >= 2:
             # Resume from Phase 2 checkpoint
@@ -1119,30 +1075,31 @@ def _discover_or_load_urls(session, context: dict) -> Optional[List[str]]:
                 states_completed = [0]
                 states_lock = threading.Lock()
 
-                with ThreadPoolExecutor(max_workers=discovery_workers) as executor:
-                    futures = {
-                        executor.submit(
-                            _fetch_cities_for_state_worker,
-                            state,
-                            session_factory,
-                            config,
-                            retailer_name
-                        ): state
-                        for state in all_states
-                    }
-
-                    for future in as_completed(futures):
-                        state_name, cities = future.result()
-                        all_cities.extend(cities)
-
-                        with states_lock:
-                            states_completed[0] += 1
-                            if states_completed[0] % 10 == 0 or states_completed[0] == len(all_states):
-                                logging.info(
-                                    f"[{retailer_name}] Phase 2 progress: "
-                                    f"{states_completed[0]}/{len(all_states)} states, "
-                                    f"{len(all_cities)} cities found"
-                                )
+                with create_session_pool(config) as session_pool:
+                    with ThreadPoolExecutor(max_workers=discovery_workers) as executor:
+                        futures = {
+                            executor.submit(
+                                _fetch_cities_for_state_worker,
+                                state,
+                                session_pool,
+                                config,
+                                retailer_name
+                            ): state
+                            for state in all_states
+                        }
+
+                        for future in as_completed(futures):
+                            state_name, cities = future.result()
+                            all_cities.extend(cities)
+
+                            with states_lock:
+                                states_completed[0] += 1
+                                if states_completed[0] % 10 == 0 or states_completed[0] == len(all_states):
+                                    logging.info(
+                                        f"[{retailer_name}] Phase 2 progress: "
+                                        f"{states_completed[0]}/{len(all_states)} states, "
+                                        f"{len(all_cities)} cities found"
+                                    )
             else:
                 # Sequential fallback for direct mode or single state
                 logging.info(f"[{retailer_name}] Phase 2: Discovering cities (sequential)")
@@ -1181,30 +1138,31 @@ def _discover_or_load_urls(session, context: dict) -> Optional[List[str]]:
                 cities_completed = [0]
                 cities_lock = threading.Lock()
 
-                with ThreadPoolExecutor(max_workers=discovery_workers) as executor:
-                    futures = {
-                        executor.submit(
-                            _fetch_stores_for_city_worker,
-                            city,
-                            session_factory,
-                            config,
-                            retailer_name
-                        ): city
-                        for city in all_cities
-                    }
-
-                    for future in as_completed(futures):
-                        city_name, state_name, store_urls = future.result()
-                        all_store_urls.extend(store_urls)
-
-                        with cities_lock:
-                            cities_completed[0] += 1
-                            if cities_completed[0] % 100 == 0 or cities_completed[0] == len(all_cities):
-                                logging.info(
-                                    f"[{retailer_name}] Phase 3 progress: "
-                                    f"{cities_completed[0]}/{len(all_cities)} cities, "
-                                    f"{len(all_store_urls)} store URLs found"
-                                )
+                with create_session_pool(config) as session_pool:
+                    with ThreadPoolExecutor(max_workers=discovery_workers) as executor:
+                        futures = {
+                            executor.submit(
+                                _fetch_stores_for_city_worker,
+                                city,
+                                session_pool,
+                                config,
+                                retailer_name
+                            ): city
+                            for city in all_cities
+                        }
+
+                        for future in as_completed(futures):
+                            city_name, state_name, store_urls = future.result()
+                            all_store_urls.extend(store_urls)
+
+                            with cities_lock:
+                                cities_completed[0] += 1
+                                if cities_completed[0] % 100 == 0 or cities_completed[0] == len(all_cities):
+                                    logging.info(
+                                        f"[{retailer_name}] Phase 3 progress: "
+                                        f"{cities_completed[0]}/{len(all_cities)} cities, "
+                                        f"{len(all_store_urls)} store URLs found"
+                                    )
             else:
                 # Sequential fallback for direct mode or few cities
                 logging.info(f"[{retailer_name}] Phase 3: Discovering store URLs (sequential)")
@@ -1243,7 +1201,7 @@ def _extract_store_details_parallel(session, remaining_urls: List[str], context:
     """Extract store details using parallel workers.
 
     Args:
-        session: Requests session
+        session: Requests session (workers use pooled per-thread sessions instead)
         remaining_urls: List of URLs to process
         context: Scraper execution context
         stores: List to append extracted stores to (modified in place)
@@ -1262,41 +1220,44 @@ def _extract_store_details_parallel(session, remaining_urls: List[str], context:
     processed_count = [0]  # Use list for mutable closure
     processed_lock = threading.Lock()
 
-    with ThreadPoolExecutor(max_workers=parallel_workers) as executor:
-        # Process in batches to limit memory usage
-        batch_size = config.get('extraction_batch_size', 500)
-
-        for batch_start in range(0, len(remaining_urls), batch_size):
-            batch_urls = remaining_urls[batch_start:batch_start + batch_size]
-            futures = {
-                executor.submit(_extract_single_store, url, session, config, retailer_name): url
-                for url in batch_urls
-            }
+    # Each worker thread gets its own warm keep-alive session; requests.Session
+    # is not thread-safe, so the caller's session is not shared across workers
+    with create_session_pool(config) as session_pool:
+        with ThreadPoolExecutor(max_workers=parallel_workers) as executor:
+            # Process in batches to limit memory usage
+            batch_size = config.get('extraction_batch_size', 500)
+
+            for batch_start in range(0, len(remaining_urls), batch_size):
+                batch_urls = remaining_urls[batch_start:batch_start + batch_size]
+                futures = {
+                    executor.submit(_extract_single_store, url, session_pool, config, retailer_name): url
+                    for url in batch_urls
+                }
 
-            for future in as_completed(futures):
-                url, store_data = future.result()
-
-                with processed_lock:
-                    processed_count[0] += 1
-                    current_count = processed_count[0]
-
-                    if store_data:
-                        stores.append(store_data)
-                        completed_urls.add(url)
-
-                    # Progress logging every 100 stores
-                    if current_count % 100 == 0:
-                        logging.info(f"[{retailer_name}] Progress: {current_count}/{total_to_process} ({current_count/total_to_process*100:.1f}%)")
-
-                    # Checkpoint at intervals
-                    if current_count % checkpoint_interval == 0:
-                        utils.save_checkpoint({
-                            'completed_count': len(stores),
-                            'completed_urls': list(completed_urls),
-                            'stores': stores,
-                            'last_updated': datetime.now().isoformat()
-                        }, checkpoint_path)
-                        logging.info(f"[{retailer_name}] Checkpoint saved: {len(stores)} stores processed")
+                for future in as_completed(futures):
+                    url, store_data = future.result()
+
+                    with processed_lock:
+                        processed_count[0] += 1
+                        current_count = processed_count[0]
+
+                        if store_data:
+                            stores.append(store_data)
+                            completed_urls.add(url)
+
+                        # Progress logging every 100 stores
+                        if current_count % 100 == 0:
+                            logging.info(f"[{retailer_name}] Progress: {current_count}/{total_to_process} ({current_count/total_to_process*100:.1f}%)")
+
+                        # Checkpoint at intervals
+                        if current_count % checkpoint_interval == 0:
+                            utils.save_checkpoint({
+                                'completed_count': len(stores),
+                                'completed_urls': list(completed_urls),
+                                'stores': stores,
+                                'last_updated': datetime.now().isoformat()
+                            }, checkpoint_path)
+                            logging.info(f"[{retailer_name}] Checkpoint saved: {len(stores)} stores processed")
 
 
 def _extract_store_details_sequential(session, remaining_urls: List[str], context: dict, stores: List[dict], completed_urls: Set[str]) -> None:
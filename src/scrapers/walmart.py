@@ -5,20 +5,24 @@ import hashlib
 import json
 import logging
 import re
+import threading
 import defusedxml.ElementTree as ET
 from datetime import datetime, timedelta
 from dataclasses import dataclass, asdict
 from pathlib import Path
-from typing import List, Optional
+from typing import Dict, List, Optional, Tuple
 from bs4 import BeautifulSoup
 import requests
 
 from config import walmart_config
 from src.shared import utils
 from src.shared.cache import URLCache
+from src.shared.cache_interface import ResponseCache, RevalidationCache, SQLiteCacheBackend
+from src.shared.incremental import IncrementalState, sitemap_lastmods
 from src.shared.constants import CACHE
 from src.shared.request_counter import RequestCounter, check_pause_logic
 from src.shared.proxy_client import ProxyClient, ProxyConfig, ProxyMode
+from src.shared.scrape_runner import ScrapeRunner, ScraperContext
 
 
 # Global request counter
@@ -32,25 +36,60 @@ _request_counter = RequestCounter()
 # Default response cache expiry in days (store pages rarely change structure)
 RESPONSE_CACHE_EXPIRY_DAYS = CACHE.RESPONSE_CACHE_EXPIRY_DAYS
 
+# One SQLite-backed ResponseCache per retailer, shared by all extraction calls
+_response_caches: Dict[str, ResponseCache] = {}
+_response_caches_lock = threading.Lock()
+
 
 def _get_response_cache_dir(retailer: str) -> Path:
     """Get directory for response cache files."""
     return Path(f"data/{retailer}/response_cache")
 
 
-def _get_cached_response(url: str, retailer: str) -> Optional[str]:
-    """Check cache for stored Web Scraper API response.
+def _get_response_cache(retailer: str, max_bytes: Optional[int] = CACHE.SQLITE_MAX_BYTES) -> ResponseCache:
+    """Get (or open) the single-file response cache for a retailer.
+
+    Args:
+        retailer: Retailer name
+        max_bytes: Compressed size cap applied when the cache is first opened
+
+    Returns:
+        ResponseCache backed by data/{retailer}/response_cache/cache.sqlite3
+    """
+    with _response_caches_lock:
+        cache = _response_caches.get(retailer)
+        if cache is None:
+            cache_dir = _get_response_cache_dir(retailer)
+            cache = ResponseCache(
+                retailer,
+                cache_dir=cache_dir,
+                ttl_days=RESPONSE_CACHE_EXPIRY_DAYS,
+                backend=SQLiteCacheBackend(cache_dir, max_bytes=max_bytes)
+            )
+            _response_caches[retailer] = cache
+        return cache
+
+
+def _close_response_cache(retailer: str) -> None:
+    """Close and forget the response cache for a retailer."""
+    with _response_caches_lock:
+        cache = _response_caches.pop(retailer, None)
+    if cache is not None:
+        cache.close()
+
+
+def _get_legacy_cached_response(url: str, retailer: str) -> Optional[Tuple[str, datetime]]:
+    """Read a response from the old one-JSON-file-per-URL cache layout.
 
     Args:
         url: Store page URL
         retailer: Retailer name
 
     Returns:
-        Cached HTML response if valid, None otherwise
+        (html, cached_at) if a legacy file exists and is not expired, None otherwise
     """
-    cache_dir = _get_response_cache_dir(retailer)
     url_hash = hashlib.sha256(url.encode()).hexdigest()
-    cache_file = cache_dir / f"{url_hash}.json"
+    cache_file = _get_response_cache_dir(retailer) / f"{url_hash}.json"
 
     if not cache_file.exists():
         return None
@@ -62,21 +101,54 @@ def _get_cached_response(url: str, retailer: str) -> Optional[str]:
         cached_at = data.get('cached_at')
         if cached_at:
             cached_time = datetime.fromisoformat(cached_at)
-            age = datetime.now() - cached_time
-
-            if age < timedelta(days=RESPONSE_CACHE_EXPIRY_DAYS):
-                logging.debug(f"[{retailer}] Cache hit for {url}")
-                return data.get('html')
-            else:
-                logging.debug(f"[{retailer}] Response cache expired for {url}")
+            html = data.get('html')
+            if html and datetime.now() - cached_time < timedelta(days=RESPONSE_CACHE_EXPIRY_DAYS):
+                return html, cached_time
 
         return None
 
-    except (json.JSONDecodeError, KeyError, ValueError) as e:
-        logging.debug(f"[{retailer}] Error reading response cache: {e}")
+    except (json.JSONDecodeError, KeyError, ValueError, OSError) as e:
+        logging.debug(f"[{retailer}] Error reading legacy response cache: {e}")
         return None
 
 
+def _remove_legacy_cached_response(url: str, retailer: str) -> None:
+    """Delete a legacy per-URL JSON file after it has been migrated."""
+    url_hash = hashlib.sha256(url.encode()).hexdigest()
+    try:
+        (_get_response_cache_dir(retailer) / f"{url_hash}.json").unlink(missing_ok=True)
+    except OSError as e:
+        logging.debug(f"[{retailer}] Could not remove migrated legacy cache file: {e}")
+
+
+def _get_cached_response(url: str, retailer: str) -> Optional[str]:
+    """Check cache for stored Web Scraper API response.
+
+    Falls back to the legacy per-URL JSON files and migrates hits into the
+    SQLite store with their original timestamp, so responses cached before
+    the switch are not re-fetched and still expire on schedule. The legacy
+    file is removed once migrated.
+
+    Args:
+        url: Store page URL
+        retailer: Retailer name
+
+    Returns:
+        Cached HTML response if valid, None otherwise
+    """
+    cache = _get_response_cache(retailer)
+    html = cache.get(url)
+    if html is None:
+        legacy = _get_legacy_cached_response(url, retailer)
+        if legacy:
+            html, cached_at = legacy
+            cache.set(url, html, cached_at=cached_at)
+            _remove_legacy_cached_response(url, retailer)
+    if html:
+        logging.debug(f"[{retailer}] Cache hit for {url}")
+    return html
+
+
 def _cache_response(url: str, html: str, retailer: str) -> None:
     """Cache Web Scraper API response to avoid re-fetching.
 
@@ -85,22 +157,8 @@ def _cache_response(url: str, html: str, retailer: str) -> None:
         html: HTML response content
         retailer: Retailer name
     """
-    cache_dir = _get_response_cache_dir(retailer)
-    cache_dir.mkdir(parents=True, exist_ok=True)
-
-    url_hash = hashlib.sha256(url.encode()).hexdigest()
-    cache_file = cache_dir / f"{url_hash}.json"
-
-    try:
-        with open(cache_file, 'w', encoding='utf-8') as f:
-            json.dump({
-                'url': url,
-                'cached_at': datetime.now().isoformat(),
-                'html': html
-            }, f)
-        logging.debug(f"[{retailer}] Cached response for {url}")
-    except IOError as e:
-        logging.warning(f"[{retailer}] Failed to cache response: {e}")
+    _get_response_cache(retailer).set(url, html)
+    logging.debug(f"[{retailer}] Cached response for {url}")
 
 
 @dataclass
@@ -162,9 +220,18 @@ class WalmartStore:
         return result
 
 
-def get_store_urls_from_sitemap(session: requests.Session, retailer: str = 'walmart') -> List[str]:
+def get_store_urls_from_sitemap(
+    session: requests.Session,
+    retailer: str = 'walmart',
+    lastmods: Optional[Dict[str, str]] = None
+) -> List[str]:
     """Fetch all store URLs from the Walmart gzipped sitemaps.
 
+    Args:
+        session: Requests session object
+        retailer: Retailer name for logging
+        lastmods: Optional dict filled with each URL's sitemap <lastmod> (incremental runs)
+
     Returns:
         List of store URLs from all sitemap types
     """
@@ -173,7 +240,9 @@ def get_store_urls_from_sitemap(session: requests.Session, retailer: str = 'walm
     for sitemap_url in walmart_config.SITEMAP_URLS:
         logging.info(f"[{retailer}] Fetching sitemap: {sitemap_url}")
 
-        response = utils.get_with_retry(session, sitemap_url)
+        response = utils.get_with_retry(
+            session, sitemap_url, revalidation_cache=RevalidationCache.for_retailer(retailer)
+        )
         if not response:
             logging.error(f"[{retailer}] Failed to fetch sitemap: {sitemap_url}")
             continue
@@ -202,6 +271,8 @@ def get_store_urls_from_sitemap(session: requests.Session, retailer: str = 'walm
                     sitemap_urls.append(url)
 
             all_store_urls.extend(sitemap_urls)
+            if lastmods is not None:
+                lastmods.update(sitemap_lastmods(root))
             logging.info(f"[{retailer}] Found {len(sitemap_urls)} store URLs from {sitemap_url}")
         except ET.ParseError as e:
             logging.error(f"[{retailer}] Failed to parse XML sitemap {sitemap_url}: {e}")
@@ -264,6 +335,20 @@ def extract_store_details(client, url: str, retailer: str = 'walmart', use_cache
         if use_cache and response_text:
             _cache_response(url, response_text, retailer)
 
+    return parse_store_page(response_text, url, retailer)
+
+
+def parse_store_page(response_text: str, url: str, retailer: str = 'walmart') -> Optional[WalmartStore]:
+    """Build a WalmartStore from a rendered store page.
+
+    Args:
+        response_text: Store page HTML (JS-rendered)
+        url: Store page URL
+        retailer: Retailer name for logging
+
+    Returns:
+        WalmartStore object if successful, None otherwise
+    """
     try:
         # Use BeautifulSoup to extract __NEXT_DATA__ script tag
         # This is more robust than regex as it properly handles embedded scripts
@@ -384,6 +469,46 @@ def extract_store_details(client, url: str, retailer: str = 'walmart', use_cache
         return None
 
 
+def _run_batch(session, config: dict, store_client: ProxyClient, **kwargs) -> dict:
+    """Scrape store pages as Web Scraper API batch jobs (`scraper_api_batch: true`).
+
+    Uses ScrapeRunner's push-pull backend: cached pages are parsed directly,
+    the rest are submitted in bulk and parsed as their jobs complete.
+
+    Args:
+        session: Session used for sitemap discovery
+        config: Retailer configuration dict
+        store_client: ProxyClient in web_scraper_api mode for store pages
+        **kwargs: Options from run()
+
+    Returns:
+        Same dict as run()
+    """
+    retailer_name = kwargs.get('retailer', 'walmart')
+    context = ScraperContext(
+        retailer=retailer_name,
+        session=session,
+        config=config,
+        resume=kwargs.get('resume', False),
+        limit=kwargs.get('limit'),
+        refresh_urls=kwargs.get('refresh_urls', False),
+        store_sink=kwargs.get('store_sink'),
+        incremental=kwargs.get('incremental', False),
+    )
+    runner = ScrapeRunner(context)
+
+    return runner.run_with_checkpoints_batch(
+        url_discovery_func=lambda session, retailer, lastmods=None, **_: get_store_urls_from_sitemap(
+            session, retailer, lastmods=lastmods
+        ),
+        parse_func=parse_store_page,
+        item_key_func=lambda url: url,
+        client=store_client,
+        cached_page_func=lambda url: _get_cached_response(url, retailer_name),
+        cache_page_func=lambda url, html: _cache_response(url, html, retailer_name),
+    )
+
+
 def reset_request_counter() -> None:
     """Reset the global request counter"""
     _request_counter.reset()
@@ -412,7 +537,7 @@ def run(session, config: dict, **kwargs) -> dict:
         **kwargs: Additional options
             - resume: bool - Resume from checkpoint
             - limit: int - Max stores to process
-            - incremental: bool - Only process changes
+            - incremental: bool - Only fetch URLs whose sitemap <lastmod> changed
             - refresh_urls: bool - Force URL re-discovery (ignore cache)
 
     Returns:
@@ -430,9 +555,19 @@ def run(session, config: dict, **kwargs) -> dict:
         limit = kwargs.get('limit')
         resume = kwargs.get('resume', False)
         refresh_urls = kwargs.get('refresh_urls', False)
+        incremental = IncrementalState(retailer_name) if kwargs.get('incremental', False) else None
 
         reset_request_counter()
 
+        # Open the response cache and drop expired pages in one statement
+        max_mb = config.get('response_cache_max_mb')
+        response_cache = _get_response_cache(
+            retailer_name, max_mb * 1024 * 1024 if max_mb else CACHE.SQLITE_MAX_BYTES
+        )
+        expired = response_cache.evict_expired()
+        if expired:
+            logging.info(f"[{retailer_name}] Evicted {expired} expired cached responses")
+
         # Auto-select delays based on proxy mode for optimal performance
         proxy_config_dict = config.get('proxy', {})
         proxy_mode = proxy_config_dict.get('mode', 'direct')
@@ -456,7 +591,10 @@ def run(session, config: dict, **kwargs) -> dict:
 
         # Create store client using config-based proxy settings (#149)
         proxy_config = ProxyConfig.from_dict(store_proxy_config)
-        store_client = ProxyClient(proxy_config)
+        store_client = ProxyClient(proxy_config, retailer=retailer_name)
+
+        if config.get('scraper_api_batch') and store_client.config.mode == ProxyMode.WEB_SCRAPER_API:
+            return _run_batch(session, config, store_client, **kwargs)
 
         checkpoint_path = f"data/{retailer_name}/checkpoints/scrape_progress.json"
         checkpoint_interval = config.get('checkpoint_interval', 100)
@@ -473,15 +611,18 @@ def run(session, config: dict, **kwargs) -> dict:
                 logging.info(f"[{retailer_name}] Resuming from checkpoint: {len(stores)} stores already collected")
                 checkpoints_used = True
 
-        # Try to load cached URLs (skip sitemap fetch if cache is valid)
+        # Try to load cached URLs (skip sitemap fetch if cache is valid; incremental
+        # runs rediscover to get fresh <lastmod> dates)
         url_cache = URLCache(retailer_name)
         store_urls = None
-        if not refresh_urls:
+        if not refresh_urls and not incremental:
             store_urls = url_cache.get()
 
         if store_urls is None:
             # Cache miss or refresh requested - fetch from sitemap
-            store_urls = get_store_urls_from_sitemap(session, retailer_name)
+            store_urls = get_store_urls_from_sitemap(
+                session, retailer_name, lastmods=incremental.lastmods if incremental else None
+            )
             logging.info(f"[{retailer_name}] Found {len(store_urls)} store URLs from sitemap")
 
             # Save to cache for future runs
@@ -494,6 +635,11 @@ def run(session, config: dict, **kwargs) -> dict:
             logging.warning(f"[{retailer_name}] No store URLs found")
             return {'stores': [], 'count': 0, 'checkpoints_used': False}
 
+        # Incremental: only fetch new/changed URLs, carry unchanged stores forward
+        carried = []
+        if incremental:
+            store_urls, carried = incremental.plan(store_urls, completed=completed_urls)
+
         remaining_urls = [url for url in store_urls if url not in completed_urls]
 
         if resume and completed_urls:
@@ -507,6 +653,10 @@ def run(session, config: dict, **kwargs) -> dict:
             else:
                 remaining_urls = []
 
+        for url, store_data in carried:
+            stores.append(store_data)
+            completed_urls.add(url)
+
         total_to_process = len(remaining_urls)
         if total_to_process > 0:
             logging.info(f"[{retailer_name}] Extracting details for {total_to_process} stores")
@@ -583,6 +733,9 @@ def run(session, config: dict, **kwargs) -> dict:
 
         logging.info(f"[{retailer_name}] Completed: {len(stores)} stores successfully scraped")
 
+        if incremental:
+            incremental.save(stores)
+
         return {
             'stores': stores,
             'count': len(stores),
@@ -593,6 +746,8 @@ def run(session, config: dict, **kwargs) -> dict:
         logging.error(f"[{retailer_name}] Fatal error: {e}", exc_info=True)
         raise
     finally:
+        _close_response_cache(retailer_name)
+
         # Clean up store extraction session
         if 'store_client' in locals() and store_client and hasattr(store_client, 'close'):
             try:
@@ -33,11 +33,22 @@ from .utils import (
 from .proxy_client import (
     ProxyClient,
     ProxyConfig,
+    ProxyCostLedger,
     ProxyMode,
     ProxyResponse,
     create_proxy_client,
 )
 
+from .residential_pool import (
+    ResidentialSessionPool,
+    StickySession,
+)
+
+from .tiered_proxy import (
+    TieredProxiedSession,
+    is_block_response,
+)
+
 from .scraper_manager import (
     ScraperManager,
     get_scraper_manager,
@@ -69,10 +80,31 @@ from .cache_interface import (
     URLListCache,
     RichURLCache as RichURLCacheInterface,
     ResponseCache,
+    RevalidationCache,
+    SQLiteCacheBackend,
 )
 
 from .session_factory import (
+    SessionPool,
     create_session_factory,
+    create_session_pool,
+)
+
+from .incremental import (
+    IncrementalState,
+    sitemap_lastmods,
+)
+
+from .html_extract import (
+    extract_js_object,
+    extract_json_ld,
+    extract_next_data,
+    find_json_ld,
+)
+
+from .gap_fill import (
+    ZipGapFill,
+    haversine_miles,
 )
 
 from .scrape_runner import (
@@ -81,8 +113,11 @@ from .scrape_runner import (
 )
 
 from .concurrency import (
+    AdaptiveController,
     GlobalConcurrencyManager,
     ConcurrencyConfig,
+    PauseGate,
+    TokenBucket,
 )
 
 from .validation import (
@@ -143,6 +178,7 @@ __all__ = [
     # Oxylabs proxy integration
     'ProxyClient',
     'ProxyConfig',
+    'ProxyCostLedger',
     'ProxyMode',
     'ProxyResponse',
     'create_proxy_client',
@@ -153,6 +189,12 @@ __all__ = [
     'close_proxy_client',
     'close_all_proxy_clients',
     'ProxiedSession',
+    # Sticky residential session pool
+    'ResidentialSessionPool',
+    'StickySession',
+    # Tiered proxy escalation
+    'TieredProxiedSession',
+    'is_block_response',
     # Per-retailer proxy configuration
     'get_retailer_proxy_config',
     'load_retailer_config',
@@ -181,14 +223,32 @@ __all__ = [
     'URLListCache',
     'RichURLCacheInterface',
     'ResponseCache',
+    'RevalidationCache',
+    'SQLiteCacheBackend',
     # Session factory
+    'SessionPool',
     'create_session_factory',
+    'create_session_pool',
+    # Changed-only incremental runs
+    'IncrementalState',
+    'sitemap_lastmods',
+    # Fast JSON-LD / embedded JSON extraction
+    'extract_js_object',
+    'extract_json_ld',
+    'extract_next_data',
+    'find_json_ld',
+    # Coverage-aware ZIP gap-fill
+    'ZipGapFill',
+    'haversine_miles',
     # Scrape runner (unified orchestration)
     'ScrapeRunner',
     'ScraperContext',
     # Concurrency management
+    'AdaptiveController',
     'GlobalConcurrencyManager',
     'ConcurrencyConfig',
+    'PauseGate',
+    'TokenBucket',
     # Validation
     'ValidationResult',
     'validate_store_data',
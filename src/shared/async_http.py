@@ -0,0 +1,438 @@
+"""Asyncio HTTP engine for high-concurrency scraping.
+
+This module provides non-blocking counterparts to ProxyClient and
+get_with_retry built on aiohttp. A single event loop can multiplex
+thousands of in-flight requests, with delays and backoff implemented as
+asyncio.sleep() so waiting requests never pin an OS thread.
+
+Usage:
+    from src.shared.async_http import AsyncProxyClient, async_get_with_retry
+
+    async with AsyncProxyClient(ProxyConfig.from_dict(config['proxy'])) as client:
+        response = await async_get_with_retry(client, url, min_delay=0.2, max_delay=0.5)
+
+aiohttp is optional: callers should check AIOHTTP_AVAILABLE and fall back
+to the synchronous ProxyClient/get_with_retry path when it is missing.
+"""
+
+import asyncio
+import logging
+import random
+import time
+from types import TracebackType
+from typing import Any, Callable, Dict, Optional, Type
+
+try:
+    import aiohttp
+    AIOHTTP_AVAILABLE = True
+except ImportError:
+    AIOHTTP_AVAILABLE = False
+
+from src.shared.concurrency import GlobalConcurrencyManager
+from src.shared.constants import HTTP, WORKERS
+from src.shared.delays import DEFAULT_MAX_DELAY, DEFAULT_MIN_DELAY
+from src.shared.http import _sanitize_url, get_headers, log_safe
+from src.shared.proxy_client import (
+    _USER_AGENTS,
+    ProxyConfig,
+    ProxyCostLedger,
+    ProxyMode,
+    ProxyResponse,
+    _request_headers,
+    _residential_proxy_url,
+    _scraper_api_payload,
+    _scraper_api_result,
+    redact_credentials,
+)
+from src.shared.residential_pool import ResidentialSessionPool
+
+__all__ = [
+    'AIOHTTP_AVAILABLE',
+    'AsyncProxyClient',
+    'async_get_with_retry',
+    'async_random_delay',
+]
+
+
+async def async_random_delay(min_sec: float = None, max_sec: float = None, scale: float = 1.0) -> None:
+    """Non-blocking equivalent of delays.random_delay().
+
+    Args:
+        min_sec: Minimum delay in seconds (uses default if None)
+        max_sec: Maximum delay in seconds (uses default if None)
+        scale: Multiplier applied to both bounds (AdaptiveController.delay_scale)
+    """
+    min_sec = min_sec if min_sec is not None else DEFAULT_MIN_DELAY
+    max_sec = max_sec if max_sec is not None else DEFAULT_MAX_DELAY
+    delay = random.uniform(min_sec * scale, max_sec * scale)
+    await asyncio.sleep(delay)
+    logging.debug(f"Delayed {delay:.2f} seconds")
+
+
+class AsyncProxyClient:
+    """Asyncio counterpart to ProxyClient.
+
+    Supports the same three proxy modes and returns the same ProxyResponse
+    objects, so parse code written against ProxyClient works unchanged:
+    - Direct: plain aiohttp request
+    - Residential: request routed through the Oxylabs residential proxy
+    - Web Scraper API: POST to the Oxylabs realtime endpoint
+
+    The underlying aiohttp.ClientSession is created lazily on first use so
+    the client can be constructed outside a running event loop.
+    """
+
+    USER_AGENTS = _USER_AGENTS
+
+    def __init__(
+        self,
+        config: Optional[ProxyConfig] = None,
+        concurrency: int = WORKERS.ASYNC_CONCURRENCY,
+        retailer: Optional[str] = None,
+    ):
+        """Initialize async proxy client.
+
+        Args:
+            config: Proxy configuration. If None, loads from environment.
+            concurrency: Maximum simultaneous connections held by the connector
+            retailer: Optional retailer name, used for per-retailer rate limiting
+
+        Raises:
+            ImportError: If aiohttp is not installed
+        """
+        if not AIOHTTP_AVAILABLE:
+            raise ImportError("aiohttp is required for AsyncProxyClient. Install with: pip install aiohttp")
+
+        self.config = config or ProxyConfig.from_env()
+        self.concurrency = max(1, concurrency)
+        self.retailer = retailer
+        self._session: Optional["aiohttp.ClientSession"] = None
+        self._request_count = 0
+
+        if not self.config.validate():
+            log_safe(f"Invalid proxy config for mode '{self.config.mode.value}' - missing credentials", level=logging.ERROR)
+            log_safe("Falling back to direct mode", level=logging.WARNING)
+            self.config.mode = ProxyMode.DIRECT
+
+        self._proxy_url = (
+            _residential_proxy_url(self.config)
+            if self.config.mode == ProxyMode.RESIDENTIAL else None
+        )
+        self._session_pool: Optional[ResidentialSessionPool] = None
+        if self.config.mode == ProxyMode.RESIDENTIAL and self.config.session_type == "pool":
+            self._session_pool = ResidentialSessionPool.for_retailer(retailer, self.config.session_pool_size)
+
+        log_safe(f"AsyncProxyClient initialized in {self.config.mode.value} mode", level=logging.INFO)
+
+    def _get_session(self) -> "aiohttp.ClientSession":
+        """Get or create the aiohttp session (must be called inside the event loop)."""
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(limit=self.concurrency)
+            self._session = aiohttp.ClientSession(connector=connector)
+        return self._session
+
+    async def fetch(
+        self,
+        url: str,
+        headers: Optional[Dict[str, str]] = None,
+        params: Optional[Dict[str, str]] = None,
+        render_js: Optional[bool] = None,
+        timeout: Optional[int] = None,
+        retry: bool = False,
+    ) -> ProxyResponse:
+        """Make a single GET request without retries.
+
+        Waits for a GlobalConcurrencyManager rate-limit token first, and
+        records the outcome in the shared ProxyCostLedger.
+
+        Args:
+            url: Target URL
+            headers: Optional custom headers
+            params: Optional query parameters
+            render_js: Override JS rendering setting (Web Scraper API only)
+            timeout: Request timeout in seconds
+            retry: Whether this is a repeat attempt (for cost accounting)
+
+        Returns:
+            ProxyResponse for whatever status the server returned
+
+        Raises:
+            aiohttp.ClientError: On connection-level failures
+            asyncio.TimeoutError: If the request exceeds the timeout
+        """
+        timeout = timeout or self.config.timeout
+        render_js = render_js if render_js is not None else self.config.render_js
+        rendered = render_js and self.config.mode == ProxyMode.WEB_SCRAPER_API
+
+        # Same shared token buckets as ProxyClient, awaited without blocking the loop
+        await GlobalConcurrencyManager().wait_for_token_async(self.retailer, self.config.mode.value)
+        try:
+            response = await self._send(url, headers, params, render_js, aiohttp.ClientTimeout(total=timeout))
+        except (aiohttp.ClientError, asyncio.TimeoutError):
+            ProxyCostLedger().record(self.retailer, self.config.mode, rendered=rendered, retry=retry)
+            raise
+        ProxyCostLedger().record(self.retailer, self.config.mode, response, rendered=rendered, retry=retry)
+        return response
+
+    async def _send(
+        self,
+        url: str,
+        headers: Optional[Dict[str, str]],
+        params: Optional[Dict[str, str]],
+        render_js: bool,
+        client_timeout: "aiohttp.ClientTimeout",
+    ) -> ProxyResponse:
+        """Issue one request in the configured proxy mode (see fetch())."""
+        session = self._get_session()
+        start_time = time.time()
+
+        if self.config.mode == ProxyMode.WEB_SCRAPER_API:
+            url, payload = _scraper_api_payload(self.config, url, headers, params, render_js)
+            async with session.post(
+                self.config.scraper_api_endpoint,
+                auth=aiohttp.BasicAuth(self.config.username, self.config.password),
+                json=payload,
+                timeout=client_timeout,
+            ) as response:
+                body = await response.read()
+                elapsed = time.time() - start_time
+                self._request_count += 1
+
+                if response.status == 200:
+                    proxy_response = _scraper_api_result(
+                        await response.json(content_type=None), url, elapsed
+                    )
+                    if proxy_response is not None:
+                        return proxy_response
+
+                if response.status in (401, 403):
+                    log_safe(f"[web_scraper_api] Authentication failed ({response.status}) - verify OXYLABS_SCRAPER_API credentials", level=logging.ERROR)
+
+                text = body.decode('utf-8', errors='replace')
+                return ProxyResponse(
+                    status_code=response.status,
+                    text=text,
+                    content=body,
+                    headers=dict(response.headers),
+                    url=url,
+                    elapsed_seconds=elapsed,
+                    proxy_mode=ProxyMode.WEB_SCRAPER_API,
+                )
+
+        # Pooled residential mode: route through a leased sticky session
+        pool = self._session_pool
+        sticky = pool.lease() if pool is not None else None
+        proxy_url = _residential_proxy_url(self.config, sticky.session_id) if sticky else self._proxy_url
+        proxy_response = None
+        try:
+            async with session.get(
+                url,
+                headers=_request_headers(headers),
+                params=params,
+                proxy=proxy_url,
+                timeout=client_timeout,
+            ) as response:
+                body = await response.read()
+                self._request_count += 1
+                proxy_response = ProxyResponse(
+                    status_code=response.status,
+                    text=body.decode(response.get_encoding() if body else 'utf-8', errors='replace'),
+                    content=body,
+                    headers=dict(response.headers),
+                    url=str(response.url),
+                    elapsed_seconds=time.time() - start_time,
+                    proxy_mode=self.config.mode,
+                )
+                return proxy_response
+        finally:
+            if pool is not None and sticky is not None:
+                pool.release(
+                    sticky,
+                    proxy_response.status_code if proxy_response is not None else None,
+                    time.time() - start_time,
+                )
+
+    async def get(
+        self,
+        url: str,
+        headers: Optional[Dict[str, str]] = None,
+        params: Optional[Dict[str, str]] = None,
+        render_js: Optional[bool] = None,
+        timeout: Optional[int] = None,
+    ) -> Optional[ProxyResponse]:
+        """Make a GET request with the same retry policy as ProxyClient.get().
+
+        Args:
+            url: Target URL
+            headers: Optional custom headers
+            params: Optional query parameters
+            render_js: Override JS rendering setting (Web Scraper API only)
+            timeout: Request timeout in seconds
+
+        Returns:
+            ProxyResponse object or None on failure
+        """
+        for attempt in range(self.config.max_retries):
+            try:
+                response = await self.fetch(url, headers, params, render_js, timeout, retry=attempt > 0)
+
+                if response.ok:
+                    if self.config.mode == ProxyMode.DIRECT and self.config.max_delay > 0:
+                        await asyncio.sleep(random.uniform(self.config.min_delay, self.config.max_delay))
+                    return response
+
+                if response.status_code == 429:
+                    wait_time = self.config.retry_delay * (2 ** attempt)
+                    log_safe(f"Rate limited, waiting {wait_time:.1f}s before retry", level=logging.WARNING)
+                    await asyncio.sleep(wait_time)
+                    continue
+
+                if response.status_code >= 500:
+                    log_safe(f"Server error {response.status_code}, retrying...", level=logging.WARNING)
+                    await asyncio.sleep(self.config.retry_delay)
+                    continue
+
+                if 400 <= response.status_code < 500:
+                    safe_url = _sanitize_url(redact_credentials(url))
+                    log_safe(f"Client error {response.status_code} for {safe_url}", level=logging.WARNING)
+                    return response
+
+            except asyncio.TimeoutError:
+                safe_url = _sanitize_url(redact_credentials(url))
+                log_safe(f"Timeout on attempt {attempt + 1} for {safe_url}", level=logging.WARNING)
+                await asyncio.sleep(self.config.retry_delay)
+            except aiohttp.ClientError as e:
+                safe_error = redact_credentials(str(e))
+                log_safe(f"Request error on attempt {attempt + 1}: {safe_error}", level=logging.WARNING)
+                await asyncio.sleep(self.config.retry_delay)
+
+        safe_url = _sanitize_url(redact_credentials(url))
+        log_safe(f"All {self.config.max_retries} attempts failed for {safe_url}", level=logging.ERROR)
+        return None
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get client statistics"""
+        return {
+            "mode": self.config.mode.value,
+            "request_count": self._request_count,
+            "concurrency": self.concurrency,
+        }
+
+    async def close(self) -> None:
+        """Close the aiohttp session and its connection pool."""
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    async def __aenter__(self) -> "AsyncProxyClient":
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_val: Optional[BaseException],
+        exc_tb: Optional[TracebackType],
+    ) -> None:
+        await self.close()
+
+
+async def async_get_with_retry(
+    client: AsyncProxyClient,
+    url: str,
+    max_retries: int = None,
+    timeout: int = None,
+    rate_limit_base_wait: int = None,
+    min_delay: float = None,
+    max_delay: float = None,
+    headers_func: Optional[Callable[[], Dict[str, str]]] = None,
+) -> Optional[ProxyResponse]:
+    """Async equivalent of http.get_with_retry().
+
+    Applies the same status handling as the synchronous helper (exponential
+    backoff on 429/403, fixed wait on 5xx/408, fail fast on other 4xx) but
+    every delay is an asyncio.sleep(), so thousands of calls can wait
+    concurrently on one event loop. Delays and status feedback go through the
+    client retailer's AdaptiveController when adaptive mode is enabled.
+
+    Args:
+        client: AsyncProxyClient to issue requests through
+        url: URL to fetch
+        max_retries: Maximum number of retry attempts
+        timeout: Request timeout in seconds
+        rate_limit_base_wait: Base wait time for 429 errors
+        min_delay: Minimum delay between requests
+        max_delay: Maximum delay between requests
+        headers_func: Optional function to get headers (for config integration)
+
+    Returns:
+        ProxyResponse on success, None on failure
+    """
+    max_retries = max_retries if max_retries is not None else HTTP.MAX_RETRIES
+    timeout = timeout if timeout is not None else HTTP.TIMEOUT
+    rate_limit_base_wait = rate_limit_base_wait if rate_limit_base_wait is not None else HTTP.RATE_LIMIT_BASE_WAIT
+
+    headers = headers_func() if headers_func else get_headers()
+    safe_url = _sanitize_url(redact_credentials(url))
+    final_status: Any = 'no response'
+    adaptive = GlobalConcurrencyManager().get_adaptive_controller(client.retailer)
+
+    for attempt in range(max_retries):
+        try:
+            await async_random_delay(min_delay, max_delay, scale=adaptive.delay_scale if adaptive else 1.0)
+            response = await client.fetch(url, headers=headers, timeout=timeout, retry=attempt > 0)
+            final_status = response.status_code
+            if adaptive:
+                adaptive.record(response.status_code)
+
+            if response.status_code == 200:
+                log_safe(f"Successfully fetched {safe_url}", level=logging.DEBUG)
+                return response
+
+            if response.status_code in (429, 403):
+                wait_time = (2 ** attempt) * rate_limit_base_wait
+                label = "Rate limited" if response.status_code == 429 else "Blocked"
+                log_safe(
+                    f"{label} ({response.status_code}) for {safe_url}. "
+                    f"Waiting {wait_time}s (attempt {attempt + 1}/{max_retries})...",
+                    level=logging.WARNING
+                )
+                await asyncio.sleep(wait_time)
+
+            elif response.status_code >= 500 or response.status_code == 408:
+                wait_time = HTTP.SERVER_ERROR_WAIT
+                log_safe(
+                    f"Server error ({response.status_code}) for {safe_url}. "
+                    f"Waiting {wait_time}s (attempt {attempt + 1}/{max_retries})...",
+                    level=logging.WARNING
+                )
+                await asyncio.sleep(wait_time)
+
+            elif 400 <= response.status_code < 500:
+                log_safe(
+                    f"Client error ({response.status_code}) for {safe_url}. Failing immediately.",
+                    level=logging.ERROR
+                )
+                return None
+
+            else:
+                log_safe(f"Unexpected HTTP {response.status_code} for {safe_url}", level=logging.WARNING)
+                return None
+
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            final_status = 'no response'
+            if adaptive:
+                adaptive.record(None)
+            wait_time = HTTP.SERVER_ERROR_WAIT
+            safe_error = redact_credentials(str(e)) or type(e).__name__
+            log_safe(
+                f"Request error for {safe_url}: {safe_error}. "
+                f"Waiting {wait_time}s (attempt {attempt + 1}/{max_retries})...",
+                level=logging.WARNING
+            )
+            await asyncio.sleep(wait_time)
+
+    log_safe(
+        f"Failed to fetch {safe_url} after {max_retries} attempts (last status: {final_status})",
+        level=logging.ERROR
+    )
+    return None
@@ -28,27 +28,253 @@ Usage:
     if store_infos is None:
         store_infos = discover_stores_with_metadata(session)
         rich_cache.set(store_infos)
+
+    # Conditional GET: send stored validators, treat 304 as a hit
+    validators = RevalidationCache.for_retailer('att')
+    response = get_with_retry(session, sitemap_url, revalidation_cache=validators)
+
+    # Single-file response store for large page caches
+    backend = SQLiteCacheBackend(Path('data/walmart/response_cache'))
+    response_cache = ResponseCache('walmart', backend=backend)
+    response_cache.evict_expired()
 """
 
+import base64
 import hashlib
 import json
 import logging
+import sqlite3
+import threading
+import time
+import zlib
 from abc import ABC, abstractmethod
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Any, Dict, Generic, List, Optional, TypeVar
+from typing import Any, Callable, Dict, Generic, List, Mapping, Optional, TypeVar
 
 from src.shared.constants import CACHE
 
 __all__ = [
+    'CacheBackend',
     'CacheInterface',
+    'FileCacheBackend',
     'ResponseCache',
+    'RevalidationCache',
     'RichURLCache',
+    'SQLiteCacheBackend',
     'URLListCache',
 ]
 
 T = TypeVar('T')
 
+# Errors that mean a stored entry is unreadable (treated as a cache miss)
+_READ_ERRORS = (json.JSONDecodeError, KeyError, ValueError, AttributeError, sqlite3.Error, zlib.error)
+
+
+class CacheBackend(ABC):
+    """Storage backend for CacheInterface entries.
+
+    An entry is a dict with 'cached_at' (ISO timestamp), 'identifier' and
+    'data' (the serialized payload), stored under the key returned by
+    CacheInterface.get_cache_key(). TTL checks stay in CacheInterface so
+    every backend has the same expiry semantics.
+    """
+
+    @abstractmethod
+    def read(self, key: str) -> Optional[Dict[str, Any]]:
+        """Return the stored entry for key, or None if there is none."""
+
+    @abstractmethod
+    def write(self, key: str, entry: Dict[str, Any]) -> None:
+        """Store an entry, replacing any existing entry for key."""
+
+    @abstractmethod
+    def delete(self, key: str) -> None:
+        """Remove the entry for key if present."""
+
+    def evict_expired(self, ttl: timedelta) -> int:
+        """Remove entries older than ttl.
+
+        Args:
+            ttl: Maximum entry age
+
+        Returns:
+            Number of entries removed
+        """
+        return 0
+
+    def close(self) -> None:
+        """Release any resources held by the backend."""
+
+
+class FileCacheBackend(CacheBackend):
+    """One JSON file per key (the original CacheInterface storage format).
+
+    Args:
+        cache_dir: Directory holding <key>.cache files
+    """
+
+    def __init__(self, cache_dir: Path):
+        self.cache_dir = cache_dir
+
+    def _path(self, key: str) -> Path:
+        return self.cache_dir / f"{key}.cache"
+
+    def read(self, key: str) -> Optional[Dict[str, Any]]:
+        cache_file = self._path(key)
+        if not cache_file.exists():
+            return None
+        with open(cache_file, 'r', encoding='utf-8') as f:
+            return json.load(f)
+
+    def write(self, key: str, entry: Dict[str, Any]) -> None:
+        with open(self._path(key), 'w', encoding='utf-8') as f:
+            json.dump(entry, f, indent=2)
+
+    def delete(self, key: str) -> None:
+        cache_file = self._path(key)
+        if cache_file.exists():
+            cache_file.unlink()
+
+    def evict_expired(self, ttl: timedelta) -> int:
+        removed = 0
+        now = datetime.now()
+        for cache_file in self.cache_dir.glob('*.cache'):
+            try:
+                with open(cache_file, 'r', encoding='utf-8') as f:
+                    cached_at = json.load(f).get('cached_at')
+                if cached_at and now - datetime.fromisoformat(cached_at) <= ttl:
+                    continue
+            except (OSError, *_READ_ERRORS):
+                pass
+            cache_file.unlink(missing_ok=True)
+            removed += 1
+        return removed
+
+
+_SQLITE_SCHEMA = """
+CREATE TABLE IF NOT EXISTS entries (
+    key TEXT PRIMARY KEY,
+    identifier TEXT,
+    cached_at REAL NOT NULL,
+    accessed_at REAL NOT NULL,
+    size INTEGER NOT NULL,
+    body BLOB NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_entries_cached_at ON entries (cached_at);
+CREATE INDEX IF NOT EXISTS idx_entries_accessed_at ON entries (accessed_at);
+"""
+
+
+class SQLiteCacheBackend(CacheBackend):
+    """Single-file SQLite store with compressed bodies and an LRU size cap.
+
+    Keeps every entry of a cache directory in one database instead of one
+    file per key. cached_at and accessed_at are indexed epoch columns, so
+    TTL expiry is a single DELETE and LRU eviction reads the oldest rows
+    directly. Bodies are zlib-compressed; the size cap counts compressed
+    bytes. One connection is shared by all threads behind a lock.
+
+    Args:
+        cache_dir: Directory for the database file
+        filename: Database file name inside cache_dir
+        max_bytes: Compressed size cap (None or 0 disables eviction by size)
+        compress_level: zlib compression level (1-9)
+        clock: Time source returning epoch seconds (injectable for tests)
+    """
+
+    def __init__(
+        self,
+        cache_dir: Path,
+        filename: str = 'cache.sqlite3',
+        max_bytes: Optional[int] = CACHE.SQLITE_MAX_BYTES,
+        compress_level: int = CACHE.SQLITE_COMPRESS_LEVEL,
+        clock: Callable[[], float] = time.time,
+    ):
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.db_path = self.cache_dir / filename
+        self.max_bytes = max_bytes
+        self.compress_level = compress_level
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.db_path), check_same_thread=False, isolation_level=None)
+        self._conn.execute('PRAGMA journal_mode=WAL')
+        self._conn.execute('PRAGMA synchronous=NORMAL')
+        self._conn.executescript(_SQLITE_SCHEMA)
+        self.total_bytes = self._conn.execute('SELECT COALESCE(SUM(size), 0) FROM entries').fetchone()[0]
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute('SELECT COUNT(*) FROM entries').fetchone()[0]
+
+    def read(self, key: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            row = self._conn.execute(
+                'SELECT identifier, cached_at, body FROM entries WHERE key = ?', (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            self._conn.execute('UPDATE entries SET accessed_at = ? WHERE key = ?', (self._clock(), key))
+        identifier, cached_at, body = row
+        return {
+            'cached_at': datetime.fromtimestamp(cached_at).isoformat(),
+            'identifier': identifier,
+            'data': zlib.decompress(body).decode('utf-8'),
+        }
+
+    def write(self, key: str, entry: Dict[str, Any]) -> None:
+        body = zlib.compress(entry['data'].encode('utf-8'), self.compress_level)
+        cached_at = datetime.fromisoformat(entry['cached_at']).timestamp()
+        with self._lock:
+            old = self._conn.execute('SELECT size FROM entries WHERE key = ?', (key,)).fetchone()
+            self._conn.execute(
+                'INSERT OR REPLACE INTO entries (key, identifier, cached_at, accessed_at, size, body) '
+                'VALUES (?, ?, ?, ?, ?, ?)',
+                (key, entry.get('identifier'), cached_at, self._clock(), len(body), body)
+            )
+            self.total_bytes += len(body) - (old[0] if old else 0)
+            if self.max_bytes and self.total_bytes > self.max_bytes:
+                self._evict_lru()
+
+    def _evict_lru(self) -> None:
+        """Delete least recently used entries until under max_bytes (lock held)."""
+        excess = self.total_bytes - self.max_bytes
+        victims = []
+        cursor = self._conn.execute('SELECT key, size FROM entries ORDER BY accessed_at')
+        for key, size in cursor:
+            if excess <= 0:
+                break
+            victims.append((key,))
+            excess -= size
+        cursor.close()
+        self._conn.execute('BEGIN')
+        self._conn.executemany('DELETE FROM entries WHERE key = ?', victims)
+        self._conn.execute('COMMIT')
+        self.total_bytes = self.max_bytes + excess
+        logging.debug(f"Evicted {len(victims)} least recently used entries from {self.db_path}")
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            row = self._conn.execute('SELECT size FROM entries WHERE key = ?', (key,)).fetchone()
+            if row is not None:
+                self._conn.execute('DELETE FROM entries WHERE key = ?', (key,))
+                self.total_bytes -= row[0]
+
+    def evict_expired(self, ttl: timedelta) -> int:
+        cutoff = self._clock() - ttl.total_seconds()
+        with self._lock:
+            freed = self._conn.execute(
+                'SELECT COALESCE(SUM(size), 0) FROM entries WHERE cached_at < ?', (cutoff,)
+            ).fetchone()[0]
+            removed = self._conn.execute('DELETE FROM entries WHERE cached_at < ?', (cutoff,)).rowcount
+            self.total_bytes -= freed
+        return removed
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
 
 class CacheInterface(ABC, Generic[T]):
     """Abstract cache interface with TTL and refresh support.
@@ -67,18 +293,22 @@ class CacheInterface(ABC, Generic[T]):
     Args:
         cache_dir: Directory for cache files
         ttl_days: Cache time-to-live in days (default: 7)
+        backend: Storage backend (default: one JSON file per key in cache_dir)
     """
 
-    def __init__(self, cache_dir: Path, ttl_days: int = CACHE.URL_CACHE_EXPIRY_DAYS):
+    def __init__(self, cache_dir: Path, ttl_days: int = CACHE.URL_CACHE_EXPIRY_DAYS,
+                 backend: Optional[CacheBackend] = None):
         """Initialize cache interface.
 
         Args:
             cache_dir: Directory path for cache storage
             ttl_days: Time-to-live in days before cache expires
+            backend: Optional storage backend; defaults to FileCacheBackend(cache_dir)
         """
         self.cache_dir = cache_dir
         self.ttl = timedelta(days=ttl_days)
         self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.backend = backend if backend is not None else FileCacheBackend(cache_dir)
 
     @abstractmethod
     def get_cache_key(self, identifier: str) -> str:
@@ -126,13 +356,10 @@ class CacheInterface(ABC, Generic[T]):
         if force_refresh:
             return None
 
-        cache_file = self._get_cache_file(identifier)
-        if not cache_file.exists():
-            return None
-
         try:
-            with open(cache_file, 'r', encoding='utf-8') as f:
-                cache_data = json.load(f)
+            cache_data = self.backend.read(self.get_cache_key(identifier))
+            if cache_data is None:
+                return None
 
             # Check expiry based on internal 'cached_at' timestamp for consistency
             cached_at_str = cache_data.get('cached_at')
@@ -152,29 +379,28 @@ class CacheInterface(ABC, Generic[T]):
 
             return self.deserialize(data_str)
 
-        except (json.JSONDecodeError, KeyError, ValueError, AttributeError) as e:
+        except _READ_ERRORS as e:
             logging.warning(f"Error reading cache for {identifier}: {e}")
             return None
 
-    def set(self, identifier: str, data: T) -> None:
+    def set(self, identifier: str, data: T, cached_at: Optional[datetime] = None) -> None:
         """Store data in cache with metadata.
 
         Args:
             identifier: Unique identifier for cached data
             data: Data to cache
+            cached_at: When the data was fetched (default: now); lets migrated
+                entries keep their original age
         """
-        cache_file = self._get_cache_file(identifier)
-
         cache_data = {
-            'cached_at': datetime.now().isoformat(),
+            'cached_at': (cached_at or datetime.now()).isoformat(),
             'identifier': identifier,
             'data': self.serialize(data)
         }
 
         try:
-            with open(cache_file, 'w', encoding='utf-8') as f:
-                json.dump(cache_data, f, indent=2)
-        except IOError as e:
+            self.backend.write(self.get_cache_key(identifier), cache_data)
+        except (IOError, sqlite3.Error) as e:
             logging.warning(f"Failed to save cache for {identifier}: {e}")
 
     def clear(self, identifier: str) -> None:
@@ -183,9 +409,23 @@ class CacheInterface(ABC, Generic[T]):
         Args:
             identifier: Unique identifier for cached data
         """
-        cache_file = self._get_cache_file(identifier)
-        if cache_file.exists():
-            cache_file.unlink()
+        self.backend.delete(self.get_cache_key(identifier))
+
+    def evict_expired(self) -> int:
+        """Remove every entry older than the TTL from the backend.
+
+        Returns:
+            Number of entries removed
+        """
+        try:
+            return self.backend.evict_expired(self.ttl)
+        except (OSError, sqlite3.Error) as e:
+            logging.warning(f"Failed to evict expired cache entries: {e}")
+            return 0
+
+    def close(self) -> None:
+        """Close the storage backend."""
+        self.backend.close()
 
     def is_valid(self, identifier: str) -> bool:
         """Check if cache exists and is not expired.
@@ -196,13 +436,10 @@ class CacheInterface(ABC, Generic[T]):
         Returns:
             True if cache is valid, False otherwise
         """
-        cache_file = self._get_cache_file(identifier)
-        if not cache_file.exists():
-            return False
-
         try:
-            with open(cache_file, 'r', encoding='utf-8') as f:
-                cache_data = json.load(f)
+            cache_data = self.backend.read(self.get_cache_key(identifier))
+            if cache_data is None:
+                return False
 
             cached_at_str = cache_data.get('cached_at')
             if not cached_at_str:
@@ -211,7 +448,7 @@ class CacheInterface(ABC, Generic[T]):
             cache_time = datetime.fromisoformat(cached_at_str)
             return datetime.now() - cache_time <= self.ttl
 
-        except (json.JSONDecodeError, KeyError, ValueError, AttributeError):
+        except _READ_ERRORS:
             return False
 
     def get_metadata(self, identifier: str) -> Optional[Dict[str, Any]]:
@@ -223,13 +460,10 @@ class CacheInterface(ABC, Generic[T]):
         Returns:
             Dict with 'cached_at', 'age_days', 'expired' or None if no cache
         """
-        cache_file = self._get_cache_file(identifier)
-        if not cache_file.exists():
-            return None
-
         try:
-            with open(cache_file, 'r', encoding='utf-8') as f:
-                cache_data = json.load(f)
+            cache_data = self.backend.read(self.get_cache_key(identifier))
+            if cache_data is None:
+                return None
 
             cached_at = cache_data.get('cached_at')
             if not cached_at:
@@ -244,7 +478,7 @@ class CacheInterface(ABC, Generic[T]):
                 'expired': age > self.ttl
             }
 
-        except (json.JSONDecodeError, KeyError, ValueError, AttributeError):
+        except _READ_ERRORS:
             return None
 
     def _get_cache_file(self, identifier: str) -> Path:
@@ -397,17 +631,19 @@ class ResponseCache(CacheInterface[str]):
     """
 
     def __init__(self, retailer: str, cache_dir: Optional[Path] = None,
-                 ttl_days: int = CACHE.RESPONSE_CACHE_EXPIRY_DAYS):
+                 ttl_days: int = CACHE.RESPONSE_CACHE_EXPIRY_DAYS,
+                 backend: Optional[CacheBackend] = None):
         """Initialize response cache for a retailer.
 
         Args:
             retailer: Retailer name (e.g., 'walmart')
             cache_dir: Optional custom cache directory. Defaults to data/{retailer}/response_cache/
             ttl_days: Cache expiry in days (default: 30)
+            backend: Optional storage backend, e.g. SQLiteCacheBackend for large page caches
         """
         if cache_dir is None:
             cache_dir = Path(f"data/{retailer}/response_cache")
-        super().__init__(cache_dir, ttl_days)
+        super().__init__(cache_dir, ttl_days, backend)
 
     def get_cache_key(self, url: str) -> str:
         """Generate cache key from URL hash.
@@ -441,3 +677,163 @@ class ResponseCache(CacheInterface[str]):
             Same response string
         """
         return raw
+
+
+def _header(headers: Any, name: str) -> Optional[str]:
+    """Case-insensitive header lookup that tolerates non-mapping headers."""
+    if not isinstance(headers, Mapping):
+        return None
+    for key, value in headers.items():
+        if isinstance(key, str) and key.lower() == name:
+            return value if isinstance(value, str) else None
+    return None
+
+
+class RevalidationCache(CacheInterface[Dict[str, Any]]):
+    """Validator store for conditional GET (ETag / Last-Modified) revalidation.
+
+    Keeps each URL's last 200 body together with its ETag and Last-Modified
+    validators. The next fetch sends If-None-Match / If-Modified-Since and a
+    304 Not Modified is answered from the stored body, so unchanged sitemaps
+    and store pages cost a header round-trip instead of a full download.
+    Unlike ResponseCache, an entry is never used without asking the server.
+
+    Entries are kept in a single SQLiteCacheBackend file by default; the TTL
+    only bounds how long validators are kept, forcing a full re-download of
+    pages that have not been revalidated within it.
+
+    Usage:
+        cache = RevalidationCache.for_retailer('att')
+        response = get_with_retry(session, sitemap_url, revalidation_cache=cache)
+    """
+
+    _instances: Dict[str, 'RevalidationCache'] = {}
+    _instances_lock = threading.Lock()
+
+    def __init__(self, retailer: str, cache_dir: Optional[Path] = None,
+                 ttl_days: int = CACHE.RESPONSE_CACHE_EXPIRY_DAYS,
+                 backend: Optional[CacheBackend] = None):
+        """Initialize revalidation cache for a retailer.
+
+        Args:
+            retailer: Retailer name (e.g., 'att')
+            cache_dir: Optional custom cache directory. Defaults to data/{retailer}/revalidation_cache/
+            ttl_days: Days a validator is kept without a successful fetch (default: 30)
+            backend: Optional storage backend (default: SQLiteCacheBackend in cache_dir)
+        """
+        if cache_dir is None:
+            cache_dir = Path(f"data/{retailer}/revalidation_cache")
+        if backend is None:
+            backend = SQLiteCacheBackend(cache_dir)
+        super().__init__(cache_dir, ttl_days, backend)
+
+    @classmethod
+    def for_retailer(cls, retailer: str) -> 'RevalidationCache':
+        """Get the process-wide revalidation cache for a retailer.
+
+        Sitemap fetchers and every pooled session of a retailer share one
+        instance (and one SQLite connection).
+
+        Args:
+            retailer: Retailer name
+
+        Returns:
+            Shared RevalidationCache for the retailer
+        """
+        with cls._instances_lock:
+            cache = cls._instances.get(retailer)
+            if cache is None:
+                cache = cls(retailer)
+                cls._instances[retailer] = cache
+            return cache
+
+    def get_cache_key(self, url: str) -> str:
+        """Generate cache key from URL hash.
+
+        Args:
+            url: Full URL
+
+        Returns:
+            SHA256 hex digest of the URL
+        """
+        return hashlib.sha256(url.encode()).hexdigest()
+
+    def serialize(self, entry: Dict[str, Any]) -> str:
+        """Serialize a validator entry to JSON.
+
+        Args:
+            entry: Validator entry
+
+        Returns:
+            JSON string
+        """
+        return json.dumps(entry)
+
+    def deserialize(self, raw: str) -> Dict[str, Any]:
+        """Deserialize JSON to a validator entry.
+
+        Args:
+            raw: JSON string
+
+        Returns:
+            Validator entry
+        """
+        return json.loads(raw)
+
+    @staticmethod
+    def conditional_headers(entry: Optional[Dict[str, Any]]) -> Dict[str, str]:
+        """Build If-None-Match / If-Modified-Since headers for a stored entry.
+
+        Args:
+            entry: Entry returned by get(), or None
+
+        Returns:
+            Conditional request headers (empty if there is no entry)
+        """
+        headers = {}
+        if entry:
+            if entry.get('etag'):
+                headers['If-None-Match'] = entry['etag']
+            if entry.get('last_modified'):
+                headers['If-Modified-Since'] = entry['last_modified']
+        return headers
+
+    @staticmethod
+    def body(entry: Dict[str, Any]) -> bytes:
+        """Decode the stored response body of an entry.
+
+        Args:
+            entry: Entry returned by get()
+
+        Returns:
+            Raw response body
+        """
+        return base64.b64decode(entry['body'])
+
+    def store(self, url: str, content: Any, headers: Any, encoding: Optional[str] = None) -> bool:
+        """Store a 200 response body with its validators.
+
+        Responses without an ETag or Last-Modified header cannot be
+        revalidated and are not stored.
+
+        Args:
+            url: Requested URL
+            content: Response body bytes
+            headers: Response headers (any mapping, matched case-insensitively)
+            encoding: Text encoding used to decode the body, if known
+
+        Returns:
+            True if the entry was stored
+        """
+        etag = _header(headers, 'etag')
+        last_modified = _header(headers, 'last-modified')
+        if not (etag or last_modified) or not isinstance(content, bytes):
+            return False
+        self.set(url, {
+            'etag': etag,
+            'last_modified': last_modified,
+            'content_type': _header(headers, 'content-type'),
+            'encoding': encoding if isinstance(encoding, str) else None,
+            'body': base64.b64encode(content).decode('ascii'),
+        })
+        return True
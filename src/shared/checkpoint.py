@@ -2,16 +2,25 @@
 
 This module provides functions to save and load checkpoint data,
 allowing scrapers to resume from where they left off if interrupted.
+
+For long runs, CheckpointJournal records progress as an append-only JSONL
+log next to the checkpoint snapshot: each completed item costs one line
+instead of a rewrite of the whole checkpoint, and the snapshot is only
+rewritten when the journal is compacted.
 """
 
 import json
 import logging
 import os
 import tempfile
+import threading
 from pathlib import Path
-from typing import Any, Optional
+from typing import IO, Any, Dict, Iterator, Optional
+
+from src.shared.constants import CHECKPOINT
 
 __all__ = [
+    'CheckpointJournal',
     'load_checkpoint',
     'save_checkpoint',
 ]
@@ -94,3 +103,97 @@ def load_checkpoint(filepath: str) -> Optional[Any]:
     except (json.JSONDecodeError, FileNotFoundError) as e:
         logging.warning(f"Failed to load checkpoint {filepath}: {e}")
         return None
+
+
+class CheckpointJournal:
+    """Append-only JSONL journal of completed items for a checkpoint snapshot.
+
+    append() writes one line per record and fsyncs in batches, so recording
+    progress is O(1) per item. Callers periodically compact: write a full
+    snapshot with save_checkpoint(), then truncate() the journal. On resume,
+    load the snapshot and replay read() on top of it; replay must be
+    idempotent, since a crash between snapshot and truncate leaves records
+    that are already in the snapshot.
+
+    A torn final line (crash mid-write) is ignored on read.
+
+    Example:
+        journal = CheckpointJournal('data/att/checkpoints/scrape_progress.json')
+        journal.append({'key': url, 'store': store})
+        ...
+        save_checkpoint(snapshot, checkpoint_path)
+        journal.truncate()
+    """
+
+    def __init__(self, checkpoint_path: str, fsync_every: int = CHECKPOINT.JOURNAL_FSYNC_EVERY) -> None:
+        """Initialize journal for a checkpoint (the file is opened on first append).
+
+        Args:
+            checkpoint_path: Path of the snapshot checkpoint; the journal lives
+                beside it as <name>.journal.jsonl
+            fsync_every: Records between fsyncs (1 = fsync every record)
+        """
+        snapshot = Path(checkpoint_path)
+        self.path = snapshot.with_name(snapshot.stem + '.journal.jsonl')
+        self.fsync_every = max(1, fsync_every)
+        self._lock = threading.Lock()
+        self._handle: Optional[IO[str]] = None
+        self._unsynced = 0
+        self.records = 0
+
+    def append(self, record: Dict[str, Any]) -> None:
+        """Append one record, fsyncing once every fsync_every records."""
+        line = json.dumps(record, ensure_ascii=False, separators=(',', ':')) + '\n'
+        with self._lock:
+            if self._handle is None:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                self._handle = open(self.path, 'a', encoding='utf-8')
+            self._handle.write(line)
+            self.records += 1
+            self._unsynced += 1
+            if self._unsynced >= self.fsync_every:
+                self._sync()
+
+    def _sync(self) -> None:
+        """Flush and fsync the open handle (caller holds the lock)."""
+        if self._handle is not None and self._unsynced:
+            self._handle.flush()
+            os.fsync(self._handle.fileno())
+            self._unsynced = 0
+
+    def flush(self) -> None:
+        """Force any buffered records to disk."""
+        with self._lock:
+            self._sync()
+
+    def read(self) -> Iterator[Dict[str, Any]]:
+        """Yield journal records in append order, skipping a torn trailing line."""
+        if not self.path.exists():
+            return
+        with open(self.path, 'r', encoding='utf-8') as f:
+            for line_number, line in enumerate(f, 1):
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    yield json.loads(line)
+                except json.JSONDecodeError:
+                    logging.warning(f"Ignoring corrupt journal line {line_number} in {self.path}")
+
+    def truncate(self) -> None:
+        """Discard all records (after a snapshot has been saved, or for a fresh run)."""
+        with self._lock:
+            if self._handle is not None:
+                self._handle.close()
+                self._handle = None
+            self._unsynced = 0
+            self.records = 0
+            self.path.unlink(missing_ok=True)
+
+    def close(self) -> None:
+        """Flush and close the journal file, keeping its records."""
+        with self._lock:
+            self._sync()
+            if self._handle is not None:
+                self._handle.close()
+                self._handle = None
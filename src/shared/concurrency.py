@@ -6,7 +6,9 @@ scrapers to prevent CPU oversubscription and coordinate proxy rate limits.
 The GlobalConcurrencyManager is a thread-safe singleton that manages:
 - Global max workers limit across all scrapers
 - Per-retailer worker limits
-- Proxy request rate limiting
+- Proxy request rate limiting (token buckets per proxy mode and per retailer)
+- Optional per-retailer AIMD tuning of workers and delays (AdaptiveController)
+- Coordinated pauses shared by all workers of a retailer or proxy mode (PauseGate)
 
 Usage:
     from src.shared.concurrency import GlobalConcurrencyManager
@@ -15,19 +17,31 @@ Usage:
     with manager.acquire_slot('verizon'):
         # Make request within concurrency limits
         response = session.get(url)
+
+    # Block until the proxy-mode and retailer buckets allow one more request
+    manager.wait_for_token('verizon', 'residential')
+    await manager.wait_for_token_async('verizon', 'residential')  # asyncio code
+
+    # Both waits also block while another worker holds the retailer's pause gate
 """
 
+import asyncio
 import logging
 import threading
 import time
 from contextlib import contextmanager
 from dataclasses import dataclass
-from typing import Dict, Optional
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from src.shared.constants import ADAPTIVE
 
 
 __all__ = [
+    'AdaptiveController',
     'ConcurrencyConfig',
     'GlobalConcurrencyManager',
+    'PauseGate',
+    'TokenBucket',
 ]
 
 
@@ -46,16 +60,395 @@ class ConcurrencyConfig:
     proxy_requests_per_second: float = 10.0
 
 
+class TokenBucket:
+    """Thread-safe token bucket usable from both threads and asyncio tasks.
+
+    Tokens refill continuously at `rate` per second up to `capacity`.
+    Callers reserve a token and are told how long to wait for it; the
+    balance may go negative, so concurrent callers queue up in order
+    instead of all waking at the same instant. The lock is only held
+    for the arithmetic, never while sleeping, which is what lets the
+    same bucket back both time.sleep() and asyncio.sleep() waiters.
+
+    Example:
+        bucket = TokenBucket(rate=10.0)
+        bucket.acquire()                # blocks the thread if needed
+        await bucket.acquire_async()    # yields to the event loop instead
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        capacity: Optional[float] = None,
+        clock: Callable[[], float] = time.monotonic
+    ) -> None:
+        """Initialize the bucket full.
+
+        Args:
+            rate: Tokens added per second (must be > 0)
+            capacity: Maximum burst size (default: one second of tokens, at least 1)
+            clock: Monotonic clock function (injectable for tests)
+
+        Raises:
+            ValueError: If rate is not positive
+        """
+        if rate <= 0:
+            raise ValueError(f"TokenBucket rate must be positive, got {rate}")
+        self._clock = clock
+        self._lock = threading.Lock()
+        self.rate = float(rate)
+        self.capacity = float(capacity) if capacity is not None else max(1.0, self.rate)
+        self._tokens = self.capacity
+        self._updated = clock()
+
+    def _refill(self, now: float) -> None:
+        """Add tokens accrued since the last update (caller holds the lock)."""
+        elapsed = now - self._updated
+        if elapsed > 0:
+            self._tokens = min(self.capacity, self._tokens + elapsed * self.rate)
+            self._updated = now
+
+    def set_rate(self, rate: float, capacity: Optional[float] = None) -> None:
+        """Change the refill rate (and burst size) without losing queued debt.
+
+        Args:
+            rate: New tokens per second (must be > 0)
+            capacity: New maximum burst size (default: one second of tokens)
+        """
+        if rate <= 0:
+            raise ValueError(f"TokenBucket rate must be positive, got {rate}")
+        with self._lock:
+            self._refill(self._clock())
+            self.rate = float(rate)
+            self.capacity = float(capacity) if capacity is not None else max(1.0, self.rate)
+            self._tokens = min(self._tokens, self.capacity)
+
+    def reserve(self, tokens: float = 1.0) -> float:
+        """Take tokens now and return how long the caller must wait before using them.
+
+        Args:
+            tokens: Number of tokens to take
+
+        Returns:
+            Seconds to wait (0.0 if tokens were available immediately)
+        """
+        with self._lock:
+            self._refill(self._clock())
+            self._tokens -= tokens
+            if self._tokens >= 0:
+                return 0.0
+            return -self._tokens / self.rate
+
+    def acquire(self, tokens: float = 1.0) -> float:
+        """Block the current thread until tokens are available.
+
+        Returns:
+            Seconds spent waiting
+        """
+        wait = self.reserve(tokens)
+        if wait > 0:
+            time.sleep(wait)
+        return wait
+
+    async def acquire_async(self, tokens: float = 1.0) -> float:
+        """Wait on the event loop until tokens are available.
+
+        Returns:
+            Seconds spent waiting
+        """
+        wait = self.reserve(tokens)
+        if wait > 0:
+            await asyncio.sleep(wait)
+        return wait
+
+    @property
+    def available(self) -> float:
+        """Tokens currently available (negative while callers are queued)."""
+        with self._lock:
+            self._refill(self._clock())
+            return self._tokens
+
+
+class PauseGate:
+    """Shared pause that every worker of a retailer (or proxy mode) honors.
+
+    The worker whose request count crosses a pause threshold holds the gate
+    for the length of its own sleep; every other worker blocks in wait()
+    until all holders release it, so the whole retailer goes quiet at once
+    instead of one thread napping while the rest keep requesting.
+
+    The gate also tracks the current pause window (requests and time since
+    the last pause) so a pause can be sized from a request-rate budget.
+
+    Example:
+        gate = manager.get_pause_gate('att')
+        gate.hold(30.0)
+        try:
+            time.sleep(30.0)
+        finally:
+            gate.release()
+
+        gate.wait()                # in every other worker, before a request
+        await gate.wait_async()    # asyncio code
+    """
+
+    def __init__(self, name: str, clock: Callable[[], float] = time.monotonic) -> None:
+        """Initialize an open gate.
+
+        Args:
+            name: Gate key (retailer name or 'proxy:<mode>'), for logging
+            clock: Monotonic clock function (injectable for tests)
+        """
+        self.name = name
+        self._clock = clock
+        self._cond = threading.Condition()
+        self._holders = 0
+        self._until = 0.0
+        self._window_started = clock()
+        self._window_count = 0
+        self.pauses = 0
+
+    def hold(self, duration: float) -> None:
+        """Close the gate for up to `duration` seconds (until release())."""
+        with self._cond:
+            self._holders += 1
+            self._until = max(self._until, self._clock() + duration)
+            self.pauses += 1
+
+    def release(self) -> None:
+        """Release one hold; reopens the gate and starts a new window once all are released."""
+        with self._cond:
+            self._holders = max(0, self._holders - 1)
+            if self._holders == 0:
+                self._until = 0.0
+                self._window_started = self._clock()
+                self._window_count = 0
+                self._cond.notify_all()
+
+    def remaining(self) -> float:
+        """Seconds left in the current pause (0.0 if the gate is open)."""
+        with self._cond:
+            if self._holders == 0:
+                return 0.0
+            return max(0.0, self._until - self._clock())
+
+    def wait(self) -> float:
+        """Block the current thread while the gate is held.
+
+        Returns:
+            Seconds spent waiting
+        """
+        started = self._clock()
+        with self._cond:
+            while self._holders > 0:
+                remaining = self._until - self._clock()
+                if remaining <= 0:
+                    break
+                self._cond.wait(remaining)
+        return self._clock() - started
+
+    async def wait_async(self, poll_interval: float = 0.5) -> float:
+        """Wait on the event loop while the gate is held.
+
+        Returns:
+            Seconds spent waiting
+        """
+        started = self._clock()
+        remaining = self.remaining()
+        while remaining > 0:
+            await asyncio.sleep(min(remaining, poll_interval))
+            remaining = self.remaining()
+        return self._clock() - started
+
+    def budget_pause(self, requests_per_minute: float) -> float:
+        """Size a pause so the window since the last pause averages the budget.
+
+        Args:
+            requests_per_minute: Target average request rate
+
+        Returns:
+            Seconds to pause (0.0 if the window already ran under budget)
+        """
+        with self._cond:
+            elapsed = self._clock() - self._window_started
+            allowed = self._window_count * 60.0 / requests_per_minute
+            return max(0.0, allowed - elapsed)
+
+    def count_request(self) -> None:
+        """Count one request against the current window."""
+        with self._cond:
+            self._window_count += 1
+
+    def reset_window(self) -> None:
+        """Start a new budget window without pausing (window ran under budget)."""
+        with self._cond:
+            self._window_started = self._clock()
+            self._window_count = 0
+
+
+class AdaptiveController:
+    """Per-retailer AIMD controller for worker count and request delays.
+
+    Clean responses grow the worker limit and shrink the delay multiplier
+    additively once per SUCCESS_WINDOW; a 429/403, or a burst of 5xx and
+    timeouts, cuts workers multiplicatively and scales delays up by the
+    inverse factor. Decreases are rate-limited by a cooldown so one burst
+    of throttled in-flight requests counts as a single congestion event.
+
+    Workers are enforced with slot(): callers size their thread pool to
+    max_workers and wrap each unit of work, so only `workers` run at once.
+
+    Example:
+        controller = manager.enable_adaptive('att', initial_workers=5)
+        with controller.slot():
+            min_d, max_d = controller.scale_delays(min_delay, max_delay)
+            response = fetch(url)
+            controller.record(response.status_code)
+    """
+
+    def __init__(
+        self,
+        retailer: str,
+        initial_workers: int,
+        min_workers: int = 1,
+        max_workers: Optional[int] = None,
+        success_window: int = ADAPTIVE.SUCCESS_WINDOW,
+        decrease_factor: float = ADAPTIVE.DECREASE_FACTOR,
+        min_delay_scale: float = ADAPTIVE.MIN_DELAY_SCALE,
+        max_delay_scale: float = ADAPTIVE.MAX_DELAY_SCALE,
+        cooldown_seconds: float = ADAPTIVE.COOLDOWN_SECONDS,
+        clock: Callable[[], float] = time.monotonic
+    ) -> None:
+        """Initialize controller at the configured starting point.
+
+        Args:
+            retailer: Retailer name (for logging)
+            initial_workers: Starting worker limit (usually parallel_workers)
+            min_workers: Lowest worker limit after decreases
+            max_workers: Highest worker limit after increases (default: 2x initial)
+            success_window: Consecutive clean responses per additive increase
+            decrease_factor: Multiplier applied to workers on congestion (0-1)
+            min_delay_scale: Lowest delay multiplier
+            max_delay_scale: Highest delay multiplier
+            cooldown_seconds: Minimum time between decreases
+            clock: Monotonic clock function (injectable for tests)
+        """
+        self.retailer = retailer
+        self.min_workers = max(1, min_workers)
+        self.max_workers = max(self.min_workers, max_workers or initial_workers * 2)
+        self.workers = min(self.max_workers, max(self.min_workers, initial_workers))
+        self.delay_scale = 1.0
+        self.success_window = max(1, success_window)
+        self.decrease_factor = decrease_factor
+        self.min_delay_scale = min_delay_scale
+        self.max_delay_scale = max_delay_scale
+        self.cooldown_seconds = cooldown_seconds
+        self._clock = clock
+        self._lock = threading.Condition()
+        self._clean_streak = 0
+        self._server_errors = 0
+        self._last_decrease: Optional[float] = None
+        self._in_flight = 0
+        self.increases = 0
+        self.decreases = 0
+
+    def record(self, status_code: Optional[int]) -> None:
+        """Feed back the outcome of one request.
+
+        Args:
+            status_code: HTTP status, or None for a connection error/timeout
+        """
+        with self._lock:
+            if status_code in (429, 403):
+                self._decrease(f"HTTP {status_code}")
+            elif status_code is None or status_code == 408 or status_code >= 500:
+                self._clean_streak = 0
+                self._server_errors += 1
+                if self._server_errors >= ADAPTIVE.SERVER_ERROR_BURST:
+                    self._decrease(f"{self._server_errors} server errors/timeouts")
+            else:
+                self._clean_streak += 1
+                if self._clean_streak >= self.success_window:
+                    self._increase()
+
+    def _increase(self) -> None:
+        """Additive increase (caller holds the lock)."""
+        self._clean_streak = 0
+        self._server_errors = 0
+        old_workers, old_scale = self.workers, self.delay_scale
+        self.workers = min(self.max_workers, self.workers + ADAPTIVE.WORKER_INCREASE)
+        self.delay_scale = max(self.min_delay_scale, self.delay_scale - ADAPTIVE.DELAY_SCALE_DECREASE)
+        if (self.workers, self.delay_scale) != (old_workers, old_scale):
+            self.increases += 1
+            logging.debug(
+                f"[{self.retailer}] Adaptive increase: workers {old_workers}->{self.workers}, "
+                f"delay x{old_scale:.2f}->x{self.delay_scale:.2f}"
+            )
+            self._lock.notify_all()
+
+    def _decrease(self, reason: str) -> None:
+        """Multiplicative decrease, at most once per cooldown (caller holds the lock)."""
+        self._clean_streak = 0
+        self._server_errors = 0
+        now = self._clock()
+        if self._last_decrease is not None and now - self._last_decrease < self.cooldown_seconds:
+            return
+        self._last_decrease = now
+        old_workers, old_scale = self.workers, self.delay_scale
+        self.workers = max(self.min_workers, int(self.workers * self.decrease_factor))
+        self.delay_scale = min(self.max_delay_scale, self.delay_scale / self.decrease_factor)
+        self.decreases += 1
+        logging.warning(
+            f"[{self.retailer}] Adaptive backoff ({reason}): workers {old_workers}->{self.workers}, "
+            f"delay x{old_scale:.2f}->x{self.delay_scale:.2f}"
+        )
+
+    def scale_delays(self, min_delay: float, max_delay: float) -> Tuple[float, float]:
+        """Apply the current delay multiplier to a (min, max) delay pair."""
+        scale = self.delay_scale
+        return min_delay * scale, max_delay * scale
+
+    @contextmanager
+    def slot(self):
+        """Hold one of the currently allowed worker slots for the duration of the block."""
+        with self._lock:
+            while self._in_flight >= self.workers:
+                self._lock.wait()
+            self._in_flight += 1
+        try:
+            yield
+        finally:
+            with self._lock:
+                self._in_flight -= 1
+                self._lock.notify()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get current controller state."""
+        with self._lock:
+            return {
+                'workers': self.workers,
+                'min_workers': self.min_workers,
+                'max_workers': self.max_workers,
+                'delay_scale': round(self.delay_scale, 2),
+                'in_flight': self._in_flight,
+                'increases': self.increases,
+                'decreases': self.decreases,
+            }
+
+
 class GlobalConcurrencyManager:
     """Thread-safe singleton for managing concurrency across all scrapers.
 
     This manager prevents resource oversubscription by coordinating:
     1. Global worker limit across all retailers
     2. Per-retailer worker limits
-    3. Proxy request rate limiting (future enhancement)
+    3. Proxy request rate limiting
 
-    The manager uses semaphores for worker limits and token bucket algorithm
-    for rate limiting (future implementation).
+    The manager uses semaphores for worker limits and TokenBuckets for rate
+    limiting. Each proxy mode (residential, web_scraper_api) has its own
+    bucket refilled at proxy_requests_per_second unless overridden per mode,
+    and retailers can additionally be capped with per_retailer_rate_limit.
+    Direct-mode requests only consume from a retailer bucket, if configured.
 
     Example:
         manager = GlobalConcurrencyManager()
@@ -69,6 +462,9 @@ class GlobalConcurrencyManager:
         # Acquire slot before making request
         with manager.acquire_slot('verizon'):
             response = session.get(url)
+
+        # Respect proxy/retailer request rates
+        manager.wait_for_token('verizon', 'residential')
     """
 
     _instance: Optional['GlobalConcurrencyManager'] = None
@@ -107,6 +503,12 @@ class GlobalConcurrencyManager:
             self._global_semaphore = threading.Semaphore(self.config.global_max_workers)
             self._retailer_semaphores: Dict[str, threading.Semaphore] = {}
             self._retailer_max_workers: Dict[str, int] = {}
+            self._proxy_mode_rate_limits: Dict[str, float] = {}
+            self._retailer_rate_limits: Dict[str, float] = {}
+            self._proxy_buckets: Dict[str, TokenBucket] = {}
+            self._retailer_buckets: Dict[str, TokenBucket] = {}
+            self._adaptive_controllers: Dict[str, AdaptiveController] = {}
+            self._pause_gates: Dict[str, PauseGate] = {}
             self._config_lock = threading.Lock()
             self._initialized = True
 
@@ -120,14 +522,20 @@ class GlobalConcurrencyManager:
         self,
         global_max_workers: Optional[int] = None,
         per_retailer_max: Optional[Dict[str, int]] = None,
-        proxy_requests_per_second: Optional[float] = None
+        proxy_requests_per_second: Optional[float] = None,
+        proxy_rate_limit_by_mode: Optional[Dict[str, float]] = None,
+        per_retailer_rate_limit: Optional[Dict[str, float]] = None
     ) -> None:
         """Configure concurrency limits (can be called multiple times).
 
         Args:
             global_max_workers: Maximum concurrent workers across all retailers
             per_retailer_max: Dict mapping retailer names to their max workers
-            proxy_requests_per_second: Rate limit for proxy requests
+            proxy_requests_per_second: Default rate limit for each proxy mode
+            proxy_rate_limit_by_mode: Dict mapping proxy mode names to their own
+                rate limit (overrides proxy_requests_per_second for that mode)
+            per_retailer_rate_limit: Dict mapping retailer names to a request
+                rate cap that applies in every proxy mode (0 or None = no cap)
 
         Note:
             Changing limits while scrapers are running may not take effect
@@ -175,6 +583,194 @@ class GlobalConcurrencyManager:
                     f"{old_value} -> {proxy_requests_per_second} req/s"
                 )
 
+            if proxy_rate_limit_by_mode is not None:
+                self._proxy_mode_rate_limits.update(proxy_rate_limit_by_mode)
+                logging.info(
+                    f"[ConcurrencyManager] Per-mode proxy rate limits: {self._proxy_mode_rate_limits}"
+                )
+
+            if per_retailer_rate_limit is not None:
+                self._retailer_rate_limits.update(per_retailer_rate_limit)
+                logging.debug(
+                    f"[ConcurrencyManager] Per-retailer rate limits: {self._retailer_rate_limits}"
+                )
+
+            if proxy_requests_per_second is not None or proxy_rate_limit_by_mode is not None:
+                self._sync_buckets(self._proxy_buckets, self._proxy_rate_for)
+            if per_retailer_rate_limit is not None:
+                self._sync_buckets(self._retailer_buckets, self._retailer_rate_limits.get)
+
+    @staticmethod
+    def _sync_buckets(
+        buckets: Dict[str, TokenBucket],
+        rate_for: Callable[[str], Optional[float]]
+    ) -> None:
+        """Apply changed rates to existing buckets (caller holds _config_lock)."""
+        for key in list(buckets):
+            rate = rate_for(key)
+            if rate:
+                buckets[key].set_rate(rate)
+            else:
+                del buckets[key]
+
+    def _proxy_rate_for(self, proxy_mode: str) -> Optional[float]:
+        """Effective requests/second for a proxy mode (None = unlimited)."""
+        if proxy_mode == 'direct':
+            return None
+        return self._proxy_mode_rate_limits.get(proxy_mode, self.config.proxy_requests_per_second)
+
+    def _get_bucket(
+        self,
+        buckets: Dict[str, TokenBucket],
+        key: str,
+        rate: Optional[float]
+    ) -> Optional[TokenBucket]:
+        """Get or lazily create the bucket for key, or None if unlimited."""
+        if not rate or rate <= 0:
+            return None
+        bucket = buckets.get(key)
+        if bucket is None:
+            with self._config_lock:
+                bucket = buckets.get(key)
+                if bucket is None:
+                    bucket = TokenBucket(rate)
+                    buckets[key] = bucket
+                    logging.debug(f"[ConcurrencyManager] Created rate bucket for {key}: {rate} req/s")
+        return bucket
+
+    def _buckets_for(self, retailer: Optional[str], proxy_mode: str) -> List[TokenBucket]:
+        """Collect the buckets a request for (retailer, proxy_mode) must draw from."""
+        buckets = []
+        proxy_bucket = self._get_bucket(self._proxy_buckets, proxy_mode, self._proxy_rate_for(proxy_mode))
+        if proxy_bucket is not None:
+            buckets.append(proxy_bucket)
+        if retailer:
+            retailer_bucket = self._get_bucket(
+                self._retailer_buckets, retailer, self._retailer_rate_limits.get(retailer)
+            )
+            if retailer_bucket is not None:
+                buckets.append(retailer_bucket)
+        return buckets
+
+    def reserve_request(self, retailer: Optional[str] = None, proxy_mode: str = 'direct') -> float:
+        """Reserve a token from every applicable bucket without waiting.
+
+        Args:
+            retailer: Retailer name (optional; enables the per-retailer cap)
+            proxy_mode: Proxy mode value ('direct', 'residential', 'web_scraper_api')
+
+        Returns:
+            Seconds the caller must wait before sending the request
+        """
+        return max((bucket.reserve() for bucket in self._buckets_for(retailer, proxy_mode)), default=0.0)
+
+    def wait_for_token(self, retailer: Optional[str] = None, proxy_mode: str = 'direct') -> float:
+        """Block until one request is allowed for this retailer and proxy mode.
+
+        Args:
+            retailer: Retailer name (optional; enables the per-retailer cap)
+            proxy_mode: Proxy mode value ('direct', 'residential', 'web_scraper_api')
+
+        Returns:
+            Seconds spent waiting
+        """
+        paused = sum(gate.wait() for gate in self._active_pause_gates(retailer, proxy_mode))
+        wait = self.reserve_request(retailer, proxy_mode)
+        if wait > 0:
+            logging.debug(f"[ConcurrencyManager] Rate limited {retailer or proxy_mode}: waiting {wait:.2f}s")
+            time.sleep(wait)
+        return paused + wait
+
+    async def wait_for_token_async(self, retailer: Optional[str] = None, proxy_mode: str = 'direct') -> float:
+        """Asyncio variant of wait_for_token() that yields to the event loop.
+
+        Args:
+            retailer: Retailer name (optional; enables the per-retailer cap)
+            proxy_mode: Proxy mode value ('direct', 'residential', 'web_scraper_api')
+
+        Returns:
+            Seconds spent waiting
+        """
+        paused = 0.0
+        for gate in self._active_pause_gates(retailer, proxy_mode):
+            paused += await gate.wait_async()
+        wait = self.reserve_request(retailer, proxy_mode)
+        if wait > 0:
+            logging.debug(f"[ConcurrencyManager] Rate limited {retailer or proxy_mode}: waiting {wait:.2f}s")
+            await asyncio.sleep(wait)
+        return paused + wait
+
+    def get_pause_gate(self, retailer: Optional[str] = None, proxy_mode: Optional[str] = None) -> PauseGate:
+        """Get (or create) the pause gate for a retailer or a proxy mode.
+
+        Args:
+            retailer: Retailer name (gate shared by that retailer's workers)
+            proxy_mode: Proxy mode, used when retailer is None (gate shared
+                by every retailer using that proxy mode)
+
+        Returns:
+            The shared PauseGate
+        """
+        key = retailer if retailer else f"proxy:{proxy_mode or 'direct'}"
+        gate = self._pause_gates.get(key)
+        if gate is None:
+            with self._config_lock:
+                gate = self._pause_gates.setdefault(key, PauseGate(key))
+        return gate
+
+    def _active_pause_gates(self, retailer: Optional[str], proxy_mode: str) -> List[PauseGate]:
+        """Existing gates a request for this retailer and proxy mode must honor."""
+        keys = [f"proxy:{proxy_mode}"]
+        if retailer:
+            keys.append(retailer)
+        return [self._pause_gates[key] for key in keys if key in self._pause_gates]
+
+    def enable_adaptive(
+        self,
+        retailer: str,
+        initial_workers: int,
+        settings: Optional[Dict[str, Any]] = None
+    ) -> AdaptiveController:
+        """Create (or replace) the AIMD controller for a retailer's run.
+
+        Unless settings sets max_workers, the worker ceiling is the larger of
+        the retailer's max workers (per_retailer_max if unset) and twice the
+        starting workers, so the controller may grow past the hand-tuned
+        limit up to 2x initial_workers.
+
+        Args:
+            retailer: Retailer name
+            initial_workers: Starting worker limit (usually parallel_workers)
+            settings: Optional `adaptive` block from retailers.yaml
+                (min_workers, max_workers, success_window, cooldown_seconds)
+
+        Returns:
+            The retailer's AdaptiveController
+        """
+        settings = settings or {}
+        default_max = self._retailer_max_workers.get(retailer) or self.config.per_retailer_max
+        controller = AdaptiveController(
+            retailer,
+            initial_workers=initial_workers,
+            min_workers=settings.get('min_workers', 1),
+            max_workers=settings.get('max_workers', max(default_max, initial_workers * 2)),
+            success_window=settings.get('success_window', ADAPTIVE.SUCCESS_WINDOW),
+            cooldown_seconds=settings.get('cooldown_seconds', ADAPTIVE.COOLDOWN_SECONDS),
+        )
+        with self._config_lock:
+            self._adaptive_controllers[retailer] = controller
+        logging.info(
+            f"[{retailer}] Adaptive concurrency enabled: workers={controller.workers} "
+            f"(range {controller.min_workers}-{controller.max_workers})"
+        )
+        return controller
+
+    def get_adaptive_controller(self, retailer: Optional[str]) -> Optional[AdaptiveController]:
+        """Get the retailer's AIMD controller, or None if adaptive mode is off."""
+        if not retailer:
+            return None
+        return self._adaptive_controllers.get(retailer)
+
     def get_retailer_semaphore(self, retailer: str) -> threading.Semaphore:
         """Get or create per-retailer semaphore.
 
@@ -277,8 +873,28 @@ class GlobalConcurrencyManager:
                 'global_max_workers': self.config.global_max_workers,
                 'per_retailer_max': self.config.per_retailer_max,
                 'proxy_requests_per_second': self.config.proxy_requests_per_second,
+                'proxy_rate_limit_by_mode': dict(self._proxy_mode_rate_limits),
+                'per_retailer_rate_limit': dict(self._retailer_rate_limits),
             },
             'retailers': {},
+            'rate_buckets': {
+                'proxy': {
+                    mode: {'rate': bucket.rate, 'available': round(bucket.available, 2)}
+                    for mode, bucket in list(self._proxy_buckets.items())
+                },
+                'retailers': {
+                    retailer: {'rate': bucket.rate, 'available': round(bucket.available, 2)}
+                    for retailer, bucket in list(self._retailer_buckets.items())
+                },
+            },
+            'adaptive': {
+                retailer: controller.get_stats()
+                for retailer, controller in list(self._adaptive_controllers.items())
+            },
+            'pauses': {
+                key: {'pauses': gate.pauses, 'remaining': round(gate.remaining(), 2)}
+                for key, gate in list(self._pause_gates.items())
+            },
         }
 
         # Note: Semaphore doesn't expose current value in standard library,
@@ -311,4 +927,10 @@ class GlobalConcurrencyManager:
             self._global_semaphore = threading.Semaphore(self.config.global_max_workers)
             self._retailer_semaphores.clear()
             self._retailer_max_workers.clear()
+            self._proxy_mode_rate_limits.clear()
+            self._retailer_rate_limits.clear()
+            self._proxy_buckets.clear()
+            self._retailer_buckets.clear()
+            self._adaptive_controllers.clear()
+            self._pause_gates.clear()
             logging.debug("[ConcurrencyManager] Reset to initial state")
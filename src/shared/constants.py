@@ -16,12 +16,19 @@ Usage:
 """
 
 from dataclasses import dataclass
+from typing import Tuple
 
 __all__ = [
+    'ADAPTIVE',
+    'AdaptiveDefaults',
     'CACHE',
+    'CHECKPOINT',
     'CacheDefaults',
+    'CheckpointDefaults',
     'EXPORT',
     'ExportDefaults',
+    'GAP_FILL',
+    'GapFillDefaults',
     'HTTP',
     'HttpDefaults',
     'LOGGING',
@@ -30,14 +37,20 @@ __all__ = [
     'PauseDefaults',
     'PROGRESS',
     'ProgressDefaults',
+    'RESIDENTIAL_POOL',
+    'ResidentialPoolDefaults',
     'RUN_HISTORY',
     'RunHistoryDefaults',
+    'SCRAPER_API',
+    'ScraperApiDefaults',
     'STATUS',
     'StatusDefaults',
     'STREAMING',
     'StreamingDefaults',
     'TEST_MODE',
+    'TIERED_PROXY',
     'TestModeDefaults',
+    'TieredProxyDefaults',
     'VALIDATION',
     'ValidationDefaults',
     'WORKERS',
@@ -71,6 +84,99 @@ class HttpDefaults:
     SERVER_ERROR_WAIT: int = 10
     """Wait time in seconds after server errors (5xx) or timeouts before retry."""
 
+    POOL_CONNECTIONS: int = 10
+    """Number of per-host connection pools kept by each session's HTTPAdapter."""
+
+    POOL_MAXSIZE: int = 10
+    """Maximum keep-alive connections per host pool in each session's HTTPAdapter."""
+
+
+@dataclass(frozen=True)
+class ScraperApiDefaults:
+    """Oxylabs Web Scraper API push-pull (batch job) settings.
+
+    Controls how many URLs are submitted per batch request and how the
+    resulting jobs are polled until their results can be collected.
+    """
+
+    BATCH_SIZE: int = 1000
+    """URLs submitted per batch request (the API accepts up to 5000)."""
+
+    POLL_INTERVAL: float = 5.0
+    """Seconds between job status polling rounds."""
+
+    JOB_TIMEOUT: float = 1800.0
+    """Seconds after submission before an unfinished job is given up on."""
+
+    POLL_WORKERS: int = 8
+    """Job status checks and result downloads in flight at once while polling."""
+
+    POLL_WINDOW: int = 100
+    """Oldest pending jobs whose status is checked in each polling round."""
+
+
+@dataclass(frozen=True)
+class ResidentialPoolDefaults:
+    """Sticky residential session pool settings.
+
+    Controls how many sticky Oxylabs exits each retailer keeps warm and when
+    a session's health is poor enough to retire and replace it. Enabled per
+    retailer with `session_type: "pool"` in the proxy config.
+    """
+
+    SIZE: int = 10
+    """Sticky sessions kept per retailer."""
+
+    WINDOW: int = 20
+    """Recent outcomes per session used for its success rate and block count."""
+
+    MIN_OUTCOMES: int = 5
+    """Outcomes required before a session can be retired for a low success rate."""
+
+    RETIRE_SUCCESS_RATE: float = 0.5
+    """Success rate below which a session is retired."""
+
+    BLOCK_LIMIT: int = 2
+    """Consecutive 403/429 responses after which a session is retired."""
+
+    LATENCY_TARGET_SECONDS: float = 2.0
+    """Average latency at which a session's latency factor drops to one half."""
+
+    MAX_AGE_SECONDS: float = 540.0
+    """Session lifetime before replacement (Oxylabs keeps a sticky exit for 10 minutes)."""
+
+
+@dataclass(frozen=True)
+class TieredProxyDefaults:
+    """Tiered proxy escalation settings.
+
+    Controls the per-request escalation ladder used with proxy mode
+    `tiered`: each request starts on the cheapest tier that works for its
+    host and moves up only on block signals.
+    """
+
+    TIERS: Tuple[str, ...] = ('direct', 'residential', 'web_scraper_api', 'render_js')
+    """Default ladder, cheapest first (`render_js` is Web Scraper API with rendering)."""
+
+    BLOCK_STATUS_CODES: Tuple[int, ...] = (403, 429, 503)
+    """Statuses treated as a block signal and escalated."""
+
+    BLOCK_MARKERS: Tuple[str, ...] = (
+        'px-captcha',
+        '_Incapsula_Resource',
+        'captcha-delivery.com',
+        'cf-chl-',
+        'Pardon Our Interruption',
+        '<title>Access Denied</title>',
+    )
+    """Bot-challenge page fragments that mark an otherwise successful response as blocked."""
+
+    MARKER_SCAN_BYTES: int = 16 * 1024
+    """Leading bytes of a response body searched for block markers."""
+
+    ESCALATION_TTL_SECONDS: float = 1800.0
+    """How long a host's escalated tier is remembered before cheaper tiers are tried again."""
+
 
 @dataclass(frozen=True)
 class CacheDefaults:
@@ -85,6 +191,27 @@ class CacheDefaults:
     RESPONSE_CACHE_EXPIRY_DAYS: int = 30
     """Number of days to cache HTTP responses (e.g., Walmart sitemap)."""
 
+    SQLITE_MAX_BYTES: int = 2 * 1024 * 1024 * 1024
+    """Compressed size cap (2GB) for SQLite response caches before LRU eviction."""
+
+    SQLITE_COMPRESS_LEVEL: int = 6
+    """zlib compression level for SQLite cache bodies."""
+
+
+@dataclass(frozen=True)
+class CheckpointDefaults:
+    """Checkpoint journal settings.
+
+    Controls how often appended progress records are made durable and how
+    often the journal is folded back into the full checkpoint snapshot.
+    """
+
+    JOURNAL_FSYNC_EVERY: int = 100
+    """Journal records written between fsyncs."""
+
+    COMPACT_EVERY: int = 5000
+    """Journal records between full checkpoint snapshot rewrites."""
+
 
 @dataclass(frozen=True)
 class PauseDefaults:
@@ -139,6 +266,46 @@ class WorkerDefaults:
     DISCOVERY_WORKERS_DIRECT: int = 1
     """Workers for URL discovery phase without proxy."""
 
+    ASYNC_CONCURRENCY: int = 50
+    """Maximum in-flight requests per retailer when using the asyncio engine."""
+
+    PARSE_PROCESSES: int = 0
+    """Parse worker processes per retailer (0 = parse on the fetching thread)."""
+
+
+@dataclass(frozen=True)
+class AdaptiveDefaults:
+    """Adaptive (AIMD) concurrency and delay tuning.
+
+    Controls how quickly a retailer's worker count and request delays react
+    to clean responses versus 429/403/5xx feedback. Enabled per retailer via
+    the `adaptive` block in config/retailers.yaml.
+    """
+
+    SUCCESS_WINDOW: int = 20
+    """Consecutive clean responses required before each additive increase."""
+
+    WORKER_INCREASE: int = 1
+    """Workers added after each clean window."""
+
+    DELAY_SCALE_DECREASE: float = 0.1
+    """Amount subtracted from the delay multiplier after each clean window."""
+
+    DECREASE_FACTOR: float = 0.5
+    """Multiplicative cut applied to workers (and inverse to delays) on congestion."""
+
+    MIN_DELAY_SCALE: float = 0.5
+    """Lowest delay multiplier (fraction of the configured delays)."""
+
+    MAX_DELAY_SCALE: float = 8.0
+    """Highest delay multiplier after repeated congestion."""
+
+    SERVER_ERROR_BURST: int = 3
+    """5xx/timeout responses within one window that count as a congestion event."""
+
+    COOLDOWN_SECONDS: float = 5.0
+    """Minimum time between decreases, so one burst of 429s is one event."""
+
 
 @dataclass(frozen=True)
 class ProgressDefaults:
@@ -174,6 +341,26 @@ class ExportDefaults:
     """Maximum characters for Excel sheet names (Excel limitation)."""
 
 
+@dataclass(frozen=True)
+class GapFillDefaults:
+    """ZIP code gap-fill sweep configuration.
+
+    Controls the shared ZipGapFill engine used by locator-API scrapers.
+    """
+
+    WORKERS: int = 4
+    """ZIP searches in flight at once."""
+
+    PATIENCE: int = 10
+    """Consecutive searches without a new store before the sweep stops (0 = never)."""
+
+    RETRIES: int = 1
+    """Extra attempts for a ZIP whose search failed before it is reported as failed."""
+
+    SEED_RADIUS_MILES: float = 25.0
+    """Radius around each already-known store treated as covered."""
+
+
 @dataclass(frozen=True)
 class LoggingDefaults:
     """Logging configuration.
@@ -212,6 +399,9 @@ class StreamingDefaults:
     LARGE_FILE_THRESHOLD_BYTES: int = 50 * 1024 * 1024
     """File size threshold (50MB) above which streaming is used."""
 
+    PIPELINE_QUEUE_SIZE: int = 1000
+    """Maximum extracted stores buffered ahead of the StorePipeline writer thread."""
+
 
 @dataclass(frozen=True)
 class StatusDefaults:
@@ -272,11 +462,17 @@ class ValidationDefaults:
 
 # Singleton instances for easy import
 HTTP = HttpDefaults()
+SCRAPER_API = ScraperApiDefaults()
+RESIDENTIAL_POOL = ResidentialPoolDefaults()
+TIERED_PROXY = TieredProxyDefaults()
 CACHE = CacheDefaults()
+CHECKPOINT = CheckpointDefaults()
 PAUSE = PauseDefaults()
 WORKERS = WorkerDefaults()
+ADAPTIVE = AdaptiveDefaults()
 PROGRESS = ProgressDefaults()
 EXPORT = ExportDefaults()
+GAP_FILL = GapFillDefaults()
 LOGGING = LoggingDefaults()
 RUN_HISTORY = RunHistoryDefaults()
 STREAMING = StreamingDefaults()
@@ -24,16 +24,17 @@ DEFAULT_MIN_DELAY = HTTP.MIN_DELAY
 DEFAULT_MAX_DELAY = HTTP.MAX_DELAY
 
 
-def random_delay(min_sec: float = None, max_sec: float = None) -> None:
+def random_delay(min_sec: float = None, max_sec: float = None, scale: float = 1.0) -> None:
     """Add randomized delay between requests.
 
     Args:
         min_sec: Minimum delay in seconds (uses default if None)
         max_sec: Maximum delay in seconds (uses default if None)
+        scale: Multiplier applied to both bounds (AdaptiveController.delay_scale)
     """
     min_sec = min_sec if min_sec is not None else DEFAULT_MIN_DELAY
     max_sec = max_sec if max_sec is not None else DEFAULT_MAX_DELAY
-    delay = random.uniform(min_sec, max_sec)
+    delay = random.uniform(min_sec * scale, max_sec * scale)
     time.sleep(delay)
     logging.debug(f"Delayed {delay:.2f} seconds")
 
@@ -1,12 +1,18 @@
 """
 Export Service - Multi-format export functionality for store data.
 
-Supports exporting to JSON, CSV, Excel (.xlsx), and GeoJSON formats.
+Supports exporting to JSON, JSON Lines, CSV, Excel (.xlsx), and GeoJSON formats.
+
+JSON, JSON Lines, CSV and GeoJSON are written one store at a time by the
+stream writers below (also used by StorePipeline), so an export never holds
+more than the input iterable and one CSV field-sampling window; only Excel
+needs the full list.
 """
 
 import csv
 import json
 import logging
+import os
 from enum import Enum
 from io import BytesIO, StringIO
 from pathlib import Path
@@ -14,10 +20,10 @@ from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
     from openpyxl import Workbook as WorkbookType
-from typing import Any, Dict, List, Optional, Union
+from typing import IO, Any, Dict, Iterable, List, Optional, Union
 
 from src.shared.constants import EXPORT
-from src.shared.store_schema import normalize_stores_batch
+from src.shared.store_schema import normalize_store_data
 
 
 try:
@@ -34,6 +40,7 @@ __all__ = [
     "ExportFormat",
     "ExportService",
     "OPENPYXL_AVAILABLE",
+    "create_stream_writer",
     "parse_format_list",
     "sanitize_csv_value",
     "sanitize_store_for_csv",
@@ -43,6 +50,7 @@ __all__ = [
 class ExportFormat(Enum):
     """Supported export formats."""
     JSON = "json"
+    JSONL = "jsonl"
     CSV = "csv"
     EXCEL = "excel"
     GEOJSON = "geojson"
@@ -109,6 +117,203 @@ def sanitize_store_for_csv(store: Dict[str, Any]) -> Dict[str, Any]:
     return {key: sanitize_csv_value(value) for key, value in store.items()}
 
 
+def _store_to_feature(store: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """Build a GeoJSON Point feature for a store, or None without valid coordinates."""
+    # Get coordinates - try multiple field names
+    # Use explicit None checks to handle 0 values (equator/prime meridian)
+    lat = store.get('latitude') if store.get('latitude') is not None else store.get('lat')
+    lng = store.get('longitude') if store.get('longitude') is not None else (
+        store.get('lng') if store.get('lng') is not None else store.get('lon')
+    )
+
+    # Skip stores without valid coordinates
+    if lat is None or lng is None:
+        return None
+
+    try:
+        lat_float = float(lat)
+        lng_float = float(lng)
+    except (ValueError, TypeError):
+        return None
+
+    # Skip invalid coordinates
+    if not (-90 <= lat_float <= 90) or not (-180 <= lng_float <= 180):
+        return None
+
+    # Build feature with all store properties
+    return {
+        "type": "Feature",
+        "geometry": {
+            "type": "Point",
+            # GeoJSON uses [longitude, latitude] order
+            "coordinates": [lng_float, lat_float]
+        },
+        "properties": dict(store.items())
+    }
+
+
+class _JsonArrayWriter:
+    """Incremental writer producing the same bytes as json.dump(stores, indent=2).
+
+    With compact=True the output matches json.dump(stores, separators=(',', ':')).
+    """
+
+    def __init__(self, handle: IO[str], compact: bool = False) -> None:
+        self._handle = handle
+        self._first = True
+        self._compact = compact
+
+    def write(self, store: Dict[str, Any]) -> None:
+        if self._compact:
+            body = json.dumps(store, ensure_ascii=False, separators=(',', ':'))
+            self._handle.write(('[' if self._first else ',') + body)
+        else:
+            body = json.dumps(store, indent=2, ensure_ascii=False).replace('\n', '\n  ')
+            self._handle.write(('[\n  ' if self._first else ',\n  ') + body)
+        self._first = False
+
+    def finish(self) -> None:
+        if self._first:
+            self._handle.write('[]')
+        else:
+            self._handle.write(']' if self._compact else '\n]')
+
+
+class _JsonLinesWriter:
+    """One compact JSON object per line."""
+
+    def __init__(self, handle: IO[str]) -> None:
+        self._handle = handle
+
+    def write(self, store: Dict[str, Any]) -> None:
+        self._handle.write(json.dumps(store, ensure_ascii=False, separators=(',', ':')) + '\n')
+
+    def finish(self) -> None:
+        pass
+
+
+class _GeoJsonWriter:
+    """Incremental writer producing the same bytes as json.dump(generate_geojson(stores), indent=2).
+
+    With compact=True the output matches json.dump(..., separators=(',', ':')).
+    Stores without valid coordinates are skipped and counted.
+    """
+
+    def __init__(self, handle: IO[str], compact: bool = False) -> None:
+        self._handle = handle
+        self._compact = compact
+        self._first = True
+        self.skipped = 0
+        if compact:
+            handle.write('{"type":"FeatureCollection","features":[')
+        else:
+            handle.write('{\n  "type": "FeatureCollection",\n  "features": [')
+
+    def write(self, store: Dict[str, Any]) -> None:
+        feature = _store_to_feature(store)
+        if feature is None:
+            self.skipped += 1
+            return
+        if self._compact:
+            body = json.dumps(feature, ensure_ascii=False, separators=(',', ':'))
+            self._handle.write(('' if self._first else ',') + body)
+        else:
+            body = json.dumps(feature, indent=2, ensure_ascii=False).replace('\n', '\n    ')
+            self._handle.write(('\n    ' if self._first else ',\n    ') + body)
+        self._first = False
+
+    def finish(self) -> None:
+        if self._compact:
+            self._handle.write(']}')
+        else:
+            self._handle.write(']\n}' if self._first else '\n  ]\n}')
+        if self.skipped:
+            logging.warning(f"Skipped {self.skipped} stores with missing or invalid coordinates")
+
+
+class _CsvWriter:
+    """Incremental CSV writer with formula-injection sanitization (#73).
+
+    Without configured output_fields the header is the sorted union of the
+    first EXPORT.FIELD_SAMPLE_SIZE stores' fields (same rule as
+    ExportService._get_fieldnames), so only that many rows are buffered.
+    """
+
+    def __init__(
+        self,
+        handle: IO[str],
+        fieldnames: Optional[List[str]] = None,
+        sample_size: int = EXPORT.FIELD_SAMPLE_SIZE
+    ) -> None:
+        self._handle = handle
+        self._fieldnames = fieldnames
+        self._sample_size = sample_size
+        self._buffer: List[Dict[str, Any]] = []
+        self._writer: Optional[csv.DictWriter] = None
+        # An explicit (even empty) field list is used as-is, like _get_fieldnames
+        if fieldnames is not None:
+            self._start()
+
+    def _start(self) -> None:
+        if self._fieldnames is None:
+            fields = set()
+            for row in self._buffer:
+                fields.update(row.keys())
+            self._fieldnames = sorted(fields)
+        self._writer = csv.DictWriter(self._handle, fieldnames=self._fieldnames, extrasaction='ignore')
+        self._writer.writeheader()
+        self._writer.writerows(self._buffer)
+        self._buffer = []
+
+    def write(self, store: Dict[str, Any]) -> None:
+        row = sanitize_store_for_csv(store)
+        if self._writer is not None:
+            self._writer.writerow(row)
+            return
+        self._buffer.append(row)
+        if len(self._buffer) >= self._sample_size:
+            self._start()
+
+    def finish(self) -> None:
+        if self._writer is None:
+            self._start()
+
+
+def create_stream_writer(
+    export_format: 'ExportFormat',
+    handle: IO[str],
+    retailer_config: Optional[Dict[str, Any]] = None
+) -> Any:
+    """Create an incremental writer for a text export format.
+
+    The writer has write(store) and finish(); finish() must be called once
+    after the last store. CSV handles must be opened with newline=''.
+
+    Args:
+        export_format: JSON, JSONL, CSV or GEOJSON
+        handle: Open text file handle to write to
+        retailer_config: Optional retailer config (output_fields, compact_json)
+
+    Returns:
+        Writer object for the format
+
+    Raises:
+        ValueError: If the format cannot be written incrementally (Excel)
+    """
+    retailer_config = retailer_config or {}
+    compact = bool(retailer_config.get('compact_json', False))
+    if export_format == ExportFormat.JSON:
+        return _JsonArrayWriter(handle, compact)
+    if export_format == ExportFormat.JSONL:
+        return _JsonLinesWriter(handle)
+    if export_format == ExportFormat.CSV:
+        return _CsvWriter(handle, retailer_config.get('output_fields'))
+    if export_format == ExportFormat.GEOJSON:
+        return _GeoJsonWriter(handle, compact)
+    raise ValueError(f"{export_format.value} cannot be written incrementally")
+
+
+
 class ExportService:
     """Service for exporting store data to various formats."""
 
@@ -120,7 +325,7 @@ class ExportService:
 
     @staticmethod
     def export_stores(
-        stores: List[Dict[str, Any]],
+        stores: Iterable[Dict[str, Any]],
         export_format: ExportFormat,
         output_path: str,
         retailer_config: Optional[Dict[str, Any]] = None,
@@ -130,41 +335,109 @@ class ExportService:
         Export stores to a file in the specified format.
 
         Args:
-            stores: List of store dictionaries
-            export_format: Target format (JSON, CSV, EXCEL, GEOJSON)
+            stores: Iterable of store dictionaries (consumed once)
+            export_format: Target format (JSON, JSONL, CSV, EXCEL, GEOJSON)
             output_path: Path to save the output file
             retailer_config: Optional retailer config with output_fields
             normalize_fields: If True, normalize field names to canonical schema (default: True)
         """
-        if not stores:
-            logging.warning("No stores to export")
-            return
+        ExportService.export_stores_multi(
+            stores, {export_format: output_path}, retailer_config, normalize_fields
+        )
 
-        # Normalize field names if requested (Issue #170)
-        if normalize_fields:
-            retailer_name = retailer_config and retailer_config.get('name')
-            stores = normalize_stores_batch(stores, retailer=retailer_name)
+    @staticmethod
+    def export_stores_multi(
+        stores: Iterable[Dict[str, Any]],
+        outputs: Dict[ExportFormat, str],
+        retailer_config: Optional[Dict[str, Any]] = None,
+        normalize_fields: bool = True
+    ) -> Dict[ExportFormat, str]:
+        """
+        Export stores to several formats in a single pass over the data.
 
-        # Validate output path to prevent path traversal attacks
-        path = Path(output_path)
-        # Check for path traversal attempts
-        if ".." in str(path) or ".." in str(path.resolve()):
-            raise ValueError(f"Invalid output path: {output_path}. Path traversal not allowed.")
+        Each store is normalized once and handed to every format's stream
+        writer; only Excel collects the stores in memory. Files are written
+        to a temporary name and moved into place once all formats finished,
+        so a failed export never replaces existing outputs.
 
-        path.parent.mkdir(parents=True, exist_ok=True)
+        Args:
+            stores: Iterable of store dictionaries (consumed once)
+            outputs: Mapping of format to output path
+            retailer_config: Optional retailer config with output_fields and compact_json
+            normalize_fields: If True, normalize field names to canonical schema (default: True)
 
-        fieldnames = ExportService._get_fieldnames(stores, retailer_config)
+        Returns:
+            Mapping of written format to output path (empty if there were no stores)
 
-        if export_format == ExportFormat.JSON:
-            ExportService._save_json(stores, path)
-        elif export_format == ExportFormat.CSV:
-            ExportService._save_csv(stores, path, fieldnames)
-        elif export_format == ExportFormat.EXCEL:
-            ExportService._save_excel(stores, path, fieldnames)
-        elif export_format == ExportFormat.GEOJSON:
-            ExportService._save_geojson(stores, path)
+        Raises:
+            ValueError: If an output path contains path traversal
+            ImportError: If Excel is requested and openpyxl is not installed
+        """
+        paths: Dict[ExportFormat, Path] = {}
+        for export_format, output_path in outputs.items():
+            path = Path(output_path)
+            # Check for path traversal attempts
+            if ".." in str(path) or ".." in str(path.resolve()):
+                raise ValueError(f"Invalid output path: {output_path}. Path traversal not allowed.")
+            paths[export_format] = path
+
+        if ExportFormat.EXCEL in paths and not OPENPYXL_AVAILABLE:
+            raise ImportError(
+                "openpyxl is required for Excel export. "
+                "Install it with: pip install openpyxl"
+            )
 
-        logging.info(f"Exported {len(stores)} stores to {export_format.value.upper()}: {output_path}")
+        retailer_name = retailer_config and retailer_config.get('name')
+        excel_stores: Optional[List[Dict[str, Any]]] = [] if ExportFormat.EXCEL in paths else None
+        temp_paths = {
+            fmt: path.with_name(f".{path.name}.partial")
+            for fmt, path in paths.items() if fmt != ExportFormat.EXCEL
+        }
+        handles: Dict[ExportFormat, IO[str]] = {}
+        count = 0
+
+        try:
+            writers = {}
+            for fmt, temp_path in temp_paths.items():
+                temp_path.parent.mkdir(parents=True, exist_ok=True)
+                newline = '' if fmt == ExportFormat.CSV else None
+                handles[fmt] = open(temp_path, 'w', newline=newline, encoding='utf-8')
+                writers[fmt] = create_stream_writer(fmt, handles[fmt], retailer_config)
+
+            for store in stores:
+                # Normalize field names if requested (Issue #170)
+                if normalize_fields:
+                    store = normalize_store_data(store, retailer=retailer_name)
+                for writer in writers.values():
+                    writer.write(store)
+                if excel_stores is not None:
+                    excel_stores.append(store)
+                count += 1
+
+            if count:
+                for writer in writers.values():
+                    writer.finish()
+            for handle in handles.values():
+                handle.close()
+
+            if not count:
+                logging.warning("No stores to export")
+                return {}
+
+            if excel_stores is not None:
+                paths[ExportFormat.EXCEL].parent.mkdir(parents=True, exist_ok=True)
+                fieldnames = ExportService._get_fieldnames(excel_stores, retailer_config)
+                ExportService._save_excel(excel_stores, paths[ExportFormat.EXCEL], fieldnames)
+            for fmt, temp_path in temp_paths.items():
+                os.replace(temp_path, paths[fmt])
+        finally:
+            for fmt, handle in handles.items():
+                handle.close()
+                temp_paths[fmt].unlink(missing_ok=True)
+
+        for fmt, path in paths.items():
+            logging.info(f"Exported {count} stores to {fmt.value.upper()}: {path}")
+        return {fmt: str(path) for fmt, path in paths.items()}
 
     @staticmethod
     def _get_fieldnames(
@@ -200,26 +473,6 @@ class ExportService:
         # Fallback to defaults
         return ExportService.DEFAULT_FIELDS
 
-    @staticmethod
-    def _save_json(stores: List[Dict[str, Any]], path: Path) -> None:
-        """Save stores to JSON file."""
-        with open(path, 'w', encoding='utf-8') as f:
-            json.dump(stores, f, indent=2, ensure_ascii=False)
-
-    @staticmethod
-    def _save_csv(
-        stores: List[Dict[str, Any]],
-        path: Path,
-        fieldnames: List[str]
-    ) -> None:
-        """Save stores to CSV file with formula injection protection (#73)."""
-        # Sanitize stores to prevent CSV injection
-        sanitized_stores = [sanitize_store_for_csv(store) for store in stores]
-        with open(path, 'w', newline='', encoding='utf-8') as f:
-            writer = csv.DictWriter(f, fieldnames=fieldnames, extrasaction='ignore')
-            writer.writeheader()
-            writer.writerows(sanitized_stores)
-
     @staticmethod
     def _save_excel(
         stores: List[Dict[str, Any]],
@@ -270,13 +523,6 @@ class ExportService:
 
         wb.save(path)
 
-    @staticmethod
-    def _save_geojson(stores: List[Dict[str, Any]], path: Path) -> None:
-        """Save stores to GeoJSON file."""
-        geojson = ExportService.generate_geojson(stores)
-        with open(path, 'w', encoding='utf-8') as f:
-            json.dump(geojson, f, indent=2, ensure_ascii=False)
-
     @staticmethod
     def generate_geojson(stores: List[Dict[str, Any]]) -> Dict[str, Any]:
         """
@@ -292,40 +538,10 @@ class ExportService:
         skipped = 0
 
         for store in stores:
-            # Get coordinates - try multiple field names
-            # Use explicit None checks to handle 0 values (equator/prime meridian)
-            lat = store.get('latitude') if store.get('latitude') is not None else store.get('lat')
-            lng = store.get('longitude') if store.get('longitude') is not None else (
-                store.get('lng') if store.get('lng') is not None else store.get('lon')
-            )
-
-            # Skip stores without valid coordinates
-            if lat is None or lng is None:
-                skipped += 1
-                continue
-
-            try:
-                lat_float = float(lat)
-                lng_float = float(lng)
-            except (ValueError, TypeError):
+            feature = _store_to_feature(store)
+            if feature is None:
                 skipped += 1
                 continue
-
-            # Skip invalid coordinates
-            if not (-90 <= lat_float <= 90) or not (-180 <= lng_float <= 180):
-                skipped += 1
-                continue
-
-            # Build feature with all store properties
-            feature = {
-                "type": "Feature",
-                "geometry": {
-                    "type": "Point",
-                    # GeoJSON uses [longitude, latitude] order
-                    "coordinates": [lng_float, lat_float]
-                },
-                "properties": dict(store.items())
-            }
             features.append(feature)
 
         if skipped > 0:
@@ -509,13 +725,11 @@ class ExportService:
         elif fieldnames is None:
             fieldnames = ExportService.DEFAULT_FIELDS
 
-        # Sanitize stores to prevent CSV injection
-        sanitized_stores = [sanitize_store_for_csv(store) for store in stores]
-
         output = StringIO()
         writer = csv.DictWriter(output, fieldnames=fieldnames, extrasaction='ignore')
         writer.writeheader()
-        writer.writerows(sanitized_stores)
+        # Sanitize row by row to prevent CSV injection
+        writer.writerows(sanitize_store_for_csv(store) for store in stores)
         return output.getvalue()
 
 
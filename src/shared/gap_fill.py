@@ -0,0 +1,370 @@
+"""Coverage-aware ZIP code gap-fill for store-locator APIs.
+
+Locator-based scrapers sweep a list of ZIP codes to catch stores their main
+discovery pass missed. Sweeping the list in order wastes most requests on
+areas already covered by earlier searches or by stores found upstream, so
+ZipGapFill instead:
+
+- runs several searches concurrently, each drawing a token from the global
+  rate limiter when the search does not go through ProxyClient itself;
+- always searches next the candidate ZIP that lies farthest outside every
+  coverage circle drawn so far (farthest-first sampling);
+- stops once every remaining candidate is covered, or after `patience`
+  consecutive searches turned up nothing new.
+
+A completed search covers `radius_miles` around its ZIP, unless it returned
+`max_results` stores: a truncated answer only proves coverage out to its
+farthest store. A search that failed (search() raised or returned None)
+covers nothing and does not count toward `patience`; its ZIP is retried up
+to `retries` times and then reported in `failed`. Stores already known
+before the sweep cover `seed_radius_miles` around themselves; only pass
+them when finding a store nearby proves the locator was searched there.
+ZIP coordinates come from US_ZIP_CENTROIDS; candidates without coordinates
+are always searched.
+
+Usage:
+    engine = ZipGapFill(
+        search=lambda zip_code: locator_search(client, zip_code),
+        key_func=lambda store: store.store_id,
+        coords_func=lambda store: (store.latitude, store.longitude),
+        radius_miles=200,
+        max_results=10,
+        retailer='staples',
+        proxy_mode='web_scraper_api',
+    )
+    new_stores = engine.run(known_ids=phase1_ids)
+"""
+
+import logging
+import math
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Set, Tuple
+
+from src.shared.concurrency import GlobalConcurrencyManager
+from src.shared.constants import GAP_FILL
+
+
+__all__ = [
+    'US_ZIP_CENTROIDS',
+    'ZipGapFill',
+    'haversine_miles',
+]
+
+
+# Approximate (lat, lng) centroids for ZIP codes spread over the US: the
+# gap-fill lists of the locator scrapers plus one ZIP per sparse region so
+# the default candidate pool reaches every state.
+US_ZIP_CENTROIDS: Dict[str, Tuple[float, float]] = {
+    # New England
+    '01001': (42.07, -72.62), '02101': (42.36, -71.06), '03101': (42.99, -71.46),
+    '03301': (43.21, -71.54), '04101': (43.66, -70.26), '04401': (44.80, -68.77),
+    '04730': (46.13, -67.84), '05401': (44.48, -73.21), '06101': (41.76, -72.68),
+    # Mid-Atlantic
+    '07101': (40.74, -74.17), '08401': (39.36, -74.43), '08601': (40.22, -74.76),
+    '10001': (40.75, -74.00), '11201': (40.69, -73.99), '12201': (42.65, -73.76),
+    '13201': (43.05, -76.15), '13501': (43.10, -75.23), '14201': (42.89, -78.88),
+    '14601': (43.16, -77.61), '15201': (40.47, -79.95), '16501': (42.13, -80.09),
+    '16801': (40.79, -77.86), '17101': (40.26, -76.88), '18101': (40.60, -75.47),
+    '19101': (39.95, -75.16), '19103': (39.95, -75.17), '20001': (38.91, -77.02),
+    '21201': (39.29, -76.62), '22201': (38.89, -77.09), '23219': (37.54, -77.44),
+    '23501': (36.85, -76.29), '24001': (37.27, -79.94), '25301': (38.35, -81.63),
+    '26501': (39.63, -79.96),
+    # Southeast
+    '27001': (36.00, -80.43), '27601': (35.78, -78.64), '28001': (35.35, -80.20),
+    '28201': (35.23, -80.84), '28401': (34.23, -77.94), '29201': (34.00, -81.03),
+    '29401': (32.78, -79.93), '30301': (33.75, -84.39), '30901': (33.47, -81.97),
+    '31201': (32.84, -83.63), '31401': (32.08, -81.09), '32201': (30.33, -81.66),
+    '32301': (30.44, -84.28), '32801': (28.54, -81.38), '33101': (25.78, -80.20),
+    '33601': (27.95, -82.46), '33901': (26.64, -81.87), '35201': (33.52, -86.81),
+    '35801': (34.73, -86.59), '36101': (32.38, -86.30), '36601': (30.69, -88.04),
+    '37201': (36.17, -86.78), '37901': (35.96, -83.92), '38101': (35.15, -90.05),
+    '39201': (32.30, -90.18),
+    # Midwest
+    '40201': (38.25, -85.76), '40501': (38.04, -84.50), '41101': (38.48, -82.64),
+    '43201': (39.99, -83.00), '43601': (41.65, -83.54), '44101': (41.50, -81.69),
+    '45201': (39.10, -84.51), '46201': (39.77, -86.11), '46801': (41.08, -85.14),
+    '47701': (37.97, -87.56), '48201': (42.35, -83.06), '48601': (43.42, -83.95),
+    '49501': (42.96, -85.67), '49701': (45.78, -84.73), '50301': (41.59, -93.62),
+    '52401': (41.98, -91.67), '53201': (43.04, -87.91), '53701': (43.07, -89.40),
+    '54301': (44.51, -88.01), '55101': (44.95, -93.09), '55401': (44.98, -93.27),
+    '55801': (46.79, -92.10), '56601': (47.47, -94.88), '60601': (41.89, -87.62),
+    '61601': (40.69, -89.59), '62701': (39.80, -89.65), '63101': (38.63, -90.19),
+    '64101': (39.10, -94.60), '65801': (37.21, -93.29), '66101': (39.12, -94.63),
+    '67202': (37.69, -97.34), '67801': (37.75, -100.02), '68101': (41.26, -95.94),
+    '69101': (41.12, -100.77),
+    # Plains and South Central
+    '57101': (43.55, -96.73), '57701': (44.08, -103.23), '58102': (46.88, -96.79),
+    '58501': (46.81, -100.78), '70112': (29.96, -90.08), '70801': (30.45, -91.19),
+    '71101': (32.51, -93.75), '72201': (34.75, -92.28), '72701': (36.06, -94.16),
+    '73101': (35.47, -97.52), '73301': (30.27, -97.74), '74101': (36.15, -95.99),
+    '75201': (32.79, -96.80), '76101': (32.75, -97.33), '77001': (29.76, -95.37),
+    '78201': (29.47, -98.53), '78401': (27.80, -97.40), '78501': (26.20, -98.23),
+    '79101': (35.21, -101.83), '79401': (33.58, -101.85), '79701': (32.00, -102.08),
+    '79901': (31.76, -106.49),
+    # Mountain
+    '59101': (45.78, -108.50), '59601': (46.59, -112.04), '59801': (46.87, -114.00),
+    '80201': (39.74, -104.99), '81001': (38.27, -104.61), '81501': (39.06, -108.55),
+    '82001': (41.14, -104.82), '82601': (42.85, -106.30), '82901': (41.59, -109.20),
+    '83201': (42.87, -112.45), '83701': (43.61, -116.20), '83814': (47.68, -116.78),
+    '84101': (40.76, -111.89), '84501': (39.60, -110.81), '84701': (38.77, -112.08),
+    '85001': (33.45, -112.07), '85701': (32.22, -110.97), '86001': (35.20, -111.65),
+    '86401': (35.19, -114.05), '87101': (35.08, -106.65), '87401': (36.73, -108.21),
+    '87501': (35.69, -105.94), '88001': (32.31, -106.78), '88201': (33.39, -104.52),
+    '89101': (36.17, -115.14), '89501': (39.53, -119.81), '89801': (40.83, -115.76),
+    # Pacific
+    '90001': (33.97, -118.25), '92101': (32.72, -117.16), '92201': (33.72, -116.22),
+    '92401': (34.11, -117.29), '93301': (35.37, -119.02), '93401': (35.28, -120.66),
+    '93701': (36.75, -119.79), '94101': (37.78, -122.42), '95501': (40.80, -124.16),
+    '95801': (38.58, -121.49), '96001': (40.59, -122.39), '97201': (45.50, -122.69),
+    '97401': (44.05, -123.09), '97701': (44.06, -121.31), '97801': (45.67, -118.79),
+    '98101': (47.61, -122.33), '98501': (47.04, -122.90), '98801': (47.42, -120.31),
+    '99201': (47.66, -117.43), '99301': (46.24, -119.10),
+    # Alaska and Hawaii
+    '96801': (21.31, -157.86), '99501': (61.22, -149.89),
+}
+
+_EARTH_RADIUS_MILES = 3958.8
+
+Circle = Tuple[float, float, float]
+
+
+def haversine_miles(lat1: float, lng1: float, lat2: float, lng2: float) -> float:
+    """Great-circle distance between two points in miles.
+
+    Args:
+        lat1: Latitude of the first point
+        lng1: Longitude of the first point
+        lat2: Latitude of the second point
+        lng2: Longitude of the second point
+
+    Returns:
+        Distance in miles
+    """
+    phi1, phi2 = math.radians(lat1), math.radians(lat2)
+    dphi = phi2 - phi1
+    dlmb = math.radians(lng2 - lng1)
+    a = math.sin(dphi / 2) ** 2 + math.cos(phi1) * math.cos(phi2) * math.sin(dlmb / 2) ** 2
+    return 2 * _EARTH_RADIUS_MILES * math.asin(min(1.0, math.sqrt(a)))
+
+
+def _as_point(coords: Any) -> Optional[Tuple[float, float]]:
+    """Coerce a (lat, lng) pair of numbers or numeric strings, or None."""
+    try:
+        lat, lng = coords
+        lat, lng = float(lat), float(lng)
+    except (TypeError, ValueError):
+        return None
+    if not (math.isfinite(lat) and math.isfinite(lng)) or (lat == 0.0 and lng == 0.0):
+        return None
+    return lat, lng
+
+
+class ZipGapFill:
+    """Concurrent, deduplicating ZIP code sweep that stops once coverage saturates.
+
+    run() is driven from the calling thread; only search() runs in workers.
+    """
+
+    def __init__(
+        self,
+        search: Callable[[str], Optional[Iterable[Any]]],
+        key_func: Callable[[Any], Optional[str]],
+        coords_func: Callable[[Any], Any],
+        radius_miles: float,
+        max_results: Optional[int] = None,
+        zip_codes: Optional[Sequence[str]] = None,
+        workers: int = GAP_FILL.WORKERS,
+        patience: int = GAP_FILL.PATIENCE,
+        retries: int = GAP_FILL.RETRIES,
+        seed_radius_miles: float = GAP_FILL.SEED_RADIUS_MILES,
+        retailer: Optional[str] = None,
+        proxy_mode: Optional[str] = None,
+        limit: Optional[int] = None,
+    ):
+        """Configure a sweep.
+
+        Args:
+            search: Callable returning the stores found near a ZIP code, or
+                None when the search failed
+            key_func: Returns a store's unique ID (falsy IDs are ignored)
+            coords_func: Returns a store's (lat, lng); unusable values are ignored
+            radius_miles: Search radius the locator was asked for
+            max_results: Most stores the locator returns per query (None = unbounded)
+            zip_codes: Candidate ZIP codes (default: every US_ZIP_CENTROIDS key)
+            workers: Searches in flight at once
+            patience: Stop after this many consecutive searches without a new
+                store (0 disables)
+            retries: Extra attempts for a ZIP whose search failed
+            seed_radius_miles: Radius each known store covers before the sweep
+            retailer: Retailer name for the per-retailer rate limit
+            proxy_mode: When set, draw a rate-limit token for this proxy mode
+                before each search; leave None if search already goes through
+                ProxyClient, which draws its own
+            limit: Stop once this many new stores are found
+        """
+        self.search = search
+        self.key_func = key_func
+        self.coords_func = coords_func
+        self.radius_miles = float(radius_miles)
+        self.max_results = max_results
+        self.zip_codes = list(zip_codes) if zip_codes is not None else list(US_ZIP_CENTROIDS)
+        self.workers = max(1, int(workers))
+        self.patience = max(0, int(patience))
+        self.retries = max(0, int(retries))
+        self.seed_radius_miles = float(seed_radius_miles)
+        self.retailer = retailer
+        self.proxy_mode = proxy_mode
+        self.limit = limit
+        self.searched: List[str] = []
+        self.failed: List[str] = []
+        self.stop_reason = ''
+
+    def _margin(self, zip_code: str, circles: Sequence[Circle]) -> float:
+        """Miles by which a candidate lies outside every circle (<= 0 = covered)."""
+        point = US_ZIP_CENTROIDS.get(zip_code)
+        if point is None:
+            return math.inf
+        margin = math.inf
+        for lat, lng, radius in circles:
+            margin = min(margin, haversine_miles(point[0], point[1], lat, lng) - radius)
+            if margin <= 0:
+                break
+        return margin
+
+    def _covered_radius(self, zip_code: str, stores: Sequence[Any]) -> float:
+        """Radius a completed search proves there is nothing left to find in."""
+        if self.max_results is None or len(stores) < self.max_results:
+            return self.radius_miles
+        center = US_ZIP_CENTROIDS.get(zip_code)
+        farthest = 0.0
+        for store in stores:
+            point = _as_point(self.coords_func(store))
+            if point is not None and center is not None:
+                farthest = max(farthest, haversine_miles(center[0], center[1], point[0], point[1]))
+        return min(farthest, self.radius_miles)
+
+    def _next_candidate(self, pending: List[str], circles: Sequence[Circle]) -> Optional[str]:
+        """Pop the least-covered pending ZIP, dropping ones now covered."""
+        best, best_margin = None, 0.0
+        for zip_code in list(pending):
+            margin = self._margin(zip_code, circles)
+            if margin <= 0:
+                pending.remove(zip_code)
+            elif best is None or margin > best_margin:
+                best, best_margin = zip_code, margin
+        if best is not None:
+            pending.remove(best)
+        return best
+
+    def _search_one(self, zip_code: str) -> Optional[List[Any]]:
+        """Rate-limited search; None if it raised or reported a failure."""
+        if self.proxy_mode:
+            GlobalConcurrencyManager().wait_for_token(self.retailer, self.proxy_mode)
+        try:
+            stores = self.search(zip_code)
+        except Exception as e:
+            logging.warning(f"[GapFill] Search for ZIP {zip_code} failed: {e}")
+            return None
+        if stores is None:
+            logging.warning(f"[GapFill] Search for ZIP {zip_code} failed")
+            return None
+        return list(stores)
+
+    def run(
+        self,
+        known_ids: Optional[Iterable[str]] = None,
+        known_points: Optional[Iterable[Any]] = None,
+    ) -> Dict[str, Any]:
+        """Sweep candidates until coverage saturates.
+
+        Args:
+            known_ids: Store IDs found before the sweep; never returned
+            known_points: (lat, lng) of stores found before the sweep; each
+                covers seed_radius_miles
+
+        Returns:
+            Newly discovered stores keyed by store ID, in discovery order
+        """
+        known: Set[str] = set(known_ids or ())
+        circles: List[Circle] = []
+        if self.seed_radius_miles > 0:
+            for coords in known_points or ():
+                point = _as_point(coords)
+                if point is not None:
+                    circles.append((point[0], point[1], self.seed_radius_miles))
+
+        pending = list(dict.fromkeys(self.zip_codes))
+        new_stores: Dict[str, Any] = {}
+        in_flight: Dict[Future, str] = {}
+        provisional: Dict[str, Circle] = {}
+        failures: Dict[str, int] = {}
+        dry_streak = 0
+        self.searched = []
+        self.failed = []
+        self.stop_reason = ''
+
+        def can_submit() -> bool:
+            if self.limit and len(new_stores) >= self.limit:
+                self.stop_reason = self.stop_reason or 'limit reached'
+                return False
+            if self.patience and dry_streak >= self.patience:
+                self.stop_reason = self.stop_reason or f'{dry_streak} searches without new stores'
+                return False
+            return True
+
+        with ThreadPoolExecutor(max_workers=self.workers) as executor:
+            while True:
+                while len(in_flight) < self.workers and can_submit():
+                    # In-flight searches provisionally cover their full radius
+                    zip_code = self._next_candidate(pending, circles + list(provisional.values()))
+                    if zip_code is None:
+                        break
+                    point = US_ZIP_CENTROIDS.get(zip_code)
+                    if point is not None:
+                        provisional[zip_code] = (point[0], point[1], self.radius_miles)
+                    in_flight[executor.submit(self._search_one, zip_code)] = zip_code
+                    if zip_code not in failures:
+                        self.searched.append(zip_code)
+
+                if not in_flight:
+                    break
+
+                done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                for future in done:
+                    zip_code = in_flight.pop(future)
+                    stores = future.result()
+                    provisional.pop(zip_code, None)
+                    if stores is None:
+                        # A failed search proves nothing: no coverage, no dry streak
+                        failures[zip_code] = failures.get(zip_code, 0) + 1
+                        if failures[zip_code] <= self.retries:
+                            pending.append(zip_code)
+                        else:
+                            self.failed.append(zip_code)
+                        continue
+                    point = US_ZIP_CENTROIDS.get(zip_code)
+                    if point is not None:
+                        circles.append((point[0], point[1], self._covered_radius(zip_code, stores)))
+
+                    found = 0
+                    for store in stores:
+                        store_id = self.key_func(store)
+                        if not store_id or store_id in known or store_id in new_stores:
+                            continue
+                        new_stores[store_id] = store
+                        found += 1
+                    dry_streak = 0 if found else dry_streak + 1
+                    if found:
+                        logging.debug(f"[GapFill] ZIP {zip_code}: {found} new stores")
+
+        if not self.stop_reason:
+            self.stop_reason = 'all candidates covered'
+        logging.info(
+            f"[GapFill] {len(self.searched)}/{len(self.zip_codes)} ZIPs searched, "
+            f"{len(new_stores)} new stores ({self.stop_reason})"
+        )
+        if self.failed:
+            logging.warning(f"[GapFill] {len(self.failed)} ZIP searches failed: {', '.join(self.failed)}")
+        if self.limit and len(new_stores) > self.limit:
+            return dict(list(new_stores.items())[:self.limit])
+        return new_stores
@@ -0,0 +1,267 @@
+"""Fast extraction of JSON-LD and embedded JSON from store pages.
+
+Most store pages carry everything we need in a few <script> blocks:
+schema.org JSON-LD, Next.js __NEXT_DATA__, or a `var cityJSON = {...};`
+state blob. Building a full BeautifulSoup tree just to find them is the
+biggest CPU cost of a proxied --all run (and holds the GIL, so worker
+threads serialize on it). This module finds those blocks with a regex
+scanner over the raw HTML and decodes only the JSON.
+
+If the scanner finds no block of the wanted kind although the page clearly
+contains one (unusual markup), it falls back to lxml when installed, and to
+BeautifulSoup's html.parser otherwise. Scrapers that still need DOM queries
+can build a tree lazily with make_soup(), which also uses lxml when available.
+
+Usage:
+    from src.shared.html_extract import find_json_ld, extract_next_data
+
+    store = find_json_ld(html, 'Store')
+    next_data = extract_next_data(html)
+    city = extract_js_object(html, 'cityJSON')
+"""
+
+import json
+import logging
+import re
+from html import unescape
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Union
+
+from bs4 import BeautifulSoup
+
+try:
+    import lxml.html
+    LXML_AVAILABLE = True
+except ImportError:
+    lxml = None
+    LXML_AVAILABLE = False
+
+
+__all__ = [
+    'LXML_AVAILABLE',
+    'extract_js_object',
+    'extract_json_ld',
+    'extract_next_data',
+    'extract_title',
+    'find_json_ld',
+    'iter_script_blocks',
+    'make_soup',
+]
+
+_SCRIPT_OPEN = re.compile(r'<script\b([^>]*)>', re.IGNORECASE)
+_SCRIPT_CLOSE = re.compile(r'</script\s*>', re.IGNORECASE)
+_ATTRIBUTE = re.compile(
+    r'([^\s"\'=<>/]+)\s*=\s*(?:"([^"]*)"|\'([^\']*)\'|([^\s"\'=<>`]+))'
+)
+_TITLE = re.compile(r'<title\b[^>]*>(.*?)</title\s*>', re.IGNORECASE | re.DOTALL)
+_JSON_LD_TYPE = 'application/ld+json'
+
+_decoder = json.JSONDecoder(strict=False)
+
+
+def _script_attributes(raw: str) -> Dict[str, str]:
+    """Parse the attribute string of a <script ...> tag (names lowercased)."""
+    attributes = {}
+    for name, double, single, bare in _ATTRIBUTE.findall(raw):
+        attributes[name.lower()] = unescape(double or single or bare)
+    return attributes
+
+
+def _matches(attributes: Dict[str, str], script_type: Optional[str], script_id: Optional[str]) -> bool:
+    if script_type and attributes.get('type', '').strip().lower() != script_type:
+        return False
+    if script_id and attributes.get('id') != script_id:
+        return False
+    return True
+
+
+def _fallback_script_blocks(html: str, script_type: Optional[str], script_id: Optional[str]) -> List[str]:
+    """Find script blocks with a real HTML parser (lxml, else html.parser)."""
+    if LXML_AVAILABLE:
+        try:
+            tree = lxml.html.fromstring(
+                html.encode('utf-8', errors='replace'),
+                parser=lxml.html.HTMLParser(encoding='utf-8'),
+            )
+            return [
+                script.text or ''
+                for script in tree.iter('script')
+                if _matches({k.lower(): v for k, v in script.attrib.items()}, script_type, script_id)
+            ]
+        except (ValueError, lxml.etree.ParserError) as e:
+            logging.debug(f"lxml could not parse page, using html.parser: {e}")
+
+    soup = BeautifulSoup(html, 'html.parser')
+    return [
+        script.string or ''
+        for script in soup.find_all('script')
+        if _matches({k.lower(): v if isinstance(v, str) else ' '.join(v) for k, v in script.attrs.items()},
+                    script_type, script_id)
+    ]
+
+
+def iter_script_blocks(
+    html: str,
+    script_type: Optional[str] = None,
+    script_id: Optional[str] = None
+) -> Iterator[str]:
+    """Yield the contents of <script> blocks, optionally filtered by type/id.
+
+    Scans the raw HTML without building a tree. When a filter is given, the
+    scanner finds nothing, and the filter value appears in the page anyway,
+    the blocks are looked up with a real HTML parser instead.
+
+    Args:
+        html: Page HTML
+        script_type: Only blocks with this type attribute (e.g. 'application/ld+json')
+        script_id: Only blocks with this id attribute (e.g. '__NEXT_DATA__')
+
+    Yields:
+        Raw text between <script ...> and </script>
+    """
+    if not html:
+        return
+    script_type = script_type.lower() if script_type else None
+    found = False
+    position = 0
+    while True:
+        opening = _SCRIPT_OPEN.search(html, position)
+        if opening is None:
+            break
+        closing = _SCRIPT_CLOSE.search(html, opening.end())
+        if closing is None:
+            break
+        position = closing.end()
+        if (script_type or script_id) and not _matches(
+                _script_attributes(opening.group(1)), script_type, script_id):
+            continue
+        found = True
+        yield html[opening.end():closing.start()]
+
+    if not found and (script_type or script_id):
+        marker = script_id or script_type
+        if marker in html or marker in html.lower():
+            yield from _fallback_script_blocks(html, script_type, script_id)
+
+
+def _decode(text: str) -> Optional[Any]:
+    """Decode a JSON script body, tolerating HTML comment/CDATA wrappers."""
+    text = text.strip()
+    for prefix, suffix in (('<!--', '-->'), ('<![CDATA[', ']]>'), ('//<![CDATA[', '//]]>')):
+        if text.startswith(prefix) and text.endswith(suffix):
+            text = text[len(prefix):-len(suffix)].strip()
+    if not text:
+        return None
+    try:
+        return _decoder.decode(text)
+    except json.JSONDecodeError as e:
+        logging.debug(f"Skipping undecodable JSON script block: {e}")
+        return None
+
+
+def extract_json_ld(html: str) -> List[Dict[str, Any]]:
+    """Decode every JSON-LD object on a page.
+
+    Top-level arrays and `@graph` containers are flattened, so each entry is
+    one schema.org object. Blocks that are not valid JSON are skipped.
+
+    Args:
+        html: Page HTML
+
+    Returns:
+        List of JSON-LD objects in page order
+    """
+    objects: List[Dict[str, Any]] = []
+    for block in iter_script_blocks(html, script_type=_JSON_LD_TYPE):
+        data = _decode(block)
+        items = data if isinstance(data, list) else [data]
+        for item in items:
+            if not isinstance(item, dict):
+                continue
+            graph = item.get('@graph')
+            if isinstance(graph, list):
+                objects.extend(node for node in graph if isinstance(node, dict))
+            else:
+                objects.append(item)
+    return objects
+
+
+def _has_type(item: Dict[str, Any], types: Iterable[str]) -> bool:
+    item_type = item.get('@type')
+    item_types = item_type if isinstance(item_type, list) else [item_type]
+    return any(t in item_types for t in types)
+
+
+def find_json_ld(
+    html: str,
+    types: Union[str, Iterable[str]],
+    objects: Optional[List[Dict[str, Any]]] = None
+) -> Optional[Dict[str, Any]]:
+    """Return the first JSON-LD object whose @type is one of `types`.
+
+    Args:
+        html: Page HTML
+        types: schema.org type name, or several (e.g. ('Store', 'LocalBusiness'))
+        objects: Already extracted JSON-LD objects (skips re-scanning html)
+
+    Returns:
+        Matching JSON-LD object, or None
+    """
+    types = (types,) if isinstance(types, str) else tuple(types)
+    for item in objects if objects is not None else extract_json_ld(html):
+        if _has_type(item, types):
+            return item
+    return None
+
+
+def extract_next_data(html: str) -> Optional[Dict[str, Any]]:
+    """Decode the Next.js `<script id="__NEXT_DATA__">` blob.
+
+    Args:
+        html: Page HTML
+
+    Returns:
+        Decoded __NEXT_DATA__ object, or None if absent or invalid
+    """
+    for block in iter_script_blocks(html, script_id='__NEXT_DATA__'):
+        data = _decode(block)
+        if isinstance(data, dict):
+            return data
+    return None
+
+
+def extract_js_object(html: str, name: str) -> Optional[Any]:
+    """Decode the JSON literal assigned to a JavaScript variable.
+
+    Matches `var name = {...};`, `window.name = [...]` and similar. The
+    value is decoded with json.JSONDecoder.raw_decode, so braces or `};`
+    inside strings do not cut it short.
+
+    Args:
+        html: Page HTML (or a script body)
+        name: Variable name (e.g. 'cityJSON')
+
+    Returns:
+        Decoded object/array, or None if not found or not valid JSON
+    """
+    for match in re.finditer(r'\b' + re.escape(name) + r'\s*=\s*(?=[\[{])', html):
+        try:
+            return _decoder.raw_decode(html, match.end())[0]
+        except json.JSONDecodeError as e:
+            logging.debug(f"Could not decode {name}: {e}")
+    return None
+
+
+def extract_title(html: str) -> Optional[str]:
+    """Return the text of the page's <title>, or None."""
+    match = _TITLE.search(html or '')
+    if not match:
+        return None
+    return unescape(match.group(1)).strip() or None
+
+
+def make_soup(html: str) -> BeautifulSoup:
+    """Build a BeautifulSoup tree with lxml when installed (html.parser otherwise).
+
+    For the DOM queries that remain after the JSON has been extracted.
+    """
+    return BeautifulSoup(html, 'lxml' if LXML_AVAILABLE else 'html.parser')
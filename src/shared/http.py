@@ -7,11 +7,14 @@ session management, and header generation.
 import logging
 import random
 import time
-from typing import Dict, Optional
+from typing import Any, Dict, Optional
 from urllib.parse import urlparse
 
 import requests
+from requests.adapters import HTTPAdapter
 
+from src.shared.cache_interface import RevalidationCache
+from src.shared.concurrency import GlobalConcurrencyManager
 from src.shared.constants import HTTP
 from src.shared.proxy_client import redact_credentials
 
@@ -20,6 +23,7 @@ __all__ = [
     'get_headers',
     'get_with_retry',
     'log_safe',
+    'mount_pooled_adapter',
 ]
 
 
@@ -100,6 +104,59 @@ def get_headers(user_agent: str = None, base_url: str = None) -> Dict[str, str]:
     }
 
 
+def mount_pooled_adapter(
+    session: requests.Session,
+    pool_connections: Optional[int] = None,
+    pool_maxsize: Optional[int] = None,
+) -> requests.Session:
+    """Mount a sized keep-alive HTTPAdapter on a session for http and https.
+
+    Long-lived sessions reuse TCP/TLS connections through the adapter's
+    urllib3 pool, so sizing the pool to the expected concurrency avoids
+    discarding warm connections when it overflows.
+
+    Args:
+        session: requests.Session to configure
+        pool_connections: Number of per-host pools to cache (default: HTTP.POOL_CONNECTIONS)
+        pool_maxsize: Maximum connections kept per host (default: HTTP.POOL_MAXSIZE)
+
+    Returns:
+        The same session, for chaining
+    """
+    adapter = HTTPAdapter(
+        pool_connections=pool_connections or HTTP.POOL_CONNECTIONS,
+        pool_maxsize=pool_maxsize or HTTP.POOL_MAXSIZE,
+    )
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    return session
+
+
+def _response_from_validators(url: str, entry: Dict[str, Any]) -> requests.Response:
+    """Build a 200 response from a RevalidationCache entry after a 304.
+
+    Args:
+        url: Requested URL
+        entry: Stored validator entry
+
+    Returns:
+        requests.Response carrying the stored body, with from_cache=True
+    """
+    response = requests.Response()
+    response.status_code = 200
+    response.url = url
+    response._content = RevalidationCache.body(entry)
+    response.encoding = entry.get('encoding')
+    if entry.get('content_type'):
+        response.headers['Content-Type'] = entry['content_type']
+    if entry.get('etag'):
+        response.headers['ETag'] = entry['etag']
+    if entry.get('last_modified'):
+        response.headers['Last-Modified'] = entry['last_modified']
+    response.from_cache = True
+    return response
+
+
 def get_with_retry(
     session: requests.Session,
     url: str,
@@ -109,6 +166,8 @@ def get_with_retry(
     min_delay: float = None,
     max_delay: float = None,
     headers_func=None,
+    retailer: Optional[str] = None,
+    revalidation_cache: Optional[RevalidationCache] = None,
 ) -> Optional[requests.Response]:
     """Fetch URL with exponential backoff retry and proper error handling.
 
@@ -116,6 +175,16 @@ def get_with_retry(
     Instead of mutating session.headers, it passes headers per-request to avoid
     side effects when the session is shared across threads.
 
+    Each attempt draws a token from the GlobalConcurrencyManager rate limiter,
+    unless the session already does so itself (ProxiedSession). If adaptive
+    mode is enabled for the retailer, delays are scaled by its controller and
+    every attempt's status is fed back to it.
+
+    With a RevalidationCache (passed in, or attached to the session as
+    ``revalidation_cache``), stored ETag/Last-Modified validators are sent as
+    If-None-Match/If-Modified-Since and a 304 Not Modified returns the stored
+    body as a 200 response with ``from_cache = True``.
+
     Args:
         session: requests.Session to use
         url: URL to fetch
@@ -125,6 +194,9 @@ def get_with_retry(
         min_delay: Minimum delay between requests
         max_delay: Maximum delay between requests
         headers_func: Optional function to get headers (for config integration)
+        retailer: Retailer name for per-retailer rate limiting (defaults to
+            the session's retailer_name, if set)
+        revalidation_cache: Optional validator store for conditional GETs
 
     Returns:
         Response object on success, None on failure
@@ -141,13 +213,32 @@ def get_with_retry(
     else:
         headers = get_headers()
 
+    # Conditional GET: send stored validators so unchanged pages come back as 304
+    if revalidation_cache is None:
+        revalidation_cache = getattr(session, 'revalidation_cache', None)
+    if not isinstance(revalidation_cache, RevalidationCache):
+        revalidation_cache = None
+    validators = revalidation_cache.get(url) if revalidation_cache else None
+    if validators:
+        headers = {**headers, **RevalidationCache.conditional_headers(validators)}
+
     response = None  # Initialize response to prevent AttributeError
 
+    # ProxiedSession throttles inside its own get(); plain sessions are throttled here
+    throttle = not getattr(session, 'rate_limited', False)
+    rate_limit_key = retailer or getattr(session, 'retailer_name', None)
+    limiter = GlobalConcurrencyManager()
+    adaptive = limiter.get_adaptive_controller(rate_limit_key)
+
     for attempt in range(max_retries):
         try:
-            random_delay(min_delay, max_delay)
+            random_delay(min_delay, max_delay, scale=adaptive.delay_scale if adaptive else 1.0)
+            if throttle:
+                limiter.wait_for_token(rate_limit_key, 'direct')
             # Pass headers per-request instead of mutating session.headers (#206)
             response = session.get(url, headers=headers, timeout=timeout)
+            if adaptive:
+                adaptive.record(response.status_code)
 
             # Sanitize URL for safe logging (prevents leaking credentials in query params)
             # Use both sanitization and credential redaction for defense in depth
@@ -161,8 +252,15 @@ def get_with_retry(
 
             if response.status_code == 200:
                 log_safe(f"Successfully fetched {safe_url}", level=logging.DEBUG)
+                if revalidation_cache and not getattr(response, 'from_cache', False):
+                    revalidation_cache.store(url, response.content, response.headers,
+                                             getattr(response, 'encoding', None))
                 return response
 
+            if response.status_code == 304 and validators:
+                log_safe(f"Not modified (304) for {safe_url}, using stored body", level=logging.DEBUG)
+                return _response_from_validators(url, validators)
+
             if response.status_code == 429:  # Rate limited
                 wait_time = (2 ** attempt) * rate_limit_base_wait
                 log_safe(
@@ -216,6 +314,8 @@ def get_with_retry(
 
         except requests.exceptions.RequestException as e:
             response = None  # Ensure response is None after exception
+            if adaptive:
+                adaptive.record(None)
             wait_time = HTTP.SERVER_ERROR_WAIT
             # Sanitize URL and error message to prevent leaking sensitive info
             safe_url = _sanitize_url(redact_credentials(url))
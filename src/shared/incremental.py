@@ -0,0 +1,194 @@
+"""Changed-only incremental runs driven by sitemap <lastmod> dates.
+
+URL discovery records each store URL's <lastmod> from the sitemap. On the
+next --incremental run, URLs whose <lastmod> matches the previous run are
+not fetched again; their stores are carried forward from the previous run
+instead. New URLs, URLs with a changed (or missing) <lastmod>, and URLs whose
+store is missing from the previous run are scraped as usual.
+
+State is stored per retailer in data/{retailer}/incremental_state.json and is
+only written after a run finishes, so an interrupted run never marks URLs as
+seen that were not scraped. The state keeps each URL's store exactly as the
+scraper returned it: stores_latest.json holds normalized export records
+(canonical field names, a retailer field, output_fields filtering), which
+would fingerprint differently from freshly scraped stores in change detection.
+
+Usage:
+    incremental = IncrementalState('att')
+    urls = get_store_urls_from_sitemap(session, 'att', lastmods=incremental.lastmods)
+    urls, carried = incremental.plan(urls)
+    ...  # scrape urls, then combine with the carried (item, store) pairs
+    incremental.save(stores)
+"""
+
+import json
+import logging
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Collection, Dict, Iterable, List, Optional, Tuple
+from xml.etree.ElementTree import Element  # Type only; sitemaps are parsed with defusedxml
+
+from src.shared.checkpoint import save_checkpoint
+
+
+__all__ = [
+    'IncrementalState',
+    'sitemap_lastmods',
+]
+
+
+def _local_name(tag: str) -> str:
+    """Strip the '{namespace}' prefix ElementTree puts on tag names."""
+    return tag.rsplit('}', 1)[-1]
+
+
+def sitemap_lastmods(root: Element) -> Dict[str, str]:
+    """Map each <url><loc> in a parsed sitemap to its <lastmod>.
+
+    Works with and without the sitemaps.org namespace. Entries without a
+    <lastmod> are left out, so their URLs are always treated as changed.
+
+    Args:
+        root: Sitemap root element (<urlset>) parsed with defusedxml
+
+    Returns:
+        Dict of URL -> lastmod string
+    """
+    lastmods: Dict[str, str] = {}
+    for entry in root.iter():
+        if _local_name(entry.tag) != 'url':
+            continue
+        loc = lastmod = None
+        for child in entry:
+            name = _local_name(child.tag)
+            if name == 'loc' and child.text:
+                loc = child.text.strip()
+            elif name == 'lastmod' and child.text:
+                lastmod = child.text.strip()
+        if loc and lastmod:
+            lastmods[loc] = lastmod
+    return lastmods
+
+
+class IncrementalState:
+    """Per-URL <lastmod> state for one retailer's changed-only runs.
+
+    Attributes:
+        retailer: Retailer name
+        lastmods: URL -> lastmod collected by this run's discovery (filled
+            in place by discovery functions given lastmods=state.lastmods)
+        carried: Number of stores carried forward by the last plan()
+    """
+
+    def __init__(self, retailer: str, state_path: Optional[str] = None) -> None:
+        """Initialize incremental state.
+
+        Args:
+            retailer: Retailer name
+            state_path: Override for data/{retailer}/incremental_state.json
+        """
+        self.retailer = retailer
+        self.state_path = Path(state_path or f"data/{retailer}/incremental_state.json")
+        self.lastmods: Dict[str, str] = {}
+        self.carried = 0
+
+    def _load_previous(self) -> Tuple[Dict[str, str], Dict[str, Dict[str, Any]]]:
+        """Load the previous run's URL -> lastmod and URL -> store maps.
+
+        Returns:
+            Tuple of (lastmods, stores); both empty if the state is missing,
+            unreadable, or was written before stores were kept in it
+        """
+        if not self.state_path.exists():
+            return {}, {}
+        try:
+            with open(self.state_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            lastmods = dict(data.get('lastmods', {}))
+            stores = {
+                url: store
+                for url, store in dict(data.get('stores', {})).items()
+                if isinstance(store, dict)
+            }
+        except (json.JSONDecodeError, AttributeError, TypeError, ValueError, IOError, OSError) as e:
+            logging.warning(f"[{self.retailer}] Ignoring unreadable incremental state {self.state_path}: {e}")
+            return {}, {}
+        return lastmods, stores
+
+    def plan(
+        self,
+        items: Iterable[Any],
+        url_func: Optional[Callable[[Any], str]] = None,
+        completed: Collection[Any] = ()
+    ) -> Tuple[List[Any], List[Tuple[Any, Dict[str, Any]]]]:
+        """Split discovered items into those to fetch and stores to carry forward.
+
+        An item is carried forward only when its URL has a <lastmod> equal to
+        the previous run's and the previous run recorded a store for that URL.
+
+        Args:
+            items: Discovered items (URLs or store info dicts)
+            url_func: Returns the store URL for an item (defaults to the item itself)
+            completed: URLs already restored from a checkpoint; unchanged ones are
+                not carried again (changed ones are returned for fetching, and the
+                caller's own checkpoint filter skips them as usual)
+
+        Returns:
+            Tuple of (items to fetch, list of (item, previous store dict))
+        """
+        items = list(items)
+        self.carried = 0
+        if not self.lastmods:
+            logging.info(f"[{self.retailer}] Incremental: sitemap has no <lastmod> dates, fetching all URLs")
+            return items, []
+
+        previous, latest = self._load_previous()
+        if not latest:
+            logging.info(f"[{self.retailer}] Incremental: no previous state to compare, fetching all URLs")
+            return items, []
+
+        url_func = url_func or (lambda item: item)
+        to_fetch: List[Any] = []
+        carried: List[Tuple[Any, Dict[str, Any]]] = []
+        for item in items:
+            url = url_func(item)
+            lastmod = self.lastmods.get(url)
+            store = latest.get(url)
+            if lastmod is None or store is None or previous.get(url) != lastmod:
+                to_fetch.append(item)
+            elif url not in completed:
+                carried.append((item, store))
+
+        self.carried = len(carried)
+        logging.info(
+            f"[{self.retailer}] Incremental: {len(to_fetch)} new/changed URLs to fetch, "
+            f"{self.carried} unchanged stores carried forward"
+        )
+        return to_fetch, carried
+
+    def save(self, stores: Iterable[Dict[str, Any]]) -> None:
+        """Record the lastmod and raw store of every URL that produced a store in this run.
+
+        URLs that failed to scrape are left out so the next run retries them.
+
+        Args:
+            stores: Final store dicts of the run (scraped and carried), as
+                returned by the scraper rather than as exported
+        """
+        if not self.lastmods:
+            return
+        recorded = {}
+        recorded_stores = {}
+        for store in stores:
+            url = store.get('url') if isinstance(store, dict) else None
+            if url in self.lastmods:
+                recorded[url] = self.lastmods[url]
+                recorded_stores[url] = store
+        try:
+            save_checkpoint({
+                'updated_at': datetime.now().isoformat(),
+                'lastmods': recorded,
+                'stores': recorded_stores,
+            }, str(self.state_path))
+        except (IOError, OSError) as e:
+            logging.warning(f"[{self.retailer}] Failed to save incremental state: {e}")
@@ -14,25 +14,66 @@ Usage:
     # Make requests (automatically uses configured proxy method)
     response = client.get(url)
     html_content = response.text
+
+Web Scraper API calls go through a keep-alive connection pool owned by the
+client. When httpx is installed with HTTP/2 support (``pip install
+'httpx[http2]'``), they are multiplexed over HTTP/2 instead.
+
+Residential mode can route requests through a health-scored pool of sticky
+sessions shared by all clients of a retailer (``session_type: "pool"``, see
+src.shared.residential_pool) instead of a fresh rotating exit per request.
+
+For bulk runs, get_batch() submits URLs as Web Scraper API push-pull jobs
+and yields results as they complete, so hundreds of pages are in flight
+without a blocked thread per request:
+
+    for url, response in client.get_batch(urls):
+        ...
 """
 
+import itertools
 import json
 import logging
 import os
 import random
 import re
+import threading
 import time
 import urllib.parse
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from enum import Enum
 from types import TracebackType
-from typing import Any, Dict, Optional, Tuple, Type
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple, Type
 import requests
+from requests.adapters import HTTPAdapter
+
+from src.shared.cache_interface import RevalidationCache
+from src.shared.concurrency import GlobalConcurrencyManager
+from src.shared.constants import HTTP, RESIDENTIAL_POOL, SCRAPER_API
+from src.shared.residential_pool import ResidentialSessionPool
+
+try:
+    import h2  # noqa: F401 - httpx needs the h2 package for HTTP/2
+    import httpx
+    HTTP2_AVAILABLE = True
+except ImportError:
+    httpx = None
+    HTTP2_AVAILABLE = False
+
+# Transport errors worth retrying, from either HTTP stack
+_TIMEOUT_ERRORS: Tuple[Type[Exception], ...] = (requests.exceptions.Timeout,)
+_REQUEST_ERRORS: Tuple[Type[Exception], ...] = (requests.exceptions.RequestException,)
+if HTTP2_AVAILABLE:
+    _TIMEOUT_ERRORS += (httpx.TimeoutException,)
+    _REQUEST_ERRORS += (httpx.HTTPError,)
 
 
 __all__ = [
+    'HTTP2_AVAILABLE',
     'ProxyClient',
     'ProxyConfig',
+    'ProxyCostLedger',
     'ProxyMode',
     'ProxyResponse',
     'create_proxy_client',
@@ -135,11 +176,13 @@ class ProxyConfig:
     country_code: str = "us"  # Target country
     city: str = ""            # Optional city targeting
     state: str = ""           # Optional state targeting
-    session_type: str = "rotating"  # "rotating" or "sticky"
+    session_type: str = "rotating"  # "rotating", "sticky" or "pool"
     session_id: str = ""      # For sticky sessions
+    session_pool_size: int = RESIDENTIAL_POOL.SIZE  # Sticky sessions per retailer in "pool" mode
 
     # Web Scraper API settings
     scraper_api_endpoint: str = "https://realtime.oxylabs.io/v1/queries"
+    scraper_api_batch_endpoint: str = "https://data.oxylabs.io/v1/queries"  # Push-pull jobs
     render_js: bool = False   # Enable JavaScript rendering
     parse: bool = False       # Return parsed JSON instead of HTML
 
@@ -147,11 +190,18 @@ class ProxyConfig:
     timeout: int = 60
     max_retries: int = 3
     retry_delay: float = 2.0
+    retry_errors: bool = True  # Wait and retry 429/5xx; False returns them to the caller at once
 
     # Rate limiting (only applies to direct mode)
     min_delay: float = 0.0
     max_delay: float = 0.0
 
+    # Connection pooling (keep-alive HTTPAdapter sizing, also used for the
+    # Web Scraper API transport)
+    pool_connections: int = HTTP.POOL_CONNECTIONS
+    pool_maxsize: int = HTTP.POOL_MAXSIZE
+    http2: bool = True  # Use HTTP/2 for Web Scraper API calls when httpx[http2] is installed
+
     @property
     def username(self) -> str:
         """Get the appropriate username for the current mode"""
@@ -269,13 +319,21 @@ class ProxyConfig:
             city=data.get("city", ""),
             state=data.get("state", ""),
             session_type=data.get("session_type", "rotating"),
+            session_pool_size=data.get("session_pool_size", RESIDENTIAL_POOL.SIZE),
+            scraper_api_batch_endpoint=data.get(
+                "scraper_api_batch_endpoint", "https://data.oxylabs.io/v1/queries"
+            ),
             render_js=data.get("render_js", False),
             parse=data.get("parse", False),
             timeout=data.get("timeout", 60),
             max_retries=data.get("max_retries", 3),
             retry_delay=data.get("retry_delay", 2.0),
+            retry_errors=data.get("retry_errors", True),
             min_delay=data.get("min_delay", 0.0),
             max_delay=data.get("max_delay", 0.0),
+            pool_connections=data.get("pool_connections", HTTP.POOL_CONNECTIONS),
+            pool_maxsize=data.get("pool_maxsize", HTTP.POOL_MAXSIZE),
+            http2=data.get("http2", True),
         )
 
     def is_enabled(self) -> bool:
@@ -333,6 +391,274 @@ class ProxyResponse:
             )
 
 
+# Per-mode counters kept by ProxyCostLedger
+_LEDGER_FIELDS = ('requests', 'rendered', 'retries', 'errors', 'credits', 'bytes', 'latency_seconds')
+
+
+class ProxyCostLedger:
+    """Thread-safe singleton tallying proxy usage per retailer and proxy mode.
+
+    Every ProxyClient/AsyncProxyClient request is recorded here: Web Scraper
+    API credits, bytes received, JS-rendered vs plain calls, retries, errors
+    and latency. Clients are created per session and per worker, so the
+    ledger aggregates across all of them for the whole process.
+
+    Usage:
+        ProxyCostLedger().summary('bestbuy', stores=1050)
+    """
+
+    _instance: Optional['ProxyCostLedger'] = None
+    _lock = threading.Lock()
+
+    def __new__(cls) -> 'ProxyCostLedger':
+        """Create or return singleton instance (thread-safe)."""
+        if cls._instance is None:
+            with cls._lock:
+                if cls._instance is None:
+                    cls._instance = super().__new__(cls)
+                    cls._instance._initialized = False
+        return cls._instance
+
+    def __init__(self) -> None:
+        """Initialize the ledger (only runs once for singleton)."""
+        if self._initialized:
+            return
+        self._entries: Dict[Tuple[str, str], Dict[str, float]] = {}
+        self._entries_lock = threading.Lock()
+        self._initialized = True
+
+    @staticmethod
+    def _key(retailer: Optional[str]) -> str:
+        return retailer or '__global__'
+
+    def record(
+        self,
+        retailer: Optional[str],
+        mode: ProxyMode,
+        response: Optional['ProxyResponse'] = None,
+        rendered: bool = False,
+        retry: bool = False,
+    ) -> None:
+        """Record one proxy request.
+
+        Args:
+            retailer: Retailer the request was made for (None for shared clients)
+            mode: Proxy mode the request went through
+            response: Response received, or None if the request failed outright
+            rendered: Whether the request asked for JavaScript rendering
+            retry: Whether this was a repeat attempt for the same URL
+        """
+        with self._entries_lock:
+            entry = self._entries.setdefault(
+                (self._key(retailer), mode.value), dict.fromkeys(_LEDGER_FIELDS, 0)
+            )
+            entry['requests'] += 1
+            if rendered:
+                entry['rendered'] += 1
+            if retry:
+                entry['retries'] += 1
+            if response is None or not response.ok:
+                entry['errors'] += 1
+            if response is not None:
+                entry['bytes'] += len(response.content or b'')
+                entry['latency_seconds'] += response.elapsed_seconds
+                entry['credits'] += response.credits_used or 0
+
+    @staticmethod
+    def _totals(entries: Iterable[Dict[str, float]]) -> Dict[str, Any]:
+        totals: Dict[str, Any] = dict.fromkeys(_LEDGER_FIELDS, 0)
+        for entry in entries:
+            for field in _LEDGER_FIELDS:
+                totals[field] += entry[field]
+        latency = totals.pop('latency_seconds')
+        totals['avg_latency_ms'] = round(latency / totals['requests'] * 1000, 1) if totals['requests'] else 0.0
+        return totals
+
+    def summary(self, retailer: Optional[str], stores: Optional[int] = None) -> Dict[str, Any]:
+        """Summarize a retailer's proxy usage.
+
+        Args:
+            retailer: Retailer name
+            stores: Optional number of stores extracted, for per-store costs
+
+        Returns:
+            Totals (requests, rendered, retries, errors, credits, bytes,
+            avg_latency_ms) with a per-mode breakdown under 'modes' and, when
+            stores is given, credits/bytes/requests per store
+        """
+        key = self._key(retailer)
+        with self._entries_lock:
+            by_mode = {mode: dict(entry) for (name, mode), entry in self._entries.items() if name == key}
+
+        summary = self._totals(by_mode.values())
+        summary['modes'] = {mode: self._totals([entry]) for mode, entry in by_mode.items()}
+        if stores is not None:
+            summary['stores'] = stores
+            for field in ('credits', 'bytes', 'requests'):
+                summary[f'{field}_per_store'] = round(summary[field] / stores, 2) if stores else None
+        return summary
+
+    def reset(self, retailer: Optional[str] = None) -> None:
+        """Forget recorded usage for one retailer, or for all retailers if None."""
+        with self._entries_lock:
+            if retailer is None:
+                self._entries.clear()
+            else:
+                key = self._key(retailer)
+                for entry_key in [k for k in self._entries if k[0] == key]:
+                    del self._entries[entry_key]
+
+
+# Request construction shared by ProxyClient and async_http.AsyncProxyClient
+
+_USER_AGENTS = [
+    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
+    "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
+    "Mozilla/5.0 (Windows NT 10.0; Win64; x64; rv:121.0) Gecko/20100101 Firefox/121.0",
+    "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/17.2 Safari/605.1.15",
+]
+
+
+def _residential_proxy_url(config: ProxyConfig, session_id: Optional[str] = None) -> str:
+    """Build residential proxy URL with authentication and targeting
+
+    Format according to Oxylabs documentation:
+    - Basic: customer-{username}
+    - Country: customer-{username}-cc-{country}
+    - City: customer-{username}-cc-{country}-city-{city}
+    - State: customer-{username}-st-{state}
+    - Session: customer-{username}-sessid-{session_id}
+
+    Args:
+        config: Residential proxy configuration
+        session_id: Sticky session to use (e.g. one leased from the session
+            pool); defaults to config.session_id for "sticky" sessions
+    """
+    # Start with customer- prefix if not already present
+    username = config.username
+    if not username.startswith('customer-'):
+        username = f'customer-{username}'
+
+    username_parts = [username]
+
+    # Add country targeting (cc-COUNTRY_CODE format)
+    if config.country_code:
+        username_parts.append(f"cc-{config.country_code.upper()}")
+
+    # Add city targeting
+    if config.city:
+        # Replace spaces with underscores as per Oxylabs docs
+        city = config.city.lower().replace(' ', '_')
+        username_parts.append(f"city-{city}")
+
+    # Add state targeting (st-STATE format for US)
+    if config.state:
+        state = config.state.lower().replace(' ', '_')
+        username_parts.append(f"st-{state}")
+
+    # Add session ID for sticky sessions (sessid-SESSION_ID format)
+    if session_id is None and config.session_type == "sticky":
+        session_id = config.session_id
+    if session_id:
+        username_parts.append(f"sessid-{session_id}")
+
+    username = "-".join(username_parts)
+
+    return f"http://{username}:{config.password}@{config.residential_endpoint}"
+
+
+def _request_headers(custom_headers: Optional[Dict[str, str]] = None) -> Dict[str, str]:
+    """Get request headers with random user agent"""
+    headers = {
+        "User-Agent": random.choice(_USER_AGENTS),
+        "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8",
+        "Accept-Language": "en-US,en;q=0.9",
+        "Accept-Encoding": "gzip, deflate, br",
+        "Connection": "keep-alive",
+        "Upgrade-Insecure-Requests": "1",
+    }
+
+    if custom_headers:
+        headers.update(custom_headers)
+
+    return headers
+
+
+def _scraper_api_payload(
+    config: ProxyConfig,
+    url: str,
+    headers: Optional[Dict[str, str]],
+    params: Optional[Dict[str, str]],
+    render_js: bool,
+) -> Tuple[str, Dict[str, Any]]:
+    """Build the target URL and Web Scraper API payload for a request.
+
+    Returns:
+        Tuple of (target_url_with_params, payload_dict)
+    """
+    # Build full URL with params
+    if params:
+        parsed = urllib.parse.urlparse(url)
+        existing_params = urllib.parse.parse_qs(parsed.query)
+        existing_params.update(params)
+        new_query = urllib.parse.urlencode(existing_params, doseq=True)
+        url = urllib.parse.urlunparse(parsed._replace(query=new_query))
+
+    # Build API payload
+    payload = {
+        "source": "universal",
+        "url": url,
+        "geo_location": config.country_code.upper() if config.country_code else None,
+    }
+
+    # Add JavaScript rendering if needed
+    if render_js:
+        payload["render"] = "html"
+
+    # Add custom headers if provided
+    if headers:
+        payload["custom_headers"] = headers
+
+    # Add parsing if configured
+    if config.parse:
+        payload["parse"] = True
+
+    # Remove None values
+    payload = {k: v for k, v in payload.items() if v is not None}
+
+    return url, payload
+
+
+def _scraper_api_result(
+    api_response: Dict[str, Any],
+    url: str,
+    elapsed: float,
+) -> Optional[ProxyResponse]:
+    """Convert a successful Web Scraper API JSON body into a ProxyResponse.
+
+    Returns:
+        ProxyResponse for the first result, or None if the API returned no results
+    """
+    results = api_response.get("results", [])
+    if not results:
+        return None
+
+    result = results[0]
+    content = result.get("content", "")
+
+    return ProxyResponse(
+        status_code=result.get("status_code", 200),
+        text=content,
+        content=content.encode("utf-8") if isinstance(content, str) else content,
+        headers={},
+        url=url,
+        elapsed_seconds=elapsed,
+        proxy_mode=ProxyMode.WEB_SCRAPER_API,
+        job_id=api_response.get("job_id"),
+        credits_used=api_response.get("credits_used"),
+    )
+
+
 class ProxyClient:
     """
     Unified proxy client supporting multiple Oxylabs products.
@@ -344,29 +670,37 @@ class ProxyClient:
     """
 
     # User agents for rotation
-    USER_AGENTS = [
-        "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
-        "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
-        "Mozilla/5.0 (Windows NT 10.0; Win64; x64; rv:121.0) Gecko/20100101 Firefox/121.0",
-        "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/17.2 Safari/605.1.15",
-    ]
-
-    def __init__(self, config: Optional[ProxyConfig] = None):
+    USER_AGENTS = _USER_AGENTS
+
+    def __init__(self, config: Optional[ProxyConfig] = None, retailer: Optional[str] = None):
         """
         Initialize proxy client.
 
         Args:
             config: Proxy configuration. If None, loads from environment.
+            retailer: Optional retailer name, used for per-retailer rate limiting
         """
         self.config = config or ProxyConfig.from_env()
+        self.retailer = retailer
         self._session: Optional[requests.Session] = None
         self._request_count = 0
 
+        # Web Scraper API transport: one keep-alive pool shared by all threads
+        self._api_lock = threading.Lock()
+        self._api_local = threading.local()
+        self._api_adapter: Optional[HTTPAdapter] = None
+        self._api_http2_client: Optional[Any] = None
+
         if not self.config.validate():
             _log_safe(f"Invalid proxy config for mode '{self.config.mode.value}' - missing credentials", level=logging.ERROR)
             _log_safe("Falling back to direct mode", level=logging.WARNING)
             self.config.mode = ProxyMode.DIRECT
 
+        # Sticky residential sessions shared by every client of the retailer
+        self._session_pool: Optional[ResidentialSessionPool] = None
+        if self.config.mode == ProxyMode.RESIDENTIAL and self.config.session_type == "pool":
+            self._session_pool = ResidentialSessionPool.for_retailer(retailer, self.config.session_pool_size)
+
         _log_safe(f"ProxyClient initialized in {self.config.mode.value} mode", level=logging.INFO)
 
         # Log credential status for debugging (without exposing actual credentials)
@@ -385,6 +719,14 @@ class ProxyClient:
 
     def _configure_session(self) -> None:
         """Configure session based on proxy mode"""
+        # Size the keep-alive pool so warm connections are reused across requests
+        adapter = HTTPAdapter(
+            pool_connections=self.config.pool_connections,
+            pool_maxsize=self.config.pool_maxsize,
+        )
+        self._session.mount("http://", adapter)
+        self._session.mount("https://", adapter)
+
         if self.config.mode == ProxyMode.RESIDENTIAL:
             # Configure residential proxy
             proxy_url = self._build_residential_proxy_url()
@@ -394,61 +736,52 @@ class ProxyClient:
             }
             _log_safe(f"Configured residential proxy: {self.config.residential_endpoint}", level=logging.DEBUG)
 
-    def _build_residential_proxy_url(self) -> str:
-        """Build residential proxy URL with authentication and targeting
+    def _api_transport(self) -> Any:
+        """Return the pooled transport for Web Scraper API calls.
 
-        Format according to Oxylabs documentation:
-        - Basic: customer-{username}
-        - Country: customer-{username}-cc-{country}
-        - City: customer-{username}-cc-{country}-city-{city}
-        - State: customer-{username}-st-{state}
-        - Session: customer-{username}-sessid-{session_id}
-        """
-        # Start with customer- prefix if not already present
-        username = self.config.username
-        if not username.startswith('customer-'):
-            username = f'customer-{username}'
+        With HTTP/2 available this is one httpx.Client shared by all threads
+        (it is thread-safe and multiplexes requests over a single connection).
+        Otherwise each thread gets its own lightweight requests.Session, all
+        mounted on one shared HTTPAdapter, so threads never share Session
+        state but do share the keep-alive connections to the API endpoint.
 
-        username_parts = [username]
-
-        # Add country targeting (cc-COUNTRY_CODE format)
-        if self.config.country_code:
-            username_parts.append(f"cc-{self.config.country_code.upper()}")
-
-        # Add city targeting
-        if self.config.city:
-            # Replace spaces with underscores as per Oxylabs docs
-            city = self.config.city.lower().replace(' ', '_')
-            username_parts.append(f"city-{city}")
-
-        # Add state targeting (st-STATE format for US)
-        if self.config.state:
-            state = self.config.state.lower().replace(' ', '_')
-            username_parts.append(f"st-{state}")
-
-        # Add session ID for sticky sessions (sessid-SESSION_ID format)
-        if self.config.session_type == "sticky" and self.config.session_id:
-            username_parts.append(f"sessid-{self.config.session_id}")
-
-        username = "-".join(username_parts)
-
-        return f"http://{username}:{self.config.password}@{self.config.residential_endpoint}"
+        Returns:
+            Object with a requests-compatible post() method
+        """
+        if self.config.http2 and HTTP2_AVAILABLE:
+            if self._api_http2_client is None:
+                with self._api_lock:
+                    if self._api_http2_client is None:
+                        self._api_http2_client = httpx.Client(
+                            http2=True,
+                            limits=httpx.Limits(
+                                max_connections=self.config.pool_maxsize,
+                                max_keepalive_connections=self.config.pool_maxsize,
+                            ),
+                        )
+            return self._api_http2_client
+
+        session = getattr(self._api_local, "session", None)
+        if session is None:
+            with self._api_lock:
+                if self._api_adapter is None:
+                    self._api_adapter = HTTPAdapter(
+                        pool_connections=self.config.pool_connections,
+                        pool_maxsize=self.config.pool_maxsize,
+                    )
+                session = requests.Session()
+                session.mount("https://", self._api_adapter)
+                session.mount("http://", self._api_adapter)
+            self._api_local.session = session
+        return session
+
+    def _build_residential_proxy_url(self, session_id: Optional[str] = None) -> str:
+        """Build residential proxy URL (see _residential_proxy_url)"""
+        return _residential_proxy_url(self.config, session_id)
 
     def _get_headers(self, custom_headers: Optional[Dict[str, str]] = None) -> Dict[str, str]:
         """Get request headers with random user agent"""
-        headers = {
-            "User-Agent": random.choice(self.USER_AGENTS),
-            "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8",
-            "Accept-Language": "en-US,en;q=0.9",
-            "Accept-Encoding": "gzip, deflate, br",
-            "Connection": "keep-alive",
-            "Upgrade-Insecure-Requests": "1",
-        }
-
-        if custom_headers:
-            headers.update(custom_headers)
-
-        return headers
+        return _request_headers(custom_headers)
 
     def get(
         self,
@@ -457,17 +790,23 @@ class ProxyClient:
         params: Optional[Dict[str, str]] = None,
         render_js: Optional[bool] = None,
         timeout: Optional[int] = None,
+        revalidation_cache: Optional[RevalidationCache] = None,
         **kwargs: Any
     ) -> Optional[ProxyResponse]:
         """
         Make a GET request using configured proxy mode.
 
+        A 304 Not Modified is returned to the caller as-is, unless a
+        revalidation_cache is given: then stored validators are sent with the
+        request and a 304 is answered from the stored body as a 200.
+
         Args:
             url: Target URL
             headers: Optional custom headers
             params: Optional query parameters
             render_js: Override JS rendering setting (Web Scraper API only)
             timeout: Request timeout in seconds
+            revalidation_cache: Optional validator store for conditional GETs
             **kwargs: Additional arguments passed to underlying request
 
         Returns:
@@ -476,17 +815,36 @@ class ProxyClient:
         timeout = timeout or self.config.timeout
         render_js = render_js if render_js is not None else self.config.render_js
 
+        validators = revalidation_cache.get(url) if revalidation_cache else None
+        if validators:
+            headers = {**(headers or {}), **RevalidationCache.conditional_headers(validators)}
+        ledger = ProxyCostLedger()
+        rendered = render_js and self.config.mode == ProxyMode.WEB_SCRAPER_API
+
         for attempt in range(self.config.max_retries):
+            # Shared token buckets keep all clients within the contracted proxy rate
+            GlobalConcurrencyManager().wait_for_token(self.retailer, self.config.mode.value)
             try:
                 if self.config.mode == ProxyMode.WEB_SCRAPER_API:
                     response = self._request_scraper_api(url, headers, params, render_js, timeout)
+                elif self._session_pool is not None:
+                    response = self._request_pooled(url, headers, params, timeout, **kwargs)
                 else:
                     # Direct or Residential mode (both use requests session)
                     response = self._request_direct(url, headers, params, timeout, **kwargs)
 
                 self._request_count += 1
+                ledger.record(self.retailer, self.config.mode, response, rendered=rendered, retry=attempt > 0)
+
+                # Not modified - serve the stored body, or let the caller revalidate
+                if response and response.status_code == 304:
+                    if validators:
+                        return self._revalidated_response(url, validators, response)
+                    return response
 
                 if response and response.ok:
+                    if revalidation_cache and response.status_code == 200:
+                        revalidation_cache.store(url, response.content, response.headers)
                     # Apply delay for direct mode
                     if self.config.mode == ProxyMode.DIRECT and self.config.max_delay > 0:
                         delay = random.uniform(self.config.min_delay, self.config.max_delay)
@@ -494,6 +852,11 @@ class ProxyClient:
 
                     return response
 
+                # Callers that react to error statuses themselves (a tiered
+                # session escalating on 429/503) get them without waiting
+                if response and not self.config.retry_errors:
+                    return response
+
                 # Handle rate limiting
                 if response and response.status_code == 429:
                     wait_time = self.config.retry_delay * (2 ** attempt)
@@ -521,25 +884,53 @@ class ProxyClient:
                         _log_safe(f"Client error {response.status_code} for {safe_url}", level=logging.WARNING)
                     return response
 
-            except requests.exceptions.Timeout:
+            except _TIMEOUT_ERRORS:
+                ledger.record(self.retailer, self.config.mode, rendered=rendered, retry=attempt > 0)
                 safe_url = _sanitize_url(redact_credentials(url))
                 _log_safe(f"Timeout on attempt {attempt + 1} for {safe_url}", level=logging.WARNING)
-                time.sleep(self.config.retry_delay)
-            except requests.exceptions.RequestException as e:
+                if attempt + 1 < self.config.max_retries:
+                    time.sleep(self.config.retry_delay)
+            except _REQUEST_ERRORS as e:
+                ledger.record(self.retailer, self.config.mode, rendered=rendered, retry=attempt > 0)
                 # Redact credentials from error messages to prevent leaking sensitive info
                 safe_error = redact_credentials(str(e))
                 _log_safe(f"Request error on attempt {attempt + 1}: {safe_error}", level=logging.WARNING)
-                time.sleep(self.config.retry_delay)
+                if attempt + 1 < self.config.max_retries:
+                    time.sleep(self.config.retry_delay)
             except Exception as e:
                 # Redact credentials from error messages
                 safe_error = redact_credentials(str(e))
                 _log_safe(f"Unexpected error: {safe_error}", level=logging.ERROR)
-                time.sleep(self.config.retry_delay)
+                if attempt + 1 < self.config.max_retries:
+                    time.sleep(self.config.retry_delay)
 
         safe_url = _sanitize_url(redact_credentials(url))
         _log_safe(f"All {self.config.max_retries} attempts failed for {safe_url}", level=logging.ERROR)
         return None
 
+    def _revalidated_response(
+        self,
+        url: str,
+        validators: Dict[str, Any],
+        not_modified: ProxyResponse
+    ) -> ProxyResponse:
+        """Turn a 304 into a 200 ProxyResponse carrying the stored body."""
+        content = RevalidationCache.body(validators)
+        headers = {'Content-Type': validators.get('content_type') or 'text/html'}
+        if validators.get('etag'):
+            headers['ETag'] = validators['etag']
+        if validators.get('last_modified'):
+            headers['Last-Modified'] = validators['last_modified']
+        return ProxyResponse(
+            status_code=200,
+            text=content.decode(validators.get('encoding') or 'utf-8', errors='replace'),
+            content=content,
+            headers=headers,
+            url=url,
+            elapsed_seconds=not_modified.elapsed_seconds,
+            proxy_mode=self.config.mode,
+        )
+
     def _request_direct(
         self,
         url: str,
@@ -575,6 +966,36 @@ class ProxyClient:
             proxy_mode=self.config.mode,
         )
 
+    def _request_pooled(
+        self,
+        url: str,
+        headers: Optional[Dict[str, str]],
+        params: Optional[Dict[str, str]],
+        timeout: int,
+        **kwargs: Any
+    ) -> ProxyResponse:
+        """Make a residential request through a sticky session leased from the pool
+
+        The outcome is reported back to the pool, which retires sessions that
+        start getting blocked; a retry leases again and so may use another exit.
+        """
+        session = self._session_pool.lease()
+        proxy_url = self._build_residential_proxy_url(session.session_id)
+        response = None
+        try:
+            response = self._request_direct(
+                url, headers, params, timeout,
+                proxies={"http": proxy_url, "https": proxy_url},
+                **kwargs
+            )
+            return response
+        finally:
+            self._session_pool.release(
+                session,
+                response.status_code if response is not None else None,
+                response.elapsed_seconds if response is not None else 0.0,
+            )
+
     def _request_scraper_api(
         self,
         url: str,
@@ -586,38 +1007,10 @@ class ProxyClient:
         """Make request via Oxylabs Web Scraper API"""
         start_time = time.time()
 
-        # Build full URL with params
-        if params:
-            parsed = urllib.parse.urlparse(url)
-            existing_params = urllib.parse.parse_qs(parsed.query)
-            existing_params.update(params)
-            new_query = urllib.parse.urlencode(existing_params, doseq=True)
-            url = urllib.parse.urlunparse(parsed._replace(query=new_query))
-
-        # Build API payload
-        payload = {
-            "source": "universal",
-            "url": url,
-            "geo_location": self.config.country_code.upper() if self.config.country_code else None,
-        }
-
-        # Add JavaScript rendering if needed
-        if render_js:
-            payload["render"] = "html"
+        url, payload = _scraper_api_payload(self.config, url, headers, params, render_js)
 
-        # Add custom headers if provided
-        if headers:
-            payload["custom_headers"] = headers
-
-        # Add parsing if configured
-        if self.config.parse:
-            payload["parse"] = True
-
-        # Remove None values
-        payload = {k: v for k, v in payload.items() if v is not None}
-
-        # Make API request
-        response = requests.post(
+        # Make API request over the pooled keep-alive transport
+        response = self._api_transport().post(
             self.config.scraper_api_endpoint,
             auth=(self.config.username, self.config.password),
             json=payload,
@@ -628,24 +1021,9 @@ class ProxyClient:
 
         # Parse API response
         if response.status_code == 200:
-            api_response = response.json()
-            results = api_response.get("results", [])
-
-            if results:
-                result = results[0]
-                content = result.get("content", "")
-
-                return ProxyResponse(
-                    status_code=result.get("status_code", 200),
-                    text=content,
-                    content=content.encode("utf-8") if isinstance(content, str) else content,
-                    headers={},
-                    url=url,
-                    elapsed_seconds=elapsed,
-                    proxy_mode=ProxyMode.WEB_SCRAPER_API,
-                    job_id=api_response.get("job_id"),
-                    credits_used=api_response.get("credits_used"),
-                )
+            proxy_response = _scraper_api_result(response.json(), url, elapsed)
+            if proxy_response is not None:
+                return proxy_response
 
         # Handle credential errors explicitly
         if response.status_code in (401, 403):
@@ -665,6 +1043,224 @@ class ProxyClient:
             proxy_mode=ProxyMode.WEB_SCRAPER_API,
         )
 
+    def get_batch(
+        self,
+        urls: Iterable[str],
+        render_js: Optional[bool] = None,
+        batch_size: int = SCRAPER_API.BATCH_SIZE,
+        poll_interval: float = SCRAPER_API.POLL_INTERVAL,
+        job_timeout: float = SCRAPER_API.JOB_TIMEOUT,
+        poll_workers: int = SCRAPER_API.POLL_WORKERS,
+        poll_window: int = SCRAPER_API.POLL_WINDOW,
+    ) -> Iterator[Tuple[str, Optional[ProxyResponse]]]:
+        """Fetch many URLs as Web Scraper API push-pull jobs.
+
+        Each round submits the next batch of batch_size URLs (until all are
+        queued) and then checks the poll_window oldest pending jobs, fetching
+        statuses and finished results poll_workers at a time. Each result is
+        yielded as soon as its job is done, so results stream while later
+        batches are still being submitted and arrive in completion order,
+        not submission order.
+
+        Only submissions take a rate-limit token: status checks and result
+        downloads read back work that was already charged, and poll_window
+        bounds them per round instead.
+
+        Jobs are tracked by id, so every requested URL is yielded exactly once
+        under the URL it was requested as, even if the API echoes a
+        normalized URL back.
+
+        Args:
+            urls: Target URLs
+            render_js: Override JS rendering setting
+            batch_size: URLs per batch submission
+            poll_interval: Seconds between polling rounds
+            job_timeout: Seconds after submission before a job is given up on
+            poll_workers: Status checks and result downloads in flight at once
+            poll_window: Oldest pending jobs checked per round
+
+        Yields:
+            Tuple of (url, ProxyResponse). The response is None when the URL
+            could not be submitted, its job faulted, or it timed out.
+
+        Raises:
+            ValueError: If the client is not in web_scraper_api mode
+        """
+        if self.config.mode != ProxyMode.WEB_SCRAPER_API:
+            raise ValueError("Batch jobs require web_scraper_api proxy mode")
+        render_js = render_js if render_js is not None else self.config.render_js
+        urls = list(urls)
+        batch_size = max(1, batch_size)
+
+        poll_window = max(1, poll_window)
+        chunks = iter(range(0, len(urls), batch_size))
+        submitting = True
+
+        # job_id -> (requested url, submitted_at), oldest first
+        pending: Dict[str, Tuple[str, float]] = {}
+        with ThreadPoolExecutor(max_workers=max(1, poll_workers)) as executor:
+            while submitting or pending:
+                # Queue one more chunk per round, so results stream while later chunks are submitted
+                start = next(chunks, None) if submitting else None
+                if start is None:
+                    if submitting:
+                        submitting = False
+                        _log_safe("[web_scraper_api] All batch jobs submitted", level=logging.INFO)
+                else:
+                    chunk = urls[start:start + batch_size]
+                    jobs = self._submit_batch(chunk, render_js)
+                    submitted_at = time.time()
+                    assigned = self._match_batch_jobs(chunk, jobs)
+                    for job_id, url in assigned.items():
+                        pending[job_id] = (url, submitted_at)
+                    submitted = set(assigned.values())
+                    for url in chunk:
+                        if url not in submitted:
+                            yield url, None
+
+                # Give up on expired jobs without asking the API about them
+                now = time.time()
+                for job_id, (url, submitted_at) in list(pending.items()):
+                    if now - submitted_at > job_timeout:
+                        del pending[job_id]
+                        safe_url = _sanitize_url(redact_credentials(url))
+                        _log_safe(f"[web_scraper_api] Job {job_id} timed out for {safe_url}", level=logging.WARNING)
+                        ProxyCostLedger().record(self.retailer, self.config.mode, rendered=render_js)
+                        yield url, None
+
+                # Jobs finish roughly in submission order, so only the oldest are checked
+                window = list(itertools.islice(pending, poll_window))
+                statuses = dict(zip(window, executor.map(self._batch_job_status, window)))
+                done = [job_id for job_id in window if statuses[job_id] == "done"]
+                results = dict(zip(done, executor.map(
+                    lambda job_id: self._batch_job_result(job_id, *pending[job_id]), done
+                )))
+
+                for job_id in window:
+                    url, _ = pending[job_id]
+                    status = statuses[job_id]
+                    if status == "done":
+                        del pending[job_id]
+                        response = results[job_id]
+                        ProxyCostLedger().record(self.retailer, self.config.mode, response, rendered=render_js)
+                        yield url, response
+                    elif status == "faulted":
+                        del pending[job_id]
+                        safe_url = _sanitize_url(redact_credentials(url))
+                        _log_safe(f"[web_scraper_api] Job {job_id} faulted for {safe_url}", level=logging.WARNING)
+                        ProxyCostLedger().record(self.retailer, self.config.mode, rendered=render_js)
+                        yield url, None
+
+                if pending and not submitting:
+                    time.sleep(poll_interval)
+
+    @staticmethod
+    def _match_batch_jobs(chunk: List[str], jobs: List[Dict[str, str]]) -> Dict[str, str]:
+        """Map accepted job ids to the URLs they were requested for.
+
+        The API lists one query per submitted URL in submission order, so a
+        full response is matched by position even if it echoes normalized
+        URLs. A partial response is matched by echoed URL; jobs that match no
+        requested URL are logged and dropped, and their URLs are reported as
+        failures by the caller.
+
+        Returns:
+            Dict of job_id -> requested URL
+        """
+        if len(jobs) == len(chunk):
+            return {job["id"]: url for job, url in zip(jobs, chunk)}
+
+        unassigned = set(chunk)
+        assigned: Dict[str, str] = {}
+        for job in jobs:
+            if job["url"] in unassigned:
+                unassigned.discard(job["url"])
+                assigned[job["id"]] = job["url"]
+            else:
+                _log_safe(
+                    f"[web_scraper_api] Job {job['id']} does not match a submitted URL, ignoring it",
+                    level=logging.WARNING,
+                )
+        return assigned
+
+    def _submit_batch(self, urls: List[str], render_js: bool) -> List[Dict[str, str]]:
+        """Submit one batch of URLs, retrying like get().
+
+        Returns:
+            List of {'id': job_id, 'url': url} for the accepted jobs (empty on failure)
+        """
+        _, payload = _scraper_api_payload(self.config, urls[0], None, None, render_js)
+        payload["url"] = urls
+
+        for attempt in range(self.config.max_retries):
+            GlobalConcurrencyManager().wait_for_token(self.retailer, self.config.mode.value)
+            try:
+                response = self._api_transport().post(
+                    f"{self.config.scraper_api_batch_endpoint}/batch",
+                    auth=(self.config.username, self.config.password),
+                    json=payload,
+                    timeout=self.config.timeout,
+                )
+                self._request_count += 1
+                if response.status_code in (200, 201, 202):
+                    return [
+                        {"id": str(query["id"]), "url": query["url"]}
+                        for query in response.json().get("queries", [])
+                        if query.get("id") and query.get("url")
+                    ]
+                if response.status_code in (401, 403):
+                    _log_safe(f"[web_scraper_api] Authentication failed ({response.status_code}) - verify OXYLABS_SCRAPER_API credentials", level=logging.ERROR)
+                    return []
+                _log_safe(f"[web_scraper_api] Batch submission failed with {response.status_code}, retrying...", level=logging.WARNING)
+            except (ValueError, KeyError) as e:
+                _log_safe(f"[web_scraper_api] Unexpected batch submission response: {e}", level=logging.ERROR)
+                return []
+            except _REQUEST_ERRORS as e:
+                safe_error = redact_credentials(str(e))
+                _log_safe(f"Batch submission error on attempt {attempt + 1}: {safe_error}", level=logging.WARNING)
+            time.sleep(self.config.retry_delay * (2 ** attempt))
+
+        _log_safe(f"[web_scraper_api] Batch of {len(urls)} URLs could not be submitted", level=logging.ERROR)
+        return []
+
+    def _batch_job_status(self, job_id: str) -> str:
+        """Poll one job's status ('pending', 'done' or 'faulted').
+
+        Network errors are reported as 'pending' so the job is polled again.
+        """
+        try:
+            response = self._api_transport().get(
+                f"{self.config.scraper_api_batch_endpoint}/{job_id}",
+                auth=(self.config.username, self.config.password),
+                timeout=self.config.timeout,
+            )
+            if response.status_code != 200:
+                return "pending"
+            return response.json().get("status", "pending")
+        except (ValueError, *_REQUEST_ERRORS) as e:
+            _log_safe(f"[web_scraper_api] Status check failed for job {job_id}: {redact_credentials(str(e))}", level=logging.DEBUG)
+            return "pending"
+
+    def _batch_job_result(self, job_id: str, url: str, submitted_at: float) -> Optional[ProxyResponse]:
+        """Download a finished job's result as a ProxyResponse (None on failure)."""
+        try:
+            response = self._api_transport().get(
+                f"{self.config.scraper_api_batch_endpoint}/{job_id}/results",
+                auth=(self.config.username, self.config.password),
+                timeout=self.config.timeout,
+            )
+            self._request_count += 1
+            if response.status_code != 200:
+                _log_safe(f"[web_scraper_api] Result download for job {job_id} failed with {response.status_code}", level=logging.WARNING)
+                return None
+            proxy_response = _scraper_api_result(response.json(), url, time.time() - submitted_at)
+        except (ValueError, *_REQUEST_ERRORS) as e:
+            _log_safe(f"[web_scraper_api] Result download failed for job {job_id}: {redact_credentials(str(e))}", level=logging.WARNING)
+            return None
+        if proxy_response is not None:
+            proxy_response.job_id = job_id
+        return proxy_response
+
     def validate_credentials(self) -> Tuple[bool, str]:
         """Test proxy credentials with a simple request.
 
@@ -689,19 +1285,31 @@ class ProxyClient:
 
     def get_stats(self) -> Dict[str, Any]:
         """Get client statistics"""
-        return {
+        stats = {
             "mode": self.config.mode.value,
             "request_count": self._request_count,
             "country": self.config.country_code,
             "render_js": self.config.render_js,
         }
+        if self._session_pool is not None:
+            stats["session_pool"] = self._session_pool.get_stats()
+        return stats
 
     def close(self) -> None:
-        """Close the client session"""
+        """Close the client session and the Web Scraper API transport"""
         if self._session:
             self._session.close()
             self._session = None
 
+        with self._api_lock:
+            if self._api_http2_client is not None:
+                self._api_http2_client.close()
+                self._api_http2_client = None
+            if self._api_adapter is not None:
+                self._api_adapter.close()
+                self._api_adapter = None
+            self._api_local = threading.local()
+
     def __enter__(self) -> "ProxyClient":
         return self
 
@@ -1,16 +1,26 @@
-"""Shared request counter for tracking requests across scrapers."""
+"""Shared request counter for tracking requests across scrapers.
 
+Threshold pauses are coordinated through the retailer's PauseGate: the
+worker that crosses a threshold holds the gate while it sleeps, and every
+other worker of that retailer waits on it before its next request.
+"""
+
+import asyncio
 import logging
 import random
 import threading
 import time
+from typing import List, Optional
 
+from src.shared.concurrency import GlobalConcurrencyManager, PauseGate
 from src.shared.constants import PAUSE
 
 
 __all__ = [
     'RequestCounter',
     'check_pause_logic',
+    'check_pause_logic_async',
+    'get_pause_duration',
 ]
 
 
@@ -72,7 +82,7 @@ class RequestCounter:
         return self.increment()
 
 
-def check_pause_logic(
+def get_pause_duration(
     counter: RequestCounter,
     retailer: str = None,
     config: dict = None,
@@ -83,26 +93,17 @@ def check_pause_logic(
     pause_200_min: float = PAUSE.LONG_MIN_SECONDS,
     pause_200_max: float = PAUSE.LONG_MAX_SECONDS,
     current_count: int = None,
-) -> None:
-    """Check if we need to pause based on request count (#71).
+) -> float:
+    """Compute the pause owed at the current request count, without sleeping.
 
-    If config is provided, it can contain keys that override the default
-    values for the pause-related arguments (e.g., `pause_50_requests`).
-
-    To avoid TOCTOU race conditions in parallel execution, pass current_count
-    from the atomic increment operation.
+    Takes the same arguments as check_pause_logic(). When a retailer is
+    given, the request is counted against its pause window; if the config
+    sets `pause_budget_rpm`, a due pause is sized so the window since the
+    previous pause averages that many requests per minute, instead of
+    drawing from the pause_50/pause_200 ranges.
 
-    Args:
-        counter: RequestCounter instance to check
-        retailer: Retailer name for logging (optional)
-        config: YAML config dict with pause settings (optional, overrides defaults)
-        pause_50_requests: Pause after this many requests (default: 50)
-        pause_50_min: Minimum pause duration in seconds for 50-request pause (default: 30)
-        pause_50_max: Maximum pause duration in seconds for 50-request pause (default: 60)
-        pause_200_requests: Longer pause after this many requests (default: 200)
-        pause_200_min: Minimum pause duration in seconds for 200-request pause (default: 120)
-        pause_200_max: Maximum pause duration in seconds for 200-request pause (default: 180)
-        current_count: Current count from atomic increment (optional, avoids race condition)
+    Returns:
+        Pause duration in seconds (0.0 if no pause is due)
     """
     # Read from config if provided, otherwise use defaults
     if config:
@@ -115,17 +116,138 @@ def check_pause_logic(
 
     # Skip if pauses are effectively disabled
     if pause_50_requests >= PAUSE.DISABLED_THRESHOLD and pause_200_requests >= PAUSE.DISABLED_THRESHOLD:
-        return
+        return 0.0
 
     # Use provided count if available (avoids TOCTOU race), otherwise read from counter
     count = current_count if current_count is not None else counter.count
     prefix = f"[{retailer}] " if retailer else ""
 
+    budget_rpm = config.get('pause_budget_rpm') if config else None
+    gate = GlobalConcurrencyManager().get_pause_gate(retailer) if retailer else None
+    if gate:
+        gate.count_request()
+
+    if budget_rpm and gate:
+        if count <= 0 or (count % pause_50_requests and count % pause_200_requests):
+            return 0.0
+        pause_time = gate.budget_pause(budget_rpm)
+        if pause_time > 0:
+            logging.info(f"{prefix}Budget pause after {count} requests: {pause_time:.0f} seconds ({budget_rpm} req/min)")
+        else:
+            gate.reset_window()
+        return pause_time
+
     if count % pause_200_requests == 0 and count > 0:
         pause_time = random.uniform(pause_200_min, pause_200_max)
         logging.info(f"{prefix}Long pause after {count} requests: {pause_time:.0f} seconds")
-        time.sleep(pause_time)
-    elif count % pause_50_requests == 0 and count > 0:
+        return pause_time
+    if count % pause_50_requests == 0 and count > 0:
         pause_time = random.uniform(pause_50_min, pause_50_max)
         logging.info(f"{prefix}Pause after {count} requests: {pause_time:.0f} seconds")
-        time.sleep(pause_time)
+        return pause_time
+    return 0.0
+
+
+def check_pause_logic(
+    counter: RequestCounter,
+    retailer: str = None,
+    config: dict = None,
+    pause_50_requests: int = PAUSE.SHORT_THRESHOLD,
+    pause_50_min: float = PAUSE.SHORT_MIN_SECONDS,
+    pause_50_max: float = PAUSE.SHORT_MAX_SECONDS,
+    pause_200_requests: int = PAUSE.LONG_THRESHOLD,
+    pause_200_min: float = PAUSE.LONG_MIN_SECONDS,
+    pause_200_max: float = PAUSE.LONG_MAX_SECONDS,
+    current_count: int = None,
+) -> None:
+    """Check if we need to pause based on request count (#71).
+
+    If config is provided, it can contain keys that override the default
+    values for the pause-related arguments (e.g., `pause_50_requests`).
+
+    To avoid TOCTOU race conditions in parallel execution, pass current_count
+    from the atomic increment operation.
+
+    With a retailer, the pause is shared: the calling worker holds the
+    retailer's PauseGate (and the proxy mode's gate when the config sets
+    `pause_scope: proxy`) for the duration of its sleep, and workers that
+    are not due a pause wait for any pause already in progress.
+
+    Args:
+        counter: RequestCounter instance to check
+        retailer: Retailer name for logging (optional)
+        config: YAML config dict with pause settings (optional, overrides defaults)
+        pause_50_requests: Pause after this many requests (default: 50)
+        pause_50_min: Minimum pause duration in seconds for 50-request pause (default: 30)
+        pause_50_max: Maximum pause duration in seconds for 50-request pause (default: 60)
+        pause_200_requests: Longer pause after this many requests (default: 200)
+        pause_200_min: Minimum pause duration in seconds for 200-request pause (default: 120)
+        pause_200_max: Maximum pause duration in seconds for 200-request pause (default: 180)
+        current_count: Current count from atomic increment (optional, avoids race condition)
+    """
+    pause_time = get_pause_duration(
+        counter,
+        retailer=retailer,
+        config=config,
+        pause_50_requests=pause_50_requests,
+        pause_50_min=pause_50_min,
+        pause_50_max=pause_50_max,
+        pause_200_requests=pause_200_requests,
+        pause_200_min=pause_200_min,
+        pause_200_max=pause_200_max,
+        current_count=current_count,
+    )
+    gates = _pause_gates(retailer, config)
+    if pause_time > 0:
+        for gate in gates:
+            gate.hold(pause_time)
+        try:
+            time.sleep(pause_time)
+        finally:
+            for gate in gates:
+                gate.release()
+    else:
+        for gate in gates:
+            gate.wait()
+
+
+async def check_pause_logic_async(
+    counter: RequestCounter,
+    retailer: str = None,
+    config: dict = None,
+    current_count: int = None,
+) -> None:
+    """Asyncio variant of check_pause_logic() that yields to the event loop.
+
+    Args:
+        counter: RequestCounter instance to check
+        retailer: Retailer name (enables the shared pause gate)
+        config: YAML config dict with pause settings (optional)
+        current_count: Current count from atomic increment (optional)
+    """
+    pause_time = get_pause_duration(counter, retailer=retailer, config=config, current_count=current_count)
+    gates = _pause_gates(retailer, config)
+    if pause_time > 0:
+        for gate in gates:
+            gate.hold(pause_time)
+        try:
+            await asyncio.sleep(pause_time)
+        finally:
+            for gate in gates:
+                gate.release()
+    else:
+        for gate in gates:
+            await gate.wait_async()
+
+
+def _pause_gates(retailer: Optional[str], config: Optional[dict]) -> List[PauseGate]:
+    """Gates a threshold pause should close for this retailer and config."""
+    if not retailer:
+        return []
+    manager = GlobalConcurrencyManager()
+    gates = [manager.get_pause_gate(retailer)]
+    if config and config.get('pause_scope') == 'proxy':
+        proxy_mode = config.get('proxy', {}).get('mode', 'direct')
+        if proxy_mode != 'direct':
+            gates.append(manager.get_pause_gate(proxy_mode=proxy_mode))
+    return gates
@@ -0,0 +1,245 @@
+"""Health-scored pool of sticky Oxylabs residential sessions.
+
+Rotating residential mode gets a new exit IP for every request, so each page
+arrives from a "cold" IP that bot managers (Akamai, PerimeterX) have never
+seen pass a challenge. A ResidentialSessionPool keeps N sticky sessions
+(`sessid-` usernames) per retailer instead. Workers lease the healthiest idle
+session, report the outcome on release, and sessions that start getting
+blocked are retired and replaced with a fresh exit.
+
+A session's score combines its recent success rate, average latency and
+recent 403/429 responses. Sessions are retired after BLOCK_LIMIT consecutive
+blocks, when their success rate drops below RETIRE_SUCCESS_RATE, or when
+they reach MAX_AGE_SECONDS (before the provider rotates the exit itself).
+
+Usage:
+    pool = ResidentialSessionPool.for_retailer('lowes', size=8)
+    session = pool.lease()
+    try:
+        response = fetch(url, proxy=build_proxy_url(session.session_id))
+    finally:
+        pool.release(session, response.status_code if response else None, elapsed)
+
+ProxyClient does this automatically when the proxy config has
+`session_type: "pool"` (pool size from `session_pool_size`).
+"""
+
+import logging
+import threading
+import time
+import uuid
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Any, Callable, Deque, Dict, List, Optional
+
+from src.shared.constants import RESIDENTIAL_POOL
+
+
+__all__ = [
+    'ResidentialSessionPool',
+    'StickySession',
+]
+
+# Outcome codes kept in each session's recent window
+_OK = 'ok'
+_ERROR = 'error'
+_BLOCKED = 'blocked'
+
+
+def _new_session_id() -> str:
+    """Random sticky session ID (any alphanumeric string is accepted by Oxylabs)."""
+    return uuid.uuid4().hex[:16]
+
+
+@dataclass(eq=False)
+class StickySession:
+    """One sticky residential exit and its recent health.
+
+    Attributes:
+        session_id: Value sent as `sessid-{session_id}` in the proxy username
+        created_at: Clock time the session was created
+        outcomes: Recent outcome codes ('ok', 'error', 'blocked')
+        latency: Exponentially weighted average latency in seconds
+        requests: Requests completed through this session
+        leases: Requests currently in flight on this session
+        consecutive_blocks: 403/429 responses since the last non-blocked one
+    """
+
+    session_id: str
+    created_at: float
+    outcomes: Deque[str] = field(default_factory=lambda: deque(maxlen=RESIDENTIAL_POOL.WINDOW))
+    latency: float = 0.0
+    requests: int = 0
+    leases: int = 0
+    consecutive_blocks: int = 0
+
+    @property
+    def success_rate(self) -> float:
+        """Share of recent outcomes that succeeded (1.0 before any outcome)."""
+        if not self.outcomes:
+            return 1.0
+        return self.outcomes.count(_OK) / len(self.outcomes)
+
+    @property
+    def score(self) -> float:
+        """Health score in (0, 1]; higher is better.
+
+        The success rate is smoothed towards 0.5 so a fresh session ranks
+        below an exit with a proven record, discounted by latency and
+        divided by one plus the number of recent 403/429 responses.
+        """
+        successes = self.outcomes.count(_OK)
+        smoothed = (successes + 1) / (len(self.outcomes) + 2)
+        target = RESIDENTIAL_POOL.LATENCY_TARGET_SECONDS
+        latency_factor = target / (target + self.latency) if self.requests else 1.0
+        return smoothed * latency_factor / (1 + self.outcomes.count(_BLOCKED))
+
+
+class ResidentialSessionPool:
+    """Thread-safe pool of sticky residential sessions for one retailer.
+
+    Example:
+        pool = ResidentialSessionPool.for_retailer('costco')
+        session = pool.lease()
+        ...
+        pool.release(session, 200, elapsed=0.8)
+    """
+
+    _instances: Dict[str, 'ResidentialSessionPool'] = {}
+    _instances_lock = threading.Lock()
+
+    def __init__(
+        self,
+        retailer: Optional[str] = None,
+        size: int = RESIDENTIAL_POOL.SIZE,
+        max_age_seconds: float = RESIDENTIAL_POOL.MAX_AGE_SECONDS,
+        clock: Callable[[], float] = time.monotonic
+    ) -> None:
+        """Initialize the pool with `size` fresh sessions.
+
+        Args:
+            retailer: Retailer name (for logging)
+            size: Number of sticky sessions kept in the pool
+            max_age_seconds: Session lifetime before it is replaced
+            clock: Monotonic clock function (injectable for tests)
+        """
+        self.retailer = retailer or '__global__'
+        self.size = max(1, size)
+        self.max_age_seconds = max_age_seconds
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._sessions: List[StickySession] = [self._new_session() for _ in range(self.size)]
+        self.retired = 0
+
+    @classmethod
+    def for_retailer(cls, retailer: Optional[str], size: int = RESIDENTIAL_POOL.SIZE) -> 'ResidentialSessionPool':
+        """Get the process-wide session pool for a retailer.
+
+        Every ProxyClient of a retailer (one per worker session) shares one
+        pool, so warm sessions are reused across workers.
+
+        Args:
+            retailer: Retailer name (None for clients without a retailer)
+            size: Pool size, used when the pool is first created
+
+        Returns:
+            Shared ResidentialSessionPool for the retailer
+        """
+        key = retailer or '__global__'
+        with cls._instances_lock:
+            pool = cls._instances.get(key)
+            if pool is None:
+                pool = cls(retailer, size=size)
+                cls._instances[key] = pool
+            return pool
+
+    def _new_session(self) -> StickySession:
+        return StickySession(session_id=_new_session_id(), created_at=self._clock())
+
+    def _retire(self, session: StickySession, reason: str) -> None:
+        """Replace a session with a fresh one (caller holds the lock)."""
+        try:
+            index = self._sessions.index(session)
+        except ValueError:
+            return  # Already replaced while a lease was still in flight
+        self._sessions[index] = self._new_session()
+        self.retired += 1
+        logging.debug(
+            f"[{self.retailer}] Retired sticky session {session.session_id} ({reason}) "
+            f"after {session.requests} requests"
+        )
+
+    def _expired(self, session: StickySession) -> bool:
+        return self._clock() - session.created_at >= self.max_age_seconds
+
+    def _retire_reason(self, session: StickySession) -> Optional[str]:
+        """Why a session should be retired, or None if it is healthy."""
+        if session.consecutive_blocks >= RESIDENTIAL_POOL.BLOCK_LIMIT:
+            return f"{session.consecutive_blocks} consecutive blocks"
+        if (len(session.outcomes) >= RESIDENTIAL_POOL.MIN_OUTCOMES
+                and session.success_rate < RESIDENTIAL_POOL.RETIRE_SUCCESS_RATE):
+            return f"success rate {session.success_rate:.0%}"
+        if self._expired(session):
+            return "expired"
+        return None
+
+    def lease(self) -> StickySession:
+        """Lease the healthiest session, preferring ones with nothing in flight.
+
+        Idle sessions that have reached their maximum age are replaced first.
+
+        Returns:
+            StickySession to route one request through; pass it to release()
+        """
+        with self._lock:
+            for session in list(self._sessions):
+                if session.leases == 0 and self._expired(session):
+                    self._retire(session, "expired")
+            session = min(self._sessions, key=lambda s: (s.leases, -s.score))
+            session.leases += 1
+            return session
+
+    def release(self, session: StickySession, status_code: Optional[int], elapsed: float = 0.0) -> None:
+        """Record the outcome of a leased request and retire the session if it is poisoned.
+
+        403/429 responses count as blocks; 5xx and connection errors (None)
+        as errors; anything else (including 404) as a success.
+
+        Args:
+            session: Session returned by lease()
+            status_code: HTTP status, or None for a connection error/timeout
+            elapsed: Request latency in seconds
+        """
+        with self._lock:
+            session.leases = max(0, session.leases - 1)
+            session.requests += 1
+            if status_code in (403, 429):
+                session.outcomes.append(_BLOCKED)
+                session.consecutive_blocks += 1
+            else:
+                session.consecutive_blocks = 0
+                session.outcomes.append(_ERROR if status_code is None or status_code >= 500 else _OK)
+            if elapsed:
+                session.latency = elapsed if session.requests == 1 else 0.7 * session.latency + 0.3 * elapsed
+
+            reason = self._retire_reason(session)
+            if reason:
+                self._retire(session, reason)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get current pool state."""
+        with self._lock:
+            return {
+                'size': self.size,
+                'retired': self.retired,
+                'in_flight': sum(s.leases for s in self._sessions),
+                'sessions': [
+                    {
+                        'session_id': s.session_id,
+                        'score': round(s.score, 3),
+                        'success_rate': round(s.success_rate, 3),
+                        'requests': s.requests,
+                    }
+                    for s in sorted(self._sessions, key=lambda s: -s.score)
+                ],
+            }
@@ -120,6 +120,16 @@ class RunTracker:
             self.metadata["stats"][stat_name] = amount
         self._save()
 
+    def update_proxy_costs(self, costs: Dict[str, Any]) -> None:
+        """Record proxy usage for the run
+
+        Args:
+            costs: Summary from ProxyCostLedger.summary() (credits, bytes,
+                   rendered/plain calls, retries, latency, per-mode breakdown)
+        """
+        self.metadata["proxy_costs"] = costs
+        self._save()
+
     def update_phases(self, phases: Dict[str, Any]) -> None:
         """Update phase information
 
@@ -8,20 +8,29 @@ Addresses Issue #150: Reduce code duplication and regression risk by providing
 a single source of truth for scraper execution patterns.
 """
 
+import asyncio
 import json
 import logging
+import multiprocessing
+import os
 import threading
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import nullcontext
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, ThreadPoolExecutor, as_completed, wait
 from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
 from typing import Callable, Dict, Any, List, Optional, Tuple, Union
 
 from src.shared import utils
+from src.shared.async_http import AsyncProxyClient, async_get_with_retry
 from src.shared.cache import URLCache, RichURLCache
-from src.shared.constants import WORKERS
-from src.shared.request_counter import RequestCounter
-from src.shared.session_factory import create_session_factory
+from src.shared.checkpoint import CheckpointJournal
+from src.shared.concurrency import AdaptiveController, GlobalConcurrencyManager
+from src.shared.constants import CHECKPOINT, SCRAPER_API, WORKERS
+from src.shared.incremental import IncrementalState
+from src.shared.proxy_client import ProxyClient, ProxyConfig
+from src.shared.request_counter import RequestCounter, check_pause_logic, check_pause_logic_async
+from src.shared.session_factory import create_session_pool, release_session
 
 
 __all__ = [
@@ -30,6 +39,14 @@ __all__ = [
 ]
 
 
+def _parse_page(parse_func: Callable, text: str, item: Any, retailer: str) -> Optional[Dict[str, Any]]:
+    """Run parse_func in a parse worker process and return a picklable store dict."""
+    store_obj = parse_func(text, item, retailer)
+    if store_obj and hasattr(store_obj, 'to_dict'):
+        return store_obj.to_dict()
+    return store_obj or None
+
+
 @dataclass
 class ScraperContext:
     """Configuration and state for a scraper run.
@@ -42,6 +59,11 @@ class ScraperContext:
         limit: Maximum number of stores to process
         refresh_urls: Force URL re-discovery (ignore cache)
         use_rich_cache: Use RichURLCache instead of URLCache
+        store_sink: Optional callable that receives each store dict as soon
+            as it is extracted (e.g. StorePipeline.add for streaming exports)
+        incremental: Only fetch URLs whose sitemap <lastmod> changed since the
+            previous run; unchanged stores are carried forward from the
+            incremental state
     """
     retailer: str
     session: Any
@@ -50,6 +72,8 @@ class ScraperContext:
     limit: Optional[int] = None
     refresh_urls: bool = False
     use_rich_cache: bool = False
+    store_sink: Optional[Callable[[Dict[str, Any]], None]] = None
+    incremental: bool = False
 
 
 class ScrapeRunner:
@@ -57,11 +81,26 @@ class ScrapeRunner:
 
     Provides standardized:
     - URL caching (7-day cache to skip sitemap fetches)
-    - Checkpoint/resume (atomic saves with completed URL tracking)
-    - Parallel extraction (ThreadPoolExecutor with configurable workers)
+    - Checkpoint/resume (append-only journal of completed items, compacted
+      into an atomic snapshot periodically and at the end of the run)
+    - Parallel extraction (ThreadPoolExecutor with configurable workers and
+      one pooled keep-alive session per worker thread)
     - Progress logging (consistent reporting across scrapers)
     - Request tracking (rate limiting and pause logic)
-    - Validation (batch validation at end of run)
+    - Validation (batch validation at end of run, or per store by the
+      store_sink pipeline when streaming)
+    - Optional asyncio extraction (run_with_checkpoints_async) that
+      multiplexes many in-flight requests on one event loop
+    - Optional changed-only incremental runs (sitemap <lastmod> comparison,
+      unchanged stores carried forward instead of refetched)
+    - Optional bulk extraction through Web Scraper API push-pull batch jobs
+      (run_with_checkpoints_batch), with no thread blocked per request
+    - Optional process-pool parse stage (`parse_processes` in the retailer
+      config): worker threads (or the event loop) only fetch, and pages are
+      parsed in separate processes so parsing does not hold the GIL against
+      the fetchers
+    - Optional batched extraction (batch_extraction_func + batch_size) for
+      APIs that return many stores per request, e.g. aliased GraphQL queries
 
     Usage:
         context = ScraperContext(
@@ -104,6 +143,16 @@ class ScrapeRunner:
             else WORKERS.DIRECT_WORKERS
         )
         self.parallel_workers = self.config.get('parallel_workers', default_workers)
+        self.async_concurrency = self.config.get('async_concurrency', WORKERS.ASYNC_CONCURRENCY)
+        self.parse_processes = self._resolve_parse_processes(self.config.get('parse_processes', WORKERS.PARSE_PROCESSES))
+
+        # Optional AIMD tuning of workers and delays from 429/403/5xx feedback
+        self.adaptive: Optional[AdaptiveController] = None
+        adaptive_config = self.config.get('adaptive') or {}
+        if adaptive_config.get('enabled'):
+            self.adaptive = GlobalConcurrencyManager().enable_adaptive(
+                self.retailer, self.parallel_workers, adaptive_config
+            )
 
         # Checkpoint configuration
         self.checkpoint_path = f"data/{self.retailer}/checkpoints/scrape_progress.json"
@@ -113,6 +162,10 @@ class ScrapeRunner:
             if self.parallel_workers > 1
             else base_checkpoint_interval
         )
+        # Completed items are journaled (fsynced every checkpoint_interval records)
+        # and folded into the snapshot every checkpoint_compact_interval records
+        self.journal = CheckpointJournal(self.checkpoint_path, fsync_every=self.checkpoint_interval)
+        self.compact_interval = self.config.get('checkpoint_compact_interval', CHECKPOINT.COMPACT_EVERY)
 
         # Initialize state
         self.stores: List[Dict[str, Any]] = []
@@ -125,12 +178,32 @@ class ScrapeRunner:
         else:
             self.url_cache = URLCache(self.retailer)
 
+        # Changed-only incremental state (filled by discovery via lastmods=)
+        self.incremental: Optional[IncrementalState] = (
+            IncrementalState(self.retailer) if context.incremental else None
+        )
+
         logging.info(f"[{self.retailer}] Using delays: {self.min_delay:.1f}-{self.max_delay:.1f}s (mode: {self.proxy_mode})")
         logging.info(f"[{self.retailer}] Parallel workers: {self.parallel_workers}")
 
+    def _resolve_parse_processes(self, value: Any) -> int:
+        """Turn the `parse_processes` setting ('auto' or a count) into a process count."""
+        if value == 'auto':
+            return os.cpu_count() or 1
+        try:
+            return max(0, int(value or 0))
+        except (TypeError, ValueError):
+            logging.warning(f"[{self.retailer}] Invalid parse_processes {value!r}, parsing on worker threads")
+            return 0
+
     def _load_checkpoint(self) -> None:
-        """Load checkpoint if resume is enabled."""
+        """Load checkpoint snapshot and replay its journal if resume is enabled.
+
+        Without resume, any journal left by a previous run is discarded so it
+        cannot be replayed on top of this run's snapshot later.
+        """
         if not self.context.resume:
+            self.journal.truncate()
             return
 
         checkpoint = utils.load_checkpoint(self.checkpoint_path)
@@ -140,11 +213,56 @@ class ScrapeRunner:
             self.completed_items = set(
                 checkpoint.get('completed_urls', []) or checkpoint.get('completed_ids', [])
             )
-            logging.info(f"[{self.retailer}] Resuming from checkpoint: {len(self.stores)} stores already collected")
+
+        # Replay items completed since the last snapshot (skipping any already in it)
+        replayed = 0
+        for record in self.journal.read():
+            item_key = record.get('key')
+            if item_key is None or item_key in self.completed_items:
+                continue
+            self.completed_items.add(item_key)
+            if record.get('store') is not None:
+                self.stores.append(record['store'])
+            replayed += 1
+
+        if checkpoint or replayed:
+            logging.info(
+                f"[{self.retailer}] Resuming from checkpoint: {len(self.stores)} stores already collected "
+                f"({replayed} replayed from journal)"
+            )
             self.checkpoints_used = True
+            if self.context.store_sink:
+                for store in self.stores:
+                    self.context.store_sink(store)
+
+    def _add_store(self, item_key: Any, store_data: Dict[str, Any], compact: bool = True) -> None:
+        """Record a successfully extracted store, journal it and forward it to the store sink.
+
+        With compact=False the caller is responsible for calling
+        _compact_checkpoint() once _compaction_due() (the async path does so
+        off the event loop).
+        """
+        self.stores.append(store_data)
+        self.completed_items.add(item_key)
+        self.journal.append({'key': item_key, 'store': store_data})
+        if self.context.store_sink:
+            self.context.store_sink(store_data)
+
+        # Fold the journal into a fresh snapshot once it has grown large
+        if compact and self._compaction_due():
+            self._compact_checkpoint()
+
+    def _compaction_due(self) -> bool:
+        """Whether the journal has grown enough to fold into a snapshot."""
+        return self.journal.records >= self.compact_interval
+
+    def _compact_checkpoint(self) -> None:
+        """Fold the journal into a fresh snapshot."""
+        self._save_checkpoint()
+        logging.info(f"[{self.retailer}] Checkpoint compacted: {len(self.stores)} stores processed")
 
     def _save_checkpoint(self) -> None:
-        """Save current progress to checkpoint."""
+        """Save a full progress snapshot and truncate the journal it supersedes."""
         utils.save_checkpoint({
             'completed_count': len(self.stores),
             'completed_urls': list(self.completed_items),  # Keep 'completed_urls' for backward compatibility
@@ -152,6 +270,7 @@ class ScrapeRunner:
             'stores': self.stores,
             'last_updated': datetime.now().isoformat()
         }, self.checkpoint_path)
+        self.journal.truncate()
 
     def _load_or_discover_urls(
         self,
@@ -160,6 +279,9 @@ class ScrapeRunner:
     ) -> List[Any]:
         """Load URLs from cache or discover them.
 
+        Incremental runs always rediscover (the sitemap fetch is a conditional
+        GET) so that fresh <lastmod> dates are collected.
+
         Args:
             discovery_func: Function to discover URLs (sitemap fetch, etc.)
             **discovery_kwargs: Additional kwargs to pass to discovery function
@@ -169,7 +291,9 @@ class ScrapeRunner:
         """
         urls = None
 
-        if not self.context.refresh_urls:
+        if self.incremental is not None:
+            discovery_kwargs['lastmods'] = self.incremental.lastmods
+        elif not self.context.refresh_urls:
             if isinstance(self.url_cache, RichURLCache):
                 urls = self.url_cache.get_rich()
             else:
@@ -215,8 +339,6 @@ class ScrapeRunner:
         Returns:
             List of extracted store dictionaries
         """
-        session_factory = create_session_factory(self.config)
-
         # Thread-safe counters
         processed_count = [0]
         successful_count = [0]
@@ -225,58 +347,49 @@ class ScrapeRunner:
 
         total_to_process = len(items)
 
-        with ThreadPoolExecutor(max_workers=self.parallel_workers) as executor:
-            # Submit all extraction tasks
-            futures = {
-                executor.submit(
-                    self._extract_single_item,
-                    item,
-                    session_factory,
-                    extraction_func,
-                    item_key_func,
-                    **extraction_kwargs
-                ): item
-                for item in items
-            }
-
-            for future in as_completed(futures):
-                item_key, store_data = future.result()
-
-                with processed_lock:
-                    processed_count[0] += 1
-                    current_count = processed_count[0]
-
-                    if store_data:
-                        self.stores.append(store_data)
-                        self.completed_items.add(item_key)
-                        successful_count[0] += 1
-                    else:
-                        failed_items.append(item_key)
-
-                    # Progress logging every 50 items
-                    if current_count % 50 == 0:
-                        success_rate = (successful_count[0] / current_count * 100) if current_count > 0 else 0
-                        logging.info(
-                            f"[{self.retailer}] Progress: {current_count}/{total_to_process} "
-                            f"({current_count/total_to_process*100:.1f}%) - "
-                            f"{successful_count[0]} stores extracted ({success_rate:.0f}% success)"
-                        )
-
-                    # Checkpoint at intervals
-                    if current_count % self.checkpoint_interval == 0:
-                        self._save_checkpoint()
-                        logging.info(f"[{self.retailer}] Checkpoint saved: {len(self.stores)} stores processed")
-
-        # Log failed extractions
-        if failed_items:
-            logging.warning(f"[{self.retailer}] Failed to extract {len(failed_items)} items:")
-            for failed_item in failed_items[:10]:
-                logging.warning(f"[{self.retailer}]   - {failed_item}")
-            if len(failed_items) > 10:
-                logging.warning(f"[{self.retailer}]   ... and {len(failed_items) - 10} more")
-
-            # Save failed items to file
-            self._save_failed_items(failed_items)
+        # With adaptive mode the pool is sized to the ceiling and
+        # _extract_single_item gates on the controller's current limit
+        max_workers = self.adaptive.max_workers if self.adaptive else self.parallel_workers
+
+        # One warm session per worker thread, closed once the executor drains
+        with create_session_pool(self.config) as session_pool:
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                # Submit all extraction tasks
+                futures = {
+                    executor.submit(
+                        self._extract_single_item,
+                        item,
+                        session_pool,
+                        extraction_func,
+                        item_key_func,
+                        **extraction_kwargs
+                    ): item
+                    for item in items
+                }
+
+                for future in as_completed(futures):
+                    item_key, store_data = future.result()
+
+                    with processed_lock:
+                        processed_count[0] += 1
+                        current_count = processed_count[0]
+
+                        if store_data:
+                            self._add_store(item_key, store_data)
+                            successful_count[0] += 1
+                        else:
+                            failed_items.append(item_key)
+
+                        # Progress logging every 50 items
+                        if current_count % 50 == 0:
+                            success_rate = (successful_count[0] / current_count * 100) if current_count > 0 else 0
+                            logging.info(
+                                f"[{self.retailer}] Progress: {current_count}/{total_to_process} "
+                                f"({current_count/total_to_process*100:.1f}%) - "
+                                f"{successful_count[0]} stores extracted ({success_rate:.0f}% success)"
+                            )
+
+        self._report_failed_items(failed_items)
 
         return self.stores
 
@@ -290,9 +403,12 @@ class ScrapeRunner:
     ) -> Tuple[Any, Optional[Dict[str, Any]]]:
         """Worker function for parallel extraction.
 
+        Holds an AdaptiveController slot for the duration of the work when
+        adaptive mode is enabled.
+
         Args:
             item: Item to extract (URL or info dict)
-            session_factory: Factory to create new session instances
+            session_factory: Session factory or SessionPool providing the worker's session
             extraction_func: Function to extract store details
             item_key_func: Function to extract unique key from item
             **extraction_kwargs: Additional kwargs to pass to extraction function
@@ -306,14 +422,15 @@ class ScrapeRunner:
             # Extract key inside try block to catch key extraction errors
             item_key = item_key_func(item)
 
-            store_obj = extraction_func(
-                session,
-                item,
-                self.retailer,
-                yaml_config=self.config,
-                request_counter=self.request_counter,
-                **extraction_kwargs
-            )
+            with self.adaptive.slot() if self.adaptive else nullcontext():
+                store_obj = extraction_func(
+                    session,
+                    item,
+                    self.retailer,
+                    yaml_config=self.config,
+                    request_counter=self.request_counter,
+                    **extraction_kwargs
+                )
             if store_obj:
                 # Handle both dataclass objects and dicts
                 if hasattr(store_obj, 'to_dict'):
@@ -329,8 +446,143 @@ class ScrapeRunner:
             logging.warning(f"[{self.retailer}] Error extracting {item_key}: {e}")
             return (item_key, None)
         finally:
-            if hasattr(session, 'close'):
-                session.close()
+            release_session(session_factory, session)
+
+    def _fetch_page(
+        self,
+        item: Any,
+        session_factory: Callable,
+        item_key_func: Callable[[Any], Any],
+        item_url_func: Callable[[Any], str],
+    ) -> Tuple[Any, Any, Optional[str]]:
+        """Fetch stage of the pipelined extraction: download one page, no parsing.
+
+        Args:
+            item: Item to fetch (URL or info dict)
+            session_factory: Session factory or SessionPool providing the worker's session
+            item_key_func: Function to extract unique key from item
+            item_url_func: Function that returns the URL to fetch for item
+
+        Returns:
+            Tuple of (item_key, item, page_text) where page_text is None on failure
+        """
+        session = session_factory()
+
+        try:
+            item_key = item_key_func(item)
+
+            with self.adaptive.slot() if self.adaptive else nullcontext():
+                response = utils.get_with_retry(session, item_url_func(item))
+            if not response:
+                logging.warning(f"[{self.retailer}] Failed to fetch {item_key}")
+                return (item_key, item, None)
+
+            current_count = self.request_counter.increment()
+            check_pause_logic(
+                self.request_counter,
+                retailer=self.retailer,
+                config=self.config,
+                current_count=current_count,
+            )
+            return (item_key, item, response.text)
+        except Exception as e:
+            # Safe fallback for item_key if extraction failed before key was set
+            try:
+                item_key = item_key_func(item)
+            except Exception:
+                item_key = str(item)
+            logging.warning(f"[{self.retailer}] Error fetching {item_key}: {e}")
+            return (item_key, item, None)
+        finally:
+            release_session(session_factory, session)
+
+    def _extract_items_pipelined(
+        self,
+        items: List[Any],
+        parse_func: Callable,
+        item_key_func: Callable[[Any], Any],
+        item_url_func: Callable[[Any], str],
+    ) -> List[Dict[str, Any]]:
+        """Extract items with separate fetch threads and parse processes.
+
+        Worker threads only download pages; each body is handed to a
+        ProcessPoolExecutor running parse_func, so CPU-bound parsing runs on
+        all cores instead of holding the GIL against the fetching threads.
+        Progress logging and checkpointing match the thread-pool path.
+
+        Parse processes are started with the 'spawn' method (forking a process
+        with running fetch threads can deadlock), so parse_func must be a
+        module-level function and items must be picklable.
+
+        Args:
+            items: List of items to process (URLs or info dicts)
+            parse_func: Function that turns a page body into store data
+            item_key_func: Function to extract unique key from item
+            item_url_func: Function that returns the URL to fetch for item
+
+        Returns:
+            List of extracted store dictionaries
+        """
+        processed_count = 0
+        successful_count = 0
+        failed_items = []
+        total_to_process = len(items)
+        max_workers = self.adaptive.max_workers if self.adaptive else self.parallel_workers
+
+        def record(item_key: Any, store_data: Optional[Dict[str, Any]]) -> None:
+            nonlocal processed_count, successful_count
+            processed_count += 1
+            if store_data:
+                self._add_store(item_key, store_data)
+                successful_count += 1
+            else:
+                failed_items.append(item_key)
+
+            # Progress logging every 50 items
+            if processed_count % 50 == 0:
+                success_rate = successful_count / processed_count * 100
+                logging.info(
+                    f"[{self.retailer}] Progress: {processed_count}/{total_to_process} "
+                    f"({processed_count/total_to_process*100:.1f}%) - "
+                    f"{successful_count} stores extracted ({success_rate:.0f}% success)"
+                )
+
+        with create_session_pool(self.config) as session_pool, \
+                ProcessPoolExecutor(
+                    max_workers=self.parse_processes,
+                    mp_context=multiprocessing.get_context('spawn')
+                ) as parse_pool, \
+                ThreadPoolExecutor(max_workers=max(1, max_workers)) as fetch_pool:
+            pending = {
+                fetch_pool.submit(self._fetch_page, item, session_pool, item_key_func, item_url_func)
+                for item in items
+            }
+            parsing: Dict[Future, Any] = {}
+
+            while pending:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    if future in parsing:
+                        item_key = parsing.pop(future)
+                        try:
+                            store_data = future.result()
+                        except Exception as e:
+                            logging.warning(f"[{self.retailer}] Error extracting {item_key}: {e}")
+                            store_data = None
+                        record(item_key, store_data)
+                        continue
+
+                    item_key, item, text = future.result()
+                    if not text:
+                        record(item_key, None)
+                        continue
+                    parse_future = parse_pool.submit(_parse_page, parse_func, text, item, self.retailer)
+                    parsing[parse_future] = item_key
+                    pending.add(parse_future)
+
+        self._report_failed_items(failed_items)
+
+        return self.stores
 
     def _extract_item_sequential(
         self,
@@ -370,10 +622,8 @@ class ScrapeRunner:
                 if store_obj:
                     # Handle both dataclass objects and dicts
                     if hasattr(store_obj, 'to_dict'):
-                        self.stores.append(store_obj.to_dict())
-                    else:
-                        self.stores.append(store_obj)
-                    self.completed_items.add(item_key)
+                        store_obj = store_obj.to_dict()
+                    self._add_store(item_key, store_obj)
 
                     # Log successful extraction every 10 stores
                     if i % 10 == 0:
@@ -393,23 +643,109 @@ class ScrapeRunner:
             if i % 100 == 0:
                 logging.info(f"[{self.retailer}] Progress: {i}/{total_to_process} ({i/total_to_process*100:.1f}%)")
 
-            if i % self.checkpoint_interval == 0:
-                self._save_checkpoint()
-                logging.info(f"[{self.retailer}] Checkpoint saved: {len(self.stores)} stores processed")
+        self._report_failed_items(failed_items)
+
+        return self.stores
+
+    def _extract_item_batches(
+        self,
+        items: List[Any],
+        batch_extraction_func: Callable,
+        item_key_func: Callable[[Any], Any],
+        batch_size: int,
+        **extraction_kwargs
+    ) -> List[Dict[str, Any]]:
+        """Extract items in chunks, one batch_extraction_func call per chunk.
+
+        Chunks run on up to parallel_workers threads; results are recorded
+        per item, so checkpoints and resume work exactly as in the per-item
+        paths.
+
+        Args:
+            items: List of items to process
+            batch_extraction_func: Function extracting a list of items at once,
+                returning results aligned with its input (None = failed)
+            item_key_func: Function to extract unique key from item
+            batch_size: Items per batch_extraction_func call
+            **extraction_kwargs: Additional kwargs to pass to the batch function
+
+        Returns:
+            List of extracted store dictionaries
+        """
+        chunks = [items[i:i + batch_size] for i in range(0, len(items), batch_size)]
+        failed_items = []
+        processed = 0
 
-        # Log failed extractions
-        if failed_items:
-            logging.warning(f"[{self.retailer}] Failed to extract {len(failed_items)} items:")
-            for failed_item in failed_items[:10]:
-                logging.warning(f"[{self.retailer}]   - {failed_item}")
-            if len(failed_items) > 10:
-                logging.warning(f"[{self.retailer}]   ... and {len(failed_items) - 10} more")
+        def extract_chunk(chunk: List[Any], session_factory: Callable) -> List[Tuple[Any, Any]]:
+            session = session_factory()
+            try:
+                with self.adaptive.slot() if self.adaptive else nullcontext():
+                    results = batch_extraction_func(
+                        session,
+                        chunk,
+                        self.retailer,
+                        yaml_config=self.config,
+                        request_counter=self.request_counter,
+                        **extraction_kwargs
+                    )
+            except Exception as e:
+                logging.warning(f"[{self.retailer}] Error extracting batch of {len(chunk)}: {e}")
+                results = []
+            finally:
+                release_session(session_factory, session)
+            results = list(results or [])
+            results += [None] * (len(chunk) - len(results))
+            return list(zip(chunk, results))
+
+        workers = max(1, min(self.parallel_workers, len(chunks)))
+        logging.info(
+            f"[{self.retailer}] Extracting {len(items)} items in {len(chunks)} batches "
+            f"of up to {batch_size} ({workers} workers)"
+        )
 
-            # Save failed items to file
-            self._save_failed_items(failed_items)
+        with create_session_pool(self.config) as session_pool:
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                futures = [executor.submit(extract_chunk, chunk, session_pool) for chunk in chunks]
+                for future in as_completed(futures):
+                    for item, store_obj in future.result():
+                        processed += 1
+                        try:
+                            item_key = item_key_func(item)
+                        except Exception:
+                            item_key = str(item)
+                        if store_obj:
+                            if hasattr(store_obj, 'to_dict'):
+                                store_obj = store_obj.to_dict()
+                            self._add_store(item_key, store_obj)
+                        else:
+                            failed_items.append(item_key)
+                    logging.info(
+                        f"[{self.retailer}] Progress: {processed}/{len(items)} "
+                        f"({processed/len(items)*100:.1f}%) - {len(self.stores)} stores extracted"
+                    )
+
+        self._report_failed_items(failed_items)
 
         return self.stores
 
+    def _report_failed_items(self, failed_items: List[Any]) -> None:
+        """Log a sample of failed items and save the full list for followup.
+
+        Args:
+            failed_items: List of items that failed extraction
+        """
+        if not failed_items:
+            return
+
+        logging.warning(f"[{self.retailer}] Failed to extract {len(failed_items)} items:")
+        for failed_item in failed_items[:10]:
+            logging.warning(f"[{self.retailer}]   - {failed_item}")
+        if len(failed_items) > 10:
+            logging.warning(f"[{self.retailer}]   ... and {len(failed_items) - 10} more")
+
+        # Save failed items to file
+        self._save_failed_items(failed_items)
+
     def _save_failed_items(self, failed_items: List[Any]) -> None:
         """Save failed items for followup.
 
@@ -430,11 +766,131 @@ class ScrapeRunner:
         except (IOError, OSError) as e:
             logging.warning(f"[{self.retailer}] Failed to save failed items: {e}")
 
+    def _resolve_item_key_func(
+        self,
+        item_key_func: Optional[Callable[[Any], Any]]
+    ) -> Callable[[Any], Any]:
+        """Return item_key_func, or a default suited to the configured URL cache."""
+        if item_key_func is not None:
+            return item_key_func
+
+        if self.context.use_rich_cache:
+            # RichURLCache returns dicts, need a smarter default
+            # Try common ID fields, fall back to URL
+            return lambda x: (
+                x.get('store_id') or x.get('id') or x.get('url') or str(x)
+                if isinstance(x, dict) else x
+            )
+
+        # URLCache returns strings, use as-is
+        return lambda x: x
+
+    def _select_remaining_items(
+        self,
+        items: List[Any],
+        item_key_func: Callable[[Any], Any]
+    ) -> List[Any]:
+        """Drop checkpointed items and apply the run limit.
+
+        Args:
+            items: All discovered items
+            item_key_func: Function to extract unique key from item
+
+        Returns:
+            Items still to be extracted in this run
+        """
+        # Filter out already-completed items
+        remaining_items = [item for item in items if item_key_func(item) not in self.completed_items]
+
+        if self.context.resume and self.completed_items:
+            logging.info(
+                f"[{self.retailer}] Skipping {len(items) - len(remaining_items)} "
+                f"already-processed items from checkpoint"
+            )
+
+        # Apply limit if specified
+        if self.context.limit:
+            logging.info(f"[{self.retailer}] Limited to {self.context.limit} stores")
+            total_needed = self.context.limit - len(self.stores)
+            if total_needed > 0:
+                remaining_items = remaining_items[:total_needed]
+            else:
+                remaining_items = []
+
+        if remaining_items:
+            logging.info(f"[{self.retailer}] Extracting details for {len(remaining_items)} items")
+        else:
+            logging.info(f"[{self.retailer}] No new items to process")
+
+        return remaining_items
+
+    def _plan_incremental(
+        self,
+        items: List[Any],
+        item_key_func: Callable[[Any], Any],
+        item_url_func: Callable[[Any], str]
+    ) -> Tuple[List[Any], List[Tuple[Any, Dict[str, Any]]]]:
+        """Split items into changed ones and unchanged stores to carry forward.
+
+        Args:
+            items: All discovered items
+            item_key_func: Function to extract unique key from item
+            item_url_func: Function that returns the store URL for item
+
+        Returns:
+            Tuple of (items to extract, list of (item, previous store dict))
+        """
+        if self.incremental is None:
+            return items, []
+        completed_urls = {
+            item_url_func(item) for item in items if item_key_func(item) in self.completed_items
+        }
+        return self.incremental.plan(items, item_url_func, completed=completed_urls)
+
+    def _carry_forward(
+        self,
+        carried: List[Tuple[Any, Dict[str, Any]]],
+        item_key_func: Callable[[Any], Any]
+    ) -> None:
+        """Add unchanged stores from the previous run as completed items."""
+        for item, store in carried:
+            self._add_store(item_key_func(item), store)
+
+    def _finalize_run(self) -> Dict[str, Any]:
+        """Save the final checkpoint, validate stores and build the run result."""
+        # Final checkpoint save (compacts the journal)
+        if self.stores:
+            self._save_checkpoint()
+            logging.info(f"[{self.retailer}] Final checkpoint saved: {len(self.stores)} stores total")
+
+        # Validate store data (a streaming store_sink validates as stores arrive)
+        if not self.context.store_sink:
+            validation_summary = utils.validate_stores_batch(self.stores)
+            logging.info(
+                f"[{self.retailer}] Validation: {validation_summary['valid']}/{validation_summary['total']} valid, "
+                f"{validation_summary['warning_count']} warnings"
+            )
+
+        logging.info(f"[{self.retailer}] Completed: {len(self.stores)} stores successfully scraped")
+
+        if self.incremental is not None:
+            self.incremental.save(self.stores)
+
+        return {
+            'stores': self.stores,
+            'count': len(self.stores),
+            'checkpoints_used': self.checkpoints_used
+        }
+
     def run_with_checkpoints(
         self,
         url_discovery_func: Callable,
         extraction_func: Callable,
         item_key_func: Optional[Callable[[Any], Any]] = None,
+        parse_func: Optional[Callable] = None,
+        item_url_func: Optional[Callable[[Any], str]] = None,
+        batch_extraction_func: Optional[Callable] = None,
+        batch_size: int = 1,
         **kwargs
     ) -> Dict[str, Any]:
         """Run scraper with unified orchestration.
@@ -452,6 +908,16 @@ class ScrapeRunner:
             extraction_func: Function to extract single store details
                 Signature: func(session, item, retailer, yaml_config, request_counter, **kwargs) -> Optional[StoreData]
             item_key_func: Optional function to extract unique key from item (defaults to identity)
+            parse_func: Optional module-level function building store data from a
+                fetched page, used instead of extraction_func when the retailer sets
+                `parse_processes` (Signature: func(text, item, retailer) -> Optional[StoreData])
+            item_url_func: Optional function returning the URL to fetch for an item
+                in the parse-process path (defaults to item_key_func)
+            batch_extraction_func: Optional function extracting many items per call,
+                used instead of extraction_func when batch_size > 1
+                (Signature: func(session, items, retailer, yaml_config, request_counter,
+                **kwargs) -> List[Optional[StoreData]] aligned with items)
+            batch_size: Items per batch_extraction_func call
             **kwargs: Additional kwargs to pass to discovery and extraction functions
 
         Returns:
@@ -463,18 +929,7 @@ class ScrapeRunner:
         logging.info(f"[{self.retailer}] Starting scrape run")
 
         try:
-            # Default item key function: use item as-is (for URL strings)
-            if item_key_func is None:
-                if self.context.use_rich_cache:
-                    # RichURLCache returns dicts, need a smarter default
-                    # Try common ID fields, fall back to URL
-                    item_key_func = lambda x: (
-                        x.get('store_id') or x.get('id') or x.get('url') or str(x)
-                        if isinstance(x, dict) else x
-                    )
-                else:
-                    # URLCache returns strings, use as-is
-                    item_key_func = lambda x: x
+            item_key_func = self._resolve_item_key_func(item_key_func)
 
             # Load checkpoint if resuming
             self._load_checkpoint()
@@ -486,57 +941,439 @@ class ScrapeRunner:
                 logging.warning(f"[{self.retailer}] No items found")
                 return {'stores': [], 'count': 0, 'checkpoints_used': False}
 
-            # Filter out already-completed items
-            remaining_items = [item for item in items if item_key_func(item) not in self.completed_items]
+            items, carried = self._plan_incremental(items, item_key_func, item_key_func)
+            remaining_items = self._select_remaining_items(items, item_key_func)
+            self._carry_forward(carried, item_key_func)
+            total_to_process = len(remaining_items)
 
-            if self.context.resume and self.completed_items:
+            # Extract items (batched, fetch threads + parse processes, parallel or sequential)
+            if batch_extraction_func is not None and batch_size > 1 and total_to_process > 0:
+                self._extract_item_batches(
+                    remaining_items, batch_extraction_func, item_key_func, batch_size, **kwargs
+                )
+            elif parse_func is not None and self.parse_processes > 0 and total_to_process > 0:
                 logging.info(
-                    f"[{self.retailer}] Skipping {len(items) - len(remaining_items)} "
-                    f"already-processed items from checkpoint"
+                    f"[{self.retailer}] Using {self.parallel_workers} fetch workers "
+                    f"and {self.parse_processes} parse processes"
                 )
-
-            # Apply limit if specified
-            if self.context.limit:
-                logging.info(f"[{self.retailer}] Limited to {self.context.limit} stores")
-                total_needed = self.context.limit - len(self.stores)
-                if total_needed > 0:
-                    remaining_items = remaining_items[:total_needed]
-                else:
-                    remaining_items = []
-
-            total_to_process = len(remaining_items)
-            if total_to_process > 0:
-                logging.info(f"[{self.retailer}] Extracting details for {total_to_process} items")
-            else:
-                logging.info(f"[{self.retailer}] No new items to process")
-
-            # Extract items (parallel or sequential)
-            if self.parallel_workers > 1 and total_to_process > 0:
+                self._extract_items_pipelined(
+                    remaining_items, parse_func, item_key_func, item_url_func or item_key_func
+                )
+            elif self.parallel_workers > 1 and total_to_process > 0:
                 logging.info(f"[{self.retailer}] Using parallel extraction with {self.parallel_workers} workers")
                 self._extract_item_parallel(remaining_items, extraction_func, item_key_func, **kwargs)
             elif total_to_process > 0:
                 self._extract_item_sequential(remaining_items, extraction_func, item_key_func, **kwargs)
 
-            # Final checkpoint save
-            if self.stores:
-                self._save_checkpoint()
-                logging.info(f"[{self.retailer}] Final checkpoint saved: {len(self.stores)} stores total")
+            return self._finalize_run()
 
-            # Validate store data
-            validation_summary = utils.validate_stores_batch(self.stores)
-            logging.info(
-                f"[{self.retailer}] Validation: {validation_summary['valid']}/{validation_summary['total']} valid, "
-                f"{validation_summary['warning_count']} warnings"
+        except Exception as e:
+            logging.error(f"[{self.retailer}] Fatal error: {e}", exc_info=True)
+            raise
+        finally:
+            # Make journaled progress durable even on Ctrl-C or a fatal error
+            self.journal.close()
+
+    async def _extract_single_item_async(
+        self,
+        client: AsyncProxyClient,
+        item: Any,
+        parse_func: Callable,
+        item_key_func: Callable[[Any], Any],
+        item_url_func: Callable[[Any], str],
+        parse_pool: Optional[ProcessPoolExecutor] = None,
+    ) -> Tuple[Any, Optional[Dict[str, Any]]]:
+        """Fetch a single item on the event loop and parse it off the loop.
+
+        Args:
+            client: Shared AsyncProxyClient for this run
+            item: Item to extract (URL or info dict)
+            parse_func: Function that turns a response body into store data
+            item_key_func: Function to extract unique key from item
+            item_url_func: Function that returns the URL to fetch for item
+            parse_pool: Parse processes to use instead of a worker thread
+
+        Returns:
+            Tuple of (item_key, store_data_dict) where store_data_dict is None on failure
+        """
+        try:
+            item_key = item_key_func(item)
+
+            response = await async_get_with_retry(
+                client,
+                item_url_func(item),
+                min_delay=self.min_delay,
+                max_delay=self.max_delay,
+            )
+            if response is None:
+                return (item_key, None)
+
+            current_count = self.request_counter.increment()
+            await check_pause_logic_async(
+                self.request_counter,
+                retailer=self.retailer,
+                config=self.config,
+                current_count=current_count,
             )
 
-            logging.info(f"[{self.retailer}] Completed: {len(self.stores)} stores successfully scraped")
+            # Parsing is CPU-bound, so it must not stall the other requests in flight
+            if parse_pool is not None:
+                store_obj = await asyncio.get_running_loop().run_in_executor(
+                    parse_pool, _parse_page, parse_func, response.text, item, self.retailer
+                )
+            else:
+                store_obj = await asyncio.to_thread(parse_func, response.text, item, self.retailer)
+            if store_obj:
+                # Handle both dataclass objects and dicts
+                if hasattr(store_obj, 'to_dict'):
+                    return (item_key, store_obj.to_dict())
+                return (item_key, store_obj)
+            return (item_key, None)
+        except Exception as e:
+            # Safe fallback for item_key if extraction failed before key was set
+            try:
+                item_key = item_key_func(item)
+            except Exception:
+                item_key = str(item)
+            logging.warning(f"[{self.retailer}] Error extracting {item_key}: {e}")
+            return (item_key, None)
 
-            return {
-                'stores': self.stores,
-                'count': len(self.stores),
-                'checkpoints_used': self.checkpoints_used
-            }
+    async def _extract_items_async(
+        self,
+        items: List[Any],
+        parse_func: Callable,
+        item_key_func: Callable[[Any], Any],
+        item_url_func: Callable[[Any], str],
+    ) -> List[Dict[str, Any]]:
+        """Extract items concurrently on the running event loop.
+
+        Up to async_concurrency requests are in flight at once; all of them
+        share one AsyncProxyClient connection pool. Pages are parsed in worker
+        threads, or in parse_processes worker processes when configured (then
+        parse_func must be a module-level function, as in the threaded
+        pipeline). Progress logging and checkpointing match the thread-pool
+        path.
+
+        Args:
+            items: List of items to process (URLs or info dicts)
+            parse_func: Function that turns a response body into store data
+            item_key_func: Function to extract unique key from item
+            item_url_func: Function that returns the URL to fetch for item
+
+        Returns:
+            List of extracted store dictionaries
+        """
+        processed_count = 0
+        successful_count = 0
+        failed_items = []
+        total_to_process = len(items)
+        semaphore = asyncio.Semaphore(self.async_concurrency)
+        proxy_config = ProxyConfig.from_dict(self.config.get('proxy', {}))
+        if self.proxy_mode == 'tiered':
+            logging.warning(
+                f"[{self.retailer}] The async engine does not escalate between proxy tiers, "
+                f"using direct requests (run the threaded engine for tiered mode)"
+            )
+
+        parse_pool = None
+        if self.parse_processes > 0:
+            logging.info(f"[{self.retailer}] Parsing pages in {self.parse_processes} parse processes")
+            parse_pool = ProcessPoolExecutor(
+                max_workers=self.parse_processes,
+                mp_context=multiprocessing.get_context('spawn')
+            )
+
+        try:
+            async with AsyncProxyClient(
+                proxy_config, concurrency=self.async_concurrency, retailer=self.retailer
+            ) as client:
+                async def bounded(item: Any) -> Tuple[Any, Optional[Dict[str, Any]]]:
+                    async with semaphore:
+                        return await self._extract_single_item_async(
+                            client, item, parse_func, item_key_func, item_url_func, parse_pool
+                        )
+
+                tasks = [asyncio.ensure_future(bounded(item)) for item in items]
+                try:
+                    for next_done in asyncio.as_completed(tasks):
+                        item_key, store_data = await next_done
+                        processed_count += 1
+
+                        if store_data:
+                            self._add_store(item_key, store_data, compact=False)
+                            successful_count += 1
+                            if self._compaction_due():
+                                # No store is added while this runs: only this loop adds them
+                                await asyncio.to_thread(self._compact_checkpoint)
+                        else:
+                            failed_items.append(item_key)
+
+                        # Progress logging every 50 items
+                        if processed_count % 50 == 0:
+                            success_rate = successful_count / processed_count * 100
+                            logging.info(
+                                f"[{self.retailer}] Progress: {processed_count}/{total_to_process} "
+                                f"({processed_count/total_to_process*100:.1f}%) - "
+                                f"{successful_count} stores extracted ({success_rate:.0f}% success)"
+                            )
+                finally:
+                    for task in tasks:
+                        task.cancel()
+        finally:
+            if parse_pool is not None:
+                parse_pool.shutdown(wait=False, cancel_futures=True)
+
+        self._report_failed_items(failed_items)
+
+        return self.stores
+
+    async def run_with_checkpoints_async(
+        self,
+        url_discovery_func: Callable,
+        parse_func: Callable,
+        item_key_func: Optional[Callable[[Any], Any]] = None,
+        item_url_func: Optional[Callable[[Any], str]] = None,
+        **kwargs
+    ) -> Dict[str, Any]:
+        """Asyncio variant of run_with_checkpoints().
+
+        Discovery still runs the synchronous url_discovery_func (in a worker
+        thread so the loop stays responsive); extraction is split into a
+        non-blocking fetch via AsyncProxyClient and a synchronous parse_func
+        run in a worker thread (or in parse processes when the retailer sets
+        `parse_processes`). Checkpoint loads and saves also run in worker
+        threads.
+
+        Args:
+            url_discovery_func: Function to discover URLs (same signature as run_with_checkpoints)
+            parse_func: Function to build store data from a fetched page; must be
+                module-level when the retailer sets `parse_processes`
+                Signature: func(text, item, retailer) -> Optional[StoreData]
+            item_key_func: Optional function to extract unique key from item (defaults to identity)
+            item_url_func: Optional function returning the URL to fetch for an item
+                (defaults to item_key_func)
+            **kwargs: Additional kwargs to pass to the discovery function
+
+        Returns:
+            dict with keys:
+                - stores: List[dict] - Scraped store data
+                - count: int - Number of stores processed
+                - checkpoints_used: bool - Whether resume was used
+        """
+        logging.info(f"[{self.retailer}] Starting async scrape run")
+
+        try:
+            item_key_func = self._resolve_item_key_func(item_key_func)
+            item_url_func = item_url_func or item_key_func
+
+            await asyncio.to_thread(self._load_checkpoint)
+
+            items = await asyncio.to_thread(self._load_or_discover_urls, url_discovery_func, **kwargs)
+
+            if not items:
+                logging.warning(f"[{self.retailer}] No items found")
+                return {'stores': [], 'count': 0, 'checkpoints_used': False}
+
+            items, carried = await asyncio.to_thread(self._plan_incremental, items, item_key_func, item_url_func)
+            remaining_items = self._select_remaining_items(items, item_key_func)
+            await asyncio.to_thread(self._carry_forward, carried, item_key_func)
+
+            if remaining_items:
+                logging.info(f"[{self.retailer}] Using async extraction with concurrency {self.async_concurrency}")
+                await self._extract_items_async(remaining_items, parse_func, item_key_func, item_url_func)
+
+            return await asyncio.to_thread(self._finalize_run)
 
         except Exception as e:
             logging.error(f"[{self.retailer}] Fatal error: {e}", exc_info=True)
             raise
+        finally:
+            # Make journaled progress durable even on Ctrl-C or a fatal error
+            self.journal.close()
+
+    def _extract_items_batch(
+        self,
+        items: List[Any],
+        parse_func: Callable,
+        item_key_func: Callable[[Any], Any],
+        item_url_func: Callable[[Any], str],
+        client: ProxyClient,
+        cached_page_func: Optional[Callable[[str], Optional[str]]] = None,
+        cache_page_func: Optional[Callable[[str, str], None]] = None,
+    ) -> List[Dict[str, Any]]:
+        """Extract items from cached pages and Web Scraper API batch jobs.
+
+        Items with a cached page are parsed first; the rest are submitted via
+        client.get_batch() and parsed as their jobs complete. Progress logging
+        and checkpointing match the thread-pool path.
+
+        Args:
+            items: List of items to process (URLs or info dicts)
+            parse_func: Function that turns a page body into store data
+            item_key_func: Function to extract unique key from item
+            item_url_func: Function that returns the URL to fetch for item
+            client: ProxyClient in web_scraper_api mode
+            cached_page_func: Optional lookup returning a cached page for a URL
+            cache_page_func: Optional callback storing a fetched page for a URL
+
+        Returns:
+            List of extracted store dictionaries
+        """
+        processed_count = 0
+        successful_count = 0
+        failed_items = []
+        total_to_process = len(items)
+
+        def handle(item: Any, text: Optional[str]) -> None:
+            nonlocal processed_count, successful_count
+            processed_count += 1
+            item_key = item_key_func(item)
+            store_data = None
+            if text:
+                try:
+                    store_obj = parse_func(text, item, self.retailer)
+                    store_data = store_obj.to_dict() if hasattr(store_obj, 'to_dict') else store_obj
+                except Exception as e:
+                    logging.warning(f"[{self.retailer}] Error extracting {item_key}: {e}")
+
+            if store_data:
+                self._add_store(item_key, store_data)
+                successful_count += 1
+            else:
+                failed_items.append(item_key)
+
+            # Progress logging every 50 items
+            if processed_count % 50 == 0:
+                success_rate = successful_count / processed_count * 100
+                logging.info(
+                    f"[{self.retailer}] Progress: {processed_count}/{total_to_process} "
+                    f"({processed_count/total_to_process*100:.1f}%) - "
+                    f"{successful_count} stores extracted ({success_rate:.0f}% success)"
+                )
+
+        # Group by URL so every item sharing a page gets its result
+        to_fetch: Dict[str, List[Any]] = {}
+        for item in items:
+            url = item_url_func(item)
+            cached = cached_page_func(url) if cached_page_func else None
+            if cached:
+                handle(item, cached)
+            else:
+                to_fetch.setdefault(url, []).append(item)
+
+        if to_fetch:
+            logging.info(f"[{self.retailer}] Submitting {len(to_fetch)} URLs as Web Scraper API batch jobs")
+            for url, response in client.get_batch(
+                list(to_fetch),
+                batch_size=self.config.get('scraper_api_batch_size', SCRAPER_API.BATCH_SIZE),
+                poll_interval=self.config.get('scraper_api_poll_interval', SCRAPER_API.POLL_INTERVAL),
+                job_timeout=self.config.get('scraper_api_job_timeout', SCRAPER_API.JOB_TIMEOUT),
+                poll_workers=self.config.get('scraper_api_poll_workers', SCRAPER_API.POLL_WORKERS),
+                poll_window=self.config.get('scraper_api_poll_window', SCRAPER_API.POLL_WINDOW),
+            ):
+                text = None
+                if response is not None:
+                    self.request_counter.increment()
+                    if response.status_code == 200:
+                        text = response.text
+                        if cache_page_func and text:
+                            cache_page_func(url, text)
+                    else:
+                        logging.warning(f"[{self.retailer}] Batch job for {url} returned {response.status_code}")
+                for item in to_fetch.pop(url, []):
+                    handle(item, text)
+
+            # Anything the batch did not report back on is a failure, not a silent drop
+            for url, unreported in to_fetch.items():
+                logging.warning(f"[{self.retailer}] No batch result for {url}")
+                for item in unreported:
+                    handle(item, None)
+
+        self._report_failed_items(failed_items)
+
+        return self.stores
+
+    def run_with_checkpoints_batch(
+        self,
+        url_discovery_func: Callable,
+        parse_func: Callable,
+        item_key_func: Optional[Callable[[Any], Any]] = None,
+        item_url_func: Optional[Callable[[Any], str]] = None,
+        client: Optional[ProxyClient] = None,
+        cached_page_func: Optional[Callable[[str], Optional[str]]] = None,
+        cache_page_func: Optional[Callable[[str, str], None]] = None,
+        **kwargs
+    ) -> Dict[str, Any]:
+        """Variant of run_with_checkpoints() that fetches via Web Scraper API batch jobs.
+
+        Discovery, checkpointing, incremental planning and validation are the
+        same as the other run methods. Extraction submits all remaining URLs
+        as push-pull jobs and parses results as they complete, so throughput
+        is bounded by the API rather than by parallel_workers.
+
+        Batch size, polling interval, job timeout, polling concurrency and
+        the number of jobs checked per round can be set per retailer with
+        `scraper_api_batch_size`, `scraper_api_poll_interval`,
+        `scraper_api_job_timeout`, `scraper_api_poll_workers` and
+        `scraper_api_poll_window`.
+
+        Args:
+            url_discovery_func: Function to discover URLs (same signature as run_with_checkpoints)
+            parse_func: Function to build store data from a fetched page
+                Signature: func(text, item, retailer) -> Optional[StoreData]
+            item_key_func: Optional function to extract unique key from item (defaults to identity)
+            item_url_func: Optional function returning the URL to fetch for an item
+                (defaults to item_key_func)
+            client: ProxyClient in web_scraper_api mode (created from the
+                retailer proxy config and closed afterwards if None)
+            cached_page_func: Optional lookup returning a cached page for a URL
+            cache_page_func: Optional callback storing a fetched page for a URL
+            **kwargs: Additional kwargs to pass to the discovery function
+
+        Returns:
+            dict with keys:
+                - stores: List[dict] - Scraped store data
+                - count: int - Number of stores processed
+                - checkpoints_used: bool - Whether resume was used
+
+        Raises:
+            ValueError: If the client is not in web_scraper_api mode
+        """
+        logging.info(f"[{self.retailer}] Starting batch scrape run")
+        owns_client = client is None
+
+        try:
+            if client is None:
+                client = ProxyClient(ProxyConfig.from_dict(self.config.get('proxy', {})), retailer=self.retailer)
+
+            item_key_func = self._resolve_item_key_func(item_key_func)
+            item_url_func = item_url_func or item_key_func
+
+            self._load_checkpoint()
+
+            items = self._load_or_discover_urls(url_discovery_func, **kwargs)
+
+            if not items:
+                logging.warning(f"[{self.retailer}] No items found")
+                return {'stores': [], 'count': 0, 'checkpoints_used': False}
+
+            items, carried = self._plan_incremental(items, item_key_func, item_url_func)
+            remaining_items = self._select_remaining_items(items, item_key_func)
+            self._carry_forward(carried, item_key_func)
+
+            if remaining_items:
+                self._extract_items_batch(
+                    remaining_items, parse_func, item_key_func, item_url_func,
+                    client, cached_page_func, cache_page_func
+                )
+
+            return self._finalize_run()
+
+        except Exception as e:
+            logging.error(f"[{self.retailer}] Fatal error: {e}", exc_info=True)
+            raise
+        finally:
+            # Make journaled progress durable even on Ctrl-C or a fatal error
+            self.journal.close()
+            if owns_client and client is not None:
+                client.close()
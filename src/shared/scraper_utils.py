@@ -21,6 +21,7 @@ from typing import Any, Dict, List, Optional, Set, Union
 
 from src.shared import utils
 from src.shared.cache import URLCache, RichURLCache
+from src.shared.concurrency import AdaptiveController, GlobalConcurrencyManager
 from src.shared.constants import WORKERS
 from src.shared.request_counter import RequestCounter
 
@@ -45,6 +46,8 @@ class ScraperRunContext:
         max_delay: Maximum delay between requests
         parallel_workers: Number of parallel worker threads
         proxy_mode: Proxy mode ('direct', 'residential', 'web_scraper_api')
+        adaptive: AdaptiveController when `adaptive.enabled` is set (scales
+            delays and records statuses inside get_with_retry)
     """
     retailer_name: str
     config: Dict[str, Any]
@@ -58,6 +61,7 @@ class ScraperRunContext:
     max_delay: float = 5.0
     parallel_workers: int = 1
     proxy_mode: str = "direct"
+    adaptive: Optional[AdaptiveController] = None
 
 
 def initialize_run_context(
@@ -116,6 +120,12 @@ def initialize_run_context(
         proxy_mode=proxy_mode
     )
 
+    adaptive_config = config.get('adaptive') or {}
+    if adaptive_config.get('enabled'):
+        context.adaptive = GlobalConcurrencyManager().enable_adaptive(
+            retailer_name, parallel_workers, adaptive_config
+        )
+
     # Load checkpoint if resuming
     if resume:
         checkpoint = utils.load_checkpoint(checkpoint_path)
@@ -6,9 +6,16 @@ duplicate `_create_session_factory()` implementations across individual scrapers
 requests.Session is NOT thread-safe, so each worker thread in parallel
 scrapers needs its own session instance. This factory pattern ensures
 consistent session configuration across all scrapers.
+
+For long parallel runs, prefer a SessionPool: it keeps one warm keep-alive
+session per worker thread instead of building (and TLS-handshaking) a new
+session for every item, and closes them all when the pool is shut down.
 """
 
-from typing import Callable
+import logging
+import threading
+from types import TracebackType
+from typing import Any, Callable, List, Optional, Type
 
 import requests
 
@@ -16,7 +23,10 @@ from src.shared import utils
 
 
 __all__ = [
+    'SessionPool',
     'create_session_factory',
+    'create_session_pool',
+    'release_session',
 ]
 
 
@@ -54,3 +64,146 @@ def create_session_factory(retailer_config: dict) -> Callable[[], requests.Sessi
         return utils.create_proxied_session(retailer_config)
 
     return factory
+
+
+class SessionPool:
+    """Thread-local pool of warm, keep-alive sessions.
+
+    Each worker thread lazily gets its own session (requests.Session or
+    ProxiedSession) on first use and keeps it for the lifetime of the pool,
+    so connections to the target host are reused across items instead of
+    paying a fresh TCP/TLS handshake per store. The pool is callable, so it
+    can be passed anywhere a session factory is expected.
+
+    Sessions handed out by the pool must not be closed by workers; use
+    release_session() in worker ``finally`` blocks and close the pool once
+    the executor has finished.
+
+    Usage:
+        with create_session_pool(config) as session_pool:
+            with ThreadPoolExecutor(max_workers=5) as executor:
+                for url in urls:
+                    executor.submit(extract_store, url, session_pool)
+
+        # In worker function
+        def extract_store(url, session_factory):
+            session = session_factory()
+            try:
+                response = session.get(url)
+                ...
+            finally:
+                release_session(session_factory, session)
+    """
+
+    def __init__(self, retailer_config: dict):
+        """Initialize an empty session pool.
+
+        Args:
+            retailer_config: Retailer configuration dict from retailers.yaml with proxy settings
+        """
+        self._retailer_config = retailer_config
+        self._local = threading.local()
+        self._sessions: List[Any] = []
+        self._lock = threading.Lock()
+        self._closed = False
+
+    def get(self) -> requests.Session:
+        """Get the calling thread's session, creating it on first use.
+
+        Returns:
+            Session bound to the current thread
+
+        Raises:
+            RuntimeError: If the pool has already been closed
+        """
+        session = getattr(self._local, 'session', None)
+        if session is not None:
+            return session
+
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("SessionPool is closed")
+            session = utils.create_proxied_session(self._retailer_config)
+            self._sessions.append(session)
+        self._local.session = session
+        return session
+
+    def __call__(self) -> requests.Session:
+        return self.get()
+
+    @property
+    def size(self) -> int:
+        """Number of sessions created so far (one per worker thread used)."""
+        with self._lock:
+            return len(self._sessions)
+
+    def close(self) -> None:
+        """Close every session created by the pool (idempotent)."""
+        with self._lock:
+            sessions = self._sessions
+            self._sessions = []
+            self._closed = True
+
+        for session in sessions:
+            try:
+                if hasattr(session, 'close'):
+                    session.close()
+            except Exception as e:
+                logging.debug(f"Error closing pooled session: {e}")
+
+        if sessions:
+            retailer_name = self._retailer_config.get('name', 'unknown') if self._retailer_config else 'unknown'
+            logging.debug(f"[{retailer_name}] Closed {len(sessions)} pooled sessions")
+
+    def __enter__(self) -> "SessionPool":
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_val: Optional[BaseException],
+        exc_tb: Optional[TracebackType]
+    ) -> None:
+        """Exit context manager and close all pooled sessions.
+
+        Args:
+            exc_type: Exception type if an exception occurred
+            exc_val: Exception instance if an exception occurred
+            exc_tb: Traceback object if an exception occurred
+        """
+        self.close()
+
+
+def create_session_pool(retailer_config: dict) -> SessionPool:
+    """Create a thread-local session pool for parallel workers.
+
+    Each worker thread reuses one warm keep-alive session (and, for proxied
+    sessions, its Web Scraper API connection pool) for the pool's lifetime.
+    Use it as a context manager around the executor so the sessions are
+    closed once the workers are done.
+
+    Args:
+        retailer_config: Retailer configuration dict from retailers.yaml with proxy settings
+
+    Returns:
+        SessionPool that hands each worker thread a reusable session
+    """
+    return SessionPool(retailer_config)
+
+
+def release_session(session_factory: Callable[[], Any], session: Any) -> None:
+    """Release a session obtained from a factory or pool.
+
+    Sessions from a plain factory are single-use and closed immediately;
+    sessions owned by a SessionPool stay open for reuse by the same thread
+    and are closed when the pool is closed. Call it from the worker's
+    ``finally`` block so either kind of factory can be passed in.
+
+    Args:
+        session_factory: Factory or SessionPool the session came from
+        session: Session to release
+    """
+    if isinstance(session_factory, SessionPool):
+        return
+    if hasattr(session, 'close'):
+        session.close()
@@ -0,0 +1,270 @@
+"""Streaming store pipeline - writes exports while a scraper is still running.
+
+Extracted stores are pushed onto a bounded queue and consumed by a single
+writer thread that normalizes each store once, validates it, and appends it
+to the incremental JSON/JSONL/CSV/GeoJSON writers from export_service.
+Exports are complete as soon as the last store is extracted instead of after
+a serial post-processing phase, and the writer holds at most one CSV
+field-sampling window in memory. Scrapers still return their full store
+list (change detection and Excel export read it), so this removes the
+export stage's copies rather than bounding the run's peak memory.
+
+Files are written to a temporary path and renamed into place on close(), so
+a failed run never replaces the previous stores_latest.* outputs.
+
+Usage:
+    pipeline = StorePipeline('att', 'data/att/output', retailer_config,
+                             formats=[ExportFormat.JSON, ExportFormat.CSV])
+    with pipeline:
+        for store in stores:
+            pipeline.add(store)
+    pipeline.written   # {ExportFormat.JSON: 'data/att/output/stores_latest.json', ...}
+"""
+
+import logging
+import os
+import queue
+import threading
+from pathlib import Path
+from types import TracebackType
+from typing import Any, Dict, IO, Iterable, Optional, Type
+
+from src.shared.constants import STREAMING, VALIDATION
+from src.shared.export_service import ExportFormat, create_stream_writer
+from src.shared.store_schema import normalize_store_data
+from src.shared.validation import validate_store_data
+
+
+__all__ = [
+    'STREAMABLE_FORMATS',
+    'StorePipeline',
+]
+
+
+# Formats that can be written one store at a time
+STREAMABLE_FORMATS = (ExportFormat.JSON, ExportFormat.JSONL, ExportFormat.CSV, ExportFormat.GEOJSON)
+
+# Formats written when the caller does not choose
+_DEFAULT_FORMATS = (ExportFormat.JSON, ExportFormat.CSV)
+
+_FORMAT_EXTENSIONS = {
+    ExportFormat.JSON: 'json',
+    ExportFormat.JSONL: 'jsonl',
+    ExportFormat.CSV: 'csv',
+    ExportFormat.GEOJSON: 'geojson',
+}
+
+# Queue sentinel telling the writer thread to finish
+_DONE = object()
+
+
+class StorePipeline:
+    """Queue-backed stage that exports stores incrementally as they are extracted.
+
+    add() is thread-safe and cheap (a queue put), so it can be called from
+    worker threads and from asyncio tasks. The writer thread owns all file
+    handles. A failing writer is dropped on its own; the other formats keep
+    going.
+
+    Attributes:
+        queued: Number of stores accepted by add()
+        count: Number of stores written
+        valid: Number of stores that passed validation
+        warning_count: Total validation warnings
+        written: Mapping of format to final path, populated by close()
+    """
+
+    def __init__(
+        self,
+        retailer: str,
+        output_dir: str,
+        retailer_config: Optional[Dict[str, Any]] = None,
+        formats: Optional[Iterable[ExportFormat]] = None,
+        normalize_fields: bool = True,
+        queue_size: int = STREAMING.PIPELINE_QUEUE_SIZE
+    ) -> None:
+        """Initialize the pipeline (files are opened by start()).
+
+        Args:
+            retailer: Retailer name (for logging and normalization metadata)
+            output_dir: Directory for stores_latest.* files
+            retailer_config: Optional retailer config with output_fields and compact_json
+            formats: Formats to write (default JSON and CSV); non-streamable
+                formats are ignored
+            normalize_fields: Normalize field names to the canonical schema (Issue #170)
+            queue_size: Maximum stores buffered between producers and the writer
+
+        Raises:
+            ValueError: If output_dir contains path traversal
+        """
+        if ".." in str(Path(output_dir)):
+            raise ValueError(f"Invalid output path: {output_dir}. Path traversal not allowed.")
+        self.retailer = retailer
+        self.output_dir = Path(output_dir)
+        self.retailer_config = retailer_config or {}
+        formats = _DEFAULT_FORMATS if formats is None else formats
+        self.formats = [fmt for fmt in formats if fmt in STREAMABLE_FORMATS]
+        self.normalize_fields = normalize_fields
+        self.queued = 0
+        self.count = 0
+        self.valid = 0
+        self.warning_count = 0
+        self.written: Dict[ExportFormat, str] = {}
+        self._queue: queue.Queue = queue.Queue(maxsize=queue_size)
+        self._handles: Dict[ExportFormat, IO[str]] = {}
+        self._writers: Dict[ExportFormat, Any] = {}
+        self._thread: Optional[threading.Thread] = None
+        self._closed = False
+        self._queued_lock = threading.Lock()
+        self._errors_logged = 0
+
+    def _final_path(self, fmt: ExportFormat) -> Path:
+        return self.output_dir / f"stores_latest.{_FORMAT_EXTENSIONS[fmt]}"
+
+    def _temp_path(self, fmt: ExportFormat) -> Path:
+        return self.output_dir / f".stores_latest.{_FORMAT_EXTENSIONS[fmt]}.partial"
+
+    def start(self) -> 'StorePipeline':
+        """Open the temporary output files and start the writer thread."""
+        if self._thread is not None:
+            return self
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        for fmt in self.formats:
+            newline = '' if fmt == ExportFormat.CSV else None
+            handle = open(self._temp_path(fmt), 'w', newline=newline, encoding='utf-8')
+            self._handles[fmt] = handle
+            self._writers[fmt] = create_stream_writer(fmt, handle, self.retailer_config)
+        self._thread = threading.Thread(
+            target=self._drain, name=f"{self.retailer}-store-pipeline", daemon=True
+        )
+        self._thread.start()
+        return self
+
+    def add(self, store: Any) -> None:
+        """Queue one extracted store (dict or object with to_dict()).
+
+        Raises:
+            RuntimeError: If the pipeline was not started or is already closed
+        """
+        if self._thread is None or self._closed:
+            raise RuntimeError("StorePipeline is not running")
+        if hasattr(store, 'to_dict'):
+            store = store.to_dict()
+        with self._queued_lock:
+            self.queued += 1
+        self._queue.put(store)
+
+    def add_many(self, stores: Iterable[Any]) -> None:
+        """Queue every store from an iterable."""
+        for store in stores:
+            self.add(store)
+
+    def _drain(self) -> None:
+        """Writer thread: normalize, validate and write until the sentinel arrives."""
+        retailer_name = self.retailer_config.get('name') or self.retailer
+        while True:
+            store = self._queue.get()
+            if store is _DONE:
+                return
+            try:
+                self._validate(store)
+                if self.normalize_fields:
+                    store = normalize_store_data(store, retailer=retailer_name)
+            except Exception as e:
+                logging.warning(f"[{self.retailer}] Skipping unexportable store: {e}")
+                continue
+            for fmt, writer in list(self._writers.items()):
+                try:
+                    writer.write(store)
+                except Exception as e:
+                    self._drop_writer(fmt, e)
+            self.count += 1
+
+    def _validate(self, store: Dict[str, Any]) -> None:
+        """Validate one raw store, logging the first few errors like validate_stores_batch()."""
+        result = validate_store_data(store)
+        self.warning_count += len(result.warnings)
+        if result.is_valid:
+            self.valid += 1
+            return
+        if self._errors_logged < VALIDATION.ERROR_LOG_LIMIT:
+            store_id = store.get('store_id', f'index_{self.count}')
+            for error in result.errors:
+                logging.warning(f"Store {store_id}: {error}")
+            self._errors_logged += 1
+
+    def _drop_writer(self, fmt: ExportFormat, error: Exception) -> None:
+        """Stop writing one format after an error and discard its partial file."""
+        logging.warning(f"[{self.retailer}] Streaming {fmt.value} export failed: {error}")
+        self._writers.pop(fmt, None)
+        handle = self._handles.pop(fmt, None)
+        if handle is not None:
+            handle.close()
+        self._temp_path(fmt).unlink(missing_ok=True)
+
+    def _stop_thread(self) -> None:
+        if self._thread is not None and not self._closed:
+            self._closed = True
+            self._queue.put(_DONE)
+            self._thread.join()
+
+    def close(self) -> Dict[ExportFormat, str]:
+        """Flush all queued stores and move finished files into place.
+
+        If no stores were written, nothing is replaced (matching
+        ExportService.export_stores, which skips empty exports).
+
+        Returns:
+            Mapping of successfully written format to its output path
+        """
+        self._stop_thread()
+        for fmt in list(self._writers):
+            writer = self._writers.pop(fmt)
+            handle = self._handles.pop(fmt)
+            try:
+                if self.count:
+                    writer.finish()
+                handle.close()
+            except Exception as e:
+                handle.close()
+                self._temp_path(fmt).unlink(missing_ok=True)
+                logging.warning(f"[{self.retailer}] Streaming {fmt.value} export failed: {e}")
+                continue
+            if not self.count:
+                self._temp_path(fmt).unlink(missing_ok=True)
+                continue
+            final_path = self._final_path(fmt)
+            os.replace(self._temp_path(fmt), final_path)
+            self.written[fmt] = str(final_path)
+            logging.info(f"Exported {self.count} stores to {fmt.value.upper()}: {final_path}")
+
+        if self.count:
+            logging.info(
+                f"[{self.retailer}] Validation: {self.valid}/{self.count} valid, "
+                f"{self.warning_count} warnings"
+            )
+        else:
+            logging.warning("No stores to export")
+        return self.written
+
+    def abort(self) -> None:
+        """Stop the writer and discard partial files, leaving existing outputs untouched."""
+        self._stop_thread()
+        for fmt in list(self._handles):
+            self._handles.pop(fmt).close()
+            self._temp_path(fmt).unlink(missing_ok=True)
+        self._writers.clear()
+
+    def __enter__(self) -> 'StorePipeline':
+        return self.start()
+
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_val: Optional[BaseException],
+        exc_tb: Optional[TracebackType],
+    ) -> None:
+        if exc_type is None:
+            self.close()
+        else:
+            self.abort()
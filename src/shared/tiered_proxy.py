@@ -0,0 +1,249 @@
+"""Tiered proxy escalation: direct -> residential -> Web Scraper API per request.
+
+With `proxy.mode: "tiered"` a retailer is no longer pinned to one proxy mode
+for the whole run. Each request starts on the cheapest tier known to work
+for its host and only moves up the ladder on a block signal (403/429/503 or
+a bot-challenge page); the last tier's answer is returned as-is.
+
+    direct -> residential -> web_scraper_api -> render_js
+
+The tier that finally got through is remembered per host for all sessions
+of the retailer, so later requests skip the tiers that are known to be
+blocked. The memory expires after ESCALATION_TTL_SECONDS, after which the
+cheaper tiers are probed again. Tiers without credentials are left out.
+
+Config (config/retailers.yaml):
+    proxy:
+      mode: "tiered"
+      tiers: ["direct", "residential", "web_scraper_api", "render_js"]  # optional
+      escalation_ttl: 1800  # optional, seconds
+
+Usage:
+    session = TieredProxiedSession(proxy_config, retailer='costco')
+    response = session.get(url)  # drop-in for ProxiedSession.get()
+"""
+
+import logging
+import threading
+import time
+import urllib.parse
+from types import TracebackType
+from typing import Any, Callable, Dict, List, Optional, Tuple, Type
+
+from src.shared.constants import TIERED_PROXY
+from src.shared.http import get_headers, log_safe
+from src.shared.proxy_client import ProxyClient, ProxyConfig, ProxyResponse
+
+
+__all__ = [
+    'TieredProxiedSession',
+    'is_block_response',
+]
+
+# Proxy mode behind each tier name
+_TIER_MODES = {
+    'direct': 'direct',
+    'residential': 'residential',
+    'web_scraper_api': 'web_scraper_api',
+    'render_js': 'web_scraper_api',
+}
+
+
+def is_block_response(response: Optional[ProxyResponse]) -> bool:
+    """Check whether a response looks like a bot-protection block.
+
+    Blocks are BLOCK_STATUS_CODES, or a 200 whose leading bytes contain a
+    known challenge page marker (PerimeterX, Imperva, DataDome, Cloudflare,
+    Akamai).
+
+    Args:
+        response: Response from ProxyClient.get(), or None
+
+    Returns:
+        True if the response is a block signal (None is a failure, not a block)
+    """
+    if response is None:
+        return False
+    if response.status_code in TIERED_PROXY.BLOCK_STATUS_CODES:
+        return True
+    if response.status_code != 200 or not response.content:
+        return False
+    head = response.content[:TIERED_PROXY.MARKER_SCAN_BYTES].decode('utf-8', errors='ignore')
+    return any(marker in head for marker in TIERED_PROXY.BLOCK_MARKERS)
+
+
+class TieredProxiedSession:
+    """Session-like wrapper that escalates each request through proxy tiers.
+
+    Drop-in replacement for ProxiedSession (same get()/close()/headers
+    interface), created by create_proxied_session() for `mode: "tiered"`.
+    Every tier is a ProxyClient of its own, so rate limits and the
+    ProxyCostLedger see each request under the mode it actually used.
+    """
+
+    # Each tier's ProxyClient applies GlobalConcurrencyManager rate limits
+    rate_limited = True
+
+    # Escalated tier name and the time it was learned, per (retailer, host),
+    # shared by all sessions of a retailer
+    _host_tiers: Dict[Tuple[Optional[str], str], Tuple[str, float]] = {}
+    _host_tiers_lock = threading.Lock()
+
+    def __init__(
+        self,
+        proxy_config: Optional[Dict[str, Any]] = None,
+        retailer: Optional[str] = None,
+        clock: Callable[[], float] = time.monotonic
+    ) -> None:
+        """Initialize the tier ladder.
+
+        Args:
+            proxy_config: Proxy configuration dict (ProxyConfig.from_dict keys,
+                plus optional 'tiers' and 'escalation_ttl')
+            retailer: Optional retailer name, used for rate limiting and cost tracking
+            clock: Monotonic clock function (injectable for tests)
+        """
+        proxy_config = dict(proxy_config or {})
+        self.retailer_name = retailer
+        self.headers: Dict[str, str] = get_headers()
+        self.escalation_ttl = proxy_config.get('escalation_ttl', TIERED_PROXY.ESCALATION_TTL_SECONDS)
+        self._clock = clock
+        self._tiers = self._build_tiers(proxy_config)
+        self._stats_lock = threading.Lock()
+        self._requests = {name: 0 for name, _ in self._tiers}
+        self.escalations = 0
+
+    def _build_tiers(self, proxy_config: Dict[str, Any]) -> List[Tuple[str, ProxyClient]]:
+        """Create one ProxyClient per usable tier, cheapest first.
+
+        Lower tiers get a single attempt and return 429/5xx responses instead
+        of waiting and retrying them, so the ladder sees every block and
+        escalates at once; the top tier keeps the configured retry policy.
+        """
+        usable = []
+        for name in proxy_config.get('tiers') or TIERED_PROXY.TIERS:
+            mode = _TIER_MODES.get(name)
+            if mode is None:
+                logging.warning(f"[{self.retailer_name}] Unknown proxy tier '{name}', skipping")
+                continue
+            tier_config = {**proxy_config, 'mode': mode, 'render_js': name == 'render_js'}
+            if not ProxyConfig.from_dict(tier_config).validate():
+                logging.warning(f"[{self.retailer_name}] No credentials for proxy tier '{name}', skipping")
+                continue
+            usable.append((name, tier_config))
+
+        if not usable:
+            logging.warning(f"[{self.retailer_name}] No usable proxy tiers, using direct")
+            usable = [('direct', {**proxy_config, 'mode': 'direct'})]
+
+        tiers = []
+        for position, (name, tier_config) in enumerate(usable):
+            if position < len(usable) - 1:
+                tier_config['max_retries'] = 1
+                tier_config['retry_errors'] = False
+            tiers.append((name, ProxyClient(ProxyConfig.from_dict(tier_config), retailer=self.retailer_name)))
+        logging.info(f"[{self.retailer_name}] Tiered proxy ladder: {' -> '.join(name for name, _ in tiers)}")
+        return tiers
+
+    def _start_tier(self, host: str) -> int:
+        """Index of the tier to try first for a host."""
+        key = (self.retailer_name, host)
+        with self._host_tiers_lock:
+            entry = self._host_tiers.get(key)
+            if entry is None:
+                return 0
+            name, learned_at = entry
+            if self._clock() - learned_at >= self.escalation_ttl:
+                del self._host_tiers[key]
+                return 0
+        for index, (tier_name, _) in enumerate(self._tiers):
+            if tier_name == name:
+                return index
+        return 0
+
+    def _remember(self, host: str, index: int) -> None:
+        """Record the tier that got through for a host after an escalation."""
+        name = self._tiers[index][0]
+        with self._host_tiers_lock:
+            self._host_tiers[(self.retailer_name, host)] = (name, self._clock())
+        log_safe(f"[{self.retailer_name}] {host}: using proxy tier '{name}' after blocks", level=logging.INFO)
+
+    def get(
+        self,
+        url: str,
+        params: Optional[Dict[str, str]] = None,
+        headers: Optional[Dict[str, str]] = None,
+        timeout: Optional[int] = None,
+        **kwargs: Any
+    ) -> Optional[ProxyResponse]:
+        """Make a GET request, escalating through the tiers on block signals.
+
+        Args:
+            url: URL to fetch
+            params: Query parameters
+            headers: Custom headers
+            timeout: Request timeout
+            **kwargs: Additional arguments (passed to underlying client)
+
+        Returns:
+            First non-blocked response, else the top tier's response (None on failure)
+        """
+        merged_headers = {**self.headers, **(headers or {})}
+        host = urllib.parse.urlsplit(url).netloc
+        start = self._start_tier(host)
+        blocked = False
+        response = None
+
+        for index in range(start, len(self._tiers)):
+            name, client = self._tiers[index]
+            response = client.get(url, params=params, headers=merged_headers, timeout=timeout, **kwargs)
+            with self._stats_lock:
+                self._requests[name] += 1
+
+            if response is not None and not is_block_response(response):
+                # Only block signals are remembered; a transport failure may be transient
+                if blocked:
+                    self._remember(host, index)
+                return response
+
+            blocked = blocked or response is not None
+            if index + 1 < len(self._tiers):
+                with self._stats_lock:
+                    self.escalations += 1
+                status = response.status_code if response is not None else 'no response'
+                log_safe(
+                    f"[{self.retailer_name}] {host}: tier '{name}' failed ({status}), "
+                    f"escalating to '{self._tiers[index + 1][0]}'",
+                    level=logging.DEBUG
+                )
+
+        return response
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get requests per tier and escalation count."""
+        with self._stats_lock:
+            return {
+                'tiers': [name for name, _ in self._tiers],
+                'requests': dict(self._requests),
+                'escalations': self.escalations,
+            }
+
+    def close(self) -> None:
+        """Close every tier's ProxyClient."""
+        for _, client in self._tiers:
+            try:
+                client.close()
+            except Exception:
+                pass
+
+    def __enter__(self) -> "TieredProxiedSession":
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_val: Optional[BaseException],
+        exc_tb: Optional[TracebackType]
+    ) -> None:
+        """Exit context manager and close resources."""
+        self.close()
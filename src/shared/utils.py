@@ -23,14 +23,16 @@ import requests
 import yaml
 
 # Import from focused modules for re-export
+from src.shared.cache_interface import RevalidationCache
 from src.shared.checkpoint import load_checkpoint, save_checkpoint
+from src.shared.concurrency import GlobalConcurrencyManager
 from src.shared.delays import (
     DEFAULT_MAX_DELAY,
     DEFAULT_MIN_DELAY,
     random_delay,
     select_delays,
 )
-from src.shared.http import DEFAULT_USER_AGENTS, get_headers, get_with_retry
+from src.shared.http import DEFAULT_USER_AGENTS, get_headers, get_with_retry, mount_pooled_adapter
 from src.shared.io import save_to_csv, save_to_json
 from src.shared.logging_config import setup_logging
 from src.shared.validation import (
@@ -49,6 +51,7 @@ from src.shared.proxy_client import (
     ProxyResponse,
     redact_credentials,
 )
+from src.shared.tiered_proxy import TieredProxiedSession
 
 # Import centralized constants (Issue #171)
 from src.shared.constants import HTTP
@@ -154,6 +157,10 @@ def _merge_proxy_config(
         config.update(global_proxy['residential'])
     elif mode == 'web_scraper_api' and 'web_scraper_api' in global_proxy:
         config.update(global_proxy['web_scraper_api'])
+    elif mode == 'tiered':
+        # Tiered mode escalates into both proxy products
+        config.update(global_proxy.get('residential', {}))
+        config.update(global_proxy.get('web_scraper_api', {}))
 
     for key in ['timeout', 'max_retries', 'retry_delay']:
         if key in global_proxy:
@@ -180,6 +187,10 @@ def _build_proxy_config_from_yaml(global_proxy: Dict[str, Any]) -> Dict[str, Any
         config.update(global_proxy['residential'])
     elif mode == 'web_scraper_api' and 'web_scraper_api' in global_proxy:
         config.update(global_proxy['web_scraper_api'])
+    elif mode == 'tiered':
+        # Tiered mode escalates into both proxy products
+        config.update(global_proxy.get('residential', {}))
+        config.update(global_proxy.get('web_scraper_api', {}))
 
     for key in ['timeout', 'max_retries', 'retry_delay']:
         if key in global_proxy:
@@ -232,7 +243,7 @@ def get_retailer_proxy_config(
     Returns:
         Dict compatible with ProxyConfig.from_dict()
     """
-    VALID_MODES = {'direct', 'residential', 'web_scraper_api'}
+    VALID_MODES = {'direct', 'residential', 'web_scraper_api', 'tiered'}
     cli_settings = {
         key: value
         for key, value in (cli_settings or {}).items()
@@ -312,9 +323,11 @@ def configure_concurrency_from_yaml(config_path: str = 'config/retailers.yaml')
             verizon: 7
             target: 5
           proxy_rate_limit: 10.0
+          proxy_rate_limit_by_mode:
+            web_scraper_api: 5.0
+          per_retailer_rate_limit:
+            bell: 0.1
     """
-    from src.shared.concurrency import GlobalConcurrencyManager
-
     try:
         with open(config_path, 'r', encoding='utf-8') as f:
             config = yaml.safe_load(f)
@@ -340,19 +353,25 @@ def configure_concurrency_from_yaml(config_path: str = 'config/retailers.yaml')
     if per_retailer_max is None:
         per_retailer_max = {}
     proxy_rate_limit = concurrency_config.get('proxy_rate_limit')
+    proxy_rate_limit_by_mode = concurrency_config.get('proxy_rate_limit_by_mode') or None
+    per_retailer_rate_limit = concurrency_config.get('per_retailer_rate_limit') or None
 
     # Configure the manager
     manager.configure(
         global_max_workers=global_max_workers,
         per_retailer_max=per_retailer_max if per_retailer_max else None,
-        proxy_requests_per_second=proxy_rate_limit
+        proxy_requests_per_second=proxy_rate_limit,
+        proxy_rate_limit_by_mode=proxy_rate_limit_by_mode,
+        per_retailer_rate_limit=per_retailer_rate_limit
     )
 
     logging.info(
         f"[ConcurrencyManager] Configured from YAML: "
         f"global_max={global_max_workers}, "
         f"retailers={len(per_retailer_max)}, "
-        f"proxy_rate={proxy_rate_limit}"
+        f"proxy_rate={proxy_rate_limit}, "
+        f"proxy_rate_by_mode={proxy_rate_limit_by_mode}, "
+        f"retailer_rates={per_retailer_rate_limit}"
     )
 
 
@@ -526,6 +545,24 @@ def get_with_proxy(
     return client.get(url, headers=headers, render_js=render_js, timeout=timeout)
 
 
+def _attach_revalidation_cache(session: Any, retailer_config: Optional[Dict[str, Any]]) -> Any:
+    """Attach the retailer's RevalidationCache when `revalidate_pages` is enabled.
+
+    get_with_retry() picks the cache up from the session, so every page
+    fetched through it becomes a conditional GET.
+
+    Args:
+        session: Session created by create_proxied_session()
+        retailer_config: Retailer config (needs 'name' and 'revalidate_pages')
+
+    Returns:
+        The same session
+    """
+    if retailer_config and retailer_config.get('revalidate_pages') and retailer_config.get('name'):
+        session.revalidation_cache = RevalidationCache.for_retailer(retailer_config['name'])
+    return session
+
+
 def create_proxied_session(
     retailer_config: Optional[Dict[str, Any]] = None
 ) -> Union[requests.Session, 'ProxiedSession']:
@@ -533,6 +570,10 @@ def create_proxied_session(
 
     For direct mode, returns a standard requests.Session.
     For proxy modes, returns a ProxiedSession with compatible interface.
+    For tiered mode, returns a TieredProxiedSession that escalates each
+    request from direct to residential to Web Scraper API on block signals.
+    With `revalidate_pages: true` in the retailer config, the session carries
+    the retailer's RevalidationCache so page fetches use conditional GETs.
 
     Args:
         retailer_config: Optional retailer-specific config with proxy overrides
@@ -543,12 +584,26 @@ def create_proxied_session(
     proxy_config_dict = retailer_config.get('proxy', {}) if retailer_config else {}
     mode = proxy_config_dict.get('mode', 'direct')
     retailer_name = retailer_config.get('name', 'unknown') if retailer_config else 'unknown'
+    # Only real retailer names key per-retailer rate limits
+    rate_limit_key = retailer_config.get('name') if retailer_config else None
 
     if mode == 'direct':
         session = requests.Session()
         session.headers.update(get_headers())
+        mount_pooled_adapter(
+            session,
+            pool_connections=proxy_config_dict.get('pool_connections'),
+            pool_maxsize=proxy_config_dict.get('pool_maxsize'),
+        )
+        session.retailer_name = rate_limit_key
         logging.info(f"[{retailer_name}] Created Session for mode: {mode}")
-        return session
+        return _attach_revalidation_cache(session, retailer_config)
+
+    if mode == 'tiered':
+        # Per-request escalation; tiers without credentials are left out of the ladder
+        session = TieredProxiedSession(proxy_config_dict, retailer=rate_limit_key)
+        logging.info(f"[{retailer_name}] Created TieredProxiedSession")
+        return _attach_revalidation_cache(session, retailer_config)
 
     try:
         # Check credentials before creating client to properly detect missing credentials
@@ -559,13 +614,14 @@ def create_proxied_session(
             logging.error(f"[{retailer_name}] Missing credentials for {mode} mode, falling back to direct")
             session = requests.Session()
             session.headers.update(get_headers())
-            return session
+            session.retailer_name = rate_limit_key
+            return _attach_revalidation_cache(session, retailer_config)
 
         # Return ProxiedSession instead of ProxyClient to provide headers attribute
-        proxied_session = ProxiedSession(proxy_config_dict)
+        proxied_session = ProxiedSession(proxy_config_dict, retailer=rate_limit_key)
 
         logging.info(f"[{retailer_name}] Created ProxiedSession for mode: {mode}")
-        return proxied_session
+        return _attach_revalidation_cache(proxied_session, retailer_config)
 
     except Exception as e:
         # Redact credentials from error messages
@@ -573,7 +629,8 @@ def create_proxied_session(
         logging.error(f"[{retailer_name}] Error creating proxy client: {safe_error}, falling back to direct")
         session = requests.Session()
         session.headers.update(get_headers())
-        return session
+        session.retailer_name = rate_limit_key
+        return _attach_revalidation_cache(session, retailer_config)
 
 
 def close_proxy_client() -> None:
@@ -620,12 +677,18 @@ class ProxiedSession:
         response = session.get(url)  # Uses proxy if configured
     """
 
-    def __init__(self, proxy_config: Optional[Dict[str, Any]] = None):
+    # get() applies GlobalConcurrencyManager rate limits itself, so
+    # get_with_retry() must not take a second token for this session
+    rate_limited = True
+
+    def __init__(self, proxy_config: Optional[Dict[str, Any]] = None, retailer: Optional[str] = None):
         """Initialize proxied session with its own dedicated ProxyClient.
 
         Args:
             proxy_config: Optional proxy configuration dict
+            retailer: Optional retailer name, used for per-retailer rate limiting
         """
+        self.retailer_name = retailer
         # Create a dedicated ProxyClient instance for this session
         # instead of sharing from the global cache to avoid concurrent
         # scraper configurations interfering with each other (#53)
@@ -633,7 +696,7 @@ class ProxiedSession:
             config = ProxyConfig.from_dict(proxy_config)
         else:
             config = ProxyConfig.from_env()
-        self._client = ProxyClient(config)
+        self._client = ProxyClient(config, retailer=retailer)
         self._owns_client = True  # Track that we own this client for cleanup
         self._direct_session: Optional[requests.Session] = None
         self.headers: Dict[str, str] = get_headers()
@@ -644,6 +707,11 @@ class ProxiedSession:
         if self._direct_session is None:
             self._direct_session = requests.Session()
             self._direct_session.headers.update(self.headers)
+            mount_pooled_adapter(
+                self._direct_session,
+                pool_connections=self._client.config.pool_connections,
+                pool_maxsize=self._client.config.pool_maxsize,
+            )
         return self._direct_session
 
     def get(
@@ -670,6 +738,7 @@ class ProxiedSession:
 
         if self._client.config.mode == ProxyMode.DIRECT:
             # Use standard session for direct mode
+            GlobalConcurrencyManager().wait_for_token(self.retailer_name, ProxyMode.DIRECT.value)
             try:
                 self._session.headers.update(merged_headers)
                 response = self._session.get(url, params=params, timeout=timeout or 30, **kwargs)
@@ -9,6 +9,56 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 import pytest
 from unittest.mock import Mock
 
+from src.scrapers import walmart
+from src.shared.cache_interface import RevalidationCache
+
+
+@pytest.fixture(autouse=True)
+def isolated_cache_roots(tmp_path, monkeypatch):
+    """Keep process-wide SQLite caches out of the repo's data/ directory.
+
+    RevalidationCache.for_retailer() and Walmart's response cache open
+    data/{retailer}/... relative to the working directory and keep the
+    connection for the life of the process. Each test gets fresh instances
+    rooted under its own tmp_path instead.
+    """
+    revalidation_caches = {}
+
+    def for_retailer(cls, retailer):
+        cache = revalidation_caches.get(retailer)
+        if cache is None:
+            cache = cls(retailer, cache_dir=tmp_path / 'data' / retailer / 'revalidation_cache')
+            revalidation_caches[retailer] = cache
+        return cache
+
+    monkeypatch.setattr(RevalidationCache, 'for_retailer', classmethod(for_retailer))
+    monkeypatch.setattr(walmart, '_response_caches', {})
+    monkeypatch.setattr(
+        walmart, '_get_response_cache_dir',
+        lambda retailer: tmp_path / 'data' / retailer / 'response_cache'
+    )
+    yield
+    for cache in revalidation_caches.values():
+        cache.close()
+    for retailer in list(walmart._response_caches):
+        walmart._close_response_cache(retailer)
+
+
+class FakeClock:
+    """Manually advanced clock; tests move time by setting ``now``."""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def fake_clock():
+    """Deterministic clock for components that accept a ``clock`` callable."""
+    return FakeClock()
+
 
 @pytest.fixture
 def mock_config_data():
@@ -18,30 +18,64 @@ import pytest
 
 # Module definitions with their expected public exports
 SHARED_MODULES = {
+    'src.shared.async_http': [
+        'AIOHTTP_AVAILABLE',
+        'AsyncProxyClient',
+        'async_get_with_retry',
+        'async_random_delay',
+    ],
     'src.shared.cache': [
         'URLCache',
         'RichURLCache',
         'DEFAULT_CACHE_EXPIRY_DAYS',
     ],
     'src.shared.concurrency': [
+        'AdaptiveController',
         'ConcurrencyConfig',
         'GlobalConcurrencyManager',
+        'PauseGate',
+        'TokenBucket',
     ],
     'src.shared.session_factory': [
+        'SessionPool',
         'create_session_factory',
+        'create_session_pool',
+        'release_session',
     ],
     'src.shared.request_counter': [
         'RequestCounter',
         'check_pause_logic',
+        'check_pause_logic_async',
+        'get_pause_duration',
     ],
     'src.shared.proxy_client': [
+        'HTTP2_AVAILABLE',
         'ProxyClient',
         'ProxyConfig',
+        'ProxyCostLedger',
         'ProxyMode',
         'ProxyResponse',
         'create_proxy_client',
         'redact_credentials',
     ],
+    'src.shared.residential_pool': [
+        'ResidentialSessionPool',
+        'StickySession',
+    ],
+    'src.shared.tiered_proxy': [
+        'TieredProxiedSession',
+        'is_block_response',
+    ],
+    'src.shared.html_extract': [
+        'LXML_AVAILABLE',
+        'extract_js_object',
+        'extract_json_ld',
+        'extract_next_data',
+        'extract_title',
+        'find_json_ld',
+        'iter_script_blocks',
+        'make_soup',
+    ],
     'src.shared.export_service': [
         'ExportService',
         'ExportFormat',
@@ -50,6 +84,20 @@ SHARED_MODULES = {
         'sanitize_store_for_csv',
         'CSV_INJECTION_CHARS',
         'OPENPYXL_AVAILABLE',
+        'create_stream_writer',
+    ],
+    'src.shared.gap_fill': [
+        'US_ZIP_CENTROIDS',
+        'ZipGapFill',
+        'haversine_miles',
+    ],
+    'src.shared.incremental': [
+        'IncrementalState',
+        'sitemap_lastmods',
+    ],
+    'src.shared.store_pipeline': [
+        'STREAMABLE_FORMATS',
+        'StorePipeline',
     ],
     'src.shared.notifications': [
         'NotificationProvider',
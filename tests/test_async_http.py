@@ -0,0 +1,142 @@
+"""Tests for the asyncio HTTP engine (AsyncProxyClient and async_get_with_retry)."""
+
+from unittest.mock import patch
+
+import pytest
+import pytest_asyncio
+
+pytest.importorskip('aiohttp')
+from aiohttp import web  # noqa: E402
+
+from src.shared.async_http import (  # noqa: E402
+    AsyncProxyClient,
+    async_get_with_retry,
+)
+from src.shared.proxy_client import ProxyConfig, ProxyMode  # noqa: E402
+
+
+@pytest_asyncio.fixture
+async def server():
+    """Start a local aiohttp server with scripted status sequences per path."""
+    hits = {}
+    scripts = {
+        '/ok': [200],
+        '/missing': [404],
+        '/flaky': [503, 200],
+        '/throttled': [429, 429, 429],
+    }
+
+    async def handler(request):
+        path = request.path
+        hits[path] = hits.get(path, 0) + 1
+        statuses = scripts[path]
+        status = statuses[min(hits[path], len(statuses)) - 1]
+        return web.Response(status=status, text=f'{path} {status}')
+
+    app = web.Application()
+    app.router.add_get('/{name}', handler)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, '127.0.0.1', 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]
+
+    yield f'http://127.0.0.1:{port}', hits
+
+    await runner.cleanup()
+
+
+@pytest.fixture
+def client():
+    """Direct-mode client with no proxy credentials."""
+    return AsyncProxyClient(ProxyConfig(mode=ProxyMode.DIRECT, retry_delay=0))
+
+
+@pytest.fixture(autouse=True)
+def no_waits():
+    """Make backoff waits instant so retries don't slow the suite."""
+    with patch('src.shared.async_http.HTTP') as mock_http:
+        mock_http.MAX_RETRIES = 3
+        mock_http.TIMEOUT = 5
+        mock_http.RATE_LIMIT_BASE_WAIT = 0
+        mock_http.SERVER_ERROR_WAIT = 0
+        yield
+
+
+class TestAsyncProxyClient:
+    """Tests for AsyncProxyClient request handling."""
+
+    @pytest.mark.asyncio
+    async def test_fetch_returns_proxy_response(self, server, client):
+        """Test fetch wraps the body in a ProxyResponse."""
+        base_url, _ = server
+        async with client:
+            response = await client.fetch(f'{base_url}/ok')
+
+        assert response.status_code == 200
+        assert response.text == '/ok 200'
+        assert response.proxy_mode == ProxyMode.DIRECT
+        assert client.get_stats()['request_count'] == 1
+
+    @pytest.mark.asyncio
+    async def test_get_retries_server_errors(self, server, client):
+        """Test get() retries 5xx and returns the eventual success."""
+        base_url, hits = server
+        async with client:
+            response = await client.get(f'{base_url}/flaky')
+
+        assert response.ok
+        assert hits['/flaky'] == 2
+
+    def test_invalid_credentials_fall_back_to_direct(self):
+        """Test proxy modes without credentials fall back to direct mode."""
+        client = AsyncProxyClient(ProxyConfig(mode=ProxyMode.RESIDENTIAL))
+
+        assert client.config.mode == ProxyMode.DIRECT
+        assert client._proxy_url is None
+
+
+class TestAsyncGetWithRetry:
+    """Tests for async_get_with_retry status handling."""
+
+    @pytest.mark.asyncio
+    async def test_success(self, server, client):
+        """Test a 200 response is returned on the first attempt."""
+        base_url, hits = server
+        async with client:
+            response = await async_get_with_retry(client, f'{base_url}/ok', min_delay=0, max_delay=0)
+
+        assert response.status_code == 200
+        assert hits['/ok'] == 1
+
+    @pytest.mark.asyncio
+    async def test_client_error_fails_fast(self, server, client):
+        """Test 404 returns None without retrying."""
+        base_url, hits = server
+        async with client:
+            response = await async_get_with_retry(client, f'{base_url}/missing', min_delay=0, max_delay=0)
+
+        assert response is None
+        assert hits['/missing'] == 1
+
+    @pytest.mark.asyncio
+    async def test_rate_limit_exhausts_retries(self, server, client):
+        """Test repeated 429s are retried up to max_retries then give up."""
+        base_url, hits = server
+        async with client:
+            response = await async_get_with_retry(
+                client, f'{base_url}/throttled', max_retries=3, min_delay=0, max_delay=0
+            )
+
+        assert response is None
+        assert hits['/throttled'] == 3
+
+    @pytest.mark.asyncio
+    async def test_connection_error_returns_none(self, client):
+        """Test connection failures are retried and then return None."""
+        async with client:
+            response = await async_get_with_retry(
+                client, 'http://127.0.0.1:1/unreachable', max_retries=2, min_delay=0, max_delay=0
+            )
+
+        assert response is None
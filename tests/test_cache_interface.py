@@ -2,15 +2,18 @@
 
 import json
 import time
-from datetime import datetime
+from datetime import datetime, timedelta
 from pathlib import Path
 
 import pytest
 
 from src.shared.cache_interface import (
     CacheInterface,
+    FileCacheBackend,
     ResponseCache,
+    RevalidationCache,
     RichURLCache,
+    SQLiteCacheBackend,
     URLListCache,
 )
 
@@ -556,3 +559,191 @@ class TestCacheExpiryEdgeCases:
 
         # If get() returns None, is_valid() should return False
         assert (get_result is None) == (not is_valid_result)
+
+
+class TestSQLiteCacheBackend:
+    """Test single-file SQLite cache backend."""
+
+    @pytest.fixture
+    def cache_dir(self, tmp_path):
+        """Create temporary cache directory."""
+        return tmp_path / "walmart" / "response_cache"
+
+    @pytest.fixture
+    def backend(self, cache_dir):
+        """Create SQLite backend without a size cap."""
+        backend = SQLiteCacheBackend(cache_dir, max_bytes=None)
+        yield backend
+        backend.close()
+
+    def test_response_cache_roundtrip_uses_single_file(self, backend, cache_dir):
+        """Test responses are stored in one database file, not one file per URL."""
+        cache = ResponseCache('walmart', cache_dir=cache_dir, backend=backend)
+        for i in range(20):
+            cache.set(f'https://www.walmart.com/store/{i}', f'<html>{i}</html>')
+
+        assert cache.get('https://www.walmart.com/store/7') == '<html>7</html>'
+        assert len(backend) == 20
+        assert not list(cache_dir.glob('*.cache'))
+        assert backend.db_path.exists()
+
+    def test_bodies_are_compressed(self, backend):
+        """Test stored size is the compressed body size."""
+        html = '<div class="store">Walmart Supercenter</div>' * 500
+        backend.write('key', {'cached_at': datetime.now().isoformat(), 'identifier': 'url', 'data': html})
+
+        assert 0 < backend.total_bytes < len(html) // 10
+        assert backend.read('key')['data'] == html
+
+    def test_metadata_and_validity(self, backend, cache_dir):
+        """Test get_metadata and is_valid work through the backend."""
+        cache = ResponseCache('walmart', cache_dir=cache_dir, backend=backend)
+        cache.set('https://www.walmart.com/store/1', '<html></html>')
+
+        metadata = cache.get_metadata('https://www.walmart.com/store/1')
+        assert metadata['expired'] is False
+        assert metadata['age_days'] == 0
+        assert cache.is_valid('https://www.walmart.com/store/1')
+
+    def test_clear_removes_entry_and_bytes(self, backend, cache_dir):
+        """Test clear deletes the row and adjusts the tracked size."""
+        cache = ResponseCache('walmart', cache_dir=cache_dir, backend=backend)
+        cache.set('https://www.walmart.com/store/1', '<html>1</html>')
+
+        cache.clear('https://www.walmart.com/store/1')
+
+        assert cache.get('https://www.walmart.com/store/1') is None
+        assert backend.total_bytes == 0
+
+    def test_ttl_expiry_matches_file_backend(self, backend, cache_dir):
+        """Test expired entries are misses, as with the file backend."""
+        cache = ResponseCache('walmart', cache_dir=cache_dir, ttl_days=0, backend=backend)
+        cache.set('https://www.walmart.com/store/1', '<html></html>')
+        time.sleep(0.05)
+
+        assert cache.get('https://www.walmart.com/store/1') is None
+        assert cache.is_valid('https://www.walmart.com/store/1') is False
+
+    def test_evict_expired_bulk_delete(self, cache_dir, fake_clock):
+        """Test evict_expired removes only entries older than the TTL."""
+        fake_clock.now = 1_700_000_000.0
+        backend = SQLiteCacheBackend(cache_dir, max_bytes=None, clock=fake_clock)
+        for i in range(5):
+            cached_at = datetime.fromtimestamp(fake_clock.now - (40 if i < 3 else 1) * 86400)
+            backend.write(f'key{i}', {'cached_at': cached_at.isoformat(), 'identifier': str(i), 'data': 'x' * 10})
+
+        removed = backend.evict_expired(timedelta(days=30))
+
+        assert removed == 3
+        assert len(backend) == 2
+        assert backend.read('key0') is None
+        assert backend.read('key4') is not None
+        backend.close()
+
+    def test_size_cap_evicts_least_recently_used(self, cache_dir, fake_clock):
+        """Test exceeding max_bytes evicts the least recently read entries first."""
+        fake_clock.now = 1_700_000_000.0
+        probe = SQLiteCacheBackend(cache_dir, filename='probe.sqlite3', max_bytes=None)
+        probe.write('p', {'cached_at': datetime.now().isoformat(), 'identifier': 'p', 'data': '0123456789' * 5})
+        entry_size = probe.total_bytes
+        probe.close()
+
+        backend = SQLiteCacheBackend(cache_dir, max_bytes=entry_size * 3, clock=fake_clock)
+        for key in ('a', 'b', 'c'):
+            fake_clock.now += 1
+            backend.write(key, {'cached_at': datetime.now().isoformat(), 'identifier': key, 'data': '0123456789' * 5})
+
+        fake_clock.now += 1
+        backend.read('a')  # 'b' is now the least recently used
+        fake_clock.now += 1
+        backend.write('d', {'cached_at': datetime.now().isoformat(), 'identifier': 'd', 'data': '0123456789' * 5})
+
+        assert backend.read('b') is None
+        assert backend.read('a') is not None
+        assert backend.read('d') is not None
+        assert backend.total_bytes <= entry_size * 3
+        backend.close()
+
+    def test_total_bytes_restored_on_reopen(self, cache_dir):
+        """Test tracked size is recomputed when reopening an existing database."""
+        backend = SQLiteCacheBackend(cache_dir, max_bytes=None)
+        backend.write('a', {'cached_at': datetime.now().isoformat(), 'identifier': 'a', 'data': 'hello'})
+        size = backend.total_bytes
+        backend.close()
+
+        reopened = SQLiteCacheBackend(cache_dir, max_bytes=None)
+        assert reopened.total_bytes == size
+        assert reopened.read('a')['data'] == 'hello'
+        reopened.close()
+
+    def test_corrupt_body_is_a_miss(self, backend, cache_dir):
+        """Test an undecompressable body is treated as a cache miss."""
+        cache = ResponseCache('walmart', cache_dir=cache_dir, backend=backend)
+        cache.set('https://www.walmart.com/store/1', '<html></html>')
+        backend._conn.execute('UPDATE entries SET body = ?', (b'not zlib',))
+
+        assert cache.get('https://www.walmart.com/store/1') is None
+
+
+class TestFileCacheBackend:
+    """Test default one-file-per-key backend."""
+
+    def test_default_backend_is_file(self, tmp_path):
+        """Test CacheInterface subclasses default to FileCacheBackend."""
+        cache = URLListCache('target', cache_dir=tmp_path)
+        assert isinstance(cache.backend, FileCacheBackend)
+
+    def test_evict_expired_removes_old_files(self, tmp_path):
+        """Test evict_expired deletes expired and unreadable cache files."""
+        cache = URLListCache('target', cache_dir=tmp_path, ttl_days=7)
+        cache.set('fresh', ['https://target.com/1'])
+        (tmp_path / 'old_urls.cache').write_text(json.dumps({
+            'cached_at': (datetime.now() - timedelta(days=30)).isoformat(),
+            'data': '[]'
+        }))
+        (tmp_path / 'broken_urls.cache').write_text('{ invalid json }')
+
+        assert cache.evict_expired() == 2
+        assert cache.get('fresh') == ['https://target.com/1']
+
+
+class TestRevalidationCache:
+    """Test validator storage for conditional GETs."""
+
+    @pytest.fixture
+    def cache(self, tmp_path):
+        """Create revalidation cache in a temp directory."""
+        cache = RevalidationCache('att', cache_dir=tmp_path)
+        yield cache
+        cache.close()
+
+    def test_defaults_to_sqlite_backend(self, cache):
+        """Test validators are kept in the single-file SQLite store."""
+        assert isinstance(cache.backend, SQLiteCacheBackend)
+
+    def test_store_and_conditional_headers(self, cache):
+        """Test stored validators become If-None-Match / If-Modified-Since."""
+        stored = cache.store('https://example.com/sitemap.xml', b'\x1f\x8bbinary', {
+            'etag': '"v1"',
+            'Last-Modified': 'Mon, 05 Oct 2026 10:00:00 GMT',
+            'Content-Type': 'application/xml',
+        })
+
+        entry = cache.get('https://example.com/sitemap.xml')
+        assert stored is True
+        assert RevalidationCache.conditional_headers(entry) == {
+            'If-None-Match': '"v1"',
+            'If-Modified-Since': 'Mon, 05 Oct 2026 10:00:00 GMT',
+        }
+        assert RevalidationCache.body(entry) == b'\x1f\x8bbinary'
+        assert entry['content_type'] == 'application/xml'
+
+    def test_store_skips_responses_without_validators(self, cache):
+        """Test responses without ETag/Last-Modified are not stored."""
+        assert cache.store('https://example.com/', b'body', {'Content-Type': 'text/html'}) is False
+        assert cache.get('https://example.com/') is None
+        assert RevalidationCache.conditional_headers(None) == {}
+
+    def test_store_ignores_non_mapping_headers(self, cache):
+        """Test mock or malformed headers are ignored rather than raising."""
+        assert cache.store('https://example.com/', b'body', object()) is False
@@ -5,6 +5,7 @@ import os
 import shutil
 import tempfile
 import pytest
+from unittest.mock import patch
 from datetime import datetime
 from pathlib import Path
 
@@ -174,6 +175,40 @@ class TestFingerprintComputation:
         assert len(fp) == 64
         assert all(c in '0123456789abcdef' for c in fp)
 
+    def test_batch_fingerprints_match_single(self, temp_data_dir):
+        """compute_fingerprints() should match compute_fingerprint() store by store"""
+        detector = ChangeDetector('verizon', temp_data_dir)
+        stores = [
+            {'store_id': '1001', 'city': 'New York'},
+            {'name': 'Shop', 'postal_code': '10001', 'latitude': 40.7},
+            {},
+        ]
+        assert detector.compute_fingerprints(stores) == [detector.compute_fingerprint(s) for s in stores]
+
+    def test_fingerprint_distinguishes_missing_from_empty(self, temp_data_dir):
+        """An absent field and an empty one should still hash differently"""
+        detector = ChangeDetector('verizon', temp_data_dir)
+        assert detector.compute_fingerprint({'store_id': '1'}) != detector.compute_fingerprint(
+            {'store_id': '1', 'status': ''}
+        )
+
+    def test_identity_hash_only_computed_for_address_keyed_stores(self, temp_data_dir, monkeypatch):
+        """Index build should hash identity once per address-keyed store and never for ID-keyed ones"""
+        detector = ChangeDetector('verizon', temp_data_dir)
+        calls = []
+        original = detector.compute_identity_hash
+        monkeypatch.setattr(detector, 'compute_identity_hash', lambda store: calls.append(store) or original(store))
+        stores = [
+            {'store_id': '1', 'name': 'A'},
+            {'name': 'B', 'street_address': '1 Main St'},
+            {'url': 'https://example.com/c'},
+        ]
+
+        stores_by_key, _, _ = detector._build_store_index(stores)
+
+        assert calls == [stores[1]]
+        assert 'id:1' in stores_by_key
+
 
 class TestChangeDetection:
     """Test change detection logic"""
@@ -430,6 +465,136 @@ class TestFilePersistence:
         assert result is None
 
 
+class TestRotation:
+    """Test rename-based rotation of stores_latest.json"""
+
+    def test_rotation_does_not_copy_latest(self, temp_data_dir, sample_stores):
+        """rotate_previous should make previous the same file as latest, not a copy"""
+        detector = ChangeDetector('verizon', temp_data_dir)
+        detector.save_latest(sample_stores)
+        latest_path = detector.output_dir / 'stores_latest.json'
+        previous_path = detector.output_dir / 'stores_previous.json'
+
+        with patch('src.change_detector.shutil.copy2') as copy2:
+            assert detector.rotate_previous()
+        copy2.assert_not_called()
+        assert os.path.samefile(latest_path, previous_path)
+
+    def test_next_save_leaves_previous_intact(self, temp_data_dir, sample_stores):
+        """Saving the next latest must replace it, not rewrite the shared file"""
+        detector = ChangeDetector('verizon', temp_data_dir)
+        detector.save_latest(sample_stores[:2])
+        detector.rotate_previous()
+        detector.save_latest(sample_stores)
+
+        assert len(detector.load_previous_data()) == 2
+        assert len(detector.load_current_data()) == 3
+
+    def test_rotation_falls_back_to_copy_without_hard_links(self, temp_data_dir, sample_stores):
+        """Filesystems without hard links should still rotate"""
+        detector = ChangeDetector('verizon', temp_data_dir)
+        detector.save_latest(sample_stores)
+
+        with patch('src.change_detector.os.link', side_effect=OSError("not supported")):
+            assert detector.rotate_previous()
+
+        assert detector.load_previous_data() == sample_stores
+        assert not any(p.name.startswith('.') for p in detector.output_dir.iterdir())
+
+    def test_failed_write_keeps_existing_latest(self, temp_data_dir, sample_stores):
+        """An interrupted save should leave the old stores_latest.json in place"""
+        detector = ChangeDetector('verizon', temp_data_dir)
+        detector.save_latest(sample_stores)
+
+        with pytest.raises(TypeError):
+            detector.save_latest([{'store_id': object()}])
+
+        assert detector.load_current_data() == sample_stores
+        assert not any(p.name.startswith('.') for p in detector.output_dir.iterdir())
+
+    def test_compact_output(self, temp_data_dir, sample_stores):
+        """compact=True should write stores_latest.json without indentation"""
+        detector = ChangeDetector('verizon', temp_data_dir, compact=True)
+        detector.save_version(sample_stores)
+
+        text = (detector.output_dir / 'stores_latest.json').read_text(encoding='utf-8')
+        assert '\n' not in text
+        assert json.loads(text) == sample_stores
+
+
+class TestFingerprintIndex:
+    """Test change detection against the persisted fingerprint index"""
+
+    def _save_run(self, detector, stores):
+        """Write stores_latest.json and its fingerprint index like run.py does"""
+        detector.save_latest(stores)
+        detector.save_fingerprints(stores)
+
+    def test_index_records_offsets_into_records_file(self, temp_data_dir, sample_stores):
+        """Each indexed key should point at its own line of the records file"""
+        detector = ChangeDetector('verizon', temp_data_dir)
+        self._save_run(detector, sample_stores)
+
+        with open(detector.fingerprints_path) as f:
+            index = json.load(f)
+        with open(detector.records_path, 'rb') as f:
+            data = f.read()
+
+        assert index['version'] == ChangeDetector.INDEX_VERSION
+        for key, (offset, length) in index['offsets'].items():
+            assert json.loads(data[offset:offset + length])['key'] == key
+
+    def test_detection_uses_index_without_loading_previous(self, temp_data_dir, sample_stores, monkeypatch):
+        """Only modified and closed records should be read when the index matches"""
+        detector = ChangeDetector('verizon', temp_data_dir)
+        self._save_run(detector, sample_stores)
+        detector.rotate_previous()
+
+        def fail():
+            raise AssertionError("previous data should not be loaded")
+        monkeypatch.setattr(detector, 'load_previous_data', fail)
+
+        current = [dict(sample_stores[0], latitude='41.0'), sample_stores[1], {'store_id': '9999', 'name': 'New'}]
+        report = detector.detect_changes(current)
+
+        assert [s['store_id'] for s in report.new_stores] == ['9999']
+        assert report.closed_stores == [sample_stores[2]]
+        assert report.modified_stores[0]['previous'] == sample_stores[0]
+        assert report.modified_stores[0]['changes'] == {'latitude': {'previous': '40.7128', 'current': '41.0'}}
+        assert report.unchanged_count == 1
+        assert report.total_previous == 3
+        assert report.previous_run == sample_stores[0]['scraped_at']
+
+    def test_index_and_full_load_agree(self, temp_data_dir, sample_stores):
+        """Indexed detection should produce the same report as a full reload"""
+        current = [dict(sample_stores[1], status='closed'), sample_stores[2]]
+
+        indexed = ChangeDetector('verizon', temp_data_dir)
+        self._save_run(indexed, sample_stores)
+        indexed.rotate_previous()
+        report_indexed = indexed.detect_changes(current)
+
+        indexed.fingerprints_path.unlink()
+        report_full = indexed.detect_changes(current)
+
+        for field in ('new_stores', 'closed_stores', 'modified_stores', 'unchanged_count', 'total_previous'):
+            assert getattr(report_indexed, field) == getattr(report_full, field)
+
+    def test_stale_index_falls_back_to_previous_data(self, temp_data_dir, sample_stores):
+        """An index that no longer matches stores_previous.json should be ignored"""
+        detector = ChangeDetector('verizon', temp_data_dir)
+        self._save_run(detector, sample_stores)
+        # A later non-incremental run rewrote stores_latest.json without a new index
+        detector.save_latest(sample_stores[:1])
+        detector.rotate_previous()
+
+        report = detector.detect_changes(sample_stores[:1])
+
+        assert report.total_previous == 1
+        assert report.closed_stores == []
+        assert not report.has_changes
+
+
 class TestKeyCollisionHandling:
     """Test key collision handling with fingerprint suffixes"""
 
@@ -0,0 +1,57 @@
+"""Tests for the append-only CheckpointJournal."""
+
+from unittest.mock import patch
+
+from src.shared.checkpoint import CheckpointJournal
+
+
+class TestCheckpointJournal:
+    """Tests for journal append, replay and compaction."""
+
+    def test_append_and_read_round_trip(self, tmp_path):
+        """Test records are replayed in append order."""
+        journal = CheckpointJournal(str(tmp_path / 'scrape_progress.json'))
+        journal.append({'key': 'url1', 'store': {'store_id': '1'}})
+        journal.append({'key': 'url2', 'store': None})
+        journal.close()
+
+        assert journal.path.name == 'scrape_progress.journal.jsonl'
+        assert list(journal.read()) == [
+            {'key': 'url1', 'store': {'store_id': '1'}},
+            {'key': 'url2', 'store': None},
+        ]
+
+    def test_fsync_is_batched(self, tmp_path):
+        """Test fsync runs once per fsync_every records, not per record."""
+        journal = CheckpointJournal(str(tmp_path / 'cp.json'), fsync_every=3)
+
+        with patch('src.shared.checkpoint.os.fsync') as mock_fsync:
+            for i in range(7):
+                journal.append({'key': i})
+            assert mock_fsync.call_count == 2
+            journal.flush()
+            assert mock_fsync.call_count == 3
+
+    def test_torn_last_line_is_ignored(self, tmp_path):
+        """Test a partially written trailing record doesn't break replay."""
+        journal = CheckpointJournal(str(tmp_path / 'cp.json'))
+        journal.append({'key': 'a'})
+        journal.close()
+        with open(journal.path, 'a', encoding='utf-8') as f:
+            f.write('{"key": "b", "sto')
+
+        assert list(journal.read()) == [{'key': 'a'}]
+
+    def test_truncate_discards_records(self, tmp_path):
+        """Test truncate removes the journal and resets the record count."""
+        journal = CheckpointJournal(str(tmp_path / 'cp.json'))
+        journal.append({'key': 'a'})
+        journal.truncate()
+
+        assert journal.records == 0
+        assert not journal.path.exists()
+        assert list(journal.read()) == []
+
+        journal.append({'key': 'b'})
+        journal.close()
+        assert list(journal.read()) == [{'key': 'b'}]
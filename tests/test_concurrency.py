@@ -2,8 +2,10 @@
 
 import threading
 import time
+from unittest.mock import AsyncMock, Mock, patch
+
 import pytest
-from src.shared.concurrency import GlobalConcurrencyManager, ConcurrencyConfig
+from src.shared.concurrency import AdaptiveController, GlobalConcurrencyManager, ConcurrencyConfig, PauseGate, TokenBucket
 
 
 @pytest.fixture
@@ -476,3 +478,370 @@ def test_configure_efficiency(manager):
 
     # Verify both settings are preserved
     assert manager.config.global_max_workers == 20
+
+
+def test_token_bucket_allows_burst_then_queues(fake_clock):
+    """Test bucket serves its capacity immediately, then spaces requests by 1/rate."""
+    bucket = TokenBucket(rate=2.0, clock=fake_clock)
+
+    assert bucket.reserve() == 0.0
+    assert bucket.reserve() == 0.0
+    assert bucket.reserve() == pytest.approx(0.5)
+    assert bucket.reserve() == pytest.approx(1.0)
+
+
+def test_token_bucket_refills_over_time(fake_clock):
+    """Test tokens accrue at rate and are capped at capacity."""
+    bucket = TokenBucket(rate=1.0, capacity=2.0, clock=fake_clock)
+    bucket.reserve()
+    bucket.reserve()
+
+    fake_clock.now = 10.0
+
+    assert bucket.available == pytest.approx(2.0)
+
+
+def test_token_bucket_rejects_nonpositive_rate():
+    """Test a zero rate is a configuration error rather than an infinite wait."""
+    with pytest.raises(ValueError):
+        TokenBucket(rate=0)
+
+
+def test_token_bucket_thread_safe_reservations():
+    """Test concurrent reservations never hand out more than capacity for free."""
+    bucket = TokenBucket(rate=0.001, capacity=5.0)
+    waits = []
+    lock = threading.Lock()
+
+    def worker():
+        wait = bucket.reserve()
+        with lock:
+            waits.append(wait)
+
+    threads = [threading.Thread(target=worker) for _ in range(20)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert sum(1 for w in waits if w == 0.0) == 5
+
+
+def test_direct_mode_unlimited_by_default(manager):
+    """Test direct requests without a retailer cap never wait."""
+    manager.configure(proxy_requests_per_second=1.0)
+
+    for _ in range(5):
+        assert manager.reserve_request('att', 'direct') == 0.0
+
+
+def test_proxy_mode_bucket_enforced(manager):
+    """Test proxy modes share one bucket refilled at proxy_requests_per_second."""
+    manager.configure(proxy_requests_per_second=2.0)
+
+    assert manager.reserve_request('att', 'residential') == 0.0
+    assert manager.reserve_request('target', 'residential') == 0.0
+    assert manager.reserve_request('verizon', 'residential') > 0.0
+    # Other proxy products have their own bucket
+    assert manager.reserve_request('att', 'web_scraper_api') == 0.0
+
+
+def test_proxy_rate_limit_by_mode_override(manager):
+    """Test per-mode rate overrides the default proxy rate."""
+    manager.configure(
+        proxy_requests_per_second=100.0,
+        proxy_rate_limit_by_mode={'web_scraper_api': 1.0}
+    )
+
+    assert manager.reserve_request(None, 'web_scraper_api') == 0.0
+    assert manager.reserve_request(None, 'web_scraper_api') > 0.0
+
+
+def test_per_retailer_rate_limit(manager):
+    """Test retailer caps apply in direct mode and only to that retailer."""
+    manager.configure(per_retailer_rate_limit={'bell': 1.0})
+
+    assert manager.reserve_request('bell', 'direct') == 0.0
+    assert manager.reserve_request('bell', 'direct') > 0.0
+    assert manager.reserve_request('att', 'direct') == 0.0
+
+
+def test_reconfigure_updates_existing_bucket(manager):
+    """Test configure() changes the rate of buckets already in use."""
+    manager.configure(proxy_requests_per_second=5.0)
+    manager.reserve_request(None, 'residential')
+
+    manager.configure(proxy_requests_per_second=20.0)
+
+    assert manager._proxy_buckets['residential'].rate == 20.0
+
+
+def test_reset_clears_rate_buckets(manager):
+    """Test reset() drops rate limits and buckets."""
+    manager.configure(per_retailer_rate_limit={'bell': 1.0})
+    manager.reserve_request('bell', 'residential')
+
+    manager.reset()
+
+    assert manager._proxy_buckets == {}
+    assert manager._retailer_buckets == {}
+    assert manager.get_stats()['config']['per_retailer_rate_limit'] == {}
+
+
+@pytest.mark.asyncio
+async def test_wait_for_token_async_sleeps_on_loop(manager):
+    """Test the async wait uses asyncio.sleep for the reserved delay."""
+    manager.configure(proxy_requests_per_second=1.0)
+    await manager.wait_for_token_async(None, 'residential')
+
+    with patch('src.shared.concurrency.asyncio.sleep', new_callable=AsyncMock) as mock_sleep:
+        waited = await manager.wait_for_token_async(None, 'residential')
+
+    assert waited > 0
+    mock_sleep.assert_called_once_with(waited)
+
+
+def test_proxy_client_get_draws_token(manager):
+    """Test ProxyClient.get() waits on the shared limiter for its mode and retailer."""
+    from src.shared.proxy_client import ProxyClient, ProxyConfig, ProxyMode, ProxyResponse
+
+    client = ProxyClient(ProxyConfig(mode=ProxyMode.DIRECT), retailer='att')
+    client._request_direct = Mock(return_value=ProxyResponse(
+        status_code=200, text='', content=b'', headers={}, url='https://example.com',
+        elapsed_seconds=0.1, proxy_mode=ProxyMode.DIRECT,
+    ))
+
+    with patch.object(GlobalConcurrencyManager, 'wait_for_token', return_value=0.0) as mock_wait:
+        client.get('https://example.com')
+
+    mock_wait.assert_called_once_with('att', 'direct')
+
+
+def test_get_with_retry_throttles_plain_sessions(manager):
+    """Test get_with_retry takes a token for plain sessions but not ProxiedSession."""
+    from src.shared.http import get_with_retry
+
+    plain = Mock(spec=['get'])
+    plain.get.return_value = Mock(status_code=200)
+    proxied = Mock(spec=['get', 'rate_limited'])
+    proxied.rate_limited = True
+    proxied.get.return_value = Mock(status_code=200)
+
+    with patch.object(GlobalConcurrencyManager, 'wait_for_token', return_value=0.0) as mock_wait, \
+            patch('src.shared.delays.time.sleep'):
+        get_with_retry(plain, 'https://example.com', retailer='bell')
+        get_with_retry(proxied, 'https://example.com', retailer='bell')
+
+    mock_wait.assert_called_once_with('bell', 'direct')
+
+
+def test_adaptive_additive_increase_after_clean_window():
+    """Test a full window of clean responses adds a worker and trims delays."""
+    controller = AdaptiveController('att', initial_workers=4, max_workers=8, success_window=5)
+
+    for _ in range(4):
+        controller.record(200)
+    assert controller.workers == 4
+
+    controller.record(200)
+
+    assert controller.workers == 5
+    assert controller.delay_scale == pytest.approx(0.9)
+
+
+def test_adaptive_multiplicative_decrease_on_429():
+    """Test a 429 halves workers and doubles the delay multiplier."""
+    controller = AdaptiveController('att', initial_workers=8, max_workers=8)
+
+    controller.record(429)
+
+    assert controller.workers == 4
+    assert controller.delay_scale == pytest.approx(2.0)
+    assert controller.scale_delays(0.2, 0.4) == (pytest.approx(0.4), pytest.approx(0.8))
+
+
+def test_adaptive_decrease_respects_cooldown_and_floor(fake_clock):
+    """Test a burst of 403s counts once per cooldown and never drops below min_workers."""
+    controller = AdaptiveController('att', initial_workers=4, min_workers=2, cooldown_seconds=5.0, clock=fake_clock)
+
+    controller.record(403)
+    controller.record(403)
+    assert controller.workers == 2
+    assert controller.decreases == 1
+
+    fake_clock.now = 10.0
+    controller.record(403)
+
+    assert controller.workers == 2
+    assert controller.delay_scale == pytest.approx(4.0)
+
+
+def test_adaptive_server_errors_decrease_only_in_bursts():
+    """Test isolated 5xx/timeouts are tolerated but a burst triggers a decrease."""
+    controller = AdaptiveController('att', initial_workers=6, max_workers=6)
+
+    controller.record(503)
+    controller.record(None)
+    assert controller.workers == 6
+
+    controller.record(502)
+
+    assert controller.workers == 3
+
+
+def test_adaptive_slot_limits_in_flight_work():
+    """Test slot() admits only `workers` concurrent holders."""
+    controller = AdaptiveController('att', initial_workers=2, max_workers=4)
+    peak = [0]
+    active = [0]
+    lock = threading.Lock()
+
+    def worker():
+        with controller.slot():
+            with lock:
+                active[0] += 1
+                peak[0] = max(peak[0], active[0])
+            time.sleep(0.05)
+            with lock:
+                active[0] -= 1
+
+    threads = [threading.Thread(target=worker) for _ in range(6)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert peak[0] == 2
+
+
+def test_enable_adaptive_registers_controller(manager):
+    """Test the manager keys controllers by retailer and reports them in stats."""
+    manager.configure(per_retailer_max={'att': 7})
+
+    controller = manager.enable_adaptive('att', initial_workers=3)
+
+    assert manager.get_adaptive_controller('att') is controller
+    assert manager.get_adaptive_controller('bell') is None
+    assert controller.max_workers == 7
+    assert manager.get_stats()['adaptive']['att']['workers'] == 3
+
+    manager.reset()
+    assert manager.get_adaptive_controller('att') is None
+
+
+def test_get_with_retry_feeds_adaptive_controller(manager):
+    """Test get_with_retry scales delays and records each attempt's status."""
+    from src.shared.http import get_with_retry
+
+    controller = manager.enable_adaptive('bell', initial_workers=4, settings={'max_workers': 4})
+    session = Mock(spec=['get'])
+    session.get.side_effect = [Mock(status_code=429), Mock(status_code=200)]
+
+    with patch('src.shared.delays.random.uniform', return_value=0.0) as mock_uniform, \
+            patch('src.shared.delays.time.sleep'), patch('src.shared.http.time.sleep'):
+        response = get_with_retry(session, 'https://example.com', retailer='bell',
+                                  min_delay=1.0, max_delay=2.0)
+
+    assert response.status_code == 200
+    assert controller.workers == 2
+    # Second attempt's delay bounds are doubled by the 429
+    mock_uniform.assert_called_with(2.0, 4.0)
+
+
+def test_pause_gate_blocks_other_workers_until_released():
+    """Test workers wait on a held gate and resume together when it is released."""
+    gate = PauseGate('att')
+    gate.hold(30.0)
+    resumed = []
+
+    def worker():
+        gate.wait()
+        resumed.append(time.monotonic())
+
+    threads = [threading.Thread(target=worker) for _ in range(3)]
+    for t in threads:
+        t.start()
+    time.sleep(0.05)
+    assert resumed == []
+
+    gate.release()
+    for t in threads:
+        t.join(timeout=1.0)
+
+    assert len(resumed) == 3
+    assert gate.remaining() == 0.0
+
+
+def test_pause_gate_budget_sizes_pause_from_window(fake_clock):
+    """Test budget_pause returns the time owed to average the configured rate."""
+    gate = PauseGate('att', clock=fake_clock)
+    for _ in range(50):
+        gate.count_request()
+    fake_clock.now = 20.0
+
+    # 50 requests at 60/min should take 50s; 20s already elapsed
+    assert gate.budget_pause(60) == pytest.approx(30.0)
+
+    gate.hold(30.0)
+    gate.release()
+    assert gate.budget_pause(60) == 0.0
+
+
+def test_check_pause_logic_holds_retailer_gate(manager):
+    """Test the pausing worker closes the retailer's gate for the length of its sleep."""
+    from src.shared.request_counter import RequestCounter, check_pause_logic
+
+    counter = RequestCounter()
+    gate = manager.get_pause_gate('att')
+    observed = []
+
+    with patch('src.shared.request_counter.time.sleep',
+               side_effect=lambda seconds: observed.append(gate.remaining())), \
+            patch('src.shared.request_counter.random.uniform', return_value=40.0):
+        check_pause_logic(counter, retailer='att', current_count=50)
+
+    assert observed and observed[0] > 30.0
+    assert gate.remaining() == 0.0
+
+
+def test_wait_for_token_honors_pause_gate(manager):
+    """Test requests through the limiter wait for an in-progress retailer pause."""
+    gate = manager.get_pause_gate('att')
+    gate.hold(30.0)
+    threading.Timer(0.1, gate.release).start()
+
+    started = time.monotonic()
+    manager.wait_for_token('att', 'direct')
+
+    assert time.monotonic() - started >= 0.09
+
+
+def test_pause_scope_proxy_closes_proxy_gate(manager):
+    """Test pause_scope: proxy also pauses other retailers on the same proxy mode."""
+    from src.shared.request_counter import RequestCounter, check_pause_logic
+
+    config = {'pause_scope': 'proxy', 'proxy': {'mode': 'residential'}}
+    proxy_gate = manager.get_pause_gate(proxy_mode='residential')
+    observed = []
+
+    with patch('src.shared.request_counter.time.sleep',
+               side_effect=lambda seconds: observed.append(proxy_gate.remaining())), \
+            patch('src.shared.request_counter.random.uniform', return_value=40.0):
+        check_pause_logic(RequestCounter(), retailer='att', config=config, current_count=50)
+
+    assert observed[0] > 30.0
+
+
+def test_check_pause_logic_uses_budget(manager):
+    """Test pause_budget_rpm replaces the random pause ranges."""
+    from src.shared.request_counter import RequestCounter, get_pause_duration
+
+    counter = RequestCounter()
+    config = {'pause_budget_rpm': 60}
+    for count in range(1, 50):
+        assert get_pause_duration(counter, retailer='bell', config=config, current_count=count) == 0.0
+
+    pause = get_pause_duration(counter, retailer='bell', config=config, current_count=50)
+
+    # 50 requests completed near-instantly should owe almost the full 50s window
+    assert 45.0 < pause <= 50.0
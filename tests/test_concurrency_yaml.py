@@ -297,3 +297,22 @@ concurrency:
 
     assert manager.config.global_max_workers == 12
     assert manager.config.proxy_requests_per_second == 8.0
+
+
+def test_load_rate_limit_overrides(manager, temp_yaml):
+    """Test per-mode and per-retailer rate limits are loaded from YAML."""
+    yaml_content = """
+concurrency:
+  proxy_rate_limit: 10.0
+  proxy_rate_limit_by_mode:
+    web_scraper_api: 4.0
+  per_retailer_rate_limit:
+    bell: 0.1
+"""
+    Path(temp_yaml).write_text(yaml_content)
+
+    configure_concurrency_from_yaml(temp_yaml)
+
+    stats = manager.get_stats()
+    assert stats['config']['proxy_rate_limit_by_mode'] == {'web_scraper_api': 4.0}
+    assert stats['config']['per_retailer_rate_limit'] == {'bell': 0.1}
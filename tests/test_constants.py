@@ -450,12 +450,12 @@ class TestAllExport:
         """All singleton instances should be in __all__."""
         from src.shared import constants
         expected = [
-            'HTTP', 'CACHE', 'PAUSE', 'WORKERS', 'PROGRESS',
+            'HTTP', 'CACHE', 'CHECKPOINT', 'PAUSE', 'WORKERS', 'ADAPTIVE', 'PROGRESS',
             'EXPORT', 'LOGGING', 'RUN_HISTORY', 'STREAMING',
             'STATUS', 'TEST_MODE', 'VALIDATION',
             # Also include dataclass types
-            'HttpDefaults', 'CacheDefaults', 'PauseDefaults',
-            'WorkerDefaults', 'ProgressDefaults', 'ExportDefaults',
+            'HttpDefaults', 'CacheDefaults', 'CheckpointDefaults', 'PauseDefaults',
+            'WorkerDefaults', 'AdaptiveDefaults', 'ProgressDefaults', 'ExportDefaults',
             'LoggingDefaults', 'RunHistoryDefaults', 'StreamingDefaults',
             'StatusDefaults', 'TestModeDefaults', 'ValidationDefaults',
         ]
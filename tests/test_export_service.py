@@ -50,6 +50,7 @@ class TestExportFormat:
     def test_export_format_values(self):
         """Test that all export formats have correct values"""
         assert ExportFormat.JSON.value == "json"
+        assert ExportFormat.JSONL.value == "jsonl"
         assert ExportFormat.CSV.value == "csv"
         assert ExportFormat.EXCEL.value == "excel"
         assert ExportFormat.GEOJSON.value == "geojson"
@@ -306,6 +307,41 @@ class TestExportServiceGeoJSON:
             os.unlink(output_path)
 
 
+    def test_streamed_geojson_matches_generate_geojson(self, tmp_path):
+        """Test the streamed file is byte-identical to dumping generate_geojson()"""
+        stores = SAMPLE_STORES + [{"store_id": "1003", "name": "No Coords"}]
+        output_path = tmp_path / 'stores.geojson'
+        ExportService.export_stores(stores, ExportFormat.GEOJSON, str(output_path), normalize_fields=False)
+
+        expected = json.dumps(ExportService.generate_geojson(stores), indent=2, ensure_ascii=False)
+        assert output_path.read_text(encoding='utf-8') == expected
+
+    def test_streamed_geojson_without_features(self, tmp_path):
+        """Test a file with no locatable stores is still valid GeoJSON"""
+        stores = [{"store_id": "1003", "name": "No Coords"}]
+        output_path = tmp_path / 'stores.geojson'
+        ExportService.export_stores(stores, ExportFormat.GEOJSON, str(output_path), normalize_fields=False)
+
+        expected = json.dumps(ExportService.generate_geojson(stores), indent=2, ensure_ascii=False)
+        assert output_path.read_text(encoding='utf-8') == expected
+
+
+class TestExportServiceJSONL:
+    """Tests for JSON Lines export"""
+
+    def test_export_jsonl_one_store_per_line(self, tmp_path):
+        """Test each store is written as one compact JSON object per line"""
+        output_path = tmp_path / 'stores.jsonl'
+        ExportService.export_stores(SAMPLE_STORES, ExportFormat.JSONL, str(output_path), normalize_fields=False)
+
+        lines = output_path.read_text(encoding='utf-8').splitlines()
+        assert [json.loads(line) for line in lines] == SAMPLE_STORES
+
+    def test_parse_jsonl_format(self):
+        """Test jsonl can be selected on the command line"""
+        assert parse_format_list("json,jsonl") == [ExportFormat.JSON, ExportFormat.JSONL]
+
+
 class TestExportServiceExcel:
     """Tests for Excel export functionality"""
 
@@ -686,3 +722,62 @@ class TestFieldnameUnion:
         # Phone column should exist even though first store doesn't have it
         assert 'phone' in reader.fieldnames
         assert rows[1]['phone'] == '555-1234'
+
+
+class TestStreamingExport:
+    """Tests for single-pass export from any iterable"""
+
+    def test_export_from_generator(self, tmp_path):
+        """Test a generator is accepted and matches list input byte-for-byte"""
+        from_list = tmp_path / 'list.csv'
+        from_gen = tmp_path / 'gen.csv'
+        ExportService.export_stores(SAMPLE_STORES, ExportFormat.CSV, str(from_list))
+        ExportService.export_stores((s for s in SAMPLE_STORES), ExportFormat.CSV, str(from_gen))
+
+        assert from_gen.read_bytes() == from_list.read_bytes()
+
+    def test_multi_format_single_pass(self, tmp_path):
+        """Test every format is written while the input is iterated only once"""
+        outputs = {
+            ExportFormat.JSON: str(tmp_path / 'stores.json'),
+            ExportFormat.JSONL: str(tmp_path / 'stores.jsonl'),
+            ExportFormat.CSV: str(tmp_path / 'stores.csv'),
+            ExportFormat.GEOJSON: str(tmp_path / 'stores.geojson'),
+            ExportFormat.EXCEL: str(tmp_path / 'stores.xlsx'),
+        }
+        stores = iter(SAMPLE_STORES)
+        written = ExportService.export_stores_multi(stores, outputs)
+
+        assert written == outputs
+        for fmt, path in outputs.items():
+            single = tmp_path / 'single' / os.path.basename(path)
+            ExportService.export_stores(SAMPLE_STORES, fmt, str(single))
+            if fmt != ExportFormat.EXCEL:
+                assert single.read_bytes() == open(path, 'rb').read(), fmt
+        assert sorted(os.listdir(tmp_path)) == sorted(
+            [os.path.basename(p) for p in outputs.values()] + ['single']
+        )
+
+    def test_failed_export_keeps_previous_outputs(self, tmp_path):
+        """Test an error mid-stream leaves existing files untouched"""
+        output_path = tmp_path / 'stores.json'
+        output_path.write_text('previous', encoding='utf-8')
+
+        def stores():
+            yield SAMPLE_STORES[0]
+            raise RuntimeError('scrape failed')
+
+        with pytest.raises(RuntimeError):
+            ExportService.export_stores_multi(stores(), {ExportFormat.JSON: str(output_path)})
+
+        assert output_path.read_text(encoding='utf-8') == 'previous'
+        assert os.listdir(tmp_path) == ['stores.json']
+
+    def test_empty_iterable_writes_nothing(self, tmp_path):
+        """Test an empty input leaves no files behind"""
+        written = ExportService.export_stores_multi(
+            iter([]), {ExportFormat.CSV: str(tmp_path / 'stores.csv')}
+        )
+
+        assert written == {}
+        assert os.listdir(tmp_path) == []
@@ -0,0 +1,197 @@
+"""Tests for the coverage-aware ZIP gap-fill engine."""
+
+import threading
+from unittest.mock import patch
+
+import pytest
+
+from src.shared.gap_fill import US_ZIP_CENTROIDS, ZipGapFill, haversine_miles
+
+
+def _store(store_id, zip_code=None, lat=None, lng=None):
+    """Store dict placed at a ZIP centroid unless coordinates are given."""
+    if zip_code is not None:
+        lat, lng = US_ZIP_CENTROIDS[zip_code]
+    return {'id': store_id, 'lat': lat, 'lng': lng}
+
+
+def _engine(search, **kwargs):
+    """ZipGapFill over dict stores with defaults suited to tests."""
+    kwargs.setdefault('radius_miles', 100)
+    kwargs.setdefault('workers', 1)
+    kwargs.setdefault('patience', 0)
+    kwargs.setdefault('seed_radius_miles', 0)
+    return ZipGapFill(
+        search=search,
+        key_func=lambda s: s['id'],
+        coords_func=lambda s: (s['lat'], s['lng']),
+        **kwargs,
+    )
+
+
+class TestHaversine:
+    """Tests for haversine_miles()."""
+
+    def test_known_distance(self):
+        """New York to Los Angeles is about 2,450 miles."""
+        nyc, la = US_ZIP_CENTROIDS['10001'], US_ZIP_CENTROIDS['90001']
+        assert haversine_miles(*nyc, *la) == pytest.approx(2450, rel=0.02)
+
+    def test_zero_distance(self):
+        assert haversine_miles(40.0, -75.0, 40.0, -75.0) == 0.0
+
+
+class TestZipGapFill:
+    """Tests for ZipGapFill selection, coverage and stopping."""
+
+    def test_farthest_first_and_coverage_stop(self):
+        """Nearby ZIPs inside a finished search's radius are never searched."""
+        searched = []
+
+        def search(zip_code):
+            searched.append(zip_code)
+            return []
+
+        # 10001 and 11201 are a few miles apart; 90001 is across the country
+        engine = _engine(search, zip_codes=['10001', '11201', '90001'])
+        engine.run()
+
+        assert searched == ['10001', '90001']
+        assert engine.stop_reason == 'all candidates covered'
+
+    def test_truncated_results_shrink_coverage(self):
+        """A search that hit max_results only covers out to its farthest store."""
+        searched = []
+
+        def search(zip_code):
+            searched.append(zip_code)
+            if zip_code == '10001':
+                return [_store(str(i), '10001') for i in range(3)]
+            return []
+
+        # Brooklyn is inside the 100-mile radius but outside 0-mile coverage
+        engine = _engine(search, zip_codes=['10001', '11201'], max_results=3)
+        result = engine.run()
+
+        assert searched == ['10001', '11201']
+        assert set(result) == {'0', '1', '2'}
+
+    def test_dedupes_against_known_and_across_searches(self):
+        def search(zip_code):
+            return [_store('A', zip_code), _store('B', zip_code)]
+
+        engine = _engine(search, zip_codes=['10001', '90001', '98101'], radius_miles=10)
+        result = engine.run(known_ids={'A'})
+
+        assert list(result) == ['B']
+
+    def test_known_points_seed_coverage(self):
+        """ZIPs near stores found upstream are skipped."""
+        searched = []
+
+        def search(zip_code):
+            searched.append(zip_code)
+            return []
+
+        engine = _engine(search, zip_codes=['10001', '90001'], seed_radius_miles=25)
+        engine.run(known_points=[US_ZIP_CENTROIDS['10001'], ('', None)])
+
+        assert searched == ['90001']
+
+    def test_patience_stops_dry_sweep(self):
+        engine = _engine(lambda zip_code: [], radius_miles=1, patience=3)
+        engine.run()
+
+        assert len(engine.searched) == 3
+        assert 'without new stores' in engine.stop_reason
+
+    def test_limit_stops_sweep(self):
+        engine = _engine(
+            lambda zip_code: [_store(zip_code + '-1', zip_code), _store(zip_code + '-2', zip_code)],
+            radius_miles=1,
+            limit=3,
+        )
+        result = engine.run()
+
+        assert len(result) == 3
+        assert len(engine.searched) == 2
+
+    def test_search_errors_are_retried_then_reported(self):
+        calls = []
+
+        def search(zip_code):
+            calls.append(zip_code)
+            if zip_code == '10001':
+                raise RuntimeError('boom')
+            return [_store('X', zip_code)]
+
+        engine = _engine(search, zip_codes=['10001', '90001'], retries=1)
+        result = engine.run()
+
+        assert list(result) == ['X']
+        assert calls.count('10001') == 2
+        assert engine.failed == ['10001']
+        assert engine.searched == ['10001', '90001']
+
+    def test_failed_search_covers_nothing(self):
+        """A failed search does not mark its area covered or suppress neighbours."""
+        calls = []
+
+        def search(zip_code):
+            calls.append(zip_code)
+            if zip_code == '10001':
+                return None
+            return [_store('X', zip_code)]
+
+        # Brooklyn lies inside the 100-mile radius of a successful 10001 search;
+        # once Brooklyn succeeds, its radius covers 10001 and the retry is moot
+        engine = _engine(search, zip_codes=['10001', '11201'])
+        result = engine.run()
+
+        assert calls == ['10001', '11201']
+        assert list(result) == ['X']
+        assert engine.failed == []
+
+    def test_failed_search_does_not_count_toward_patience(self):
+        def search(zip_code):
+            if zip_code == '10001':
+                return None
+            return [_store('X', zip_code)]
+
+        engine = _engine(search, zip_codes=['10001', '90001'], patience=1)
+        result = engine.run()
+
+        assert list(result) == ['X']
+        assert set(engine.searched) == {'10001', '90001'}
+
+    def test_concurrent_searches(self):
+        """Searches overlap up to the worker count."""
+        active, peak = [0], [0]
+        lock = threading.Lock()
+        release = threading.Barrier(3, timeout=5)
+
+        def search(zip_code):
+            with lock:
+                active[0] += 1
+                peak[0] = max(peak[0], active[0])
+            if zip_code in ('10001', '90001', '98101'):
+                release.wait()
+            with lock:
+                active[0] -= 1
+            return []
+
+        engine = _engine(search, zip_codes=['10001', '90001', '98101'], radius_miles=10, workers=3)
+        engine.run()
+
+        assert peak[0] == 3
+
+    def test_rate_limiter_only_with_proxy_mode(self):
+        with patch('src.shared.gap_fill.GlobalConcurrencyManager') as manager:
+            _engine(lambda zip_code: [], zip_codes=['10001']).run()
+            manager.return_value.wait_for_token.assert_not_called()
+
+            _engine(
+                lambda zip_code: [], zip_codes=['10001'],
+                retailer='staples', proxy_mode='web_scraper_api',
+            ).run()
+            manager.return_value.wait_for_token.assert_called_once_with('staples', 'web_scraper_api')
@@ -0,0 +1,110 @@
+"""Tests for the fast JSON-LD / embedded JSON extractor."""
+
+from unittest.mock import patch
+
+from src.shared import html_extract
+from src.shared.html_extract import (
+    extract_js_object,
+    extract_json_ld,
+    extract_next_data,
+    extract_title,
+    find_json_ld,
+    iter_script_blocks,
+    make_soup,
+)
+
+
+PAGE = """<!DOCTYPE html>
+<html><head>
+<title>Store Locator &amp; Hours</title>
+<script src="/app.js"></script>
+<script type="application/ld+json">{"@type": "Organization", "name": "Acme"}</script>
+<SCRIPT TYPE='application/ld+json'>
+[{"@type": ["Store", "LocalBusiness"], "name": "Main St"}]
+</SCRIPT>
+<script type="application/ld+json">{"@context": "https://schema.org",
+  "@graph": [{"@type": "BreadcrumbList"}, {"@type": "MobilePhoneStore", "name": "Graph"}]}</script>
+<script type="application/ld+json">{not json}</script>
+<script>var cityJSON = {"stores": [{"storeUrl": "/s/1", "note": "}; not the end"}]}; var x = 1;</script>
+<script id="__NEXT_DATA__" type="application/json">{"props": {"pageProps": {"id": 7}}}</script>
+</head><body></body></html>
+"""
+
+
+class TestIterScriptBlocks:
+    """Tests for the regex script scanner."""
+
+    def test_filters_by_type_case_insensitively(self):
+        """Test type filtering matches regardless of tag/attribute case and quoting."""
+        blocks = list(iter_script_blocks(PAGE, script_type='application/ld+json'))
+
+        assert len(blocks) == 4
+        assert 'Main St' in blocks[1]
+
+    def test_filters_by_id(self):
+        """Test the __NEXT_DATA__ block is found by id."""
+        blocks = list(iter_script_blocks(PAGE, script_id='__NEXT_DATA__'))
+
+        assert blocks == ['{"props": {"pageProps": {"id": 7}}}']
+
+    def test_falls_back_to_parser_when_scanner_misses(self):
+        """Test a block the scanner cannot see is still found by the HTML parser."""
+        with patch.object(html_extract, '_SCRIPT_OPEN', html_extract.re.compile(r'(?!)')):
+            blocks = list(iter_script_blocks(PAGE, script_id='__NEXT_DATA__'))
+
+        assert blocks == ['{"props": {"pageProps": {"id": 7}}}']
+
+    def test_empty_html(self):
+        """Test empty input yields nothing."""
+        assert list(iter_script_blocks('', script_type='application/ld+json')) == []
+
+
+class TestJsonLd:
+    """Tests for extract_json_ld() and find_json_ld()."""
+
+    def test_flattens_arrays_and_graphs_and_skips_invalid(self):
+        """Test every schema.org object is returned once, in page order."""
+        types = [item['@type'] for item in extract_json_ld(PAGE)]
+
+        assert types == ['Organization', ['Store', 'LocalBusiness'], 'BreadcrumbList', 'MobilePhoneStore']
+
+    def test_find_matches_type_lists(self):
+        """Test an object whose @type is a list matches any of its types."""
+        assert find_json_ld(PAGE, 'LocalBusiness')['name'] == 'Main St'
+        assert find_json_ld(PAGE, ('Hotel', 'MobilePhoneStore'))['name'] == 'Graph'
+        assert find_json_ld(PAGE, 'Hotel') is None
+
+    def test_tolerates_comment_wrapper(self):
+        """Test JSON-LD wrapped in an HTML comment still decodes."""
+        html = '<script type="application/ld+json"><!-- {"@type": "Store"} --></script>'
+
+        assert find_json_ld(html, 'Store') == {'@type': 'Store'}
+
+
+class TestEmbeddedJson:
+    """Tests for __NEXT_DATA__, JavaScript variables and titles."""
+
+    def test_extract_next_data(self):
+        """Test the Next.js blob is decoded."""
+        assert extract_next_data(PAGE)['props']['pageProps']['id'] == 7
+        assert extract_next_data('<html></html>') is None
+
+    def test_extract_js_object_ignores_terminators_inside_strings(self):
+        """Test `};` inside a string value does not truncate the object."""
+        data = extract_js_object(PAGE, 'cityJSON')
+
+        assert data['stores'][0] == {'storeUrl': '/s/1', 'note': '}; not the end'}
+
+    def test_extract_js_object_missing_or_invalid(self):
+        """Test missing or undecodable variables return None."""
+        assert extract_js_object(PAGE, 'stateJSON') is None
+        assert extract_js_object('var stateJSON = {broken};', 'stateJSON') is None
+
+    def test_extract_title(self):
+        """Test the title is unescaped and stripped."""
+        assert extract_title(PAGE) == 'Store Locator & Hours'
+        assert extract_title('<html></html>') is None
+
+    def test_make_soup(self):
+        """Test make_soup builds a queryable tree."""
+        assert make_soup(PAGE).find('title').get_text() == 'Store Locator & Hours'
@@ -0,0 +1,138 @@
+"""Tests for sitemap <lastmod> based incremental runs."""
+
+import json
+
+import defusedxml.ElementTree as ET
+
+from src.shared.incremental import IncrementalState, sitemap_lastmods
+
+
+SITEMAP = b"""<?xml version="1.0" encoding="UTF-8"?>
+<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">
+  <url><loc>https://example.com/store/1</loc><lastmod>2024-01-01</lastmod></url>
+  <url><loc> https://example.com/store/2 </loc><lastmod> 2024-02-01T10:00:00Z </lastmod></url>
+  <url><loc>https://example.com/store/3</loc></url>
+</urlset>"""
+
+
+def _state(tmp_path, previous=None, latest=None):
+    """Build an IncrementalState with optional previous lastmods and stores."""
+    state_path = tmp_path / 'incremental_state.json'
+    if previous is not None:
+        stores = {store['url']: store for store in latest or []}
+        state_path.write_text(json.dumps({'lastmods': previous, 'stores': stores}), encoding='utf-8')
+    return IncrementalState('test', state_path=str(state_path))
+
+
+class TestSitemapLastmods:
+    """Tests for sitemap_lastmods()."""
+
+    def test_namespaced_sitemap(self):
+        """Test loc/lastmod pairs are extracted and stripped; entries without lastmod are skipped."""
+        assert sitemap_lastmods(ET.fromstring(SITEMAP)) == {
+            'https://example.com/store/1': '2024-01-01',
+            'https://example.com/store/2': '2024-02-01T10:00:00Z',
+        }
+
+    def test_plain_sitemap(self):
+        """Test sitemaps without the sitemaps.org namespace."""
+        root = ET.fromstring(b'<urlset><url><loc>u1</loc><lastmod>d1</lastmod></url></urlset>')
+        assert sitemap_lastmods(root) == {'u1': 'd1'}
+
+
+class TestIncrementalState:
+    """Tests for IncrementalState planning and persistence."""
+
+    def test_unchanged_urls_are_carried_forward(self, tmp_path):
+        """Test only new/changed URLs are fetched and unchanged stores come from the last run."""
+        state = _state(
+            tmp_path,
+            previous={'u1': 'd1', 'u2': 'd1'},
+            latest=[{'store_id': '1', 'url': 'u1'}, {'store_id': '2', 'url': 'u2'}],
+        )
+        state.lastmods.update({'u1': 'd1', 'u2': 'd2', 'u3': 'd1'})
+
+        to_fetch, carried = state.plan(['u1', 'u2', 'u3'])
+
+        assert to_fetch == ['u2', 'u3']
+        assert carried == [('u1', {'store_id': '1', 'url': 'u1'})]
+        assert state.carried == 1
+
+    def test_missing_previous_store_is_refetched(self, tmp_path):
+        """Test an unchanged URL whose store is absent from the last run is fetched again."""
+        state = _state(tmp_path, previous={'u1': 'd1'}, latest=[])
+        state.lastmods['u1'] = 'd1'
+
+        assert state.plan(['u1']) == (['u1'], [])
+
+    def test_no_lastmods_fetches_everything(self, tmp_path):
+        """Test sitemaps without <lastmod> fall back to a full run."""
+        state = _state(tmp_path, previous={'u1': 'd1'}, latest=[{'url': 'u1'}])
+
+        assert state.plan(['u1', 'u2']) == (['u1', 'u2'], [])
+
+    def test_first_run_fetches_everything(self, tmp_path):
+        """Test a run without previous state fetches all URLs."""
+        state = _state(tmp_path)
+        state.lastmods['u1'] = 'd1'
+
+        assert state.plan(['u1']) == (['u1'], [])
+
+    def test_checkpointed_urls_are_not_carried_twice(self, tmp_path):
+        """Test unchanged URLs already restored from a checkpoint are skipped."""
+        state = _state(tmp_path, previous={'u1': 'd1'}, latest=[{'url': 'u1'}])
+        state.lastmods['u1'] = 'd1'
+
+        assert state.plan(['u1'], completed={'u1'}) == ([], [])
+
+    def test_url_func_for_dict_items(self, tmp_path):
+        """Test dict items are matched on the URL returned by url_func."""
+        state = _state(tmp_path, previous={'u1': 'd1'}, latest=[{'url': 'u1'}])
+        state.lastmods['u1'] = 'd1'
+        item = {'store_id': '1', 'url': 'u1'}
+
+        to_fetch, carried = state.plan([item], url_func=lambda i: i['url'])
+
+        assert to_fetch == []
+        assert carried == [(item, {'url': 'u1'})]
+
+    def test_save_records_only_scraped_urls(self, tmp_path):
+        """Test failed URLs are left out of the saved state so they are retried."""
+        state = _state(tmp_path)
+        state.lastmods.update({'u1': 'd1', 'u2': 'd2'})
+
+        state.save([{'url': 'u1'}])
+
+        saved = json.loads((tmp_path / 'incremental_state.json').read_text(encoding='utf-8'))
+        assert saved['lastmods'] == {'u1': 'd1'}
+        assert saved['stores'] == {'u1': {'url': 'u1'}}
+
+    def test_saved_stores_are_carried_forward_unchanged(self, tmp_path):
+        """Test carried stores are the raw records saved by the last run, not export records."""
+        raw = {'store_id': '1', 'url': 'u1', 'phone_number': '555-0100', 'postal_code': '10001'}
+        first = _state(tmp_path)
+        first.lastmods['u1'] = 'd1'
+        first.save([raw])
+
+        second = IncrementalState('test', state_path=str(tmp_path / 'incremental_state.json'))
+        second.lastmods['u1'] = 'd1'
+
+        assert second.plan(['u1']) == ([], [('u1', raw)])
+
+    def test_state_without_stores_fetches_everything(self, tmp_path):
+        """Test state written before stores were recorded falls back to a full run."""
+        (tmp_path / 'incremental_state.json').write_text(
+            json.dumps({'lastmods': {'u1': 'd1'}}), encoding='utf-8'
+        )
+        state = IncrementalState('test', state_path=str(tmp_path / 'incremental_state.json'))
+        state.lastmods['u1'] = 'd1'
+
+        assert state.plan(['u1']) == (['u1'], [])
+
+    def test_unreadable_state_is_ignored(self, tmp_path):
+        """Test a corrupt state file falls back to a full run."""
+        (tmp_path / 'incremental_state.json').write_text('{not json', encoding='utf-8')
+        state = _state(tmp_path, latest=[{'url': 'u1'}])
+        state.lastmods['u1'] = 'd1'
+
+        assert state.plan(['u1']) == (['u1'], [])
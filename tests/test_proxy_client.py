@@ -6,11 +6,12 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 import json
+import threading
 import pytest
 from unittest.mock import Mock, patch, MagicMock
 
 from src.shared.proxy_client import (
-    ProxyClient, ProxyConfig, ProxyMode, ProxyResponse
+    ProxyClient, ProxyConfig, ProxyCostLedger, ProxyMode, ProxyResponse
 )
 
 
@@ -152,6 +153,43 @@ class TestProxyClientResidentialProxyURL:
         assert "sessid-session123" in url
 
 
+class TestProxyClientSessionPool:
+    """Test residential requests through the sticky session pool"""
+
+    def test_pooled_request_uses_leased_session(self):
+        """Test each pooled request is sent through a sessid- proxy and reported back"""
+        config = ProxyConfig(
+            mode=ProxyMode.RESIDENTIAL,
+            residential_username="user",
+            residential_password="pass",
+            session_type="pool",
+            session_pool_size=2,
+        )
+        client = ProxyClient(config, retailer='pool_test_client')
+        mock_response = Mock(status_code=200, text="ok", content=b"ok", headers={}, url="https://example.com")
+
+        with patch.object(client.session, 'get', return_value=mock_response) as mock_get:
+            client.get("https://example.com")
+
+        proxies = mock_get.call_args.kwargs['proxies']
+        stats = client.get_stats()['session_pool']
+        leased = [s for s in stats['sessions'] if s['requests'] == 1]
+        assert len(leased) == 1
+        assert f"sessid-{leased[0]['session_id']}" in proxies['https']
+        assert stats['in_flight'] == 0
+
+    def test_rotating_mode_has_no_pool(self):
+        """Test the pool is only used when session_type is 'pool'"""
+        config = ProxyConfig(
+            mode=ProxyMode.RESIDENTIAL,
+            residential_username="user",
+            residential_password="pass",
+        )
+        client = ProxyClient(config)
+        assert client._session_pool is None
+        assert "sessid-" not in client._build_residential_proxy_url()
+
+
 class TestProxyClientGetHeaders:
     """Test header generation"""
 
@@ -346,7 +384,8 @@ class TestProxyClientWebScraperAPI:
             mode=ProxyMode.WEB_SCRAPER_API,
             scraper_api_username="api_user",
             scraper_api_password="api_pass",
-            country_code="us"
+            country_code="us",
+            http2=False
         )
         client = ProxyClient(config)
 
@@ -361,7 +400,7 @@ class TestProxyClientWebScraperAPI:
             "credits_used": 1.5
         }
 
-        with patch('requests.post', return_value=mock_response) as mock_post:
+        with patch('requests.Session.post', return_value=mock_response) as mock_post:
             response = client.get("https://example.com")
 
         assert response is not None
@@ -382,7 +421,8 @@ class TestProxyClientWebScraperAPI:
             mode=ProxyMode.WEB_SCRAPER_API,
             scraper_api_username="api_user",
             scraper_api_password="api_pass",
-            render_js=True
+            render_js=True,
+            http2=False
         )
         client = ProxyClient(config)
 
@@ -395,7 +435,7 @@ class TestProxyClientWebScraperAPI:
             }]
         }
 
-        with patch('requests.post', return_value=mock_response) as mock_post:
+        with patch('requests.Session.post', return_value=mock_response) as mock_post:
             response = client.get("https://example.com")
 
         payload = mock_post.call_args[1]['json']
@@ -407,7 +447,8 @@ class TestProxyClientWebScraperAPI:
             mode=ProxyMode.WEB_SCRAPER_API,
             scraper_api_username="api_user",
             scraper_api_password="api_pass",
-            parse=True
+            parse=True,
+            http2=False
         )
         client = ProxyClient(config)
 
@@ -420,13 +461,240 @@ class TestProxyClientWebScraperAPI:
             }]
         }
 
-        with patch('requests.post', return_value=mock_response) as mock_post:
+        with patch('requests.Session.post', return_value=mock_response) as mock_post:
             response = client.get("https://example.com")
 
         payload = mock_post.call_args[1]['json']
         assert payload['parse'] is True
 
 
+class TestProxyClientScraperApiTransport:
+    """Test the pooled keep-alive transport for Web Scraper API calls"""
+
+    @staticmethod
+    def _client(**overrides):
+        config = ProxyConfig(
+            mode=ProxyMode.WEB_SCRAPER_API,
+            scraper_api_username="api_user",
+            scraper_api_password="api_pass",
+            http2=False,
+            **overrides
+        )
+        return ProxyClient(config)
+
+    def test_transport_is_reused_within_a_thread(self):
+        """Test repeated API calls reuse one warm session instead of requests.post"""
+        client = self._client(pool_maxsize=4)
+
+        first = client._api_transport()
+        second = client._api_transport()
+
+        assert first is second
+        adapter = first.get_adapter(client.config.scraper_api_endpoint)
+        assert adapter._pool_maxsize == 4
+
+    def test_threads_share_the_connection_pool_not_the_session(self):
+        """Test each thread gets its own session mounted on one shared adapter"""
+        client = self._client()
+        sessions = []
+
+        def worker():
+            sessions.append(client._api_transport())
+
+        threads = [threading.Thread(target=worker) for _ in range(2)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        assert sessions[0] is not sessions[1]
+        endpoint = client.config.scraper_api_endpoint
+        assert sessions[0].get_adapter(endpoint) is sessions[1].get_adapter(endpoint)
+
+    def test_close_releases_transport(self):
+        """Test close() drops the pooled transport so a new one is built on reuse"""
+        client = self._client()
+        first = client._api_transport()
+
+        client.close()
+
+        assert client._api_adapter is None
+        assert client._api_transport() is not first
+
+    def test_http2_client_used_when_available(self):
+        """Test an HTTP/2 httpx client is shared when httpx[http2] is installed"""
+        client = self._client()
+        client.config.http2 = True
+        fake_httpx = MagicMock()
+
+        with patch('src.shared.proxy_client.HTTP2_AVAILABLE', True), \
+                patch('src.shared.proxy_client.httpx', fake_httpx, create=True):
+            transport = client._api_transport()
+            assert client._api_transport() is transport
+
+        fake_httpx.Client.assert_called_once()
+        assert fake_httpx.Client.call_args[1]['http2'] is True
+
+
+class TestProxyClientBatchJobs:
+    """Test Web Scraper API push-pull batch jobs"""
+
+    @staticmethod
+    def _client():
+        config = ProxyConfig(
+            mode=ProxyMode.WEB_SCRAPER_API,
+            scraper_api_username="api_user",
+            scraper_api_password="api_pass",
+            http2=False,
+            retry_delay=0,
+        )
+        return ProxyClient(config)
+
+    @staticmethod
+    def _json_response(data, status_code=200):
+        response = Mock()
+        response.status_code = status_code
+        response.json.return_value = data
+        return response
+
+    def test_results_yielded_as_jobs_complete(self):
+        """Test URLs are submitted in one batch and results follow job completion order"""
+        client = self._client()
+        submit = self._json_response({'queries': [
+            {'id': '1', 'url': 'https://example.com/a'},
+            {'id': '2', 'url': 'https://example.com/b'},
+        ]})
+        statuses = {'1': ['pending', 'done'], '2': ['done']}
+
+        def fake_get(url, **kwargs):
+            if url.endswith('/results'):
+                job_id = url.rsplit('/', 2)[-2]
+                return self._json_response({'results': [{'content': f'<html>{job_id}</html>', 'status_code': 200}]})
+            return self._json_response({'status': statuses[url.rsplit('/', 1)[-1]].pop(0)})
+
+        with patch('requests.Session.post', return_value=submit) as mock_post, \
+                patch('requests.Session.get', side_effect=fake_get), \
+                patch('time.sleep'):
+            results = list(client.get_batch(['https://example.com/a', 'https://example.com/b']))
+
+        assert mock_post.call_args[0][0] == 'https://data.oxylabs.io/v1/queries/batch'
+        assert mock_post.call_args[1]['json']['url'] == ['https://example.com/a', 'https://example.com/b']
+        assert [url for url, _ in results] == ['https://example.com/b', 'https://example.com/a']
+        assert results[0][1].text == '<html>2</html>'
+        assert results[0][1].job_id == '2'
+
+    def test_faulted_and_unsubmitted_urls_yield_none(self):
+        """Test failed jobs and URLs the API did not accept are reported as None"""
+        client = self._client()
+        submit = self._json_response({'queries': [{'id': '1', 'url': 'https://example.com/a'}]})
+
+        with patch('requests.Session.post', return_value=submit), \
+                patch('requests.Session.get', return_value=self._json_response({'status': 'faulted'})):
+            results = dict(client.get_batch(['https://example.com/a', 'https://example.com/b']))
+
+        assert results == {'https://example.com/a': None, 'https://example.com/b': None}
+
+    def test_results_keep_the_requested_url(self):
+        """Test jobs are tracked by id, so a normalized echoed URL still maps back"""
+        client = self._client()
+        submit = self._json_response({'queries': [
+            {'id': '1', 'url': 'https://example.com/a/'},
+            {'id': '2', 'url': 'https://example.com/b/'},
+        ]})
+
+        def fake_get(url, **kwargs):
+            if url.endswith('/results'):
+                return self._json_response({'results': [{'content': '<html/>', 'status_code': 200}]})
+            return self._json_response({'status': 'done'})
+
+        with patch('requests.Session.post', return_value=submit), \
+                patch('requests.Session.get', side_effect=fake_get):
+            results = dict(client.get_batch(['https://example.com/a', 'https://example.com/b']))
+
+        assert set(results) == {'https://example.com/a', 'https://example.com/b'}
+        assert all(response is not None for response in results.values())
+
+    def test_unmatched_jobs_are_reported_as_failures(self):
+        """Test a partial submission whose jobs match no requested URL yields None for them"""
+        client = self._client()
+        submit = self._json_response({'queries': [{'id': '1', 'url': 'https://example.com/elsewhere'}]})
+
+        with patch('requests.Session.post', return_value=submit), \
+                patch('requests.Session.get') as mock_get:
+            results = dict(client.get_batch(['https://example.com/a', 'https://example.com/b']))
+
+        assert results == {'https://example.com/a': None, 'https://example.com/b': None}
+        mock_get.assert_not_called()
+
+    @staticmethod
+    def _all_done_get(url, **kwargs):
+        if url.endswith('/results'):
+            return TestProxyClientBatchJobs._json_response({'results': [{'content': '<html/>', 'status_code': 200}]})
+        return TestProxyClientBatchJobs._json_response({'status': 'done'})
+
+    def test_only_submissions_take_rate_limit_tokens(self):
+        """Test status checks and result downloads do not draw on the proxy request bucket"""
+        client = self._client()
+        submit = self._json_response({'queries': [
+            {'id': '1', 'url': 'https://example.com/a'},
+            {'id': '2', 'url': 'https://example.com/b'},
+        ]})
+
+        with patch('requests.Session.post', return_value=submit), \
+                patch('requests.Session.get', side_effect=self._all_done_get) as mock_get, \
+                patch('src.shared.proxy_client.GlobalConcurrencyManager') as mock_manager:
+            list(client.get_batch(['https://example.com/a', 'https://example.com/b'], poll_workers=2))
+
+        assert mock_manager.return_value.wait_for_token.call_count == 1
+        assert mock_get.call_count == 4
+
+    def test_polls_only_the_oldest_pending_jobs(self):
+        """Test each round checks at most poll_window jobs, oldest first"""
+        client = self._client()
+        submit = self._json_response({'queries': [
+            {'id': str(i), 'url': f'https://example.com/{i}'} for i in range(1, 4)
+        ]})
+        polled = []
+
+        def fake_get(url, **kwargs):
+            if not url.endswith('/results'):
+                polled.append(url.rsplit('/', 1)[-1])
+            return self._all_done_get(url)
+
+        with patch('requests.Session.post', return_value=submit), \
+                patch('requests.Session.get', side_effect=fake_get), \
+                patch('time.sleep'):
+            results = list(client.get_batch([f'https://example.com/{i}' for i in range(1, 4)], poll_window=2))
+
+        assert polled == ['1', '2', '3']
+        assert [url for url, _ in results] == [f'https://example.com/{i}' for i in range(1, 4)]
+
+    def test_results_stream_while_later_batches_are_submitted(self):
+        """Test a finished job is yielded before the next batch is submitted"""
+        client = self._client()
+
+        def fake_post(url, json=None, **kwargs):
+            return self._json_response({'queries': [{'id': json['url'][0][-1], 'url': json['url'][0]}]})
+
+        with patch('requests.Session.post', side_effect=fake_post) as mock_post, \
+                patch('requests.Session.get', side_effect=self._all_done_get):
+            batches = client.get_batch(['https://example.com/a', 'https://example.com/b'], batch_size=1)
+            first_url, _ = next(batches)
+            submitted_before_first_result = mock_post.call_count
+            rest = list(batches)
+
+        assert first_url == 'https://example.com/a'
+        assert submitted_before_first_result == 1
+        assert [url for url, _ in rest] == ['https://example.com/b']
+
+    def test_requires_web_scraper_api_mode(self):
+        """Test batch jobs are refused for other proxy modes"""
+        client = ProxyClient(ProxyConfig(mode=ProxyMode.DIRECT))
+
+        with pytest.raises(ValueError):
+            list(client.get_batch(['https://example.com/a']))
+
+
 class TestProxyResponse:
     """Test ProxyResponse object"""
 
@@ -541,6 +809,71 @@ class TestProxyClientStats:
         assert stats['request_count'] == 3
 
 
+class TestProxyCostLedger:
+    """Test per-retailer proxy usage accounting"""
+
+    def setup_method(self):
+        ProxyCostLedger().reset('ledger_test')
+
+    def teardown_method(self):
+        ProxyCostLedger().reset('ledger_test')
+
+    @staticmethod
+    def _response(status_code=200, content=b'x' * 100, credits=None):
+        return ProxyResponse(
+            status_code=status_code, text='', content=content, headers={},
+            url='https://example.com', elapsed_seconds=0.5,
+            proxy_mode=ProxyMode.WEB_SCRAPER_API, credits_used=credits,
+        )
+
+    def test_ledger_is_singleton(self):
+        """Test every client shares one ledger"""
+        assert ProxyCostLedger() is ProxyCostLedger()
+
+    def test_summary_totals_and_per_store(self):
+        """Test credits, bytes, rendered calls, retries and errors are aggregated per mode"""
+        ledger = ProxyCostLedger()
+        ledger.record('ledger_test', ProxyMode.WEB_SCRAPER_API, self._response(credits=2), rendered=True)
+        ledger.record('ledger_test', ProxyMode.WEB_SCRAPER_API, self._response(status_code=500), retry=True)
+        ledger.record('ledger_test', ProxyMode.RESIDENTIAL, None)
+
+        summary = ledger.summary('ledger_test', stores=2)
+
+        assert summary['requests'] == 3
+        assert summary['rendered'] == 1
+        assert summary['retries'] == 1
+        assert summary['errors'] == 2
+        assert summary['credits'] == 2
+        assert summary['bytes'] == 200
+        assert summary['avg_latency_ms'] == pytest.approx(333.3)
+        assert summary['credits_per_store'] == 1
+        assert summary['bytes_per_store'] == 100
+        assert set(summary['modes']) == {'web_scraper_api', 'residential'}
+        assert summary['modes']['residential']['errors'] == 1
+
+    def test_retailers_are_kept_apart(self):
+        """Test one retailer's usage does not leak into another's summary"""
+        ProxyCostLedger().record('ledger_test', ProxyMode.DIRECT, self._response())
+
+        assert ProxyCostLedger().summary('ledger_test_other')['requests'] == 0
+
+    def test_get_records_retries(self):
+        """Test ProxyClient.get() records every attempt, flagging repeats as retries"""
+        config = ProxyConfig(mode=ProxyMode.DIRECT, retry_delay=0)
+        client = ProxyClient(config, retailer='ledger_test')
+        error_response = Mock(status_code=503, text='', content=b'', headers={}, url='https://example.com')
+        ok_response = Mock(status_code=200, text='ok', content=b'ok', headers={}, url='https://example.com')
+
+        with patch.object(client.session, 'get', side_effect=[error_response, ok_response]):
+            client.get('https://example.com')
+
+        summary = ProxyCostLedger().summary('ledger_test')
+        assert summary['requests'] == 2
+        assert summary['retries'] == 1
+        assert summary['errors'] == 1
+        assert summary['bytes'] == 2
+
+
 class TestProxyClientContextManager:
     """Test context manager support"""
 
@@ -558,3 +891,45 @@ class TestProxyClientContextManager:
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
+
+
+class TestProxyClientRevalidation:
+    """Test conditional GET handling in ProxyClient.get"""
+
+    def _mock_response(self, status_code, content=b"", headers=None):
+        mock_response = Mock()
+        mock_response.status_code = status_code
+        mock_response.text = content.decode()
+        mock_response.content = content
+        mock_response.headers = headers or {}
+        mock_response.url = "https://example.com"
+        return mock_response
+
+    def test_304_served_from_revalidation_cache(self, tmp_path):
+        """Test a 304 is answered from the stored body"""
+        from src.shared.cache_interface import RevalidationCache
+        cache = RevalidationCache('att', cache_dir=tmp_path)
+        client = ProxyClient(ProxyConfig(mode=ProxyMode.DIRECT, min_delay=0, max_delay=0))
+
+        responses = [
+            self._mock_response(200, b"<html>store</html>", {"ETag": '"abc"', "Content-Type": "text/html"}),
+            self._mock_response(304),
+        ]
+        with patch.object(client.session, 'get', side_effect=responses) as mock_get:
+            client.get("https://example.com/store", revalidation_cache=cache)
+            response = client.get("https://example.com/store", revalidation_cache=cache)
+
+        assert response.status_code == 200
+        assert response.text == "<html>store</html>"
+        assert mock_get.call_args_list[1].kwargs['headers']['If-None-Match'] == '"abc"'
+        cache.close()
+
+    def test_304_without_cache_is_returned_without_retry(self):
+        """Test a 304 for caller-supplied validators is passed through once"""
+        client = ProxyClient(ProxyConfig(mode=ProxyMode.DIRECT, max_retries=3))
+
+        with patch.object(client.session, 'get', return_value=self._mock_response(304)) as mock_get:
+            response = client.get("https://example.com", headers={"If-None-Match": '"abc"'})
+
+        assert response.status_code == 304
+        assert mock_get.call_count == 1
@@ -0,0 +1,112 @@
+"""Tests for the sticky residential session pool."""
+
+from src.shared.constants import RESIDENTIAL_POOL
+from src.shared.residential_pool import ResidentialSessionPool
+
+
+def _pool(clock, size=3):
+    return ResidentialSessionPool('test', size=size, clock=clock)
+
+
+class TestLease:
+    """Tests for lease() session selection."""
+
+    def test_idle_sessions_are_leased_before_busy_ones(self, fake_clock):
+        """Test concurrent leases spread over distinct sticky sessions."""
+        pool = _pool(fake_clock, size=3)
+
+        leased = {pool.lease().session_id for _ in range(3)}
+
+        assert len(leased) == 3
+
+    def test_healthiest_idle_session_is_preferred(self, fake_clock):
+        """Test a session with a proven record wins over fresh and failing ones."""
+        pool = _pool(fake_clock, size=3)
+        good, failing, slow = (pool.lease() for _ in range(3))
+        pool.release(good, 200, elapsed=0.5)
+        pool.release(failing, 500, elapsed=0.5)
+        pool.release(slow, 200, elapsed=5.0)
+
+        assert pool.lease() is good
+
+    def test_expired_idle_sessions_are_replaced(self, fake_clock):
+        """Test sessions past their maximum age are swapped for fresh exits."""
+        pool = _pool(fake_clock, size=1)
+        first = pool.lease()
+        pool.release(first, 200)
+
+        fake_clock.now = RESIDENTIAL_POOL.MAX_AGE_SECONDS
+        second = pool.lease()
+
+        assert second.session_id != first.session_id
+        assert pool.retired == 1
+
+
+class TestRelease:
+    """Tests for release() health tracking and retirement."""
+
+    def test_consecutive_blocks_retire_session(self, fake_clock):
+        """Test a session is replaced after BLOCK_LIMIT 403/429 responses in a row."""
+        pool = _pool(fake_clock, size=1)
+        leases = [pool.lease() for _ in range(RESIDENTIAL_POOL.BLOCK_LIMIT)]
+        for session in leases:
+            pool.release(session, 403)
+
+        assert pool.retired == 1
+        assert pool.lease() is not leases[0]
+
+    def test_non_block_resets_block_streak(self, fake_clock):
+        """Test a clean response in between blocks keeps the session alive."""
+        pool = _pool(fake_clock, size=1)
+        session = pool.lease()
+        pool.release(session, 429)
+        pool.lease()
+        pool.release(session, 200)
+        pool.lease()
+        pool.release(session, 429)
+
+        assert pool.retired == 0
+        assert session.consecutive_blocks == 1
+
+    def test_low_success_rate_retires_session(self, fake_clock):
+        """Test persistent errors retire a session once enough outcomes are known."""
+        pool = _pool(fake_clock, size=1)
+        leases = [pool.lease() for _ in range(RESIDENTIAL_POOL.MIN_OUTCOMES)]
+        for session in leases:
+            pool.release(session, None)
+
+        assert pool.retired == 1
+
+    def test_not_found_counts_as_success(self, fake_clock):
+        """Test a 404 is not held against the exit."""
+        pool = _pool(fake_clock, size=1)
+        session = pool.lease()
+        pool.release(session, 404, elapsed=0.2)
+
+        assert session.success_rate == 1.0
+        assert session.leases == 0
+
+    def test_release_of_replaced_session_is_harmless(self, fake_clock):
+        """Test an in-flight lease on a retired session can still be released."""
+        pool = _pool(fake_clock, size=1)
+        blocked = [pool.lease() for _ in range(RESIDENTIAL_POOL.BLOCK_LIMIT)]
+        in_flight = pool.lease()
+        for session in blocked:
+            pool.release(session, 403)
+
+        pool.release(in_flight, 200)
+
+        assert pool.retired == 1
+        assert pool.get_stats()['in_flight'] == 0
+
+
+class TestForRetailer:
+    """Tests for the per-retailer pool registry."""
+
+    def test_pool_is_shared_per_retailer(self):
+        """Test every caller for a retailer gets the same pool."""
+        pool = ResidentialSessionPool.for_retailer('test_pool_shared', size=2)
+
+        assert ResidentialSessionPool.for_retailer('test_pool_shared') is pool
+        assert ResidentialSessionPool.for_retailer('test_pool_other') is not pool
+        assert pool.get_stats()['size'] == 2
@@ -1,5 +1,6 @@
 """Tests for refactored helper functions in run.py."""
 import argparse
+import asyncio
 import logging
 import os
 import tempfile
@@ -18,8 +19,12 @@ from run import (
     _log_scraper_options,
     _get_yaml_proxy_mode,
     _get_target_retailers,
+    _record_proxy_costs,
+    run_retailer_async,
     validate_cli_options,
 )
+from src.shared.proxy_client import ProxyCostLedger, ProxyMode, ProxyResponse
+from src.shared.run_tracker import get_run_history
 
 
 class TestValidateAndLoadConfig:
@@ -509,3 +514,57 @@ class TestValidateCliOptions:
         errors = validate_cli_options(args, {})
 
         assert len(errors) == 0
+
+
+class TestRecordProxyCosts:
+    """Tests for _record_proxy_costs() function."""
+
+    def setup_method(self):
+        ProxyCostLedger().reset('costs_test')
+
+    def teardown_method(self):
+        ProxyCostLedger().reset('costs_test')
+
+    def test_cli_run_gets_completed_record(self, tmp_path, monkeypatch):
+        """A CLI run without an active tracker gets its own completed record."""
+        monkeypatch.chdir(tmp_path)
+        response = ProxyResponse(
+            status_code=200, text='', content=b'x' * 10, headers={}, url='u',
+            elapsed_seconds=0.1, proxy_mode=ProxyMode.WEB_SCRAPER_API, credits_used=1,
+        )
+        ProxyCostLedger().record('costs_test', ProxyMode.WEB_SCRAPER_API, response)
+
+        _record_proxy_costs('costs_test', stores=1)
+
+        runs = get_run_history('costs_test')
+        assert len(runs) == 1
+        assert runs[0]['status'] == 'complete'
+        assert runs[0]['proxy_costs']['credits'] == 1
+        assert runs[0]['proxy_costs']['credits_per_store'] == 1
+
+    def test_no_requests_writes_nothing(self, tmp_path, monkeypatch):
+        """Runs that made no proxy requests leave no run record behind."""
+        monkeypatch.chdir(tmp_path)
+
+        _record_proxy_costs('costs_test', stores=5)
+
+        assert not (tmp_path / 'data').exists()
+
+
+class TestRunRetailerAsyncPipeline:
+    """Tests for the streaming pipeline lifecycle in run_retailer_async()."""
+
+    @pytest.mark.parametrize('interrupt', [KeyboardInterrupt, asyncio.CancelledError])
+    def test_interrupted_run_discards_partial_exports(self, tmp_path, monkeypatch, interrupt):
+        """Interrupts that bypass `except Exception` still abort the pipeline."""
+        monkeypatch.chdir(tmp_path)
+        with patch('run.load_retailer_config', return_value={'name': 'att'}), \
+                patch('run.create_proxied_session', return_value=Mock()), \
+                patch('run.get_scraper_module', return_value=Mock()), \
+                patch('run._use_async_engine', return_value=False), \
+                patch('run._run_scraper_sync', side_effect=interrupt):
+            with pytest.raises(interrupt):
+                asyncio.run(run_retailer_async('att'))
+
+        output_dir = tmp_path / 'data' / 'att' / 'output'
+        assert list(output_dir.iterdir()) == []
@@ -1,8 +1,22 @@
 """Unit tests for shared ScrapeRunner orchestration framework."""
 
+import asyncio
+import json
+import threading
+
 import pytest
-from unittest.mock import Mock, patch
+from unittest.mock import AsyncMock, Mock, patch
+from src.change_detector import ChangeDetector
+from src.shared.export_service import ExportFormat
 from src.shared.scrape_runner import ScrapeRunner, ScraperContext
+from src.shared.store_pipeline import StorePipeline
+from src.shared.checkpoint import CheckpointJournal
+
+
+@pytest.fixture(autouse=True)
+def run_in_tmp_path(tmp_path, monkeypatch):
+    """ScrapeRunner writes checkpoints and failure reports under a relative data/."""
+    monkeypatch.chdir(tmp_path)
 
 
 class TestScraperContext:
@@ -161,6 +175,45 @@ class TestScrapeRunnerCheckpoint:
         assert saved_data['stores'] == [{'store_id': '1'}]
 
 
+    @patch('src.shared.scrape_runner.utils.load_checkpoint')
+    def test_resume_replays_journal(self, mock_load, tmp_path):
+        """Test resume merges journaled items on top of the snapshot without duplicates."""
+        mock_load.return_value = {
+            'stores': [{'store_id': '1'}],
+            'completed_urls': ['url1']
+        }
+        context = ScraperContext(retailer='test', session=Mock(), config={}, resume=True)
+        runner = ScrapeRunner(context)
+        runner.journal = CheckpointJournal(str(tmp_path / 'scrape_progress.json'))
+        runner.journal.append({'key': 'url1', 'store': {'store_id': '1'}})
+        runner.journal.append({'key': 'url2', 'store': {'store_id': '2'}})
+        runner.journal.close()
+
+        runner._load_checkpoint()
+
+        assert runner.completed_items == {'url1', 'url2'}
+        assert runner.stores == [{'store_id': '1'}, {'store_id': '2'}]
+        assert runner.checkpoints_used is True
+
+    @patch('src.shared.scrape_runner.utils.save_checkpoint')
+    def test_completed_items_are_journaled_until_compaction(self, mock_save, tmp_path):
+        """Test each store is appended to the journal and compaction rewrites the snapshot."""
+        context = ScraperContext(
+            retailer='test', session=Mock(), config={'checkpoint_compact_interval': 2}
+        )
+        runner = ScrapeRunner(context)
+        runner.journal = CheckpointJournal(str(tmp_path / 'scrape_progress.json'))
+
+        runner._add_store('url1', {'store_id': '1'})
+        assert runner.journal.records == 1
+        mock_save.assert_not_called()
+
+        runner._add_store('url2', {'store_id': '2'})
+
+        mock_save.assert_called_once()
+        assert runner.journal.records == 0
+
+
 class TestScrapeRunnerURLCache:
     """Tests for URL caching functionality."""
 
@@ -331,6 +384,446 @@ class TestScrapeRunnerOrchestration:
         assert result['count'] == 0
         assert result['checkpoints_used'] is False
 
+    @patch('src.shared.scrape_runner.utils.validate_stores_batch')
+    @patch('src.shared.scrape_runner.URLCache')
+    def test_store_sink_receives_stores_as_extracted(self, mock_cache_class, mock_validate):
+        """Test each extracted store is forwarded to store_sink and batch validation is skipped."""
+        mock_cache = Mock()
+        mock_cache.get.return_value = ['url1', 'url2']
+        mock_cache_class.return_value = mock_cache
+        sink = Mock()
+
+        context = ScraperContext(
+            retailer='test',
+            session=Mock(),
+            config={},
+            store_sink=sink
+        )
+
+        runner = ScrapeRunner(context)
+        extraction_func = Mock(side_effect=[{'store_id': '1'}, {'store_id': '2'}])
+
+        runner.run_with_checkpoints(url_discovery_func=Mock(), extraction_func=extraction_func)
+
+        assert [c.args[0] for c in sink.call_args_list] == [{'store_id': '1'}, {'store_id': '2'}]
+        mock_validate.assert_not_called()
+
+
+class TestScrapeRunnerIncremental:
+    """Tests for changed-only incremental runs."""
+
+    @staticmethod
+    def _write_previous_run(root, lastmods, stores):
+        (root / 'data' / 'test').mkdir(parents=True)
+        (root / 'data' / 'test' / 'incremental_state.json').write_text(
+            json.dumps({'lastmods': lastmods, 'stores': {store['url']: store for store in stores}}),
+            encoding='utf-8'
+        )
+
+    @patch('src.shared.scrape_runner.utils.validate_stores_batch')
+    def test_only_changed_urls_are_fetched(self, mock_validate, tmp_path, monkeypatch):
+        """Test unchanged URLs are carried forward and the URL cache is bypassed."""
+        monkeypatch.chdir(tmp_path)
+        mock_validate.return_value = {'total': 3, 'valid': 3, 'warning_count': 0}
+        self._write_previous_run(
+            tmp_path,
+            {'u1': '2024-01-01', 'u2': '2024-01-01'},
+            [{'store_id': '1', 'url': 'u1', 'name': 'Old 1'},
+             {'store_id': '2', 'url': 'u2', 'name': 'Old 2'}],
+        )
+
+        def discovery(session, retailer, lastmods=None, **kwargs):
+            lastmods.update({'u1': '2024-01-01', 'u2': '2024-02-01', 'u3': '2024-02-01'})
+            return ['u1', 'u2', 'u3']
+
+        extraction_func = Mock(side_effect=lambda session, url, retailer, **kw: {'store_id': url, 'url': url})
+        context = ScraperContext(retailer='test', session=Mock(), config={}, incremental=True)
+
+        with patch('src.shared.scrape_runner.URLCache') as mock_cache_class:
+            result = ScrapeRunner(context).run_with_checkpoints(
+                url_discovery_func=discovery,
+                extraction_func=extraction_func
+            )
+            mock_cache_class.return_value.get.assert_not_called()
+
+        assert sorted(c.args[1] for c in extraction_func.call_args_list) == ['u2', 'u3']
+        assert result['count'] == 3
+        assert {'store_id': '1', 'url': 'u1', 'name': 'Old 1'} in result['stores']
+
+        state = json.loads((tmp_path / 'data' / 'test' / 'incremental_state.json').read_text())
+        assert state['lastmods'] == {'u1': '2024-01-01', 'u2': '2024-02-01', 'u3': '2024-02-01'}
+
+    def test_full_cycle_reports_carried_stores_unchanged(self, tmp_path, monkeypatch):
+        """Test a second incremental run with no sitemap changes detects no modifications.
+
+        The streamed stores_latest.json holds normalized records (phone, zip,
+        retailer); carried stores must still fingerprint like the raw stores
+        the previous run scraped.
+        """
+        monkeypatch.chdir(tmp_path)
+        sitemap = {'u1': '2024-01-01', 'u2': '2024-01-01'}
+
+        def discovery(session, retailer, lastmods=None, **kwargs):
+            lastmods.update(sitemap)
+            return list(sitemap)
+
+        def extraction(session, url, retailer, **kwargs):
+            return {
+                'store_id': url, 'url': url, 'name': f'Store {url}',
+                'street_address': '1 Main St', 'city': 'Springfield', 'state': 'IL',
+                'postal_code': '62701', 'phone_number': '555-0100',
+                'latitude': 39.78, 'longitude': -89.65,
+            }
+
+        def run_once():
+            pipeline = StorePipeline('test', 'data/test/output', {}, formats=[ExportFormat.JSON]).start()
+            context = ScraperContext(
+                retailer='test', session=Mock(), config={}, incremental=True,
+                store_sink=pipeline.add,
+            )
+            extraction_func = Mock(side_effect=extraction)
+            with patch('src.shared.scrape_runner.URLCache'):
+                result = ScrapeRunner(context).run_with_checkpoints(
+                    url_discovery_func=discovery,
+                    extraction_func=extraction_func
+                )
+            detector = ChangeDetector('test')
+            detector.rotate_previous()
+            pipeline.close()
+            report = detector.detect_changes(result['stores'])
+            detector.save_fingerprints(result['stores'])
+            return extraction_func, report
+
+        run_once()
+        extraction_func, report = run_once()
+
+        extraction_func.assert_not_called()
+        assert report.modified_stores == []
+        assert report.new_stores == []
+        assert report.closed_stores == []
+        assert report.unchanged_count == 2
+
+
+class TestScrapeRunnerAsync:
+    """Tests for the asyncio extraction path."""
+
+    @pytest.mark.asyncio
+    @patch('src.shared.scrape_runner.async_get_with_retry', new_callable=AsyncMock)
+    @patch('src.shared.scrape_runner.utils.save_checkpoint')
+    @patch('src.shared.scrape_runner.utils.validate_stores_batch')
+    @patch('src.shared.scrape_runner.URLCache')
+    async def test_run_async_parses_fetched_pages(
+        self, mock_cache_class, mock_validate, mock_save, mock_fetch
+    ):
+        """Test async run fetches every item and feeds bodies to parse_func."""
+        mock_cache = Mock()
+        mock_cache.get.return_value = ['url1', 'url2', 'url3']
+        mock_cache_class.return_value = mock_cache
+        mock_validate.return_value = {'total': 2, 'valid': 2, 'warning_count': 0}
+        mock_fetch.side_effect = lambda client, url, **kwargs: (
+            None if url == 'url3' else Mock(text=f'<html>{url}</html>')
+        )
+
+        runner = ScrapeRunner(ScraperContext(retailer='test', session=Mock(), config={}))
+        parse_func = Mock(side_effect=lambda text, item, retailer: {'store_id': item, 'body': text})
+
+        result = await runner.run_with_checkpoints_async(
+            url_discovery_func=Mock(),
+            parse_func=parse_func
+        )
+
+        assert result['count'] == 2
+        assert {s['store_id'] for s in result['stores']} == {'url1', 'url2'}
+        assert parse_func.call_count == 2
+        assert runner.completed_items == {'url1', 'url2'}
+        assert runner.request_counter.count == 2
+
+    @pytest.mark.asyncio
+    @patch('src.shared.scrape_runner.async_get_with_retry', new_callable=AsyncMock)
+    @patch('src.shared.scrape_runner.utils.save_checkpoint')
+    @patch('src.shared.scrape_runner.utils.validate_stores_batch')
+    @patch('src.shared.scrape_runner.URLCache')
+    async def test_run_async_uses_item_url_func(
+        self, mock_cache_class, mock_validate, mock_save, mock_fetch
+    ):
+        """Test item_url_func decides what is fetched while keys stay stable."""
+        mock_cache = Mock()
+        mock_cache.get.return_value = ['a', 'b']
+        mock_cache_class.return_value = mock_cache
+        mock_validate.return_value = {'total': 1, 'valid': 1, 'warning_count': 0}
+        mock_fetch.return_value = Mock(text='{}')
+
+        runner = ScrapeRunner(ScraperContext(retailer='test', session=Mock(), config={}, limit=1))
+
+        await runner.run_with_checkpoints_async(
+            url_discovery_func=Mock(),
+            parse_func=Mock(return_value={'store_id': 'a'}),
+            item_url_func=lambda item: f'https://api.example.com/{item}'
+        )
+
+        assert mock_fetch.call_count == 1
+        assert mock_fetch.call_args[0][1] == 'https://api.example.com/a'
+        assert runner.completed_items == {'a'}
+
+    @pytest.mark.asyncio
+    @patch('src.shared.scrape_runner.async_get_with_retry', new_callable=AsyncMock)
+    @patch('src.shared.scrape_runner.utils.save_checkpoint')
+    @patch('src.shared.scrape_runner.utils.validate_stores_batch')
+    @patch('src.shared.scrape_runner.URLCache')
+    async def test_run_async_parses_and_checkpoints_off_the_loop(
+        self, mock_cache_class, mock_validate, mock_save, mock_fetch
+    ):
+        """Test parse_func and checkpoint writes never run on the event loop thread."""
+        mock_cache = Mock()
+        mock_cache.get.return_value = ['url1', 'url2', 'url3']
+        mock_cache_class.return_value = mock_cache
+        mock_validate.return_value = {'total': 3, 'valid': 3, 'warning_count': 0}
+        mock_fetch.return_value = Mock(text='<html></html>')
+        loop_thread = threading.get_ident()
+        parse_threads = []
+        save_threads = []
+        mock_save.side_effect = lambda *args, **kwargs: save_threads.append(threading.get_ident())
+
+        def parse_func(text, item, retailer):
+            parse_threads.append(threading.get_ident())
+            return {'store_id': item}
+
+        runner = ScrapeRunner(ScraperContext(
+            retailer='test', session=Mock(), config={'checkpoint_compact_interval': 1}
+        ))
+        result = await runner.run_with_checkpoints_async(url_discovery_func=Mock(), parse_func=parse_func)
+
+        assert result['count'] == 3
+        assert len(parse_threads) == 3
+        assert len(save_threads) == 4  # three compactions and the final save
+        assert loop_thread not in parse_threads + save_threads
+
+    def test_async_concurrency_from_config(self):
+        """Test async_concurrency is read from retailer config."""
+        runner = ScrapeRunner(ScraperContext(
+            retailer='test', session=Mock(), config={'async_concurrency': 200}
+        ))
+
+        assert runner.async_concurrency == 200
+
+
+
+    @patch('src.shared.scrape_runner.utils.validate_stores_batch')
+    @patch('src.shared.scrape_runner.URLCache')
+    def test_batch_extraction_func_gets_chunks(self, mock_cache_class, mock_validate):
+        """Test batch_size > 1 extracts items in chunks and records results per item."""
+        mock_cache = Mock()
+        mock_cache.get.return_value = ['url1', 'url2', 'url3', 'url4', 'url5']
+        mock_cache_class.return_value = mock_cache
+        mock_validate.return_value = {'total': 4, 'valid': 4, 'warning_count': 0}
+        chunks = []
+
+        def extract_batch(session, items, retailer, **kwargs):
+            chunks.append(list(items))
+            return [None if item == 'url4' else {'store_id': item} for item in items]
+
+        extraction_func = Mock()
+        runner = ScrapeRunner(ScraperContext(retailer='test', session=Mock(), config={'parallel_workers': 2}))
+        result = runner.run_with_checkpoints(
+            url_discovery_func=Mock(),
+            extraction_func=extraction_func,
+            batch_extraction_func=extract_batch,
+            batch_size=2,
+        )
+
+        assert sorted(chunks) == [['url1', 'url2'], ['url3', 'url4'], ['url5']]
+        assert sorted(s['store_id'] for s in result['stores']) == ['url1', 'url2', 'url3', 'url5']
+        assert runner.completed_items == {'url1', 'url2', 'url3', 'url5'}
+        extraction_func.assert_not_called()
+
+class TestScrapeRunnerBatch:
+    """Tests for the Web Scraper API batch job extraction path."""
+
+    @patch('src.shared.scrape_runner.utils.save_checkpoint')
+    @patch('src.shared.scrape_runner.utils.validate_stores_batch')
+    @patch('src.shared.scrape_runner.URLCache')
+    def test_cached_pages_skip_batch_jobs(self, mock_cache_class, mock_validate, mock_save):
+        """Test cached pages are parsed directly and only the rest are submitted."""
+        mock_cache = Mock()
+        mock_cache.get.return_value = ['url1', 'url2', 'url3']
+        mock_cache_class.return_value = mock_cache
+        mock_validate.return_value = {'total': 2, 'valid': 2, 'warning_count': 0}
+        client = Mock()
+        client.get_batch.return_value = iter([
+            ('url3', None),
+            ('url2', Mock(status_code=200, text='<html>url2</html>')),
+        ])
+        cache_page_func = Mock()
+
+        runner = ScrapeRunner(ScraperContext(retailer='test', session=Mock(), config={}))
+        result = runner.run_with_checkpoints_batch(
+            url_discovery_func=Mock(),
+            parse_func=lambda text, item, retailer: {'store_id': item, 'body': text},
+            client=client,
+            cached_page_func=lambda url: '<cached/>' if url == 'url1' else None,
+            cache_page_func=cache_page_func,
+        )
+
+        assert client.get_batch.call_args[0][0] == ['url2', 'url3']
+        assert {s['store_id']: s['body'] for s in result['stores']} == {
+            'url1': '<cached/>',
+            'url2': '<html>url2</html>',
+        }
+        cache_page_func.assert_called_once_with('url2', '<html>url2</html>')
+        assert runner.completed_items == {'url1', 'url2'}
+        assert runner.request_counter.count == 1
+        client.close.assert_not_called()
+
+    @patch('src.shared.scrape_runner.utils.validate_stores_batch')
+    @patch('src.shared.scrape_runner.URLCache')
+    def test_batch_size_from_config(self, mock_cache_class, mock_validate):
+        """Test scraper_api_batch_size and scraper_api_poll_interval are passed to the client."""
+        mock_cache = Mock()
+        mock_cache.get.return_value = ['url1']
+        mock_cache_class.return_value = mock_cache
+        mock_validate.return_value = {'total': 0, 'valid': 0, 'warning_count': 0}
+        client = Mock()
+        client.get_batch.return_value = iter([('url1', None)])
+
+        runner = ScrapeRunner(ScraperContext(
+            retailer='test', session=Mock(),
+            config={
+                'scraper_api_batch_size': 200,
+                'scraper_api_poll_interval': 1,
+                'scraper_api_job_timeout': 600,
+                'scraper_api_poll_workers': 4,
+                'scraper_api_poll_window': 50,
+            }
+        ))
+        runner.run_with_checkpoints_batch(url_discovery_func=Mock(), parse_func=Mock(), client=client)
+
+        assert client.get_batch.call_args[1] == {
+            'batch_size': 200, 'poll_interval': 1, 'job_timeout': 600, 'poll_workers': 4, 'poll_window': 50
+        }
+
+    @patch('src.shared.scrape_runner.utils.validate_stores_batch')
+    @patch('src.shared.scrape_runner.URLCache')
+    def test_unreported_urls_are_failures(self, mock_cache_class, mock_validate):
+        """Test a URL the batch never yields is reported as failed instead of dropped."""
+        mock_cache = Mock()
+        mock_cache.get.return_value = ['url1', 'url2']
+        mock_cache_class.return_value = mock_cache
+        mock_validate.return_value = {'total': 1, 'valid': 1, 'warning_count': 0}
+        client = Mock()
+        client.get_batch.return_value = iter([('url1', Mock(status_code=200, text='<html/>'))])
+
+        runner = ScrapeRunner(ScraperContext(retailer='test', session=Mock(), config={}))
+        with patch.object(runner, '_report_failed_items') as mock_report:
+            result = runner.run_with_checkpoints_batch(
+                url_discovery_func=Mock(),
+                parse_func=lambda text, item, retailer: {'store_id': item},
+                client=client,
+            )
+
+        assert result['count'] == 1
+        mock_report.assert_called_once_with(['url2'])
+
+
+class TestScrapeRunnerParseProcesses:
+    """Tests for the fetch-thread / parse-process pipeline."""
+
+    STORE_PAGE = (
+        '<html><script type="application/ld+json">'
+        '{"@type": "MobilePhoneStore", "name": "AT&T Main St", "address": {"addressLocality": "Austin"}}'
+        '</script></html>'
+    )
+
+    def test_parse_processes_from_config(self):
+        """Test parse_processes accepts counts and 'auto', and rejects junk."""
+        def runner_for(value):
+            return ScrapeRunner(ScraperContext(retailer='test', session=Mock(), config={'parse_processes': value}))
+
+        assert ScrapeRunner(ScraperContext(retailer='test', session=Mock(), config={})).parse_processes == 0
+        assert runner_for(3).parse_processes == 3
+        assert runner_for('auto').parse_processes >= 1
+        assert runner_for('many').parse_processes == 0
+
+    @patch('src.shared.scrape_runner.utils.save_checkpoint')
+    @patch('src.shared.scrape_runner.utils.validate_stores_batch')
+    @patch('src.shared.scrape_runner.utils.get_with_retry')
+    @patch('src.shared.scrape_runner.URLCache')
+    def test_pages_are_parsed_in_worker_processes(self, mock_cache_class, mock_get, mock_validate, mock_save):
+        """Test fetched bodies go through parse_func and failures are reported per item."""
+        from src.scrapers.att import parse_store_page
+
+        urls = ['https://x/store/1', 'https://x/store/2', 'https://x/store/3']
+        mock_cache = Mock()
+        mock_cache.get.return_value = urls
+        mock_cache_class.return_value = mock_cache
+        mock_validate.return_value = {'total': 1, 'valid': 1, 'warning_count': 0}
+        pages = {urls[0]: Mock(text=self.STORE_PAGE), urls[1]: None, urls[2]: Mock(text='<html></html>')}
+        mock_get.side_effect = lambda session, url: pages[url]
+        extraction_func = Mock()
+
+        runner = ScrapeRunner(ScraperContext(
+            retailer='att', session=Mock(), config={'parallel_workers': 2, 'parse_processes': 1}
+        ))
+        result = runner.run_with_checkpoints(
+            url_discovery_func=Mock(),
+            extraction_func=extraction_func,
+            parse_func=parse_store_page,
+        )
+
+        extraction_func.assert_not_called()
+        assert [s['name'] for s in result['stores']] == ['AT&T Main St']
+        assert result['stores'][0]['store_id'] == '1'
+        assert runner.completed_items == {urls[0]}
+        assert runner.request_counter.count == 2
+
+    @pytest.mark.asyncio
+    @patch('src.shared.scrape_runner.async_get_with_retry', new_callable=AsyncMock)
+    @patch('src.shared.scrape_runner.utils.save_checkpoint')
+    @patch('src.shared.scrape_runner.utils.validate_stores_batch')
+    @patch('src.shared.scrape_runner.URLCache')
+    async def test_async_engine_parses_in_worker_processes(
+        self, mock_cache_class, mock_validate, mock_save, mock_fetch
+    ):
+        """Test the async engine honours parse_processes with a module-level parse_func."""
+        from src.scrapers.att import parse_store_page
+
+        urls = ['https://x/store/1', 'https://x/store/2']
+        mock_cache = Mock()
+        mock_cache.get.return_value = urls
+        mock_cache_class.return_value = mock_cache
+        mock_validate.return_value = {'total': 1, 'valid': 1, 'warning_count': 0}
+        pages = {urls[0]: Mock(text=self.STORE_PAGE), urls[1]: Mock(text='<html></html>')}
+        mock_fetch.side_effect = lambda client, url, **kwargs: pages[url]
+
+        runner = ScrapeRunner(ScraperContext(retailer='att', session=Mock(), config={'parse_processes': 1}))
+        with patch('src.shared.scrape_runner.asyncio.to_thread', wraps=asyncio.to_thread) as mock_to_thread:
+            result = await runner.run_with_checkpoints_async(
+                url_discovery_func=Mock(), parse_func=parse_store_page
+            )
+
+        assert [s['name'] for s in result['stores']] == ['AT&T Main St']
+        assert runner.completed_items == {urls[0]}
+        assert parse_store_page not in [c.args[0] for c in mock_to_thread.call_args_list]
+
+    @patch('src.shared.scrape_runner.utils.validate_stores_batch')
+    @patch('src.shared.scrape_runner.URLCache')
+    def test_parse_func_unused_without_parse_processes(self, mock_cache_class, mock_validate):
+        """Test the regular thread path is kept when parse_processes is not set."""
+        mock_cache = Mock()
+        mock_cache.get.return_value = ['url1']
+        mock_cache_class.return_value = mock_cache
+        mock_validate.return_value = {'total': 1, 'valid': 1, 'warning_count': 0}
+        parse_func = Mock()
+
+        runner = ScrapeRunner(ScraperContext(retailer='test', session=Mock(), config={}))
+        result = runner.run_with_checkpoints(
+            url_discovery_func=Mock(),
+            extraction_func=Mock(return_value={'store_id': '1'}),
+            parse_func=parse_func,
+        )
+
+        parse_func.assert_not_called()
+        assert result['count'] == 1
+
 
 if __name__ == '__main__':
     pytest.main([__file__, '-v'])
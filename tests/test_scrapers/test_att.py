@@ -181,6 +181,24 @@ class TestGetStoreUrlsFromSitemap:
         assert 'https://www.att.com/stores/texas/dallas/12345' in urls
         assert 'https://www.att.com/stores/texas/houston/67890' in urls
 
+    @patch('src.scrapers.att.utils.get_with_retry')
+    @patch('src.scrapers.att._request_counter')
+    def test_collects_lastmods(self, mock_counter, mock_get, mock_session):
+        """Test <lastmod> dates are collected for incremental runs."""
+        sitemap_xml = '''<?xml version="1.0" encoding="UTF-8"?>
+<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">
+    <url><loc>https://www.att.com/stores/texas/dallas/12345</loc><lastmod>2024-05-01</lastmod></url>
+</urlset>'''
+        mock_response = Mock()
+        mock_response.content = sitemap_xml.encode('utf-8')
+        mock_get.return_value = mock_response
+        lastmods = {}
+
+        urls = get_store_urls_from_sitemap(mock_session, lastmods=lastmods)
+
+        assert urls == ['https://www.att.com/stores/texas/dallas/12345']
+        assert lastmods == {'https://www.att.com/stores/texas/dallas/12345': '2024-05-01'}
+
     @patch('src.scrapers.att.utils.get_with_retry')
     @patch('src.scrapers.att._request_counter')
     def test_failed_fetch_returns_empty(self, mock_counter, mock_get, mock_session):
@@ -6,6 +6,8 @@ from unittest.mock import Mock, patch
 from src.scrapers.bestbuy import (
     _normalize_service_name,
     _looks_like_service_name,
+    parse_store_page,
+    run,
 )
 
 
@@ -138,3 +140,43 @@ class TestServiceMappingConsistency:
         variations = ['Geek Squad', 'GEEK SQUAD', 'geek squad', 'GeEk SqUaD']
         results = [_normalize_service_name(v) for v in variations]
         assert all(r == 'Geek Squad' for r in results)
+
+
+class TestParseStorePage:
+    """Tests for parse_store_page() (shared by per-page and batch extraction)."""
+
+    def test_parses_json_ld_graph(self):
+        """Test an ElectronicsStore node inside @graph becomes a BestBuyStore."""
+        html = (
+            '<html><script type="application/ld+json">'
+            '{"@graph": [{"@type": "ElectronicsStore", "name": "Best Buy Test",'
+            ' "address": {"streetAddress": "1 Main St", "addressLocality": "Austin",'
+            ' "addressRegion": "TX", "postalCode": "78701"},'
+            ' "geo": {"latitude": 30.27, "longitude": -97.74}}]}'
+            '</script></html>'
+        )
+
+        store = parse_store_page(html, 'https://stores.bestbuy.com/tx/austin/1-main-st-281.html')
+
+        assert store.store_id == '1'
+        assert store.name == 'Best Buy Test'
+        assert store.city == 'Austin'
+        assert store.latitude == '30.27'
+
+    def test_page_without_json_ld(self):
+        """Test pages without structured data yield None."""
+        assert parse_store_page('<html></html>', 'https://stores.bestbuy.com/1') is None
+
+
+class TestBatchMode:
+    """Tests for scraper_api_batch routing in run()."""
+
+    @patch('src.scrapers.bestbuy._run_batch', return_value={'stores': [], 'count': 0, 'checkpoints_used': False})
+    def test_batch_mode_delegates_to_runner(self, mock_run_batch):
+        """Test scraper_api_batch with web_scraper_api hands the run to the batch backend."""
+        config = {'scraper_api_batch': True, 'proxy': {'mode': 'web_scraper_api'}}
+
+        run(Mock(), config, 'bestbuy', limit=5)
+
+        mock_run_batch.assert_called_once()
+        assert mock_run_batch.call_args[1]['limit'] == 5
@@ -2,6 +2,8 @@
 # pylint: disable=no-member  # Mock objects have dynamic attributes
 
 import json
+import logging
+import math
 import pytest
 from datetime import datetime
 from unittest.mock import Mock, patch, MagicMock
@@ -13,6 +15,10 @@ from src.scrapers.cricket import (
     _categorize_store,
     _parse_store,
     _fetch_stores_at_point,
+    _SearchCell,
+    _cell_intersects_polygon,
+    _generate_seed_cells,
+    _point_in_polygon,
     run,
 )
 from config import cricket_config as config
@@ -124,6 +130,63 @@ class TestGenerateGrid:
             assert isinstance(lng, float)
 
 
+class TestAdaptiveSearchCells:
+    """Tests for the quadtree cells, US outline mask and seeding."""
+
+    def test_radius_reaches_every_corner(self):
+        """Test the query circle covers the whole cell."""
+        cell = _SearchCell(40.0, 42.0, -100.0, -97.0)
+        center_lat, center_lng = cell.center
+        radius = cell.radius_miles()
+
+        for lat in (cell.lat_min, cell.lat_max):
+            for lng in (cell.lng_min, cell.lng_max):
+                dy = (lat - center_lat) * 69.0
+                dx = (lng - center_lng) * 69.0 * math.cos(math.radians(lat))
+                assert math.hypot(dx, dy) <= radius
+
+    def test_split_quadrants_partition_the_cell(self):
+        """Test every point of a cell belongs to exactly one quadrant."""
+        cell = _SearchCell(30.0, 32.0, -90.0, -88.0)
+        children = cell.split()
+
+        for point in [(30.0, -90.0), (31.0, -89.0), (31.99, -88.01), (30.5, -88.5)]:
+            assert sum(child.contains(*point) for child in children) == 1
+
+    def test_polygon_contains_coastal_and_border_cities(self):
+        """Test the outline keeps coastal/border stores and drops open water and Canada."""
+        inside = [(24.55, -81.8), (48.38, -124.7), (44.86, -66.98), (25.9, -97.5), (32.58, -117.11), (47.47, -87.9)]
+        outside = [(43.7, -79.4), (25.0, -77.3), (26.0, -90.0), (35.0, -125.0), (25.7, -100.3)]
+
+        assert all(_point_in_polygon(lat, lng, config.US_LAND_POLYGON) for lat, lng in inside)
+        assert not any(_point_in_polygon(lat, lng, config.US_LAND_POLYGON) for lat, lng in outside)
+
+    def test_cell_straddling_the_outline_is_kept(self):
+        """Test a cell whose corners are all outside but that crosses the outline is kept."""
+        square = [(0.0, 0.0), (0.0, 10.0), (10.0, 10.0), (10.0, 0.0)]
+
+        assert _cell_intersects_polygon(_SearchCell(4.0, 6.0, -1.0, 11.0), square)
+        assert not _cell_intersects_polygon(_SearchCell(20.0, 22.0, 20.0, 22.0), square)
+
+    def test_seed_cells_skip_cells_outside_outline(self):
+        """Test ocean, Canada and Mexico cells are never queried."""
+        cells = _generate_seed_cells(200, 2)
+
+        assert cells
+        assert len(cells) < len(_generate_us_grid(200))
+        assert all(_cell_intersects_polygon(cell, config.US_LAND_POLYGON) for cell in cells)
+
+    def test_dense_prior_cells_are_split_up_front(self):
+        """Test a cell that held a full page of stores last run starts split."""
+        dallas = [(32.78 + i * 0.001, -96.8 + i * 0.001) for i in range(config.MAX_RESULTS_PER_CALL * 4)]
+
+        cold = _generate_seed_cells(200, 2)
+        seeded = _generate_seed_cells(200, 2, dallas)
+
+        assert len(seeded) > len(cold)
+        assert all(sum(cell.contains(*p) for p in dallas) < config.MAX_RESULTS_PER_CALL for cell in seeded)
+
+
 class TestFormatHours:
     """Tests for _format_hours function."""
 
@@ -293,14 +356,14 @@ class TestFetchStoresAtPoint:
         mock_get.assert_called_once()
 
     @patch('src.scrapers.cricket.utils.get_with_retry')
-    def test_fetch_returns_empty_on_failure(self, mock_get):
-        """Test fetching returns empty list on failure."""
+    def test_fetch_returns_none_on_failure(self, mock_get):
+        """Test a failed request is reported as None, not as an empty area."""
         mock_get.return_value = None
 
         session = Mock()
         stores = _fetch_stores_at_point(session, 32.7767, -96.7970)
 
-        assert stores == []
+        assert stores is None
 
     @patch('src.scrapers.cricket.utils.get_with_retry')
     def test_fetch_handles_json_error(self, mock_get):
@@ -312,7 +375,7 @@ class TestFetchStoresAtPoint:
         session = Mock()
         stores = _fetch_stores_at_point(session, 32.7767, -96.7970)
 
-        assert stores == []
+        assert stores is None
 
 
 class TestCricketRun:
@@ -340,10 +403,10 @@ class TestCricketRun:
         response.json.return_value = {'response': {'results': results}}
         return response
 
-    @patch('src.scrapers.cricket.create_session_factory')
+    @patch('src.scrapers.cricket.create_session_pool')
     @patch('src.scrapers.cricket._fetch_stores_at_point')
     @patch('src.scrapers.cricket._generate_us_grid')
-    def test_run_returns_correct_structure(self, mock_grid, mock_fetch, mock_factory, mock_session):
+    def test_run_returns_correct_structure(self, mock_grid, mock_fetch, mock_pool, mock_session):
         """Test that run() returns the expected structure."""
         # Use small grid for test
         mock_grid.return_value = [(32.0, -96.0), (33.0, -97.0)]
@@ -353,7 +416,7 @@ class TestCricketRun:
             {'data': {'id': '1', 'name': 'Store 1', 'address': {}}}
         ]
 
-        mock_factory.return_value = lambda: Mock()
+        mock_pool.return_value.__enter__.return_value = lambda: Mock()
 
         result = run(mock_session, {'parallel_workers': 1}, retailer='cricket')
 
@@ -365,27 +428,27 @@ class TestCricketRun:
         assert isinstance(result['count'], int)
         assert result['checkpoints_used'] is False
 
-    @patch('src.scrapers.cricket.create_session_factory')
+    @patch('src.scrapers.cricket.create_session_pool')
     @patch('src.scrapers.cricket._fetch_stores_at_point')
     @patch('src.scrapers.cricket._generate_us_grid')
-    def test_run_with_limit(self, mock_grid, mock_fetch, mock_factory, mock_session):
+    def test_run_with_limit(self, mock_grid, mock_fetch, mock_pool, mock_session):
         """Test run() respects limit parameter."""
         mock_grid.return_value = [(32.0, -96.0)]
         mock_fetch.return_value = [
             {'data': {'id': str(i), 'name': f'Store {i}', 'address': {}}}
             for i in range(10)
         ]
-        mock_factory.return_value = lambda: Mock()
+        mock_pool.return_value.__enter__.return_value = lambda: Mock()
 
         result = run(mock_session, {'parallel_workers': 1}, retailer='cricket', limit=3)
 
         assert result['count'] == 3
         assert len(result['stores']) == 3
 
-    @patch('src.scrapers.cricket.create_session_factory')
+    @patch('src.scrapers.cricket.create_session_pool')
     @patch('src.scrapers.cricket._fetch_stores_at_point')
     @patch('src.scrapers.cricket._generate_us_grid')
-    def test_run_deduplicates_stores(self, mock_grid, mock_fetch, mock_factory, mock_session):
+    def test_run_deduplicates_stores(self, mock_grid, mock_fetch, mock_pool, mock_session):
         """Test that run() deduplicates stores by store_id."""
         # Multiple grid points return the same store
         mock_grid.return_value = [(32.0, -96.0), (32.5, -96.5), (33.0, -97.0)]
@@ -395,7 +458,7 @@ class TestCricketRun:
             {'data': {'id': 'same-id', 'name': 'Same Store', 'address': {}}}
         ]
 
-        mock_factory.return_value = lambda: Mock()
+        mock_pool.return_value.__enter__.return_value = lambda: Mock()
 
         result = run(mock_session, {'parallel_workers': 1}, retailer='cricket')
 
@@ -403,28 +466,28 @@ class TestCricketRun:
         assert result['count'] == 1
         assert result['stores'][0]['store_id'] == 'same-id'
 
-    @patch('src.scrapers.cricket.create_session_factory')
+    @patch('src.scrapers.cricket.create_session_pool')
     @patch('src.scrapers.cricket._fetch_stores_at_point')
     @patch('src.scrapers.cricket._generate_us_grid')
-    def test_run_test_mode(self, mock_grid, mock_fetch, mock_factory, mock_session):
+    def test_run_test_mode(self, mock_grid, mock_fetch, mock_pool, mock_session):
         """Test run() in test mode uses larger grid spacing."""
         mock_grid.return_value = [(32.0, -96.0)]
         mock_fetch.return_value = []
-        mock_factory.return_value = lambda: Mock()
+        mock_pool.return_value.__enter__.return_value = lambda: Mock()
 
         run(mock_session, {'parallel_workers': 1}, retailer='cricket', test=True)
 
         # Should have been called with larger spacing
         mock_grid.assert_called_once_with(200)
 
-    @patch('src.scrapers.cricket.create_session_factory')
+    @patch('src.scrapers.cricket.create_session_pool')
     @patch('src.scrapers.cricket._fetch_stores_at_point')
     @patch('src.scrapers.cricket._generate_us_grid')
-    def test_run_empty_results(self, mock_grid, mock_fetch, mock_factory, mock_session):
+    def test_run_empty_results(self, mock_grid, mock_fetch, mock_pool, mock_session):
         """Test run() with no stores found."""
         mock_grid.return_value = [(32.0, -96.0)]
         mock_fetch.return_value = []
-        mock_factory.return_value = lambda: Mock()
+        mock_pool.return_value.__enter__.return_value = lambda: Mock()
 
         result = run(mock_session, {'parallel_workers': 1}, retailer='cricket')
 
@@ -432,6 +495,79 @@ class TestCricketRun:
         assert result['count'] == 0
         assert result['checkpoints_used'] is False
 
+    @patch('src.scrapers.cricket._load_prior_points', return_value=[])
+    @patch('src.scrapers.cricket.create_session_pool')
+    @patch('src.scrapers.cricket._fetch_stores_at_point')
+    @patch('src.scrapers.cricket._generate_seed_cells')
+    def test_run_adaptive_splits_only_saturated_cells(self, mock_seeds, mock_fetch, mock_pool, mock_prior, mock_session):
+        """Test adaptive mode re-queries the quadrants of a capped cell only."""
+        dense = _SearchCell(32.0, 34.0, -98.0, -96.0)
+        sparse = _SearchCell(40.0, 42.0, -104.0, -102.0)
+        mock_seeds.return_value = [dense, sparse]
+
+        def fetch(session, lat, lng, retailer, radius_miles):
+            if (lat, lng) == dense.center:
+                count = config.MAX_RESULTS_PER_CALL
+                return [{'data': {'id': f'd{i}', 'name': 'Dense', 'address': {}}} for i in range(count)]
+            return [{'data': {'id': f'{lat},{lng}', 'name': 'Store', 'address': {}}}]
+
+        mock_fetch.side_effect = fetch
+        mock_pool.return_value.__enter__.return_value = lambda: Mock()
+
+        result = run(mock_session, {'parallel_workers': 2, 'search_mode': 'adaptive'}, retailer='cricket')
+
+        # 2 seed cells + 4 quadrants of the saturated one
+        assert mock_fetch.call_count == 6
+        assert result['count'] == config.MAX_RESULTS_PER_CALL + 5
+        child_radii = {call.kwargs['radius_miles'] for call in mock_fetch.call_args_list[2:]}
+        assert max(child_radii) < dense.radius_miles()
+
+    @patch('src.scrapers.cricket._load_prior_points', return_value=[])
+    @patch('src.scrapers.cricket.create_session_pool')
+    @patch('src.scrapers.cricket._fetch_stores_at_point')
+    @patch('src.scrapers.cricket._generate_seed_cells')
+    def test_run_adaptive_retries_failed_cells(self, mock_seeds, mock_fetch, mock_pool, mock_prior,
+                                               mock_session, caplog):
+        """Test a failed cell query is retried and then reported, never taken as empty."""
+        flaky = _SearchCell(32.0, 34.0, -98.0, -96.0)
+        down = _SearchCell(40.0, 42.0, -104.0, -102.0)
+        mock_seeds.return_value = [flaky, down]
+        calls = []
+
+        def fetch(session, lat, lng, retailer, radius_miles):
+            calls.append((lat, lng))
+            if (lat, lng) == flaky.center and calls.count(flaky.center) == 1:
+                return None
+            if (lat, lng) == down.center:
+                return None
+            return [{'data': {'id': 'flaky-1', 'name': 'Store', 'address': {}}}]
+
+        mock_fetch.side_effect = fetch
+        mock_pool.return_value.__enter__.return_value = lambda: Mock()
+
+        with caplog.at_level(logging.WARNING):
+            result = run(mock_session, {'parallel_workers': 1, 'search_mode': 'adaptive'}, retailer='cricket')
+
+        assert result['count'] == 1
+        assert calls.count(flaky.center) == 2
+        assert calls.count(down.center) == config.ADAPTIVE_CELL_RETRIES + 1
+        assert '1 cells could not be searched' in caplog.text
+
+    @patch('src.scrapers.cricket.create_session_pool')
+    @patch('src.scrapers.cricket._fetch_stores_at_point')
+    @patch('src.scrapers.cricket._generate_us_grid')
+    def test_run_adaptive_test_mode_does_not_split(self, mock_grid, mock_fetch, mock_pool, mock_session):
+        """Test adaptive test mode queries seed cells only."""
+        mock_fetch.return_value = [
+            {'data': {'id': str(i), 'name': 'Store', 'address': {}}} for i in range(config.MAX_RESULTS_PER_CALL)
+        ]
+        mock_pool.return_value.__enter__.return_value = lambda: Mock()
+
+        run(mock_session, {'parallel_workers': 4, 'search_mode': 'adaptive'}, retailer='cricket', test=True)
+
+        mock_grid.assert_not_called()
+        assert mock_fetch.call_count == len(_generate_seed_cells(200, 200))
+
 
 class TestCricketConfig:
     """Tests for Cricket configuration."""
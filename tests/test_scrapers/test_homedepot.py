@@ -8,12 +8,15 @@ from unittest.mock import Mock, patch, MagicMock, call
 
 from config import homedepot_config
 from src.scrapers.homedepot import (
+    GraphQLBatchSize,
     HomeDepotStore,
     _post_graphql,
+    _post_graphql_batch,
     _format_day_hours,
     _format_hours_json,
     discover_stores,
     extract_store_details,
+    extract_store_details_batch,
     run,
 )
 from src.shared.request_counter import RequestCounter
@@ -1091,3 +1094,174 @@ class TestRun:
         # item_key_func should extract store_id from dict
         key_func = call_kwargs["item_key_func"]
         assert key_func({"store_id": "121", "name": "Test"}) == "121"
+
+
+# ---------------------------------------------------------------------------
+# TestGraphqlBatching
+# ---------------------------------------------------------------------------
+
+def _aliased_response(status_code=200, fields=None, errors=None):
+    """Mock response for an aliased query."""
+    response = Mock()
+    response.status_code = status_code
+    body = {"data": fields}
+    if errors:
+        body["errors"] = errors
+    response.json.return_value = body
+    return response
+
+
+def _alias_count(call_args):
+    """Number of aliases in the query of a session.post call."""
+    return call_args.kwargs["json"]["query"].count(": storeDirectoryByState(") or \
+        call_args.kwargs["json"]["query"].count(": storeSearch(")
+
+
+class TestGraphqlBatching:
+    """Tests for aliased multi-operation GraphQL requests."""
+
+    def test_batch_queries_are_aliased(self):
+        """Batch builders alias one operation per variable."""
+        query = homedepot_config.build_store_search_batch(3)
+        assert "s2: storeSearch(" in query
+        assert "$storeSearchInput2: String" in query
+        assert query.count("$storeFeaturesFilter: StoreFeaturesFilter") == 1
+
+        query = homedepot_config.build_state_directory_batch(2)
+        assert "s1: storeDirectoryByState(state: $state1)" in query
+
+    @patch('src.scrapers.homedepot.random_delay')
+    def test_discovery_batches_states(self, mock_delay, mock_session, yaml_config):
+        """All 54 states are fetched in ceil(54 / batch size) POSTs."""
+        def post(url, json=None, **kwargs):
+            count = json["query"].count(": storeDirectoryByState(")
+            fields = {}
+            for i in range(count):
+                state = json["variables"][f"state{i}"]
+                fields[f"s{i}"] = {"stateName": state, "storesInfo": [{
+                    "storeName": state,
+                    "url": f"https://www.homedepot.com/l/x/{state}/y/00000/{i + 100}",
+                    "address": {"state": state},
+                }]}
+            return _aliased_response(fields=fields)
+
+        mock_session.post.side_effect = post
+        yaml_config["graphql_batch_size"] = 25
+
+        results = discover_stores(mock_session, "homedepot", yaml_config, None)
+
+        assert mock_session.post.call_count == 3
+        assert len(results) == len(homedepot_config.US_STATES)
+        assert [r["state"] for r in results] == homedepot_config.US_STATES
+
+    @patch('src.scrapers.homedepot.random_delay')
+    def test_rejected_batch_is_split_and_size_reduced(self, mock_delay, mock_session):
+        """A 413 halves the batch and both halves are retried."""
+        def post(url, json=None, **kwargs):
+            count = json["query"].count(": storeDirectoryByState(")
+            if count > 2:
+                return _aliased_response(status_code=413)
+            return _aliased_response(fields={
+                f"s{i}": {"stateName": json["variables"][f"state{i}"]} for i in range(count)
+            })
+
+        mock_session.post.side_effect = post
+        batch = GraphQLBatchSize(8)
+
+        results = _post_graphql_batch(
+            mock_session,
+            operation_name="storeDirectoryByStateBatch",
+            build_query=homedepot_config.build_state_directory_batch,
+            alias_variable="state",
+            values=["A", "B", "C", "D", "E", "F", "G", "H"],
+            batch=batch,
+        )
+
+        assert [r["stateName"] for r in results] == list("ABCDEFGH")
+        assert batch.value == 2
+        # 8 rejected, 4 rejected, then four batches of 2
+        assert [_alias_count(c) for c in mock_session.post.call_args_list] == [8, 4, 2, 2, 2, 2]
+
+    @patch('src.scrapers.homedepot.random_delay')
+    def test_errors_without_data_count_as_rejection(self, mock_delay, mock_session):
+        """A batch answered only with errors (e.g. a complexity limit) is split."""
+        def post(url, json=None, **kwargs):
+            count = json["query"].count(": storeDirectoryByState(")
+            if count > 1:
+                return _aliased_response(fields=None, errors=[{
+                    "message": "Query too complex", "extensions": {"code": "QUERY_TOO_COMPLEX"}
+                }])
+            return _aliased_response(fields={"s0": {"stateName": json["variables"]["state0"]}})
+
+        mock_session.post.side_effect = post
+        batch = GraphQLBatchSize(2)
+
+        results = _post_graphql_batch(
+            mock_session, "storeDirectoryByStateBatch",
+            homedepot_config.build_state_directory_batch, "state", ["A", "B"], batch,
+        )
+
+        assert [r["stateName"] for r in results] == ["A", "B"]
+        assert batch.value == 1
+
+    @pytest.mark.parametrize("response", [
+        _aliased_response(status_code=400),
+        _aliased_response(status_code=422),
+        _aliased_response(fields=None, errors=[{"message": "Cannot query field", "extensions": {"code": "GRAPHQL_VALIDATION_FAILED"}}]),
+    ])
+    @patch('src.scrapers.homedepot.random_delay')
+    def test_other_failures_fail_the_batch_without_splitting(self, mock_delay, mock_session, response):
+        """Errors that would fail at any size cost one POST and keep the batch size."""
+        mock_session.post.return_value = response
+        batch = GraphQLBatchSize(4)
+
+        results = _post_graphql_batch(
+            mock_session, "storeDirectoryByStateBatch",
+            homedepot_config.build_state_directory_batch, "state", ["A", "B", "C", "D"], batch,
+        )
+
+        assert results == [None] * 4
+        assert mock_session.post.call_count == 1
+        assert batch.value == 4
+
+    @patch('src.scrapers.homedepot.random_delay')
+    def test_extract_batch_with_partial_errors(self, mock_delay, mock_session,
+                                               sample_store_search_response, yaml_config):
+        """Aliases that failed come back as None; the rest are parsed."""
+        store_search = sample_store_search_response["data"]["storeSearch"]
+        mock_session.post.return_value = _aliased_response(
+            fields={"s0": store_search, "s1": None},
+            errors=[{"message": "Store not found", "path": ["s1"]}],
+        )
+        items = [
+            {"store_id": "121", "county": "Cobb"},
+            {"store_id": "9999", "county": ""},
+        ]
+
+        results = extract_store_details_batch(
+            mock_session, items, "homedepot", yaml_config, None,
+            graphql_batch=GraphQLBatchSize(10),
+        )
+
+        assert mock_session.post.call_count == 1
+        variables = mock_session.post.call_args.kwargs["json"]["variables"]
+        assert variables["storeSearchInput0"] == "0121"
+        assert variables["storeSearchInput1"] == "9999"
+        assert results[0].store_id == "121"
+        assert results[0].county == "Cobb"
+        assert results[1] is None
+
+    @patch('src.scrapers.homedepot.ScrapeRunner')
+    def test_run_passes_batch_settings(self, mock_runner_class, mock_session, yaml_config):
+        """run() hands the batch function and a shared batch size to the runner."""
+        mock_runner_class.return_value.run_with_checkpoints.return_value = {
+            "stores": [], "count": 0, "checkpoints_used": False
+        }
+        yaml_config["graphql_batch_size"] = 40
+
+        run(mock_session, yaml_config)
+
+        call_kwargs = mock_runner_class.return_value.run_with_checkpoints.call_args[1]
+        assert call_kwargs["batch_extraction_func"] == extract_store_details_batch
+        assert call_kwargs["batch_size"] == 40
+        assert call_kwargs["graphql_batch"].value == 40
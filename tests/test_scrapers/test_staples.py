@@ -10,6 +10,7 @@ Tests cover:
   - Store data merging
   - Store number generation
   - Phase 1: Store number scanning (mocked)
+  - Phase 1 scan planning across runs
   - Phase 2: ZIP code gap-fill (mocked)
   - Phase 3: Service enrichment (mocked)
   - Full run() integration (mocked)
@@ -22,7 +23,9 @@ import pytest
 
 from src.scrapers.staples import (
     StaplesStore,
+    StoreNumberPlanner,
     _enrich_services,
+    _fetch_store_detail,
     _format_features,
     _format_hours_locator,
     _format_hours_staplesconnect,
@@ -38,6 +41,7 @@ from src.scrapers.staples import (
     run,
 )
 from config import staples_config as config
+from src.shared.gap_fill import US_ZIP_CENTROIDS
 
 
 # ===========================================================================
@@ -659,14 +663,15 @@ class TestScanStoreNumbers:
     """Tests for _scan_store_numbers with mocked proxy client."""
 
     @patch("src.scrapers.staples._scan_worker")
-    def test_basic_scan(self, mock_worker):
+    def test_basic_scan(self, mock_worker, tmp_path, monkeypatch):
         """Basic scan finds stores from valid numbers."""
+        monkeypatch.chdir(tmp_path)
         valid_store = StaplesStore(
             store_id="0001", name="Staples Brighton", street_address="123 Main",
         )
         # Return valid store for 0001, None for others
         mock_worker.side_effect = lambda num, _: (
-            (num, valid_store) if num == "0001" else (num, None)
+            (num, valid_store, True) if num == "0001" else (num, None, True)
         )
 
         mock_proxy = MagicMock()
@@ -681,10 +686,11 @@ class TestScanStoreNumbers:
 
     @patch("src.scrapers.staples._generate_store_numbers")
     @patch("src.scrapers.staples._scan_worker")
-    def test_test_mode_limits_numbers(self, mock_worker, mock_generate):
+    def test_test_mode_limits_numbers(self, mock_worker, mock_generate, tmp_path, monkeypatch):
         """Test mode scans only first 20 numbers."""
+        monkeypatch.chdir(tmp_path)
         mock_generate.return_value = [str(i).zfill(4) for i in range(1, 100)]
-        mock_worker.return_value = ("0001", None)
+        mock_worker.return_value = ("0001", None, True)
 
         mock_proxy = MagicMock()
         retailer_config = {"parallel_workers": 1, "checkpoint_interval": 999}
@@ -697,6 +703,158 @@ class TestScanStoreNumbers:
         # In test mode, only first 20 should be submitted
         assert mock_worker.call_count <= 20
 
+    @patch("src.scrapers.staples.config.build_store_detail_url", return_value="https://example.test/0005")
+    def test_fetch_store_detail_separates_misses_from_errors(self, mock_url):
+        """Only a 404 is a definitive miss; no response or a server error is not."""
+        proxy = MagicMock()
+        proxy.get.return_value = MagicMock(status_code=404, ok=False)
+        assert _fetch_store_detail("0005", proxy) == (None, True)
+
+        proxy.get.return_value = MagicMock(status_code=503, ok=False)
+        assert _fetch_store_detail("0005", proxy) == (None, False)
+
+        proxy.get.return_value = None
+        assert _fetch_store_detail("0005", proxy) == (None, False)
+
+
+# ===========================================================================
+# TestStoreNumberPlanner: Phase 1 scan planning
+# ===========================================================================
+
+NUMBERS = [str(i).zfill(4) for i in range(1, 201)]
+
+
+def _make_planner(tmp_path, **kwargs):
+    kwargs.setdefault("sample_stride", 20)
+    kwargs.setdefault("densify_radius", 5)
+    return StoreNumberPlanner(state_path=str(tmp_path / "scan_history.json"), **kwargs)
+
+
+def _finish_run(planner, live):
+    """Probe a planned run against a fixed set of live numbers and save it."""
+    probed = planner.plan(NUMBERS)
+    for number in probed:
+        planner.record(number, number in live)
+    planner.save()
+    return probed
+
+
+class TestStoreNumberPlanner:
+    """Tests for StoreNumberPlanner hit history and planning."""
+
+    def test_first_run_is_full_sweep(self, tmp_path):
+        """Without history every number is scanned."""
+        planner = _make_planner(tmp_path)
+
+        assert planner.plan(NUMBERS) == NUMBERS
+        assert planner.full_sweep
+
+    def test_next_run_probes_live_numbers_first_plus_sample(self, tmp_path):
+        """Between sweeps only known-live numbers and a 1-in-N sample are probed."""
+        _finish_run(_make_planner(tmp_path), {"0005", "0050", "0120"})
+
+        planner = _make_planner(tmp_path)
+        planned = planner.plan(NUMBERS)
+
+        assert not planner.full_sweep
+        assert planned[:3] == ["0005", "0050", "0120"]
+        assert len(planned) <= 3 + len(NUMBERS) // 20
+
+    def test_sample_offset_rotates_between_runs(self, tmp_path):
+        """Each run samples a different slice of the dead numbers."""
+        _finish_run(_make_planner(tmp_path), {"0005"})
+        second = _finish_run(_make_planner(tmp_path), {"0005"})
+        third = _make_planner(tmp_path).plan(NUMBERS)
+
+        assert set(second[1:]).isdisjoint(third[1:])
+
+    def test_neighbors_only_for_new_hits(self, tmp_path):
+        """A hit on a number not known to be live densifies around it once."""
+        _finish_run(_make_planner(tmp_path), {"0005"})
+        planner = _make_planner(tmp_path)
+        planned = set(planner.plan(NUMBERS))
+
+        neighbors = planner.neighbors("0042")
+
+        assert neighbors
+        assert all(37 <= int(n) <= 47 and n not in planned for n in neighbors)
+        assert planner.neighbors("0042") == []
+        assert planner.neighbors("0005") == []
+
+    def test_repeated_misses_retire_live_number(self, tmp_path):
+        """A live number that keeps missing stops being probed first."""
+        planner = _make_planner(tmp_path, miss_limit=2)
+        planner.plan(NUMBERS)
+        planner.record("0005", True)
+        planner.record("0005", False)
+        assert planner.known_live() == ["0005"]
+
+        planner.record("0005", False)
+        assert planner.known_live() == []
+
+    def test_full_sweep_cadence_and_force(self, tmp_path):
+        """An expired or forced sweep scans everything again."""
+        _finish_run(_make_planner(tmp_path), {"0005"})
+
+        assert _make_planner(tmp_path, full_sweep_days=0).plan(NUMBERS)[1:] == [
+            n for n in NUMBERS if n != "0005"
+        ]
+        forced = _make_planner(tmp_path, force_full_sweep=True)
+        forced.plan(NUMBERS)
+        assert forced.full_sweep
+
+    def test_scan_finds_new_stores_by_densifying(self, tmp_path, monkeypatch):
+        """A planned scan costs far less than the ID space and still finds new stores."""
+        monkeypatch.chdir(tmp_path)
+        live = {"0005", "0050", "0120"}
+
+        def worker(num, _):
+            return num, StaplesStore(store_id=num, name="S", street_address="") if num in live else None, True
+
+        retailer_config = {"parallel_workers": 2, "checkpoint_interval": 999}
+        with patch("src.scrapers.staples._generate_store_numbers", return_value=NUMBERS), \
+                patch("src.scrapers.staples._scan_worker", side_effect=worker) as mock_worker:
+            planner = _make_planner(tmp_path)
+            _scan_store_numbers(MagicMock(), retailer_config, planner=planner)
+            planner.save()
+            assert mock_worker.call_count == len(NUMBERS)
+
+            # Two stores open next to each other; the sample hits one of them
+            planner = _make_planner(tmp_path)
+            sampled = [n for n in planner.plan(NUMBERS) if n not in live]
+            live |= {sampled[2], str(int(sampled[2]) + 3).zfill(4)}
+            mock_worker.reset_mock()
+
+            stores, _ = _scan_store_numbers(MagicMock(), retailer_config, planner=_make_planner(tmp_path))
+
+        assert set(stores) == live
+        assert mock_worker.call_count < len(NUMBERS) // 4
+
+    def test_scan_errors_are_not_recorded_as_misses(self, tmp_path, monkeypatch):
+        """A live number whose probe fails keeps its history and is re-probed on resume."""
+        monkeypatch.chdir(tmp_path)
+        planner = _make_planner(tmp_path, miss_limit=1)
+        _finish_run(planner, {"0005", "0050"})
+        retailer_config = {"parallel_workers": 1, "checkpoint_interval": 999}
+
+        def worker(num, _):
+            if num == "0005":
+                return num, None, False
+            return num, None, True
+
+        with patch("src.scrapers.staples._generate_store_numbers", return_value=NUMBERS), \
+                patch("src.scrapers.staples._scan_worker", side_effect=worker):
+            planner = _make_planner(tmp_path, miss_limit=1)
+            _scan_store_numbers(MagicMock(), retailer_config, planner=planner)
+
+            assert planner.known_live() == ["0005"]
+
+            resumed = MagicMock(return_value=("0005", None, True))
+            with patch("src.scrapers.staples._scan_worker", resumed):
+                _scan_store_numbers(MagicMock(), retailer_config, resume=True, planner=_make_planner(tmp_path))
+
+        assert [c.args[0] for c in resumed.call_args_list] == ["0005"]
+
 
 # ===========================================================================
 # TestZipCodeGapFill: Phase 2 (mocked)
@@ -733,6 +891,45 @@ class TestZipCodeGapFill:
         result = _zip_code_gap_fill(mock_proxy, known_ids, test=True)
         assert "0001" not in result
 
+    @patch("src.scrapers.staples._search_stores_by_zip")
+    def test_phase1_stores_near_zips_do_not_skip_searches(self, mock_search):
+        """Phase 1 stores next to every candidate ZIP still leave each ZIP searched."""
+        nearby = {
+            zip_code: StaplesStore(
+                store_id=f"P{zip_code}", name="Phase 1 Store", street_address="1 Main",
+                latitude=US_ZIP_CENTROIDS[zip_code][0], longitude=US_ZIP_CENTROIDS[zip_code][1],
+            )
+            for zip_code in config.TEST_GAP_FILL_ZIP_CODES
+        }
+        missed = StaplesStore(store_id="9999", name="Missed Store", street_address="999 Oak")
+        mock_search.side_effect = lambda proxy, zip_code: (
+            [nearby[zip_code], missed] if zip_code == "80201" else [nearby[zip_code]]
+        )
+
+        result = _zip_code_gap_fill(MagicMock(), {s.store_id for s in nearby.values()}, test=True)
+
+        assert mock_search.call_count == 5
+        assert set(result) == {"9999"}
+
+    @patch("src.scrapers.staples._search_stores_by_zip")
+    def test_failed_search_is_retried(self, mock_search):
+        """A search that fails is retried instead of being treated as an empty area."""
+        missed = StaplesStore(store_id="9999", name="Missed Store", street_address="999 Oak")
+        attempts = []
+
+        def search(proxy, zip_code):
+            attempts.append(zip_code)
+            if zip_code == "10001" and attempts.count("10001") == 1:
+                return None
+            return [missed] if zip_code == "10001" else []
+
+        mock_search.side_effect = search
+
+        result = _zip_code_gap_fill(MagicMock(), set(), test=True)
+
+        assert attempts.count("10001") == 2
+        assert "9999" in result
+
     @patch("src.scrapers.staples._search_stores_by_zip")
     def test_test_mode_limits_zips(self, mock_search):
         """Test mode only sweeps 5 ZIP codes."""
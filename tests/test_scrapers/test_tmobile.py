@@ -792,11 +792,11 @@ class TestTMobileRunParallel:
         mock_cache.set.assert_called_once()  # Should save newly discovered URLs
 
     @patch('src.scrapers.tmobile.URLCache')
-    @patch('src.scrapers.tmobile.create_session_factory')
+    @patch('src.scrapers.tmobile.create_session_pool')
     @patch('src.scrapers.tmobile.tmobile_config')
     @patch('src.scrapers.tmobile.utils.save_checkpoint')
     @patch('src.scrapers.tmobile.extract_store_details')
-    def test_run_parallel_extraction(self, mock_extract, mock_save_checkpoint, mock_config, mock_session_factory, mock_cache_class, mock_session):
+    def test_run_parallel_extraction(self, mock_extract, mock_save_checkpoint, mock_config, mock_session_pool, mock_cache_class, mock_session):
         """Test that parallel extraction works with multiple workers."""
         mock_config.SITEMAP_PAGES = [1]
         mock_cache = Mock()
@@ -807,9 +807,9 @@ class TestTMobileRunParallel:
         ]
         mock_cache_class.return_value = mock_cache
 
-        # Mock session factory
+        # Mock session pool
         mock_worker_session = Mock()
-        mock_session_factory.return_value = lambda: mock_worker_session
+        mock_session_pool.return_value.__enter__.return_value = lambda: mock_worker_session
 
         # Mock extract_store_details to return store objects
         def make_store(session, url, retailer):
@@ -828,7 +828,7 @@ class TestTMobileRunParallel:
 
         assert result['count'] == 3
         assert len(result['stores']) == 3
-        mock_session_factory.assert_called_once()
+        mock_session_pool.assert_called_once()
 
     @patch('src.scrapers.tmobile.URLCache')
     @patch('src.scrapers.tmobile.tmobile_config')
@@ -11,13 +11,17 @@ from src.scrapers.walmart import (
     WalmartStore,
     get_store_urls_from_sitemap,
     extract_store_details,
+    parse_store_page,
     run,
     get_request_count,
     reset_request_counter,
     _get_cached_response,
     _cache_response,
+    _close_response_cache,
+    _get_response_cache,
     _request_counter,
 )
+from src.shared.proxy_client import ProxyMode
 from src.shared.request_counter import check_pause_logic
 from src.shared.cache import URLCache
 
@@ -410,6 +414,41 @@ class TestWalmartRun:
 
         assert result['count'] == len(result['stores'])
 
+    @patch('src.shared.scrape_runner.utils.save_checkpoint')
+    @patch('src.shared.scrape_runner.URLCache')
+    @patch('src.scrapers.walmart.ProxyClient')
+    @patch('src.scrapers.walmart._cache_response')
+    @patch('src.scrapers.walmart._get_cached_response', return_value=None)
+    @patch('src.scrapers.walmart.walmart_config')
+    @patch('src.scrapers.walmart.utils.get_with_retry')
+    @patch('src.scrapers.walmart._request_counter')
+    def test_run_batch_mode(self, mock_counter, mock_get, mock_config, mock_get_resp,
+                            mock_cache_resp, mock_proxy_client, mock_cache_class, mock_save,
+                            mock_session):
+        """Test scraper_api_batch submits store pages as batch jobs and caches results."""
+        mock_config.SITEMAP_URLS = ['https://test.com/sitemap.xml']
+        mock_cache_class.return_value.get.return_value = None
+        mock_get.return_value = self._make_sitemap_response([1234, 1235])
+        page = self._make_store_page_response(1234)
+        page.status_code = 200
+        client = Mock()
+        client.config.mode = ProxyMode.WEB_SCRAPER_API
+        client.get_batch.return_value = iter([
+            ('https://www.walmart.com/store/1234-test-tx', page),
+            ('https://www.walmart.com/store/1235-test-tx', None),
+        ])
+        mock_proxy_client.return_value = client
+        config = {'proxy': {'mode': 'web_scraper_api'}, 'scraper_api_batch': True}
+
+        result = run(mock_session, config, retailer='walmart')
+
+        assert result['count'] == 1
+        assert result['stores'][0]['store_id'] == '1234'
+        client.get.assert_not_called()
+        mock_cache_resp.assert_called_once_with(
+            'https://www.walmart.com/store/1234-test-tx', page.text, 'walmart'
+        )
+
 
 class TestWalmartCheckpoint:
     """Tests for Walmart checkpoint/resume functionality."""
@@ -580,6 +619,11 @@ class TestWalmartErrorHandling:
         assert store is None
 
 
+    def test_parse_store_page_without_next_data(self):
+        """Test parse_store_page() returns None for pages that were not JS-rendered."""
+        assert parse_store_page('<html></html>', 'https://www.walmart.com/store/1234-test-tx') is None
+
+
 class TestWalmartUrlCaching:
     """Tests for URL caching functionality using shared URLCache."""
 
@@ -693,12 +737,54 @@ class TestWalmartResponseCaching:
         mock_get.assert_called_once()  # Should fetch from network
         mock_cache_resp.assert_called_once()  # Should cache the response
 
+    def test_response_cache_roundtrip_in_single_file(self, tmp_path, monkeypatch):
+        """Test cached responses live in one SQLite file, not one JSON file per URL."""
+        monkeypatch.chdir(tmp_path)
+        url = 'https://www.walmart.com/store/789-single-tx'
+        try:
+            _cache_response(url, '<html>store 789</html>', 'walmart')
+            assert _get_cached_response(url, 'walmart') == '<html>store 789</html>'
+        finally:
+            _close_response_cache('walmart')
+
+        cache_dir = tmp_path / 'data' / 'walmart' / 'response_cache'
+        assert [p.name for p in cache_dir.glob('*.json')] == []
+        assert (cache_dir / 'cache.sqlite3').exists()
+
+    def test_legacy_json_response_is_migrated(self, tmp_path, monkeypatch):
+        """Test legacy per-URL JSON hits move into SQLite with their original age."""
+        import hashlib
+        from datetime import datetime, timedelta
+
+        monkeypatch.chdir(tmp_path)
+        url = 'https://www.walmart.com/store/321-legacy-tx'
+        cache_dir = tmp_path / 'data' / 'walmart' / 'response_cache'
+        cache_dir.mkdir(parents=True)
+        legacy_file = cache_dir / f"{hashlib.sha256(url.encode()).hexdigest()}.json"
+        cached_at = datetime.now() - timedelta(days=10)
+        legacy_file.write_text(json.dumps({
+            'url': url,
+            'cached_at': cached_at.isoformat(),
+            'html': '<html>legacy</html>'
+        }))
+        try:
+            assert _get_cached_response(url, 'walmart') == '<html>legacy</html>'
+            assert not legacy_file.exists()
+            assert _get_cached_response(url, 'walmart') == '<html>legacy</html>'
+
+            info = _get_response_cache('walmart').get_metadata(url)
+            assert info['age_days'] == 10
+        finally:
+            _close_response_cache('walmart')
+
 
 class TestWalmartFailedUrlTracking:
     """Tests for failed URL tracking functionality."""
 
     @patch('src.scrapers.walmart.Path.mkdir')
     @patch('builtins.open', create=True)
+    @patch('src.scrapers.walmart.RevalidationCache')
+    @patch('src.scrapers.walmart._get_response_cache')
     @patch('src.scrapers.walmart._cache_response')
     @patch('src.scrapers.walmart._get_cached_response', return_value=None)
     @patch('src.scrapers.walmart.URLCache')
@@ -707,7 +793,8 @@ class TestWalmartFailedUrlTracking:
     @patch('src.scrapers.walmart._request_counter')
     def test_tracks_failed_urls(self, mock_counter, mock_get, mock_config,
                                 mock_cache_class, mock_get_cached, mock_cache_resp,
-                                mock_open, mock_mkdir, mock_session):
+                                mock_response_cache, mock_revalidation_cache, mock_open,
+                                mock_mkdir, mock_session):
         """Test that run() tracks failed URL extractions."""
         # Setup URLCache mock
         mock_cache = Mock()
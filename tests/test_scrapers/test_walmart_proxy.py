@@ -362,7 +362,7 @@ class TestWalmartProxyCredentialValidation:
         run(mock_session, config, retailer='walmart')
 
         # Verify ProxyClient was initialized with the config instance
-        mock_proxy_client_class.assert_called_once_with(mock_config_instance)
+        mock_proxy_client_class.assert_called_once_with(mock_config_instance, retailer='walmart')
 
     @patch('src.scrapers.walmart.ProxyClient')
     @patch('src.scrapers.walmart.ProxyConfig')
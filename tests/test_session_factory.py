@@ -0,0 +1,124 @@
+"""Tests for session factory and thread-local SessionPool."""
+
+import threading
+from unittest.mock import Mock, patch
+
+import pytest
+
+from src.shared.session_factory import (
+    SessionPool,
+    create_session_factory,
+    create_session_pool,
+    release_session,
+)
+
+
+class TestSessionPool:
+    """Tests for SessionPool thread-local session reuse."""
+
+    @patch('src.shared.session_factory.utils.create_proxied_session')
+    def test_same_thread_reuses_session(self, mock_create):
+        """Test repeated calls from one thread return the same warm session."""
+        mock_create.side_effect = lambda config: Mock()
+        pool = create_session_pool({'proxy': {'mode': 'direct'}})
+
+        first = pool()
+        second = pool.get()
+
+        assert first is second
+        assert mock_create.call_count == 1
+        assert pool.size == 1
+
+    @patch('src.shared.session_factory.utils.create_proxied_session')
+    def test_each_thread_gets_own_session(self, mock_create):
+        """Test worker threads never share a session."""
+        mock_create.side_effect = lambda config: Mock()
+        pool = SessionPool({'proxy': {'mode': 'direct'}})
+        sessions = []
+        barrier = threading.Barrier(3)
+
+        def worker():
+            barrier.wait()
+            sessions.append(pool())
+
+        threads = [threading.Thread(target=worker) for _ in range(3)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        assert len({id(s) for s in sessions}) == 3
+        assert pool.size == 3
+
+    @patch('src.shared.session_factory.utils.create_proxied_session')
+    def test_close_closes_all_sessions(self, mock_create):
+        """Test closing the pool closes every session it created."""
+        created = []
+
+        def make_session(config):
+            session = Mock()
+            created.append(session)
+            return session
+
+        mock_create.side_effect = make_session
+
+        with create_session_pool({}) as pool:
+            pool()
+            t = threading.Thread(target=pool)
+            t.start()
+            t.join()
+
+        assert len(created) == 2
+        for session in created:
+            session.close.assert_called_once()
+        assert pool.size == 0
+
+    @patch('src.shared.session_factory.utils.create_proxied_session')
+    def test_closed_pool_rejects_new_sessions(self, mock_create):
+        """Test a closed pool cannot hand out new sessions."""
+        mock_create.side_effect = lambda config: Mock()
+        pool = SessionPool({})
+        pool.close()
+
+        with pytest.raises(RuntimeError):
+            pool()
+
+
+class TestReleaseSession:
+    """Tests for release_session helper."""
+
+    @patch('src.shared.session_factory.utils.create_proxied_session')
+    def test_release_keeps_pooled_session_open(self, mock_create):
+        """Test pooled sessions stay open after release."""
+        session = Mock()
+        mock_create.return_value = session
+        pool = SessionPool({})
+
+        release_session(pool, pool())
+
+        session.close.assert_not_called()
+
+    @patch('src.shared.session_factory.utils.create_proxied_session')
+    def test_release_closes_factory_session(self, mock_create):
+        """Test sessions from a plain factory are closed on release."""
+        session = Mock()
+        mock_create.return_value = session
+        factory = create_session_factory({})
+
+        release_session(factory, factory())
+
+        session.close.assert_called_once()
+
+
+class TestPooledAdapter:
+    """Tests for keep-alive adapter sizing on created sessions."""
+
+    def test_direct_session_uses_sized_adapter(self):
+        """Test direct sessions mount an HTTPAdapter sized from proxy config."""
+        pool = SessionPool({'proxy': {'mode': 'direct', 'pool_maxsize': 7}})
+        try:
+            session = pool()
+            adapter = session.get_adapter('https://example.com')
+            assert adapter._pool_maxsize == 7
+        finally:
+            pool.close()
@@ -0,0 +1,147 @@
+"""Tests for the streaming StorePipeline export stage."""
+
+import json
+import threading
+
+import pytest
+
+from src.shared.export_service import ExportFormat, ExportService
+from src.shared.store_pipeline import StorePipeline
+
+
+SAMPLE_STORES = [
+    {
+        "store_id": "1001",
+        "name": "Test Store 1",
+        "street_address": "123 Main St",
+        "city": "New York",
+        "state": "NY",
+        "zip_code": "10001",
+        "latitude": 40.7128,
+        "longitude": -74.0060,
+        "phone": "=cmd|' /C calc'!A0",
+    },
+    {
+        "store_id": "1002",
+        "name": "Café Ünïcode",
+        "street_address": "456 Oak Ave\nSuite 2",
+        "city": "Los Angeles",
+        "state": "CA",
+        "postal_code": "90001",
+        "latitude": 34.0522,
+        "longitude": -118.2437,
+        "hours": {"mon": "9-5"},
+    },
+]
+
+
+def _read(path):
+    with open(path, 'r', encoding='utf-8') as f:
+        return f.read()
+
+
+class TestStorePipelineOutput:
+    """Streamed files must match the batch ExportService output exactly."""
+
+    @pytest.mark.parametrize('fmt,ext', [
+        (ExportFormat.JSON, 'json'),
+        (ExportFormat.JSONL, 'jsonl'),
+        (ExportFormat.CSV, 'csv'),
+        (ExportFormat.GEOJSON, 'geojson'),
+    ])
+    def test_matches_export_service(self, tmp_path, fmt, ext):
+        """Test streamed files are byte-identical to ExportService.export_stores."""
+        config = {'name': 'test'}
+        expected_path = tmp_path / 'batch' / f'stores.{ext}'
+        ExportService.export_stores(SAMPLE_STORES, fmt, str(expected_path), config)
+
+        with StorePipeline('test', str(tmp_path / 'stream'), config, formats=[fmt]) as pipeline:
+            pipeline.add_many(SAMPLE_STORES)
+
+        assert _read(pipeline.written[fmt]) == _read(expected_path)
+
+    def test_csv_uses_configured_output_fields(self, tmp_path):
+        """Test output_fields fixes the CSV header without sampling rows."""
+        config = {'name': 'test', 'output_fields': ['store_id', 'zip']}
+
+        with StorePipeline('test', str(tmp_path), config, formats=[ExportFormat.CSV]) as pipeline:
+            pipeline.add_many(SAMPLE_STORES)
+
+        lines = _read(pipeline.written[ExportFormat.CSV]).splitlines()
+        assert lines == ['store_id,zip', '1001,10001', '1002,90001']
+
+    def test_compact_json(self, tmp_path):
+        """Test compact_json writes the same stores without indentation."""
+        with StorePipeline('test', str(tmp_path / 'indented'), {}, formats=[ExportFormat.JSON]) as indented:
+            indented.add_many(SAMPLE_STORES)
+        with StorePipeline('test', str(tmp_path / 'compact'), {'compact_json': True},
+                           formats=[ExportFormat.JSON]) as compact:
+            compact.add_many(SAMPLE_STORES)
+
+        stores = json.loads(_read(indented.written[ExportFormat.JSON]))
+        expected = json.dumps(stores, ensure_ascii=False, separators=(',', ':'))
+        assert _read(compact.written[ExportFormat.JSON]) == expected
+
+    def test_concurrent_producers(self, tmp_path):
+        """Test add() from many threads writes every store exactly once."""
+        with StorePipeline('test', str(tmp_path), formats=[ExportFormat.JSON], queue_size=5) as pipeline:
+            threads = [
+                threading.Thread(target=lambda i=i: pipeline.add({'store_id': str(i), 'name': f'S{i}'}))
+                for i in range(50)
+            ]
+            for t in threads:
+                t.start()
+            for t in threads:
+                t.join()
+
+        assert pipeline.count == 50
+        assert pipeline.queued == 50
+
+
+class TestStorePipelineLifecycle:
+    """Tests for atomic replacement and failure handling."""
+
+    def test_abort_keeps_previous_outputs(self, tmp_path):
+        """Test a failed run leaves the previous stores_latest files untouched."""
+        previous = tmp_path / 'stores_latest.json'
+        previous.write_text('["previous"]', encoding='utf-8')
+
+        with pytest.raises(RuntimeError):
+            with StorePipeline('test', str(tmp_path)) as pipeline:
+                pipeline.add(SAMPLE_STORES[0])
+                raise RuntimeError("scraper failed")
+
+        assert previous.read_text(encoding='utf-8') == '["previous"]'
+        assert sorted(p.name for p in tmp_path.iterdir()) == ['stores_latest.json']
+
+    def test_empty_run_writes_nothing(self, tmp_path):
+        """Test closing without stores skips export like ExportService does."""
+        with StorePipeline('test', str(tmp_path)) as pipeline:
+            pass
+
+        assert pipeline.written == {}
+        assert list(tmp_path.iterdir()) == []
+
+    def test_validation_counted_as_stores_arrive(self, tmp_path):
+        """Test stores are validated by the writer thread."""
+        with StorePipeline('test', str(tmp_path), formats=[ExportFormat.JSON]) as pipeline:
+            pipeline.add_many(SAMPLE_STORES)
+            pipeline.add({'name': 'Missing everything'})
+
+        assert pipeline.count == 3
+        assert pipeline.valid == 2
+
+    def test_non_streamable_formats_ignored(self, tmp_path):
+        """Test Excel is left to ExportService."""
+        pipeline = StorePipeline('test', str(tmp_path), formats=[ExportFormat.EXCEL])
+        assert pipeline.formats == []
+
+    def test_add_requires_running_pipeline(self, tmp_path):
+        """Test add() before start() is rejected."""
+        with pytest.raises(RuntimeError):
+            StorePipeline('test', str(tmp_path)).add({'store_id': '1'})
+
+    def test_rejects_path_traversal(self):
+        """Test output_dir with '..' is rejected."""
+        with pytest.raises(ValueError):
+            StorePipeline('test', '../outside')
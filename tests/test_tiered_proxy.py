@@ -0,0 +1,161 @@
+"""Tests for tiered proxy escalation."""
+
+from unittest.mock import Mock, patch
+
+import pytest
+
+from src.shared.constants import TIERED_PROXY
+from src.shared.proxy_client import ProxyMode, ProxyResponse
+from src.shared.tiered_proxy import TieredProxiedSession, is_block_response
+
+
+CREDENTIALS = {
+    'residential_username': 'user',
+    'residential_password': 'pass',
+    'scraper_api_username': 'user',
+    'scraper_api_password': 'pass',
+}
+
+
+def _response(status_code=200, content=b'<html>store</html>'):
+    return ProxyResponse(
+        status_code=status_code, text=content.decode(), content=content, headers={},
+        url='https://www.example.com/store/1', elapsed_seconds=0.1, proxy_mode=ProxyMode.DIRECT,
+    )
+
+
+def _session(clock, retailer, responses, **config):
+    """Build a tiered session whose tier clients answer from a {tier: [responses]} map."""
+    session = TieredProxiedSession({'mode': 'tiered', **CREDENTIALS, **config}, retailer=retailer,
+                                   clock=clock)
+    for name, client in session._tiers:
+        client.get = Mock(side_effect=list(responses.get(name, [])))
+    return session
+
+
+def _tier_calls(session):
+    return {name: client.get.call_count for name, client in session._tiers}
+
+
+class TestIsBlockResponse:
+    """Tests for is_block_response()."""
+
+    @pytest.mark.parametrize('status_code', TIERED_PROXY.BLOCK_STATUS_CODES)
+    def test_block_statuses(self, status_code):
+        """Test 403/429/503 are block signals."""
+        assert is_block_response(_response(status_code))
+
+    def test_challenge_page(self):
+        """Test a 200 carrying a bot-challenge marker is a block."""
+        assert is_block_response(_response(200, b'<html><div id="px-captcha"></div></html>'))
+
+    def test_normal_responses(self):
+        """Test real pages, 404s and failed requests are not blocks."""
+        assert not is_block_response(_response(200))
+        assert not is_block_response(_response(404))
+        assert not is_block_response(None)
+
+
+class TestTieredProxiedSession:
+    """Tests for TieredProxiedSession escalation."""
+
+    def test_tiers_without_credentials_are_skipped(self):
+        """Test the ladder only contains tiers that can authenticate."""
+        with patch.dict('os.environ', {}, clear=True):
+            session = TieredProxiedSession({'mode': 'tiered'}, retailer='tiered_test_creds')
+
+        assert session.get_stats()['tiers'] == ['direct']
+
+    def test_lower_tiers_do_not_retry(self):
+        """Test only the top tier keeps the configured retries."""
+        session = TieredProxiedSession({'mode': 'tiered', **CREDENTIALS, 'max_retries': 3},
+                                       retailer='tiered_test_retries')
+
+        retries = [client.config.max_retries for _, client in session._tiers]
+        assert retries == [1, 1, 1, 3]
+        assert [client.config.retry_errors for _, client in session._tiers] == [False, False, False, True]
+        assert [client.config.render_js for _, client in session._tiers] == [False, False, False, True]
+
+    def test_cheapest_tier_is_used_when_not_blocked(self, fake_clock):
+        """Test an unblocked direct response is returned without escalation."""
+        session = _session(fake_clock, 'tiered_test_direct', {'direct': [_response()]})
+
+        assert session.get('https://www.example.com/store/1').status_code == 200
+        assert _tier_calls(session) == {'direct': 1, 'residential': 0, 'web_scraper_api': 0, 'render_js': 0}
+
+    def test_escalates_on_block_and_remembers_host(self, fake_clock):
+        """Test a block escalates the request and later requests start at the working tier."""
+        session = _session(fake_clock, 'tiered_test_escalate', {
+            'direct': [_response(403)],
+            'residential': [_response(200, b'<title>Access Denied</title>')],
+            'web_scraper_api': [_response(), _response()],
+        })
+
+        first = session.get('https://www.example.com/store/1')
+        second = session.get('https://www.example.com/store/2')
+
+        assert first.status_code == 200 and second.status_code == 200
+        assert _tier_calls(session) == {'direct': 1, 'residential': 1, 'web_scraper_api': 2, 'render_js': 0}
+        assert session.get_stats()['escalations'] == 2
+
+    def test_memory_is_shared_and_expires(self, fake_clock):
+        """Test other sessions of the retailer reuse the tier until the TTL passes."""
+        first = _session(fake_clock, 'tiered_test_ttl', {'direct': [_response(429)], 'residential': [_response()]})
+        first.get('https://www.example.com/a')
+
+        second = _session(fake_clock, 'tiered_test_ttl', {'residential': [_response()], 'direct': [_response()]})
+        second.get('https://www.example.com/b')
+        fake_clock.now = TIERED_PROXY.ESCALATION_TTL_SECONDS
+        second.get('https://www.example.com/c')
+
+        assert _tier_calls(second) == {'direct': 1, 'residential': 1, 'web_scraper_api': 0, 'render_js': 0}
+
+    def test_rate_limit_escalates_without_waiting(self):
+        """Test a real tier client hands a 429 to the ladder instead of sleeping on it."""
+        session = TieredProxiedSession({'mode': 'tiered', **CREDENTIALS}, retailer='tiered_test_429')
+        tiers = dict(session._tiers)
+        tiers['direct']._request_direct = Mock(return_value=_response(429))
+        tiers['residential']._request_direct = Mock(return_value=_response())
+
+        with patch('src.shared.proxy_client.time.sleep') as mock_sleep:
+            response = session.get('https://www.example.com/store/1')
+
+        assert response.status_code == 200
+        mock_sleep.assert_not_called()
+        assert TieredProxiedSession._host_tiers[('tiered_test_429', 'www.example.com')][0] == 'residential'
+
+    def test_transport_failure_is_not_remembered(self, fake_clock):
+        """Test a failed request escalates once without pinning the host to a costlier tier."""
+        session = _session(fake_clock, 'tiered_test_failure', {
+            'direct': [None, _response()],
+            'residential': [_response()],
+        })
+
+        session.get('https://www.example.com/a')
+        session.get('https://www.example.com/b')
+
+        assert _tier_calls(session)['direct'] == 2
+
+    def test_top_tier_response_is_returned_when_everything_blocks(self, fake_clock):
+        """Test the last tier's answer is returned as-is."""
+        session = _session(fake_clock, 'tiered_test_all_blocked', {
+            'direct': [_response(403)],
+            'residential': [_response(403)],
+            'web_scraper_api': [_response(403)],
+            'render_js': [_response(403)],
+        })
+
+        assert session.get('https://www.example.com/a').status_code == 403
+
+
+class TestCreateProxiedSession:
+    """Tests for tiered mode in create_proxied_session()."""
+
+    def test_tiered_mode_returns_tiered_session(self):
+        """Test mode 'tiered' creates a TieredProxiedSession."""
+        from src.shared.utils import create_proxied_session
+
+        session = create_proxied_session({'name': 'tiered_test_factory', 'proxy': {'mode': 'tiered'}})
+
+        assert isinstance(session, TieredProxiedSession)
+        assert session.retailer_name == 'tiered_test_factory'
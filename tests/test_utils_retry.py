@@ -98,3 +98,79 @@ class TestGetWithRetry403Handling:
         assert result.status_code == 200
         # Should have made 2 requests
         assert session.get.call_count == 2
+
+
+class TestGetWithRetryRevalidation:
+    """Tests for conditional GET revalidation in get_with_retry."""
+
+    @staticmethod
+    def _response(status_code, content=b'', headers=None):
+        response = requests.Response()
+        response.status_code = status_code
+        response._content = content
+        response.headers.update(headers or {})
+        return response
+
+    @pytest.fixture
+    def cache(self, tmp_path):
+        """Create a revalidation cache in a temp directory."""
+        from src.shared.cache_interface import RevalidationCache
+        cache = RevalidationCache('att', cache_dir=tmp_path)
+        yield cache
+        cache.close()
+
+    def _get(self, session, cache=None):
+        with patch('src.shared.http.time.sleep'), \
+             patch('src.shared.delays.time.sleep'):
+            return get_with_retry(session, "https://example.com/sitemap.xml", max_retries=2,
+                                  min_delay=0, max_delay=0, revalidation_cache=cache)
+
+    def test_304_returns_stored_body(self, cache):
+        """A 304 after a validated 200 should return the stored body as a 200."""
+        session = Mock(spec=requests.Session)
+        session.get.side_effect = [
+            self._response(200, b'<urlset/>', {'ETag': '"v1"', 'Last-Modified': 'Mon, 05 Oct 2026 10:00:00 GMT'}),
+            self._response(304),
+        ]
+
+        first = self._get(session, cache)
+        second = self._get(session, cache)
+
+        assert first.content == b'<urlset/>'
+        assert second.status_code == 200
+        assert second.content == b'<urlset/>'
+        assert second.from_cache is True
+        sent = session.get.call_args_list[1].kwargs['headers']
+        assert sent['If-None-Match'] == '"v1"'
+        assert sent['If-Modified-Since'] == 'Mon, 05 Oct 2026 10:00:00 GMT'
+
+    def test_response_without_validators_is_not_stored(self, cache):
+        """Responses without ETag/Last-Modified cannot be revalidated."""
+        session = Mock(spec=requests.Session)
+        session.get.side_effect = [self._response(200, b'a'), self._response(200, b'b')]
+
+        self._get(session, cache)
+        self._get(session, cache)
+
+        assert 'If-None-Match' not in session.get.call_args_list[1].kwargs['headers']
+
+    def test_session_attribute_cache_is_used(self, cache):
+        """A cache attached to the session applies without passing it explicitly."""
+        session = Mock(spec=requests.Session)
+        session.revalidation_cache = cache
+        session.get.side_effect = [
+            self._response(200, b'<html/>', {'etag': 'W/"abc"'}),
+            self._response(304),
+        ]
+
+        self._get(session)
+        result = self._get(session)
+
+        assert result.content == b'<html/>'
+
+    def test_unexpected_304_without_validators_fails(self):
+        """A 304 with nothing stored is not treated as success."""
+        session = Mock(spec=requests.Session)
+        session.get.return_value = self._response(304)
+
+        assert self._get(session) is None